@@ -1,8 +1,26 @@
 # __init__.py
-from .codes import *
+from .codes import DTM01, REF01, cas_descriptions, ref_descriptions
 from .py835 import Parser
+from .batch import ParserBatch, parse_many
+from .aio import aparse, aiter_parse, aparse_many
+from . import codes
 
 __all__ = [
     'Parser',
-    'codes'
+    'ParserBatch',
+    'parse_many',
+    'aparse',
+    'aiter_parse',
+    'aparse_many',
+    'codes',
+    'DTM01',
+    'REF01',
+    'cas_descriptions',
+    'ref_descriptions'
     ]  
+
+def __getattr__(name):
+    # The code tables are loaded on first use (see codes.py), so they can't be imported up front
+    if name in codes.CODE_TABLE_NAMES:
+        return getattr(codes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+import functools
+from collections import deque
+from .batch import ParserBatch, file_id_offset, parse_file
+from .lazy import LazyModule
+from .py835 import Parser
+
+# Imported on first use, see lazy.py
+asyncio = LazyModule('asyncio')
+
+async def aparse(file_path, executor=None, **kwargs):
+    """
+    Parse a file in an executor, so the event loop keeps running while it is read and parsed.
+    executor is any concurrent.futures executor, the loop's default thread pool if None.
+    Parsing is mostly Python code, so a ProcessPoolExecutor is what spreads it over cores;
+    a thread pool only keeps the loop responsive. kwargs are passed to Parser.
+    """
+    loop = asyncio.get_running_loop()
+    # run_in_executor doesn't pass keyword arguments on
+    return await loop.run_in_executor(executor, functools.partial(Parser, file_path, **kwargs))
+
+async def iter_paths(paths):
+    if hasattr(paths, '__aiter__'):
+        async for file_path in paths:
+            yield file_path
+    else:
+        for file_path in paths:
+            yield file_path
+
+async def aiter_parse(paths, executor=None, concurrency=4, ordered=False, engine='pyx12', ids='random', stats=False, handlers=None, include=None, where=None):
+    """
+    Parse files in an executor and yield (file_path, parser, error) for each, like parse_file:
+    parser is None and error the traceback when a file fails to parse. paths can be a list or
+    an async iterator, e.g. files arriving in an intake queue.
+
+    At most `concurrency` files are parsed or waiting to be picked up at any time: the next
+    file is only started once a result has been taken, so a slow consumer holds the parsing
+    back instead of piling up parsed files in memory. Results come in the order they finish,
+    or in the order of paths with ordered=True.
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1.')
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    index = 0
+    try:
+        async for file_path in iter_paths(paths):
+            # Each file gets its own range of integer ids, as in ParserBatch
+            pending.append(loop.run_in_executor(executor, parse_file, file_path, engine, ids, file_id_offset(ids, index), stats, handlers, include, where))
+            index += 1
+            while len(pending) >= concurrency:
+                for result in await next_results(pending, ordered):
+                    yield result
+        while pending:
+            for result in await next_results(pending, ordered):
+                yield result
+    finally:
+        # Stopping early (break, cancellation) drops the files that haven't started yet
+        for future in pending:
+            future.cancel()
+
+async def next_results(pending, ordered):
+    """Wait for the next result, or for the first of the pending files to finish, and take them off pending."""
+    if ordered:
+        result = await pending[0]
+        pending.popleft()
+        return [result]
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    results = [future.result() for future in pending if future in done]
+    remaining = [future for future in pending if future not in done]
+    pending.clear()
+    pending.extend(remaining)
+    return results
+
+async def aparse_many(paths, executor=None, concurrency=4, engine='pyx12', ids='random', stats=False, handlers=None, include=None, where=None):
+    """Parse a list of files with aiter_parse and return them as a ParserBatch, like parse_many."""
+    paths = list(paths)
+    batch = ParserBatch(paths, engine=engine, ids=ids, stats=stats, handlers=handlers, include=include, where=where, parse=False)
+    results = aiter_parse(paths, executor=executor, concurrency=concurrency, ordered=True, engine=engine, ids=ids, stats=stats, handlers=handlers, include=include, where=where)
+    batch.collect([result async for result in results])
+    return batch
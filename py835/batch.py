@@ -0,0 +1,212 @@
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from . import export
+from . import maps
+from .lazy import LazyModule
+from .py835 import Parser
+from .table import typed_frame
+
+pd = LazyModule('pandas')
+
+# Each file in a batch gets its own range of integer ids
+FILE_ID_RANGE = 1 << 32
+
+def file_id_offset(ids, index):
+    """Where the ids of the index-th file of a batch start: only integer ids get a range per file."""
+    return index * FILE_ID_RANGE if ids == 'int' else 0
+
+def parse_file(file_path, engine='pyx12', ids='random', id_offset=0, stats=False, handlers=None, include=None, where=None):
+    """
+    Parse one file, meant to run in a worker process.
+    Returns (file_path, parser, error) where error is the traceback if parsing failed.
+    """
+    try:
+        # The raw text is not needed once parsed, don't read it in or ship it back to the main process
+        parser = Parser(file_path, engine=engine, ids=ids, id_offset=id_offset, keep_raw=False, stats=stats, handlers=handlers, include=include, where=where)
+    except Exception:
+        return file_path, None, traceback.format_exc()
+    return file_path, parser, None
+
+def parse_files(file_paths, id_offsets, engine, ids, stats, handlers, include, where):
+    """parse_file for each of a chunk of files, in one task of a worker process."""
+    return [
+        parse_file(file_path, engine, ids, id_offset, stats, handlers, include, where)
+        for file_path, id_offset in zip(file_paths, id_offsets)
+    ]
+
+class ParserBatch:
+    """
+    Parse many files across a process pool and expose the same tables as Parser,
+    concatenated for the whole batch with a filename column. A file that fails to parse
+    doesn't stop the batch; it is recorded in self.failures instead.
+    """
+    def __init__(self, paths, workers=None, engine='pyx12', ids='random', stats=False, handlers=None, include=None, where=None, parse=True):
+        self.paths = list(paths)
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.ids = ids
+        self.stats = stats
+        # Sent to the workers, so handlers registered in this process only (e.g. under spawn) still apply
+        self.handlers = handlers
+        self.include = include
+        # A dict, or a module-level function so it can be sent to the workers like handlers
+        self.where = where
+        self.parsers = []
+        self.failures = []
+        # parse=False leaves the batch empty, to be filled with collect()
+        if parse:
+            self.parse()
+
+    def parse(self):
+        id_offsets = [file_id_offset(self.ids, index) for index in range(len(self.paths))]
+        if self.workers == 1 or len(self.paths) <= 1:
+            results = map(parse_file, self.paths, repeat(self.engine), repeat(self.ids), id_offsets, repeat(self.stats), repeat(self.handlers), repeat(self.include), repeat(self.where))
+            self.collect(results)
+            return
+        # Hand each worker several files at a time so small files don't pay for the round trip
+        chunksize = max(1, len(self.paths) // (self.workers * 4))
+        chunks = [range(start, min(start + chunksize, len(self.paths))) for start in range(0, len(self.paths), chunksize)]
+        # pyx12 workers load the maps once as they start rather than with their first file
+        initializer = maps.warm_up if self.engine == 'pyx12' else None
+        results = [None] * len(self.paths)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=initializer) as executor:
+            futures = [executor.submit(parse_files, [self.paths[index] for index in chunk], [id_offsets[index] for index in chunk], self.engine, self.ids, self.stats, self.handlers, self.include, self.where) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    results[chunk.start:chunk.stop] = future.result()
+                except BrokenProcessPool:
+                    # A worker died (crashed, killed, out of memory), which fails every task
+                    # still in the pool, not only its own: these files are parsed again below
+                    pass
+        lost = [index for index, result in enumerate(results) if result is None]
+        if lost:
+            self.reparse(lost, id_offsets, results, initializer)
+        self.collect(results)
+
+    def reparse(self, indexes, id_offsets, results, initializer):
+        """
+        Parse the files lost to a broken pool again, one at a time in a single worker, so that
+        a file whose worker dies again is known: it is recorded as a failure and a new worker
+        takes the files after it.
+        """
+        while indexes:
+            with ProcessPoolExecutor(max_workers=1, initializer=initializer) as executor:
+                futures = [executor.submit(parse_file, self.paths[index], self.engine, self.ids, id_offsets[index], self.stats, self.handlers, self.include, self.where) for index in indexes]
+                remaining = []
+                for position, (index, future) in enumerate(zip(indexes, futures)):
+                    try:
+                        results[index] = future.result()
+                    except BrokenProcessPool:
+                        # The worker runs the files in order, so the first one lost is the one it died on
+                        error = 'The worker process parsing this file stopped abruptly.\n' + traceback.format_exc()
+                        results[index] = (self.paths[index], None, error)
+                        remaining = indexes[position + 1:]
+                        break
+            indexes = remaining
+
+    def collect(self, results):
+        for file_path, parser, error in results:
+            if parser is None:
+                self.failures.append({
+                    'filename': os.path.basename(file_path),
+                    'file_path': file_path,
+                    'error': error
+                })
+            else:
+                self.parsers.append(parser)
+
+    def failures_table(self):
+        return pd.DataFrame(self.failures, columns=['filename', 'file_path', 'error'])
+
+    def stats_table(self):
+        """One row per parsed file with its ParseStats totals and seconds per stage (needs stats=True)."""
+        rows = []
+        for parser in self.parsers:
+            if parser.stats is None:
+                continue
+            stats = parser.stats.to_dict()
+            row = {'filename': os.path.basename(parser.file_path)}
+            row.update((key, value) for key, value in stats.items() if not isinstance(value, dict))
+            row.update((stage + '_seconds', seconds) for stage, seconds in stats['stage_seconds'].items())
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def extra_table(self, name, colnames=False, typed=False):
+        return self.concat_tables('extra_table', name=name, colnames=colnames, typed=typed)
+
+    def concat_tables(self, method, typed=False, **kwargs):
+        # Type after concatenating, so the category columns cover the codes of every file
+        tables = []
+        for parser in self.parsers:
+            # The cached frame, not a copy of it: concat copies the values anyway
+            table = getattr(parser, method)(copy=False, **kwargs)
+            if 'filename' not in table.columns:
+                table = table.copy(deep=False)
+                table['filename'] = os.path.basename(parser.file_path)
+            tables.append(table)
+        if not tables:
+            return pd.DataFrame()
+        tables = pd.concat(tables, ignore_index=True)
+        if typed:
+            tables = typed_frame(tables)
+        return tables
+
+    def isa_table(self, colnames=False, typed=False):
+        return self.concat_tables('isa_table', colnames=colnames, typed=typed)
+
+    def functional_groups_table(self, colnames=False, typed=False):
+        return self.concat_tables('functional_groups_table', colnames=colnames, typed=typed)
+
+    def transaction_sets_table(self, colnames=False, typed=False):
+        return self.concat_tables('transaction_sets_table', colnames=colnames, typed=typed)
+
+    def claims_table(self, colnames=False, typed=False):
+        return self.concat_tables('claims_table', colnames=colnames, typed=typed)
+
+    def services_table(self, colnames=False, typed=False):
+        return self.concat_tables('services_table', colnames=colnames, typed=typed)
+
+    def transactions(self, colnames=False, typed=False):
+        return self.concat_tables('transactions', colnames=colnames, typed=typed)
+
+    def claims_refs_table(self, colnames=False, flatten=False, typed=False):
+        return self.concat_tables('claims_refs_table', colnames=colnames, flatten=flatten, typed=typed)
+
+    def services_refs_table(self, colnames=False, flatten=False, typed=False):
+        return self.concat_tables('services_refs_table', colnames=colnames, flatten=flatten, typed=typed)
+
+    def claims_cas_table(self, colnames=False, flatten=False, typed=False):
+        return self.concat_tables('claims_cas_table', colnames=colnames, flatten=flatten, typed=typed)
+
+    def services_cas_table(self, colnames=False, flatten=False, typed=False):
+        return self.concat_tables('services_cas_table', colnames=colnames, flatten=flatten, typed=typed)
+
+    def claims_adjustments_table(self, colnames=False, typed=False):
+        return self.concat_tables('claims_adjustments_table', colnames=colnames, typed=typed)
+
+    def services_adjustments_table(self, colnames=False, typed=False):
+        return self.concat_tables('services_adjustments_table', colnames=colnames, typed=typed)
+
+    def concat_summaries(self, method, colnames=False):
+        summary = self.concat_tables(method, colnames=colnames)
+        # A group/reason pair missing from one file's summary means nothing was adjusted for it
+        amount_columns = [column for column in summary.columns if column.startswith('CAS03_')]
+        summary[amount_columns] = summary[amount_columns].fillna(0.0)
+        return summary
+
+    def claims_adjustments_summary(self, colnames=False):
+        return self.concat_summaries('claims_adjustments_summary', colnames=colnames)
+
+    def services_adjustments_summary(self, colnames=False):
+        return self.concat_summaries('services_adjustments_summary', colnames=colnames)
+
+    def write_dataset(self, base_dir, partition_by=None, tables=None, format='parquet'):
+        """Write the tables of every file to one (partitioned) Parquet dataset, see export.write_dataset."""
+        export.write_dataset(self.parsers, base_dir, partition_by=partition_by, tables=tables, format=format)
+
+def parse_many(paths, workers=None, engine='pyx12', ids='random', stats=False, handlers=None, include=None, where=None):
+    """Parse a list of files in parallel. Returns a ParserBatch."""
+    return ParserBatch(paths, workers=workers, engine=engine, ids=ids, stats=stats, handlers=handlers, include=include, where=where)
@@ -0,0 +1,180 @@
+"""
+Benchmarks of Parser on synthetic 835 files (see synthetic.py) across size tiers.
+
+    python -m py835.benchmark --tiers small medium --output results.json
+    python -m py835.benchmark --tiers large --engines fast --baseline results.json
+
+Each tier and engine runs in a fresh process, so its peak memory is its own. Generated
+files are kept in --work-dir and reused by later runs with the same tier and seed.
+"""
+import argparse
+import datetime
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .py835 import ENGINES, Parser
+from .synthetic import generate_835
+
+# Roughly 500 bytes per claim: small is ~1 MB, medium ~10 MB and large ~100 MB
+TIERS = {
+    'small': {'statements': 1, 'claims': 2_000},
+    'medium': {'statements': 4, 'claims': 20_000},
+    'large': {'statements': 10, 'claims': 200_000}
+}
+# Table views timed after parsing, in this order; later views reuse the cached earlier ones
+VIEWS = [
+    ('transactions', 'transactions', {}),
+    ('claims_cas_flatten', 'claims_cas_table', {'flatten': True}),
+    ('services_cas_flatten', 'services_cas_table', {'flatten': True}),
+    ('claims_refs_flatten', 'claims_refs_table', {'flatten': True}),
+    ('services_refs_flatten', 'services_refs_table', {'flatten': True})
+]
+
+def tier_file(tier, work_dir, seed=0):
+    """Path of the synthetic file for a tier, generated on first use."""
+    if tier not in TIERS:
+        raise ValueError(f'Unknown tier {tier!r}. Use one of {list(TIERS)}.')
+    path = os.path.join(work_dir, f'synthetic-{tier}-{seed}.835')
+    if not os.path.exists(path):
+        os.makedirs(work_dir, exist_ok=True)
+        # Write under a temporary name so an interrupted run doesn't leave half a file behind
+        generate_835(path + '.part', seed=seed, **TIERS[tier])
+        os.replace(path + '.part', path)
+    return path
+
+def peak_memory():
+    """Peak resident memory of this process in bytes, or None where it can't be read."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def run_one(path, engine):
+    """Parse one file and build the views, meant to run in a fresh process."""
+    # pandas is imported on first use; don't count that against the first view
+    importlib.import_module('pandas')
+
+    started = time.perf_counter()
+    parser = Parser(path, engine=engine, ids='int', keep_raw=False, stats=True)
+    result = {
+        'parse_seconds': time.perf_counter() - started
+    }
+    for name, method, kwargs in VIEWS:
+        started = time.perf_counter()
+        getattr(parser, method)(**kwargs)
+        result[name + '_seconds'] = time.perf_counter() - started
+    stats = parser.stats.to_dict()
+    result.update(
+        bytes=stats['bytes_read'],
+        segments=stats['segments'],
+        claims=stats['claims'],
+        services=stats['table_rows']['services'],
+        segments_per_second=stats['segments'] / result['parse_seconds'],
+        claims_per_second=stats['claims'] / result['parse_seconds'],
+        stage_seconds=stats['stage_seconds'],
+        peak_memory_bytes=peak_memory()
+    )
+    return result
+
+def run(tiers=('small', 'medium'), engines=('fast',), work_dir=None, seed=0, repeat=1):
+    """
+    Run the benchmarks and return the results as a dict: the environment plus one result
+    per tier, engine and repeat with its timings (seconds), throughput and peak memory.
+    """
+    work_dir = work_dir or os.path.join(tempfile.gettempdir(), 'py835-benchmark')
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown engine {engine!r}. Expected one of {ENGINES}.')
+    results = []
+    # spawn rather than fork, so a run doesn't start out with this process's memory
+    context = multiprocessing.get_context('spawn')
+    for tier in tiers:
+        path = tier_file(tier, work_dir, seed)
+        for engine in engines:
+            for attempt in range(repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(run_one, path, engine).result()
+                results.append(dict({'tier': tier, 'engine': engine, 'repeat': attempt}, **result))
+    return {
+        'py835_version': package_version(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'seed': seed,
+        'results': results
+    }
+
+def package_version():
+    try:
+        from importlib.metadata import version
+        return version('py835')
+    except Exception:
+        return None
+
+def compare(results, baseline):
+    """
+    Rows of (tier, engine, metric, baseline, current, ratio) for the timings and peak memory
+    of two runs, using the best of the repeats. A ratio above 1 means slower or bigger now.
+    """
+    def best(run):
+        runs = {}
+        for result in run['results']:
+            key = (result['tier'], result['engine'])
+            for metric, value in result.items():
+                if (metric.endswith('_seconds') or metric == 'peak_memory_bytes') and isinstance(value, (int, float)):
+                    current = runs.setdefault(key, {}).get(metric)
+                    runs[key][metric] = value if current is None else min(current, value)
+        return runs
+
+    current_runs = best(results)
+    baseline_runs = best(baseline)
+    rows = []
+    for key, metrics in current_runs.items():
+        for metric, value in metrics.items():
+            before = baseline_runs.get(key, {}).get(metric)
+            if before:
+                rows.append(key + (metric, before, value, value / before))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m py835.benchmark', description='Benchmark py835 on synthetic 835 files.')
+    parser.add_argument('--tiers', nargs='+', default=['small', 'medium'], choices=list(TIERS))
+    parser.add_argument('--engines', nargs='+', default=['fast'], choices=ENGINES)
+    parser.add_argument('--work-dir', help='where the synthetic files are kept (default: a temporary directory)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='runs per tier and engine')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args(argv)
+
+    results = run(args.tiers, args.engines, work_dir=args.work_dir, seed=args.seed, repeat=args.repeat)
+    for result in results['results']:
+        memory = result['peak_memory_bytes']
+        print(
+            f"{result['tier']:<7} {result['engine']:<6} {result['bytes'] / 1e6:8.1f} MB  "
+            f"parse {result['parse_seconds']:7.2f}s  transactions {result['transactions_seconds']:6.2f}s  "
+            f"services_cas flatten {result['services_cas_flatten_seconds']:6.2f}s  "
+            f"{result['claims_per_second']:9.0f} claims/s  "
+            + (f"peak {memory / 1e6:7.0f} MB" if memory else '')
+        )
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            rows = compare(results, json.load(baseline))
+        for tier, engine, metric, before, value, ratio in rows:
+            print(f'{tier:<7} {engine:<6} {metric:<30} {before:12.3f} -> {value:12.3f}  x{ratio:.2f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3418 @@
+# Generated from the CSV files in py835/codes by codes.generate_code_tables(), do not edit.
+# One (code, description, start, stop) entry per row, dates as YYYY-MM-DD or None.
+CODE_TABLES = {
+    'claim_adjustment_group_codes': [
+        ('CO', 'Contractual Obligation', None, None),
+        ('OA', 'Other Adjustment', None, None),
+        ('PI', 'Payor Initiated Reduction', None, None),
+        ('PR', 'Patient Responsibility', None, None),
+    ],
+    'claim_adjustment_reason_codes': [
+        ('1', 'Deductible Amount', None, None),
+        ('2', 'Coinsurance Amount', None, None),
+        ('3', 'Co-payment Amount', None, None),
+        ('4', 'The procedure code is inconsistent with the modifier used. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('5', 'The procedure code/type of bill is inconsistent with the place of service. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('6', "The procedure/revenue code is inconsistent with the patient's age. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('7', "The procedure/revenue code is inconsistent with the patient's gender. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('8', 'The procedure code is inconsistent with the provider type/specialty (taxonomy). Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('9', "The diagnosis is inconsistent with the patient's age. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('10', "The diagnosis is inconsistent with the patient's gender. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('11', 'The diagnosis is inconsistent with the procedure. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('12', 'The diagnosis is inconsistent with the provider type. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('13', 'The date of death precedes the date of service.', None, None),
+        ('14', 'The date of birth follows the date of service.', None, None),
+        ('15', 'The authorization number is missing, invalid, or does not apply to the billed services or provider.', None, None),
+        ('16', 'Claim/service lacks information or has submission/billing error(s). Usage: Do not use this code for claims attachment(s)/other documentation. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.) Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('17', 'Requested information was not provided or was insufficient/incomplete. At least one Remark Code must be provided (may be comprised of either the Remittance Advice Remark Code or NCPDP Reject Reason Code.)', None, None),
+        ('18', "Exact duplicate claim/service (Use only with Group Code OA except where state workers' compensation regulations requires CO)", None, None),
+        ('19', "This is a work-related injury/illness and thus the liability of the Worker's Compensation Carrier.", None, None),
+        ('20', 'This injury/illness is covered by the liability carrier.', None, None),
+        ('21', 'This injury/illness is the liability of the no-fault carrier.', None, None),
+        ('22', 'This care may be covered by another payer per coordination of benefits.', None, None),
+        ('23', 'The impact of prior payer(s) adjudication including payments and/or adjustments. (Use only with Group Code OA)', None, None),
+        ('24', 'Charges are covered under a capitation agreement/managed care plan.', None, None),
+        ('25', 'Payment denied. Your Stop loss deductible has not been met.', None, None),
+        ('26', 'Expenses incurred prior to coverage.', None, None),
+        ('27', 'Expenses incurred after coverage terminated.', None, None),
+        ('28', 'Coverage not in effect at the time the service was provided.', None, None),
+        ('29', 'The time limit for filing has expired.', None, None),
+        ('30', 'Payment adjusted because the patient has not met the required eligibility, spend down, waiting, or residency requirements.', None, None),
+        ('31', 'Patient cannot be identified as our insured.', None, None),
+        ('32', 'Our records indicate the patient is not an eligible dependent.', None, None),
+        ('33', 'Insured has no dependent coverage.', None, None),
+        ('34', 'Insured has no coverage for newborns.', None, None),
+        ('35', 'Lifetime benefit maximum has been reached.', None, None),
+        ('36', 'Balance does not exceed co-payment amount.', None, None),
+        ('37', 'Balance does not exceed deductible.', None, None),
+        ('38', 'Services not provided or authorized by designated (network/primary care) providers.', None, None),
+        ('39', 'Services denied at the time authorization/pre-certification was requested.', None, None),
+        ('40', 'Charges do not meet qualifications for emergent/urgent care. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('41', 'Discount agreed to in Preferred Provider contract.', None, None),
+        ('42', 'Charges exceed our fee schedule or maximum allowable amount. (Use CARC 45)', None, None),
+        ('43', 'Gramm-Rudman reduction.', None, None),
+        ('44', 'Prompt-pay discount.', None, None),
+        ('45', 'Charge exceeds fee schedule/maximum allowable or contracted/legislated fee arrangement. Usage: This adjustment amount cannot equal the total service or claim charge amount; and must not duplicate provider adjustment amounts (payments and contractual reductions) that have resulted from prior payer(s) adjudication. (Use only with Group Codes PR or CO depending upon liability)', None, None),
+        ('46', 'This (these) service(s) is (are) not covered.', None, None),
+        ('47', 'This (these) diagnosis(es) is (are) not covered, missing, or are invalid.', None, None),
+        ('48', 'This (these) procedure(s) is (are) not covered.', None, None),
+        ('49', 'This is a non-covered service because it is a routine/preventive exam or a diagnostic/screening procedure done in conjunction with a routine/preventive exam. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('50', "These are non-covered services because this is not deemed a 'medical necessity' by the payer. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('51', 'These are non-covered services because this is a pre-existing condition. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('52', 'The referring/prescribing/rendering provider is not eligible to refer/prescribe/order/perform the service billed.', None, None),
+        ('53', 'Services by an immediate relative or a member of the same household are not covered.', None, None),
+        ('54', 'Multiple physicians/assistants are not covered in this case. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('55', 'Procedure/treatment/drug is deemed experimental/investigational by the payer. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('56', "Procedure/treatment has not been deemed 'proven to be effective' by the payer. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('57', "Payment denied/reduced because the payer deems the information submitted does not support this level of service, this many services, this length of service, this dosage, or this day's supply.", None, None),
+        ('58', 'Treatment was deemed by the payer to have been rendered in an inappropriate or invalid place of service. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('59', 'Processed based on multiple or concurrent procedure rules. (For example multiple surgery or diagnostic imaging, concurrent anesthesia.) Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('60', 'Charges for outpatient services are not covered when performed within a period of time prior to or after inpatient services.', None, None),
+        ('61', 'Adjusted for failure to obtain second surgical opinion', None, None),
+        ('62', 'Payment denied/reduced for absence of, or exceeded, pre-certification/authorization.', None, None),
+        ('63', 'Correction to a prior claim.', None, None),
+        ('64', 'Denial reversed per Medical Review.', None, None),
+        ('65', 'Procedure code was incorrect. This payment reflects the correct code.', None, None),
+        ('66', 'Blood Deductible.', None, None),
+        ('67', 'Lifetime reserve days. (Handled in QTY, QTY01=LA)', None, None),
+        ('68', 'DRG weight. (Handled in CLP12)', None, None),
+        ('69', 'Day outlier amount.', None, None),
+        ('70', 'Cost outlier - Adjustment to compensate for additional costs.', None, None),
+        ('71', 'Primary Payer amount.', None, None),
+        ('72', 'Coinsurance day. (Handled in QTY, QTY01=CD)', None, None),
+        ('73', 'Administrative days.', None, None),
+        ('74', 'Indirect Medical Education Adjustment.', None, None),
+        ('75', 'Direct Medical Education Adjustment.', None, None),
+        ('76', 'Disproportionate Share Adjustment.', None, None),
+        ('77', 'Covered days. (Handled in QTY, QTY01=CA)', None, None),
+        ('78', 'Non-Covered days/Room charge adjustment.', None, None),
+        ('79', 'Cost Report days. (Handled in MIA15)', None, None),
+        ('80', 'Outlier days. (Handled in QTY, QTY01=OU)', None, None),
+        ('81', 'Discharges.', None, None),
+        ('82', 'PIP days.', None, None),
+        ('83', 'Total visits.', None, None),
+        ('84', 'Capital Adjustment. (Handled in MIA)', None, None),
+        ('85', 'Patient Interest Adjustment (Use Only Group code PR)', None, None),
+        ('86', 'Statutory Adjustment.', None, None),
+        ('87', 'Transfer amount.', None, None),
+        ('88', 'Adjustment amount represents collection against receivable created in prior overpayment.', None, None),
+        ('89', 'Professional fees removed from charges.', None, None),
+        ('90', 'Ingredient cost adjustment. Usage: To be used for pharmaceuticals only.', None, None),
+        ('91', 'Dispensing fee adjustment.', None, None),
+        ('92', 'Claim Paid in full.', None, None),
+        ('93', 'No Claim level Adjustments.', None, None),
+        ('94', 'Processed in Excess of charges.', None, None),
+        ('95', 'Plan procedures not followed.', None, None),
+        ('96', 'Non-covered charge(s). At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.) Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('97', 'The benefit for this service is included in the payment/allowance for another service/procedure that has already been adjudicated. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('98', 'The hospital must file the Medicare claim for this inpatient non-physician service.', None, None),
+        ('99', 'Medicare Secondary Payer Adjustment Amount.', None, None),
+        ('100', 'Payment made to patient/insured/responsible party.', None, None),
+        ('101', 'Predetermination: anticipated payment upon completion of services or claim adjudication.', None, None),
+        ('102', 'Major Medical Adjustment.', None, None),
+        ('103', 'Provider promotional discount (e.g., Senior citizen discount).', None, None),
+        ('104', 'Managed care withholding.', None, None),
+        ('105', 'Tax withholding.', None, None),
+        ('106', 'Patient payment option/election not in effect.', None, None),
+        ('107', 'The related or qualifying claim/service was not identified on this claim. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('108', 'Rent/purchase guidelines were not met. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('109', 'Claim/service not covered by this payer/contractor. You must send the claim/service to the correct payer/contractor.', None, None),
+        ('110', 'Billing date predates service date.', None, None),
+        ('111', 'Not covered unless the provider accepts assignment.', None, None),
+        ('112', 'Service not furnished directly to the patient and/or not documented.', None, None),
+        ('113', 'Payment denied because service/procedure was provided outside the United States or as a result of war.', None, None),
+        ('114', 'Procedure/product not approved by the Food and Drug Administration.', None, None),
+        ('115', 'Procedure postponed, canceled, or delayed.', None, None),
+        ('116', 'The advance indemnification notice signed by the patient did not comply with requirements.', None, None),
+        ('117', 'Transportation is only covered to the closest facility that can provide the necessary care.', None, None),
+        ('118', 'ESRD network support adjustment.', None, None),
+        ('119', 'Benefit maximum for this time period or occurrence has been reached.', None, None),
+        ('120', 'Patient is covered by a managed care plan.', None, None),
+        ('121', 'Indemnification adjustment - compensation for outstanding member responsibility.', None, None),
+        ('122', 'Psychiatric reduction.', None, None),
+        ('123', 'Payer refund due to overpayment.', None, None),
+        ('124', 'Payer refund amount - not our patient.', None, None),
+        ('125', 'Submission/billing error(s). At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('126', 'Deductible -- Major Medical', None, None),
+        ('127', 'Coinsurance -- Major Medical', None, None),
+        ('128', "Newborn's services are covered in the mother's Allowance.", None, None),
+        ('129', 'Prior processing information appears incorrect. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('130', 'Claim submission fee.', None, None),
+        ('131', 'Claim specific negotiated discount.', None, None),
+        ('132', 'Prearranged demonstration project adjustment.', None, None),
+        ('133', 'The disposition of this service line is pending further review. (Use only with Group Code OA). Usage: Use of this code requires a reversal and correction when the service line is finalized (use only in Loop 2110 CAS segment of the 835 or Loop 2430 of the 837).', None, None),
+        ('134', 'Technical fees removed from charges.', None, None),
+        ('135', 'Interim bills cannot be processed.', None, None),
+        ('136', "Failure to follow prior payer's coverage rules. (Use only with Group Code OA)", None, None),
+        ('137', 'Regulatory Surcharges, Assessments, Allowances or Health Related Taxes.', None, None),
+        ('138', 'Appeal procedures not followed or time limits not met.', None, None),
+        ('139', 'Contracted funding agreement - Subscriber is employed by the provider of services. Use only with Group Code CO.', None, None),
+        ('140', 'Patient/Insured health identification number and name do not match.', None, None),
+        ('141', 'Claim spans eligible and ineligible periods of coverage.', None, None),
+        ('142', 'Monthly Medicaid patient liability amount.', None, None),
+        ('143', 'Portion of payment deferred.', None, None),
+        ('144', 'Incentive adjustment, e.g. preferred product/service.', None, None),
+        ('145', 'Premium payment withholding', None, None),
+        ('146', 'Diagnosis was invalid for the date(s) of service reported.', None, None),
+        ('147', 'Provider contracted/negotiated rate expired or not on file.', None, None),
+        ('148', 'Information from another provider was not provided or was insufficient/incomplete. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('149', 'Lifetime benefit maximum has been reached for this service/benefit category.', None, None),
+        ('150', 'Payer deems the information submitted does not support this level of service.', None, None),
+        ('151', 'Payment adjusted because the payer deems the information submitted does not support this many/frequency of services.', None, None),
+        ('152', 'Payer deems the information submitted does not support this length of service. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('153', 'Payer deems the information submitted does not support this dosage.', None, None),
+        ('154', "Payer deems the information submitted does not support this day's supply.", None, None),
+        ('155', 'Patient refused the service/procedure.', None, None),
+        ('156', 'Flexible spending account payments. Note: Use code 187.', None, None),
+        ('157', 'Service/procedure was provided as a result of an act of war.', None, None),
+        ('158', 'Service/procedure was provided outside of the United States.', None, None),
+        ('159', 'Service/procedure was provided as a result of terrorism.', None, None),
+        ('160', 'Injury/illness was the result of an activity that is a benefit exclusion.', None, None),
+        ('161', 'Provider performance bonus', None, None),
+        ('162', 'State-mandated Requirement for Property and Casualty, see Claim Payment Remarks Code for specific explanation.', None, None),
+        ('163', 'Attachment/other documentation referenced on the claim was not received.', None, None),
+        ('164', 'Attachment/other documentation referenced on the claim was not received in a timely fashion.', None, None),
+        ('165', 'Referral absent or exceeded.', None, None),
+        ('166', 'These services were submitted after this payers responsibility for processing claims under this plan ended.', None, None),
+        ('167', 'This (these) diagnosis(es) is (are) not covered. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('168', "Service(s) have been considered under the patient's medical plan. Benefits are not available under this dental plan.", None, None),
+        ('169', 'Alternate benefit has been provided.', None, None),
+        ('170', 'Payment is denied when performed/billed by this type of provider. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('171', 'Payment is denied when performed/billed by this type of provider in this type of facility. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('172', 'Payment is adjusted when performed/billed by a provider of this specialty. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('173', 'Service/equipment was not prescribed by a physician.', None, None),
+        ('174', 'Service was not prescribed prior to delivery.', None, None),
+        ('175', 'Prescription is incomplete.', None, None),
+        ('176', 'Prescription is not current.', None, None),
+        ('177', 'Patient has not met the required eligibility requirements.', None, None),
+        ('178', 'Patient has not met the required spend down requirements.', None, None),
+        ('179', 'Patient has not met the required waiting requirements. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('180', 'Patient has not met the required residency requirements.', None, None),
+        ('181', 'Procedure code was invalid on the date of service.', None, None),
+        ('182', 'Procedure modifier was invalid on the date of service.', None, None),
+        ('183', 'The referring provider is not eligible to refer the service billed. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('184', 'The prescribing/ordering provider is not eligible to prescribe/order the service billed. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('185', 'The rendering provider is not eligible to perform the service billed. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('186', 'Level of care change adjustment.', None, None),
+        ('187', 'Consumer Spending Account payments (includes but is not limited to Flexible Spending Account, Health Savings Account, Health Reimbursement Account, etc.)', None, None),
+        ('188', 'This product/procedure is only covered when used according to FDA recommendations.', None, None),
+        ('189', "'Not otherwise classified' or 'unlisted' procedure code (CPT/HCPCS) was billed when there is a specific procedure code for this procedure/service", None, None),
+        ('190', 'Payment is included in the allowance for a Skilled Nursing Facility (SNF) qualified stay.', None, None),
+        ('191', "Not a work related injury/illness and thus not the liability of the workers' compensation carrier Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF)", None, None),
+        ('192', 'Non standard adjustment code from paper remittance. Usage: This code is to be used by providers/payers providing Coordination of Benefits information to another payer in the 837 transaction only. This code is only used when the non-standard code cannot be reasonably mapped to an existing Claims Adjustment Reason Code, specifically Deductible, Coinsurance and Co-payment.', None, None),
+        ('193', 'Original payment decision is being maintained. Upon review, it was determined that this claim was processed properly.', None, None),
+        ('194', 'Anesthesia performed by the operating physician, the assistant surgeon or the attending physician.', None, None),
+        ('195', 'Refund issued to an erroneous priority payer for this claim/service.', None, None),
+        ('196', "Claim/service denied based on prior payer's coverage determination.", None, None),
+        ('197', 'Precertification/authorization/notification/pre-treatment absent.', None, None),
+        ('198', 'Precertification/notification/authorization/pre-treatment exceeded.', None, None),
+        ('199', 'Revenue code and Procedure code do not match.', None, None),
+        ('200', 'Expenses incurred during lapse in coverage', None, None),
+        ('201', "Patient is responsible for amount of this claim/service through 'set aside arrangement' or other agreement. (Use only with Group Code PR)  At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)", None, None),
+        ('202', 'Non-covered personal comfort or convenience services.', None, None),
+        ('203', 'Discontinued or reduced service.', None, None),
+        ('204', "This service/equipment/drug is not covered under the patient's current benefit plan", None, None),
+        ('205', 'Pharmacy discount card processing fee', None, None),
+        ('206', 'National Provider Identifier - missing.', None, None),
+        ('207', 'National Provider identifier - Invalid format', None, None),
+        ('208', 'National Provider Identifier - Not matched.', None, None),
+        ('209', 'Per regulatory or other agreement. The provider cannot collect this amount from the patient. However, this amount may be billed to subsequent payer. Refund to patient if collected. (Use only with Group code OA)', None, None),
+        ('210', 'Payment adjusted because pre-certification/authorization not received in a timely fashion', None, None),
+        ('211', 'National Drug Codes (NDC) not eligible for rebate, are not covered.', None, None),
+        ('212', 'Administrative surcharges are not covered', None, None),
+        ('213', 'Non-compliance with the physician self referral prohibition legislation or payer policy.', None, None),
+        ('214', "Workers' Compensation claim adjudicated as non-compensable. This Payer not liable for claim or service/treatment. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Workers' Compensation only", None, None),
+        ('215', 'Based on subrogation of a third party settlement', None, None),
+        ('216', 'Based on the findings of a review organization', None, None),
+        ('217', 'Based on payer reasonable and customary fees. No maximum allowable defined by legislated fee arrangement. (Note: To be used for Property and Casualty only)', None, None),
+        ('218', "Based on entitlement to benefits. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Workers' Compensation only", None, None),
+        ('219', "Based on extent of injury. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF).", None, None),
+        ('220', 'The applicable fee schedule/fee database does not contain the billed code. Please resubmit a bill with the appropriate fee schedule/fee database code(s) that best describe the service(s) provided and supporting documentation if required. (Note: To be used for Property and Casualty only)', None, None),
+        ('221', "Claim is under investigation. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). (Note: To be used by Property & Casualty only)", None, None),
+        ('222', 'Exceeds the contracted maximum number of hours/days/units by this provider for this period. This is not patient specific. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('223', 'Adjustment code for mandated federal, state or local law/regulation that is not already covered by another code and is mandated before a new code can be created.', None, None),
+        ('224', 'Patient identification compromised by identity theft. Identity verification required for processing this and future claims.', None, None),
+        ('225', 'Penalty or Interest Payment by Payer (Only used for plan to plan encounter reporting within the 837)', None, None),
+        ('226', 'Information requested from the Billing/Rendering Provider was not provided or not provided timely or was insufficient/incomplete. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('227', 'Information requested from the patient/insured/responsible party was not provided or was insufficient/incomplete. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('228', 'Denied for failure of this provider, another provider or the subscriber to supply requested information to a previous payer for their adjudication', None, None),
+        ('229', "Partial charge amount not considered by Medicare due to the initial claim Type of Bill being 12X. Usage: This code can only be used in the 837 transaction to convey Coordination of Benefits information when the secondary payer's cost avoidance policy allows providers to bypass claim submission to a prior payer. (Use only with Group Code PR)", None, None),
+        ('230', 'No available or correlating CPT/HCPCS code to describe this service. Note: Used only by Property and Casualty.', None, None),
+        ('231', 'Mutually exclusive procedures cannot be done in the same day/setting. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('232', 'Institutional Transfer Amount. Usage: Applies to institutional claims only and explains the DRG amount difference when the patient care crosses multiple institutions.', None, None),
+        ('233', 'Services/charges related to the treatment of a hospital-acquired condition or preventable medical error.', None, None),
+        ('234', 'This procedure is not paid separately. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('235', 'Sales Tax', None, None),
+        ('236', 'This procedure or procedure/modifier combination is not compatible with another procedure or procedure/modifier combination provided on the same day according to the National Correct Coding Initiative or workers compensation state regulations/ fee schedule requirements.', None, None),
+        ('237', 'Legislated/Regulatory Penalty. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('238', 'Claim spans eligible and ineligible periods of coverage, this is the reduction for the ineligible period. (Use only with Group Code PR)', None, None),
+        ('239', 'Claim spans eligible and ineligible periods of coverage. Rebill separate claims.', None, None),
+        ('240', "The diagnosis is inconsistent with the patient's birth weight. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.", None, None),
+        ('241', 'Low Income Subsidy (LIS) Co-payment Amount', None, None),
+        ('242', 'Services not provided by network/primary care providers.', None, None),
+        ('243', 'Services not authorized by network/primary care providers.', None, None),
+        ('244', 'Payment reduced to zero due to litigation. Additional information will be sent following the conclusion of litigation. To be used for Property & Casualty only.', None, None),
+        ('245', 'Provider performance program withhold.', None, None),
+        ('246', 'This non-payable code is for required reporting only.', None, None),
+        ('247', 'Deductible for Professional service rendered in an Institutional setting and billed on an Institutional claim.', None, None),
+        ('248', 'Coinsurance for Professional service rendered in an Institutional setting and billed on an Institutional claim.', None, None),
+        ('249', 'This claim has been identified as a readmission. (Use only with Group Code CO)', None, None),
+        ('250', 'The attachment/other documentation that was received was the incorrect attachment/document. The expected attachment/document is still missing. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT).', None, None),
+        ('251', 'The attachment/other documentation that was received was incomplete or deficient. The necessary information is still needed to process the claim. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT).', None, None),
+        ('252', 'An attachment/other documentation is required to adjudicate this claim/service. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT).', None, None),
+        ('253', 'Sequestration - reduction in federal payment', None, None),
+        ('254', "Claim received by the dental plan, but benefits not available under this plan.  Submit these services to the patient's medical plan for further consideration.", None, None),
+        ('255', 'The disposition of the related Property & Casualty claim (injury or illness) is pending due to litigation. (Use only with Group Code OA)', None, None),
+        ('256', 'Service not payable per managed care contract.', None, None),
+        ('257', 'The disposition of the claim/service is undetermined during the premium payment grace period, per Health Insurance Exchange requirements. This claim/service will be reversed and corrected when the grace period ends (due to premium payment or lack of premium payment). (Use only with Group Code OA)', None, None),
+        ('258', 'Claim/service not covered when patient is in custody/incarcerated. Applicable federal, state or local authority may cover the claim/service.', None, None),
+        ('259', 'Additional payment for Dental/Vision service utilization.', None, None),
+        ('260', 'Processed under Medicaid ACA Enhanced Fee Schedule', None, None),
+        ('261', "The procedure or service is inconsistent with the patient's history.", None, None),
+        ('262', 'Adjustment for delivery cost. Usage: To be used for pharmaceuticals only.', None, None),
+        ('263', 'Adjustment for shipping cost. Usage: To be used for pharmaceuticals only.', None, None),
+        ('264', 'Adjustment for postage cost. Usage: To be used for pharmaceuticals only.', None, None),
+        ('265', 'Adjustment for administrative cost. Usage: To be used for pharmaceuticals only.', None, None),
+        ('266', 'Adjustment for compound preparation cost. Usage: To be used for pharmaceuticals only.', None, None),
+        ('267', 'Claim/service spans multiple months. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('268', 'The Claim spans two calendar years. Please resubmit one claim per calendar year.', None, None),
+        ('269', 'Anesthesia not covered for this service/procedure. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('270', "Claim received by the medical plan, but benefits not available under this plan. Submit these services to the patient's dental plan for further consideration.", None, None),
+        ('271', 'Prior contractual reductions related to a current periodic payment as part of a contractual payment schedule when deferred amounts have been previously reported. (Use only with Group Code OA)', None, None),
+        ('272', 'Coverage/program guidelines were not met.', None, None),
+        ('273', 'Coverage/program guidelines were exceeded.', None, None),
+        ('274', 'Fee/Service not payable per patient Care Coordination arrangement.', None, None),
+        ('275', "Prior payer's (or payers') patient responsibility (deductible, coinsurance, co-payment) not covered. (Use only with Group Code PR)", None, None),
+        ('276', 'Services denied by the prior payer(s) are not covered by this payer.', None, None),
+        ('277', 'The disposition of the claim/service is undetermined during the premium payment grace period, per Health Insurance SHOP Exchange requirements. This claim/service will be reversed and corrected when the grace period ends (due to premium payment or lack of premium payment). (Use only with Group Code OA)', None, None),
+        ('278', 'Performance program proficiency requirements not met. (Use only with Group Codes CO or PI) Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('279', "Services not provided by Preferred network providers. Usage: Use this code when there are member network limitations. For example, using contracted providers not in the member's 'narrow' network.", None, None),
+        ('280', "Claim received by the medical plan, but benefits not available under this plan. Submit these services to the patient's Pharmacy plan for further consideration.", None, None),
+        ('281', 'Deductible waived per contractual agreement. Use only with Group Code CO.', None, None),
+        ('282', 'The procedure/revenue code is inconsistent with the type of bill. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('283', 'Attending provider is not eligible to provide direction of care.', None, None),
+        ('284', 'Precertification/authorization/notification/pre-treatment number may be valid but does not apply to the billed services.', None, None),
+        ('285', 'Appeal procedures not followed', None, None),
+        ('286', 'Appeal time limits not met', None, None),
+        ('287', 'Referral exceeded', None, None),
+        ('288', 'Referral absent', None, None),
+        ('289', 'Services considered under the dental and medical plans, benefits not available.', None, None),
+        ('290', "Claim received by the dental plan, but benefits not available under this plan. Claim has been forwarded to the patient's medical plan for further consideration.", None, None),
+        ('291', "Claim received by the medical plan, but benefits not available under this plan. Claim has been forwarded to the patient's dental plan for further consideration.", None, None),
+        ('292', "Claim received by the medical plan, but benefits not available under this plan. Claim has been forwarded to the patient's pharmacy plan for further consideration.", None, None),
+        ('293', 'Payment made to employer.', None, None),
+        ('294', 'Payment made to attorney.', None, None),
+        ('295', 'Pharmacy Direct/Indirect Remuneration (DIR)', None, None),
+        ('296', 'Precertification/authorization/notification/pre-treatment number may be valid but does not apply to the provider.', None, None),
+        ('297', "Claim received by the medical plan, but benefits not available under this plan. Submit these services to the patient's vision plan for further consideration.", None, None),
+        ('298', "Claim received by the medical plan, but benefits not available under this plan. Claim has been forwarded to the patient's vision plan for further consideration.", None, None),
+        ('299', 'The billing provider is not eligible to receive payment for the service billed.', None, None),
+        ('300', "Claim received by the Medical Plan, but benefits not available under this plan. Claim has been forwarded to the patient's Behavioral Health Plan for further consideration.", None, None),
+        ('301', "Claim received by the Medical Plan, but benefits not available under this plan. Submit these services to the patient's Behavioral Health Plan for further consideration.", None, None),
+        ('302', 'Precertification/notification/authorization/pre-treatment time limit has expired.', None, None),
+        ('303', "Prior payer's (or payers') patient responsibility (deductible, coinsurance, co-payment) not covered for Qualified Medicare and Medicaid Beneficiaries. (Use only with Group Code CO)", None, None),
+        ('304', "Claim received by the medical plan, but benefits not available under this plan. Submit these services to the patient's hearing plan for further consideration.", None, None),
+        ('305', "Claim received by the medical plan, but benefits not available under this plan. Claim has been forwarded to the patient's hearing plan for further consideration.", None, None),
+        ('306', 'Type of bill is inconsistent with the patient status. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('A0', 'Patient refund amount.', None, None),
+        ('A1', 'Claim/Service denied. At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)  Usage: Use this code only when a more specific Claim Adjustment Reason Code is not available.', None, None),
+        ('A2', 'Contractual adjustment.', None, None),
+        ('A3', 'Medicare Secondary Payer liability met.', None, None),
+        ('A4', 'Medicare Claim PPS Capital Day Outlier Amount.', None, None),
+        ('A5', 'Medicare Claim PPS Capital Cost Outlier Amount.', None, None),
+        ('A6', 'Prior hospitalization or 30 day transfer requirement not met.', None, None),
+        ('A7', 'Presumptive Payment Adjustment', None, None),
+        ('A8', 'Ungroupable DRG.', None, None),
+        ('B1', 'Non-covered visits.', None, None),
+        ('B2', 'Covered visits.', None, None),
+        ('B3', 'Covered charges.', None, None),
+        ('B4', 'Late filing penalty.', None, None),
+        ('B5', 'Coverage/program guidelines were not met or were exceeded.', None, None),
+        ('B6', 'This payment is adjusted when performed/billed by this type of provider, by this type of provider in this type of facility, or by a provider of this specialty.', None, None),
+        ('B7', 'This provider was not certified/eligible to be paid for this procedure/service on this date of service. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('B8', 'Alternative services were available, and should have been utilized. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('B9', 'Patient is enrolled in a Hospice.', None, None),
+        ('B10', 'Allowed amount has been reduced because a component of the basic procedure/test was paid. The beneficiary is not liable for more than the charge limit for the basic procedure/test.', None, None),
+        ('B11', 'The claim/service has been transferred to the proper payer/processor for processing. Claim/service not covered by this payer/processor.', None, None),
+        ('B12', "Services not documented in patient's medical records.", None, None),
+        ('B13', 'Previously paid. Payment for this claim/service may have been provided in a previous payment.', None, None),
+        ('B14', 'Only one visit or consultation per physician per day is covered.', None, None),
+        ('B15', 'This service/procedure requires that a qualifying service/procedure be received and covered. The qualifying other service/procedure has not been received/adjudicated. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present.', None, None),
+        ('B16', "'New Patient' qualifications were not met.", None, None),
+        ('B17', 'Payment adjusted because this service was not prescribed by a physician, not prescribed prior to delivery, the prescription is incomplete, or the prescription is not current.', None, None),
+        ('B18', 'This procedure code and modifier were invalid on the date of service.', None, None),
+        ('B19', 'Claim/service adjusted because of the finding of a Review Organization.', None, None),
+        ('B20', 'Procedure/service was partially or fully furnished by another provider.', None, None),
+        ('B21', 'The charges were reduced because the service/care was partially furnished by another physician.', None, None),
+        ('B22', 'This payment is adjusted based on the diagnosis.', None, None),
+        ('B23', 'Procedure billed is not authorized per your Clinical Laboratory Improvement Amendment (CLIA) proficiency test.', None, None),
+        ('D1', 'Claim/service denied. Level of subluxation is missing or inadequate.', None, None),
+        ('D2', 'Claim lacks the name, strength, or dosage of the drug furnished.', None, None),
+        ('D3', 'Claim/service denied because information to indicate if the patient owns the equipment that requires the part or supply was missing.', None, None),
+        ('D4', 'Claim/service does not indicate the period of time for which this will be needed.', None, None),
+        ('D5', 'Claim/service denied. Claim lacks individual lab codes included in the test.', None, None),
+        ('D6', "Claim/service denied. Claim did not include patient's medical record for the service.", None, None),
+        ('D7', "Claim/service denied. Claim lacks date of patient's most recent physician visit.", None, None),
+        ('D8', "Claim/service denied. Claim lacks indicator that 'x-ray is available for review.'", None, None),
+        ('D9', 'Claim/service denied. Claim lacks invoice or statement certifying the actual cost of the lens, less discounts or the type of intraocular lens used.', None, None),
+        ('D10', 'Claim/service denied. Completed physician financial relationship form not on file.', None, None),
+        ('D11', 'Claim lacks completed pacemaker registration form.', None, None),
+        ('D12', 'Claim/service denied. Claim does not identify who performed the purchased diagnostic test or the amount you were charged for the test.', None, None),
+        ('D13', 'Claim/service denied. Performed by a facility/supplier in which the ordering/referring physician has a financial interest.', None, None),
+        ('D14', 'Claim lacks indication that plan of treatment is on file.', None, None),
+        ('D15', 'Claim lacks indication that service was supervised or evaluated by a physician.', None, None),
+        ('D16', 'Claim lacks prior payer payment information.', None, None),
+        ('D17', 'Claim/Service has invalid non-covered days.', None, None),
+        ('D18', 'Claim/Service has missing diagnosis information.', None, None),
+        ('D19', 'Claim/Service lacks Physician/Operative or other supporting documentation', None, None),
+        ('D20', 'Claim/Service missing service/product information.', None, None),
+        ('D21', 'This (these) diagnosis(es) is (are) missing or are invalid', None, None),
+        ('D22', "Reimbursement was adjusted for the reasons to be provided in separate correspondence. (Note: To be used for Workers' Compensation only) - Temporary code to be added for timeframe only until 01/01/2009. Another code to be established and/or for 06/2008 meeting for a revised code to replace or strategy to use another existing code", None, None),
+        ('D23', 'This dual eligible patient is covered by Medicare Part D per Medicare Retro-Eligibility.  At least one Remark Code must be provided (may be comprised of either the NCPDP Reject Reason Code, or Remittance Advice Remark Code that is not an ALERT.)', None, None),
+        ('P1', 'State-mandated Requirement for Property and Casualty, see Claim Payment Remarks Code for specific explanation. To be used for Property and Casualty only.', None, None),
+        ('P2', "Not a work related injury/illness and thus not the liability of the workers' compensation carrier Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Workers' Compensation only.", None, None),
+        ('P3', "Workers' Compensation case settled. Patient is responsible for amount of this claim/service through WC 'Medicare set aside arrangement' or other agreement. To be used for Workers' Compensation only. (Use only with Group Code PR)", None, None),
+        ('P4', "Workers' Compensation claim adjudicated as non-compensable. This Payer not liable for claim or service/treatment. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Workers' Compensation only", None, None),
+        ('P5', 'Based on payer reasonable and customary fees. No maximum allowable defined by legislated fee arrangement. To be used for Property and Casualty only.', None, None),
+        ('P6', "Based on entitlement to benefits. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Property and Casualty only.", None, None),
+        ('P7', 'The applicable fee schedule/fee database does not contain the billed code. Please resubmit a bill with the appropriate fee schedule/fee database code(s) that best describe the service(s) provided and supporting documentation if required. To be used for Property and Casualty only.', None, None),
+        ('P8', "Claim is under investigation. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') for the jurisdictional regulation. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF). To be used for Property and Casualty only.", None, None),
+        ('P9', 'No available or correlating CPT/HCPCS code to describe this service. To be used for Property and Casualty only.', None, None),
+        ('P10', 'Payment reduced to zero due to litigation. Additional information will be sent following the conclusion of litigation. To be used for Property and Casualty only.', None, None),
+        ('P11', 'The disposition of the related Property & Casualty claim (injury or illness) is pending due to litigation. To be used for Property and Casualty only. (Use only with Group Code OA)', None, None),
+        ('P12', "Workers' compensation jurisdictional fee schedule adjustment. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Workers' Compensation only.", None, None),
+        ('P13', "Payment reduced or denied based on workers' compensation jurisdictional regulations or payment policies, use only if no other code is applicable. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Workers' Compensation only.", None, None),
+        ('P14', 'The Benefit for this Service is included in the payment/allowance for another service/procedure that has been performed on the same day. Usage: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present. To be used for Property and Casualty only.', None, None),
+        ('P15', "Workers' Compensation Medical Treatment Guideline Adjustment. To be used for Workers' Compensation only.", None, None),
+        ('P16', "Medical provider not authorized/certified to provide treatment to injured workers in this jurisdiction. To be used for Workers' Compensation only. (Use with Group Code CO or OA)", None, None),
+        ('P17', 'Referral not authorized by attending physician per regulatory requirement. To be used for Property and Casualty only.', None, None),
+        ('P18', 'Procedure is not listed in the jurisdiction fee schedule.  An allowance has been made for a comparable service. To be used for Property and Casualty only.', None, None),
+        ('P19', 'Procedure has a relative value of zero in the jurisdiction fee schedule, therefore no payment is due. To be used for Property and Casualty only.', None, None),
+        ('P20', 'Service not paid under jurisdiction allowed outpatient facility fee schedule. To be used for Property and Casualty only.', None, None),
+        ('P21', "Payment denied based on the Medical Payments Coverage (MPC) and/or Personal Injury Protection (PIP) Benefits jurisdictional regulations, or payment policies. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.", None, None),
+        ('P22', "Payment adjusted based on the Medical Payments Coverage (MPC) and/or Personal Injury Protection (PIP) Benefits jurisdictional regulations, or payment policies. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.", None, None),
+        ('P23', 'Medical Payments Coverage (MPC) or Personal Injury Protection (PIP) Benefits jurisdictional fee schedule adjustment. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.', None, None),
+        ('P24', 'Payment adjusted based on Preferred Provider Organization (PPO).  Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty only. Use only with Group Code CO.', None, None),
+        ('P25', 'Payment adjusted based on Medical Provider Network (MPN).  Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty only. (Use only with Group Code CO).', None, None),
+        ('P26', 'Payment adjusted based on Voluntary Provider network (VPN).  Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty only. (Use only with Group Code CO).', None, None),
+        ('P27', "Payment denied based on the Liability Coverage Benefits jurisdictional regulations and/or payment policies. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.", None, None),
+        ('P28', "Payment adjusted based on the Liability Coverage Benefits jurisdictional regulations and/or payment policies. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.", None, None),
+        ('P29', 'Liability Benefits jurisdictional fee schedule adjustment. Usage: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Property and Casualty Auto only.', None, None),
+        ('P30', 'Payment denied for exacerbation when supporting documentation was not complete. To be used for Property and Casualty only.', None, None),
+        ('P31', 'Payment denied for exacerbation when treatment exceeds time allowed. To be used for Property and Casualty only.', None, None),
+        ('P32', 'Payment adjusted due to Apportionment.', None, None),
+        ('W1', "Workers' compensation jurisdictional fee schedule adjustment.  Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply.", None, None),
+        ('W2', "Payment reduced or denied based on workers' compensation jurisdictional regulations or payment policies, use only if no other code is applicable. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for Workers' Compensation only.", None, None),
+        ('W3', 'The Benefit for this Service is included in the payment/allowance for another service/procedure that has been performed on the same day. Note: Refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information REF), if present. For use by Property and Casualty only.', None, None),
+        ('W4', "Workers' Compensation Medical Treatment Guideline Adjustment.", None, None),
+        ('W5', 'Medical provider not authorized/certified to provide treatment to injured workers in this jurisdiction. (Use with Group Code CO or OA)', None, None),
+        ('W6', 'Referral not authorized by attending physician per regulatory requirement.', None, None),
+        ('W7', 'Procedure is not listed in the jurisdiction fee schedule.  An allowance has been made for a comparable service.', None, None),
+        ('W8', 'Procedure has a relative value of zero in the jurisdiction fee schedule, therefore no payment is due.', None, None),
+        ('W9', 'Service not paid under jurisdiction allowed outpatient facility fee schedule.', None, None),
+        ('Y1', "Payment denied based on Medical Payments Coverage (MPC) or Personal Injury Protection (PIP) Benefits jurisdictional regulations or payment policies, use only if no other code is applicable. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for P&C Auto only.", None, None),
+        ('Y2', "Payment adjusted based on Medical Payments Coverage (MPC) or Personal Injury Protection (PIP) Benefits jurisdictional regulations or payment policies, use only if no other code is applicable. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Insurance Policy Number Segment (Loop 2100 Other Claim Related Information REF qualifier 'IG') if the jurisdictional regulation applies. If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for P&C Auto only.", None, None),
+        ('Y3', 'Medical Payments Coverage (MPC) or Personal Injury Protection (PIP) Benefits jurisdictional fee schedule adjustment. Note: If adjustment is at the Claim Level, the payer must send and the provider should refer to the 835 Class of Contract Code Identification Segment (Loop 2100 Other Claim Related Information REF). If adjustment is at the Line Level, the payer must send and the provider should refer to the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment information REF) if the regulations apply. To be used for P&C Auto only.', None, None),
+    ],
+    'claim_adjustment_reason_groups': [
+        ('CR', 'Corrections and ReversalNote: This value is not to be used with 005010 and up.', None, None),
+        ('OA', 'Other Adjustment', None, None),
+        ('PI', 'Payer Initiated Reductions', None, None),
+        ('PR', 'Patient Responsibility', None, None),
+    ],
+    'claim_status_category_codes': [
+        ('X0', 'Supplemental Messages', '1995-01-01', '2003-10-16'),
+        ('A0', 'Acknowledgement/Forwarded-The claim/encounter has been forwarded to another entity.', '1995-01-01', None),
+        ('A1', 'Acknowledgement/Receipt-The claim/encounter has been received. This does not mean that the claim has been accepted for adjudication.', '1995-01-01', None),
+        ('A2', 'Acknowledgement/Acceptance into adjudication system-The claim/encounter has been accepted into the adjudication system.', '1995-01-01', None),
+        ('A3', 'Acknowledgement/Returned as unprocessable claim-The claim/encounter has been rejected and has not been entered into the adjudication system.', '1995-01-01', None),
+        ('A4', 'Acknowledgement/Not Found-The claim/encounter can not be found in the adjudication system.', '1995-01-01', None),
+        ('A5', 'Acknowledgement/Split Claim-The claim/encounter has been split upon acceptance into the adjudication system.', '2002-02-28', None),
+        ('A6', 'Acknowledgement/Rejected for Missing Information - The claim/encounter is missing the information specified in the Status details and has been rejected.', '2002-10-31', None),
+        ('A7', 'Acknowledgement/Rejected for Invalid Information - The claim/encounter has invalid information as specified in the Status details and has been rejected.', '2002-10-31', None),
+        ('A8', 'Acknowledgement/Rejected for relational field in error.', '2004-10-31', None),
+        ('DR01', 'Acknowledgement/Receipt - The claim/encounter has been received. This does not mean the claim has been accepted into the data reporting/processing system. Usage: Can only be used in the Data Reporting Acknowledgement Transaction.', '2018-07-01', None),
+        ('DR02', 'Acknowledgement/Acceptance into the data reporting/processing system - The claim/encounter has been accepted into the data reporting/processing system. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR03', 'Acknowledgement/Returned as unprocessable claim - The claim/encounter has been rejected and has not been entered into the data reporting/processing system. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR04', 'Acknowledgement/Not Found - The claim/encounter can not be found in the data reporting/processing system. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR05', 'Acknowledgement/Rejected for Missing Information - The claim/encounter is missing the information specified in the Status details and has been rejected. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR06', 'Acknowledgment/Rejected for invalid information - The claim/encounter has invalid information as specified in the Status details and has been rejected. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR07', 'Acknowledgement/Rejected for relational field in error. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('DR08', 'Acknowledgement/Warning - The claim/encounter has been accepted into the data reporting/processing system but has received a warning as specified in the Status details. Usage: Can only be used in the Data Reporting Acknowledgment Transaction.', '2018-07-01', None),
+        ('P0', 'Pending:  Adjudication/Details-This is a generic message about a pended claim. A pended claim is one for which no remittance advice has been issued, or only part of the claim has been paid.', '1995-01-01', None),
+        ('P1', 'Pending/In Process-The claim or encounter is in the adjudication system.', '1995-01-01', None),
+        ('P2', 'Pending/Payer Review-The claim/encounter is suspended and is pending review (e.g. medical review, repricing, Third Party Administrator processing).', '1995-01-01', None),
+        ('P3', 'Pending/Provider Requested Information - The claim or encounter is waiting for information that has already been requested from the provider. (Usage: A Claim Status Code identifying the type of information requested, must be reported)', '1995-01-01', None),
+        ('P4', 'Pending/Patient Requested Information - The claim or encounter is waiting for information that has already been requested from the patient. (Usage: A status code identifying the type of information requested must be sent)', '1995-01-01', None),
+        ('P5', 'Pending/Payer Administrative/System hold', '2006-10-31', None),
+        ('F0', 'Finalized-The claim/encounter has completed the adjudication cycle and no more action will be taken.', '1995-01-01', None),
+        ('F1', 'Finalized/Payment-The claim/line has been paid.', '1995-01-01', None),
+        ('F2', 'Finalized/Denial-The claim/line has been denied.', '1995-01-01', None),
+        ('F3', 'Finalized/Revised - Adjudication information has been changed', '2001-02-28', None),
+        ('F3F', "Finalized/Forwarded-The claim/encounter processing has been completed. Any applicable payment has been made and the claim/encounter has been forwarded to a subsequent entity as identified on the original claim or in this payer's records.", '1995-01-01', None),
+        ('F3N', 'Finalized/Not Forwarded-The claim/encounter processing has been completed. Any applicable payment has been made. The claim/encounter has NOT been forwarded to any subsequent entity identified on the original claim.', '1995-01-01', None),
+        ('F4', 'Finalized/Adjudication Complete - No payment forthcoming-The claim/encounter has been adjudicated and no further payment is forthcoming.', '1995-01-01', None),
+        ('F5', 'Finalized/Cannot Process', '1995-01-01', '2003-10-16'),
+        ('R0', "Requests for additional Information/General Requests-Requests that don't fall into other R-type categories.", '1995-01-01', None),
+        ('R1', 'Requests for additional Information/Entity Requests-Requests for information about specific entities (subscribers, patients, various providers).', '1995-01-01', None),
+        ('R3', 'Requests for additional Information/Claim/Line-Requests for information that could normally be submitted on a claim.', '1995-01-01', None),
+        ('R4', 'Requests for additional Information/Documentation-Requests for additional supporting documentation. Examples: certification, x-ray, notes.', '1995-01-01', None),
+        ('R5', 'Request for additional information/more specific detail-Additional information as a follow up to a previous request is needed. The original information was received but is inadequate. More specific/detailed information is requested.', '1995-01-01', None),
+        ('R6', 'Requests for additional information – Regulatory requirements', '2007-02-28', None),
+        ('R7', 'Requests for additional information – Confirm care is consistent with Health Plan policy coverage', '2007-02-28', None),
+        ('R8', 'Requests for additional information – Confirm care is consistent with health plan coverage exceptions', '2007-02-28', None),
+        ('R9', 'Requests for additional information – Determination of medical necessity', '2007-02-28', None),
+        ('R10', 'Requests for additional information – Support a filed grievance or appeal', '2007-02-28', None),
+        ('R11', 'Requests for additional information – Pre-payment review of claims', '2007-02-28', None),
+        ('R12', 'Requests for additional information – Clarification or justification of use for specified procedure code', '2007-02-28', None),
+        ('R13', 'Requests for additional information – Original documents submitted are not readable.  Used only for subsequent request(s).', '2007-02-28', None),
+        ('R14', 'Requests for additional information – Original documents received are not what was requested.  Used only for subsequent request(s).', '2007-02-28', None),
+        ('R15', 'Requests for additional information – Workers Compensation coverage determination.', '2007-02-28', None),
+        ('R16', 'Requests for additional information – Eligibility determination', '2007-02-28', None),
+        ('R17', 'Replacement of a Prior Request. Used to indicate that the current attachment request replaces a prior attachment request.', '2013-01-20', None),
+        ('RQ', "General Questions (Yes/No Responses)-Questions that may be answered by a simple 'yes' or 'no'.", '1995-01-01', '2008-01-01'),
+        ('E0', 'Response not possible - error on submitted request data', '1995-01-01', None),
+        ('E1', 'Response not possible - System Status', '2000-02-29', None),
+        ('E2', 'Information Holder is not responding; resubmit at a later time.', '2003-06-30', None),
+        ('E3', 'Correction required - relational fields in error.', '2010-01-24', None),
+        ('E4', 'Trading partner agreement specific requirement not met: Data correction required. (Usage: A status code identifying the type of information requested must be sent)', '2011-01-30', None),
+        ('D0', 'Data Search Unsuccessful - The payer is unable to return status on the requested claim(s) based on the submitted search criteria.', '1995-01-01', None),
+    ],
+    'claim_status_codes': [
+        ('0', 'Cannot provide further status electronically.', None, None),
+        ('1', 'Processed as Primary.', None, None),
+        ('2', 'Processed as Secondary.', None, None),
+        ('3', 'Processed as Tertiary', None, None),
+        ('4', 'Denied', None, None),
+        ('22', 'Reversal of Previous Payment', None, None),
+    ],
+    'error_reason_codes': [
+        ('01', 'Inappropriate combination of service type code and service type code descriptor.', '2017-11-01', None),
+        ('02', 'Inappropriate service type code(s)', '2017-11-01', None),
+        ('03', 'The submitted procedure code(s) is not supported.', '2017-11-01', None),
+        ('04', 'Inquiries related to procedure codes are not supported.', '2017-11-01', None),
+        ('05', 'The submitted modifier code(s) is not supported.', '2017-11-01', None),
+        ('06', 'Inquiries related to modifier codes are not supported.', '2017-11-01', None),
+        ('07', 'The submitted diagnosis code(s) is not supported.', '2017-11-01', None),
+        ('08', 'Inquiries related to diagnosis codes are not supported.', '2017-11-01', None),
+        ('09', 'Duplicate ID', '2017-11-01', '2019-08-01'),
+        ('10', 'Invalid subscriber or insured ID', '2017-11-01', None),
+        ('11', 'Missing subscriber or insured ID', '2017-11-01', None),
+        ('12', 'Missing subscriber or insured name', '2017-11-01', None),
+        ('13', 'Invalid date of death', '2017-11-01', None),
+        ('14', 'Missing date of death', '2017-11-01', None),
+        ('15', 'Missing provider name', '2017-11-01', None),
+        ('16', 'Invalid taxonomy', '2017-11-01', None),
+        ('17', 'Missing taxonomy', '2017-11-01', None),
+        ('18', 'Missing provider state', '2017-11-01', None),
+        ('19', 'Invalid referring provider ID', '2017-11-01', None),
+        ('20', 'Missing referring provider ID', '2017-11-01', None),
+        ('21', "The request date(s) is not within the provider's plan enrollment period.", '2017-11-01', None),
+        ('22', 'The request date(s) precedes the date of birth.', '2017-11-01', None),
+        ('23', 'The date of death in our records precedes the request date(s).', '2017-11-01', None),
+        ('24', 'The request date(s) is not within the allowable inquiry period.', '2017-11-01', None),
+        ('25', 'The request date(s) is in the future.', '2017-11-01', None),
+        ('26', 'Invalid request date(s)', '2017-11-01', None),
+        ('27', 'Invalid patient ID', '2017-11-01', None),
+        ('28', 'Missing patient ID', '2017-11-01', None),
+        ('29', 'Missing patient name', '2017-11-01', None),
+        ('30', 'Invalid case number', '2017-11-01', None),
+        ('31', 'Missing case number', '2017-11-01', None),
+        ('32', 'Invalid provider address', '2017-11-01', None),
+        ('33', 'Missing provider address', '2017-11-01', None),
+        ('34', 'The referral number was not found.', '2017-11-01', None),
+        ('35', 'Invalid diagnosis code(s)', '2017-11-01', None),
+        ('36', 'Missing diagnosis code(s)', '2017-11-01', None),
+        ('37', 'Invalid procedure code(s)', '2017-11-01', None),
+        ('38', 'Missing procedure code(s)', '2017-11-01', None),
+        ('39', 'Invalid modifier code(s)', '2017-11-01', None),
+        ('40', 'Missing modifier code(s)', '2017-11-01', None),
+        ('41', 'Invalid authorization number', '2017-11-01', None),
+        ('42', 'Invalid referral number', '2017-11-01', None),
+        ('43', 'Missing referral number', '2017-11-01', None),
+        ('44', 'The authorized quantity of patient requests was exceeded.', '2017-11-01', None),
+        ('45', 'The provider is out of network for the member.', '2017-11-01', None),
+        ('46', 'The responding system is unable to complete the request at the current time.', '2017-11-01', None),
+        ('47', 'The provider ID does not match our records and we were not able to identify the provider.', '2017-11-01', None),
+        ('48', 'Inappropriate combination of qualifier and product or service code.', '2017-11-01', None),
+        ('49', 'Inappropriate combination of provider ID and taxonomy.', '2017-11-01', None),
+        ('50', 'Inappropriate combination of place of service and product or service code.', '2017-11-01', None),
+        ('51', 'Duplicate patient ID', '2017-11-01', '2019-08-01'),
+        ('52', "The service is inconsistent with the patient's age.", '2017-11-01', None),
+        ('53', "The diagnosis is inconsistent with the patient's age.", '2017-11-01', None),
+        ('54', "The patient's date of birth does not match our records.", '2017-11-01', None),
+        ('55', 'The subscriber or insured was not found.', '2017-11-01', None),
+        ('56', 'The subscriber ID or insured ID is not unique (returns multiple matches) in our records.', '2017-11-01', '2019-08-01'),
+        ('57', 'Although the subscriber was found, the patient was not found.', '2017-11-01', None),
+        ('58', 'The submitted group or plan does not match our records.', '2017-11-01', None),
+        ('59', "A response was not received from the information source's system.", '2017-11-01', None),
+        ('60', 'The submitted services are inconsistent with the submitted diagnosis code(s).', '2017-11-01', None),
+        ('61', 'Invalid provider ID', '2017-11-01', None),
+        ('62', 'Missing provider ID', '2017-11-01', None),
+        ('63', 'This service is not medically appropriate for this patient.', '2017-11-01', None),
+        ('64', 'The submitted authorization number does not match our records.', '2017-11-01', None),
+        ('65', 'Invalid date of birth', '2017-11-01', None),
+        ('66', 'Missing date of birth', '2017-11-01', None),
+        ('67', 'Missing gender code', '2017-11-01', None),
+        ('68', 'The provider ID does not match our records but we were able to identify the provider.', '2017-11-01', None),
+        ('69', 'Invalid member ID', '2017-11-01', None),
+        ('70', 'The responding system is unable to respond within the alloted time.', '2017-11-01', None),
+        ('71', 'Missing last name', '2017-11-01', None),
+        ('72', 'Missing first name', '2017-11-01', None),
+        ('73', 'Missing member ID', '2017-11-01', None),
+        ('74', 'The member ID does not match our records.', '2017-11-01', None),
+        ('75', 'The gender code does not match our records.', '2017-11-01', None),
+        ('76', 'The first name does not match our records.', '2017-11-01', None),
+        ('77', 'The last name does not match our records.', '2017-11-01', None),
+        ('78', 'The middle name does not match our records.', '2017-11-01', None),
+        ('79', 'Invalid name suffix', '2017-11-01', None),
+        ('80', 'Missing name suffix', '2017-11-01', None),
+        ('81', 'The name suffix does not match our records.', '2017-11-01', None),
+        ('82', 'There were duplicates within the minimum number of service types supported (ten), so there are fewer than ten responses.', '2017-11-01', None),
+        ('83', 'There were duplicate service type inquiries so the number of responses does not match the number of inquiries.', '2017-11-01', None),
+        ('84', 'The number of service type inquiries exceeds the number of responses we can return.', '2017-11-01', None),
+        ('85', 'We have responded with general benefit information, however the submitted procedure code requires separate medical review.', '2017-11-01', None),
+        ('86', 'We have responded, however the submitted procedure code requires separate medical review and prior authorization.', '2017-11-01', None),
+        ('87', 'We have responded with general benefit information, however the submitted service type code requires separate medical review.', '2017-11-01', None),
+        ('88', 'We have responded, however the submitted service type code requires separate medical review and prior authorization.', '2017-11-01', None),
+        ('89', 'Invalid group number', '2017-11-01', None),
+        ('90', 'Missing group number', '2017-11-01', None),
+        ('91', 'The responding system cannot process this real-time inquiry in real-time mode.', '2017-11-01', None),
+        ('92', 'Duplicate first name', '2018-08-24', None),
+        ('93', 'Duplicate last name', '2018-08-24', None),
+        ('94', 'Duplicate date of birth', '2018-08-24', None),
+        ('95', 'Duplicate policy(s)', '2018-08-24', None),
+        ('96', 'A date range greater than 12 months is not supported.', '2018-08-24', None),
+        ('97', 'The date range of the inquiry exceeds the period of time supported.', '2018-08-24', None),
+        ('98', 'The member ID is not unique (returns multiple matches) in our records.', '2019-08-01', None),
+        ('99', 'Inappropriate combination of service type codes', '2019-08-01', None),
+        ('100', 'Service type code(s) on this request is valid only for responses and is not valid on requests.', '2019-08-01', None),
+        ('101', 'The provider ID does match our records but has not met the eligibility requirements to send or receive this transaction.', '2019-08-01', None),
+        ('102', 'Benefit utilization information for this response, such as remaining or accumulator amounts, is restricted by the responding system.', '2019-10-01', None),
+        ('103', 'Information source is not responding; clearinghouse/intermediary has temporarily suspended request submissions.', '2021-07-01', None),
+        ('104', "Information Source's system encountered errors preventing benefit related information from being returned.", '2021-07-01', None),
+        ('105', "Information Source's system encountered errors preventing eligibility, coverage and/or policy related information from being returned.", '2021-07-01', None),
+    ],
+    'insurance_business_process_application_error_codes': [
+        ('E001', 'Missing/Invalid submitter identifier', None, None),
+        ('W001', 'Missing/Invalid submitter identifier', None, None),
+        ('E002', 'Missing/Invalid receiver identifier', None, None),
+        ('W002', 'Missing/Invalid receiver identifier', None, None),
+        ('E003', 'Missing/Invalid member identifier', None, None),
+        ('W003', 'Missing/Invalid member identifier', None, None),
+        ('E004', 'Missing/Invalid subscriber identifier', None, None),
+        ('W004', 'Missing/Invalid subscriber identifier', None, None),
+        ('E005', 'Missing/Invalid patient identifier', None, None),
+        ('W005', 'Missing/Invalid patient identifier', None, None),
+        ('E006', 'Missing/Invalid plan sponsor identifier', None, None),
+        ('W006', 'Missing/Invalid plan sponsor identifier', None, None),
+        ('E007', 'Missing/invalid payee identifier', None, None),
+        ('W007', 'Missing/invalid payee identifier', None, None),
+        ('E008', 'Missing/Invalid TPA/broker identifier', None, None),
+        ('W008', 'Missing/Invalid TPA/broker identifier', None, None),
+        ('E009', 'Missing/Invalid premium receiver identifier', None, None),
+        ('W009', 'Missing/Invalid premium receiver identifier', None, None),
+        ('E010', 'Missing/Invalid premium payer identifier', None, None),
+        ('W010', 'Missing/Invalid premium payer identifier', None, None),
+        ('E011', 'Missing/Invalid payer identifier', None, None),
+        ('W011', 'Missing/Invalid payer identifier', None, None),
+        ('E012', 'Missing/Invalid billing provider identifier', None, None),
+        ('W012', 'Missing/Invalid billing provider identifier', None, None),
+        ('E013', 'Missing/Invalid pay to provider identifier', None, None),
+        ('W013', 'Missing/Invalid pay to provider identifier', None, None),
+        ('E014', 'Missing/Invalid rendering provider identifier', None, None),
+        ('W014', 'Missing/Invalid rendering provider identifier', None, None),
+        ('E015', 'Missing/Invalid supervising provider identifier', None, None),
+        ('W015', 'Missing/Invalid supervising provider identifier', None, None),
+        ('E016', 'Missing/Invalid attending provider identifier', None, None),
+        ('W016', 'Missing/Invalid attending provider identifier', None, None),
+        ('E017', 'Missing/Invalid other provider identifier', None, None),
+        ('W017', 'Missing/Invalid other provider identifier', None, None),
+        ('E018', 'Missing/Invalid operating provider identifier', None, None),
+        ('W018', 'Missing/Invalid operating provider identifier', None, None),
+        ('E019', 'Missing/Invalid referring provider identifier', None, None),
+        ('W019', 'Missing/Invalid referring provider identifier', None, None),
+        ('E020', 'Missing/Invalid purchased service provider identifier', None, None),
+        ('W020', 'Missing/Invalid purchased service provider identifier', None, None),
+        ('E021', 'Missing/Invalid service facility identifier', None, None),
+        ('W021', 'Missing/Invalid service facility identifier', None, None),
+        ('E022', 'Missing/Invalid ordering provider identifier', None, None),
+        ('W022', 'Missing/Invalid ordering provider identifier', None, None),
+        ('E023', 'Missing/Invalid assistant surgeon identifier', None, None),
+        ('W023', 'Missing/Invalid assistant surgeon identifier', None, None),
+        ('E024', 'Amount/Quantity out of balance', None, None),
+        ('W024', 'Amount/Quantity out of balance', None, None),
+        ('E025', 'Duplicate', None, None),
+        ('W025', 'Duplicate', None, None),
+        ('E026', 'Billing date predates service date', None, None),
+        ('W026', 'Billing date predates service date', None, None),
+        ('E027', 'Business application currently not available', None, None),
+        ('W027', 'Business application currently not available', None, None),
+        ('E028', 'Sender not authorized for this transaction', None, None),
+        ('W028', 'Sender not authorized for this transaction', None, None),
+        ('E029', 'Number of errors exceeds permitted threshold', None, None),
+        ('W029', 'Number of errors exceeds permitted threshold', None, None),
+        ('E030', 'Required loop missing', None, None),
+        ('W030', 'Required loop missing', None, None),
+        ('E031', 'Required segment missing', None, None),
+        ('W031', 'Required segment missing', None, None),
+        ('E032', 'Required element missing', None, None),
+        ('W032', 'Required element missing', None, None),
+        ('E033', 'Situational required loop is missing', None, None),
+        ('W033', 'Situational required loop is missing', None, None),
+        ('E034', 'Situational required segment is missing', None, None),
+        ('W034', 'Situational required segment is missing', None, None),
+        ('E035', 'Situational required element is missing', None, None),
+        ('W035', 'Situational required element is missing', None, None),
+        ('E036', 'Data too long', None, None),
+        ('W036', 'Data too long', None, None),
+        ('E037', 'Data too short', None, None),
+        ('W037', 'Data too short', None, None),
+        ('E038', 'Invalid external code value', None, None),
+        ('W038', 'Invalid external code value', None, None),
+        ('E039', 'Data value out of sequence', None, None),
+        ('W039', 'Data value out of sequence', None, None),
+        ('E040', '"Not Used" data element present', None, None),
+        ('W040', '"Not Used" data element present', None, None),
+        ('E041', 'Too many sub-elements in composite', None, None),
+        ('W041', 'Too many sub-elements in composite', None, None),
+        ('E042', 'Unexpected segment', None, None),
+        ('W042', 'Unexpected segment', None, None),
+        ('E043', 'Missing data', None, None),
+        ('W043', 'Missing data', None, None),
+        ('E044', 'Out of range', None, None),
+        ('W044', 'Out of range', None, None),
+        ('E045', 'Invalid date', None, None),
+        ('W045', 'Invalid date', None, None),
+        ('E046', 'Not matching', None, None),
+        ('W046', 'Not matching', None, None),
+        ('E047', 'Invalid combination', None, None),
+        ('W047', 'Invalid combination', None, None),
+        ('E048', 'Customer identification number does not exist', None, None),
+        ('W048', 'Customer identification number does not exist', None, None),
+        ('E049', 'Duplicate batch', None, None),
+        ('W049', 'Duplicate batch', None, None),
+        ('E050', 'Incorrect data', None, None),
+        ('W050', 'Incorrect data', None, None),
+        ('E051', 'Incorrect date', None, None),
+        ('W051', 'Incorrect date', None, None),
+        ('E052', 'Duplicate transmission', None, None),
+        ('W052', 'Duplicate transmission', None, None),
+        ('E053', 'Invalid claim amount', None, None),
+        ('W053', 'Invalid claim amount', None, None),
+        ('E054', 'Invalid identification code', None, None),
+        ('W054', 'Invalid identification code', None, None),
+        ('E055', 'Missing or invalid issuer identification', None, None),
+        ('W055', 'Missing or invalid issuer identification', None, None),
+        ('E056', 'Missing or invalid item quantity', None, None),
+        ('W056', 'Missing or invalid item quantity', None, None),
+        ('E057', 'Missing or invalid item identification', None, None),
+        ('W057', 'Missing or invalid item identification', None, None),
+        ('E058', 'Missing or unauthorized transaction type code', None, None),
+        ('W058', 'Missing or unauthorized transaction type code', None, None),
+        ('E059', 'Unknown claim number', None, None),
+        ('W059', 'Unknown claim number', None, None),
+        ('E060', 'Bin segment contentes not in MIME format', None, None),
+        ('W060', 'Bin segment contents not in MIME format', None, None),
+        ('E061', 'Missing/invalid MIME header', None, None),
+        ('W061', 'Missing/Invalid MIME header', None, None),
+        ('E062', 'Missing/Invalid MIME boundary', None, None),
+        ('W062', 'Missing/Invalid MIME boundary', None, None),
+        ('E063', 'Missing/Invalid MIME transfer encoding', None, None),
+        ('W063', 'Missing/Invalid MIME transfer encoding', None, None),
+        ('E064', 'Missing/Invalid MIME content type', None, None),
+        ('W064', 'Missing/Invalid MIME content type', None, None),
+        ('E065', 'Missing/Invalid MIME content disposition (filename)', None, None),
+        ('W065', 'Missing/Invalid MIME content disposition (filename)', None, None),
+        ('E066', 'Missing/Invalid file name extension', None, None),
+        ('W066', 'Missing/Invalid file name extension', None, None),
+        ('E067', 'Invalid MIME base64 encoding', None, None),
+        ('W067', 'Invalid MIME base64 encoding', None, None),
+        ('E068', 'Invalid MIME quoted-printable encoding', None, None),
+        ('W068', 'Invalid MIME quoted-printable encoding', None, None),
+        ('E069', 'Missing/Invalid MIME line terminator (should be CR+LF)', None, None),
+        ('W069', 'Missing/Invalid MIME line terminator (should be CR+LF)', None, None),
+        ('E070', 'Missing/Invalid "end of MIME" headers', None, None),
+        ('W070', 'Missing/Invalid "end of MIME" headers', None, None),
+        ('E071', 'Missing/Invalid CDA in first MIME body parts', None, None),
+        ('W071', 'Missing/Invalid CDA in first MIME body parts', None, None),
+        ('E072', 'Missing/Invalid XML tag', None, None),
+        ('W072', 'Missing/Invalid XML tag', None, None),
+        ('E073', 'Unrecoverable XML error', None, None),
+        ('W073', 'Unrecoverable XML error', None, None),
+        ('E074', 'Invalid Data format for HL7 data type', None, None),
+        ('W074', 'Invalid Data format for HL7 data type', None, None),
+        ('E075', 'Missing/Invalid required LOINC answer part(s) in the CDA', None, None),
+        ('W075', 'Missing/Invalid required LOINC answer part(s) in the CDA', None, None),
+        ('E076', 'Missing/Invalid Provider information in the CDA', None, None),
+        ('W076', 'Missing/Invalid Provider information in the CDA', None, None),
+        ('E077', 'Missing/Invalid Patient information in the CDA', None, None),
+        ('W077', 'Missing/Invalid Patient information in the CDA', None, None),
+        ('E078', 'Missing/Invalid Attachment Control information in the CDA', None, None),
+        ('W078', 'Missing/Invalid Attachment Control information in the CDA', None, None),
+        ('E079', 'Missing/Invalid LOINC', None, None),
+        ('W079', 'Missing/Invalid LOINC', None, None),
+        ('E080', 'Missing/Invalid LOINC Modifier', None, None),
+        ('W080', 'Missing/Invalid LOINC Modifier', None, None),
+        ('E081', 'Missing/Invalid LOINC code for this attachment type', None, None),
+        ('W081', 'Missing/Invalid LOINC code for this attachment type', None, None),
+        ('E082', 'Missing/Invalid LOINC Modifier for this attachment type', None, None),
+        ('W082', 'Missing/Invalid LOINC Modifier for this attachment type', None, None),
+        ('E083', 'Situational prohibited element is present', None, None),
+        ('W083', 'Situational prohibited element is present', None, None),
+        ('E084', 'Duplicate qualifier value in repeated segment within a single loop', None, None),
+        ('W084', 'Duplicate qualifier value in repeated segment within a single loop', None, None),
+        ('E085', 'Situational required composite element is missing', None, None),
+        ('W085', 'Situational required composite element is missing', None, None),
+        ('E086', 'Situational required repeating element is missing', None, None),
+        ('W086', 'Situational required repeating element is missing', None, None),
+        ('E087', 'Situational prohibited loop is present', None, None),
+        ('W087', 'Situational prohibited loop is present', None, None),
+        ('E088', 'Situational prohibited segment is present', None, None),
+        ('W088', 'Situational prohibited segment is present', None, None),
+        ('E089', 'Situational prohibited composite element is present', None, None),
+        ('W089', 'Situational prohibited composite element is present', None, None),
+        ('E090', 'Situational prohibited repeating element is present', None, None),
+        ('W090', 'Situational prohibited repeating element is present', None, None),
+        ('E091', 'Transaction successfully received but not processed as applicable business function not performed.', None, None),
+        ('W091', 'Transaction successfully received but not processed as applicable business function not performed.', None, None),
+        ('E092', 'Missing/Invalid required SNOMED CT answer part(s) in the CDA', None, None),
+        ('W092', 'Missing/Invalid required SNOMED CT answer part(s) in the CDA', None, None),
+        ('E093', 'Matching Policy Information/Document not found.', None, None),
+        ('W093', 'Matching Policy Information/Document not found.', None, None),
+        ('E094', 'Financial Assistance not permitted across multiple marketplaces - Double Dip Check Edit Identified.', None, None),
+        ('W094', 'Financial Assistance not permitted across multiple marketplaces - Double Dip Check Edit Identified.', None, None),
+        ('E095', 'Business Process transaction out of sequence.', None, None),
+        ('W095', 'Business Process transaction out of sequence.', None, None),
+        ('E096', 'Advanced Premium Tax Credit is more than Total Premium.', None, None),
+        ('W096', 'Advanced Premium Tax Credit is more than Total Premium.', None, None),
+        ('E097', 'Marketplace, Off Market Variant.', None, None),
+        ('W097', 'Marketplace, Off Market Variant.', None, None),
+        ('E098', 'Maintenance Type Code', None, None),
+        ('W098', 'Maintenance Type Code', None, None),
+        ('E099', 'Maintenance Reason Code', None, None),
+        ('W099', 'Maintenance Reason Code', None, None),
+        ('E100', 'Additional Maintenance Reason Code', None, None),
+        ('W100', 'Additional Maintenance Reason Code', None, None),
+        ('E101', 'Enrollment Group member(s) count on transaction does not match Enrollment Group member(s) count found on file of record', None, None),
+        ('W101', 'Enrollment Group member(s) count on transaction does not match Enrollment Group member(s) count found on file of record', None, None),
+        ('E102', 'Effective', None, None),
+        ('W102', 'Effective', None, None),
+        ('E103', 'Advanced Payment for Tax Credit (APTC)', None, None),
+        ('W103', 'Advanced Payment for Tax Credit (APTC)', None, None),
+        ('E104', 'Total Individual Responsibility Amount', None, None),
+        ('W104', 'Total Individual Responsibility Amount', None, None),
+        ('E105', 'Other Payment Amount 1', None, None),
+        ('W105', 'Other Payment Amount 1', None, None),
+        ('E106', 'Other Payment Amount 2', None, None),
+        ('W106', 'Other Payment Amount 2', None, None),
+        ('E107', 'Total Premium Amount', None, None),
+        ('W107', 'Total Premium Amount', None, None),
+        ('E108', 'Individual Premium Amount', None, None),
+        ('W108', 'Individual Premium Amount', None, None),
+        ('E109', 'Total Employer Responsibility Amount', None, None),
+        ('W109', 'Total Employer Responsibility Amount', None, None),
+        ('E110', 'Financial Date Precedes Premium Date', None, None),
+        ('W110', 'Financial Date Precedes Premium Date', None, None),
+        ('E111', 'Exceeds Unique', None, None),
+        ('W111', 'Exceeds Unique', None, None),
+        ('E112', 'Exceeds Allowable Changes', None, None),
+        ('W112', 'Exceeds Allowable Changes', None, None),
+        ('E113', 'Cost Sharing Reduction (CSR) Date precedes the Total Premium Amount Effective', None, None),
+        ('W113', 'Cost Sharing Reduction (CSR) Date precedes the Total Premium Amount Effective', None, None),
+        ('E114', 'Renewal Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('W114', 'Renewal Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('E115', 'Financial Amounts Unchanged by newly reported data', None, None),
+        ('W115', 'Financial Amounts Unchanged by newly reported data', None, None),
+        ('E116', 'Effective', None, None),
+        ('W116', 'Effective', None, None),
+        ('E117', 'Duplicate Payment of Advanced Premium Tax Credit', None, None),
+        ('W117', 'Duplicate Payment of Advanced Premium Tax Credit', None, None),
+        ('E118', 'Duplicate Payment of Cost Sharing Reduction', None, None),
+        ('W118', 'Duplicate Payment of Cost Sharing Reduction', None, None),
+        ('E119', 'Duplicate Payment of User Fee', None, None),
+        ('W119', 'Duplicate Payment of User Fee', None, None),
+        ('E120', 'Missing Payment of Advanced Premium Tax Credit', None, None),
+        ('W120', 'Missing Payment of Advanced Premium Tax Credit', None, None),
+        ('E121', 'Missing Payment of Cost Sharing Reduction', None, None),
+        ('W121', 'Missing Payment of Cost Sharing Reduction', None, None),
+        ('E122', 'Missing Payment of User Fee', None, None),
+        ('W122', 'Missing Payment of User Fee', None, None),
+        ('E123', 'Advanced Premium Tax Credit (APTC) Payment Mismatch - The Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM) APTC amount and the Health Plan APTC amount are equal but do not match the APTC payment amount received', None, None),
+        ('W123', 'Advanced Premium Tax Credit (APTC) Payment Mismatch - The Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM) APTC amount and the Health Plan APTC amount are equal but do not match the APTC payment amount received', None, None),
+        ('E124', 'Cost Shared Reduction (CSR) Payment Mismatch - The Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM) CSR amount and the Health Plan CSR amount are equal but do not match the CSR payment amount received', None, None),
+        ('W124', 'Cost Shared Reduction (CSR) Payment Mismatch - The Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM) CSR amount and the Health Plan CSR amount are equal but do not match the CSR payment amount received', None, None),
+        ('E125', 'User Fee Payment Mismatch - The calculated Federally Facilitated Marketplace (FFM) User Fee amount and the calculated Health Plan User Fee amount are equal but do not match the User Fee payment amount received', None, None),
+        ('W125', 'User Fee Payment Mismatch - The calculated Federally Facilitated Marketplace (FFM) User Fee amount and the calculated Health Plan User Fee amount are equal but do not match the User Fee payment amount received', None, None),
+        ('E126', 'Effectuation Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('W126', 'Effectuation Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('E127', 'Cancel Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('W127', 'Cancel Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('E128', 'Termination Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('W128', 'Termination Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('E129', 'Maintenance Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('W129', 'Maintenance Transaction cannot be processed as it is outside of allocated time period', None, None),
+        ('E130', 'Policy level cancel/terminations shall not contain health coverage information', None, None),
+        ('W130', 'Policy level cancel/terminations shall not contain health coverage information', None, None),
+        ('E131', 'Dependent/Member not included in current coverage', None, None),
+        ('W131', 'Dependent/Member not included in current coverage', None, None),
+        ('E132', 'The data in the transaction does not match the exchange/marketplace type', None, None),
+        ('W132', 'The data in the transaction does not match the exchange/marketplace type', None, None),
+        ('E133', 'Policy Cancelled - cannot be processed', None, None),
+        ('W133', 'Policy Cancelled - cannot be processed', None, None),
+        ('E134', 'Policy Non-Effectuated - cannot be processed', None, None),
+        ('W134', 'Policy Non-Effectuated - cannot be processed', None, None),
+        ('E135', 'Policy ID', None, None),
+        ('W135', 'Policy ID', None, None),
+        ('E136', 'Subscriber ID', None, None),
+        ('W136', 'Subscriber ID', None, None),
+        ('E137', 'Member ID', None, None),
+        ('W137', 'Member ID', None, None),
+        ('E138', 'No Longer Eligible (NLE)', None, None),
+        ('W138', 'No Longer Eligible (NLE)', None, None),
+        ('E139', 'Exchange Assigned', None, None),
+        ('W139', 'Exchange Assigned', None, None),
+        ('E140', 'Issuer Assigned', None, None),
+        ('W140', 'Issuer Assigned', None, None),
+        ('E141', 'Issuer Prior Assigned', None, None),
+        ('W141', 'Issuer Prior Assigned', None, None),
+        ('E142', 'Action results already match current information on file', None, None),
+        ('W142', 'Action results already match current information on file', None, None),
+        ('E143', 'Action results do not match current information on file', None, None),
+        ('W143', 'Action results do not match current information on file', None, None),
+        ('E144', 'Cancellation Transaction', None, None),
+        ('W144', 'Cancellation Transaction', None, None),
+        ('E145', 'Initial Enrollment Transaction', None, None),
+        ('W145', 'Initial Enrollment Transaction', None, None),
+        ('E146', 'Maintenance Transaction', None, None),
+        ('W146', 'Maintenance Transaction', None, None),
+        ('E147', 'Reinstatement Transaction', None, None),
+        ('W147', 'Reinstatement Transaction', None, None),
+        ('E148', 'Termination Transaction', None, None),
+        ('W148', 'Termination Transaction', None, None),
+        ('E149', 'Email Address', None, None),
+        ('W149', 'Email Address', None, None),
+        ('E150', 'Mailing Address', None, None),
+        ('W150', 'Mailing Address', None, None),
+        ('E151', 'Telephone Number', None, None),
+        ('W151', 'Telephone Number', None, None),
+        ('E152', 'Consumer executed voluntary withdrawal of coverage', None, None),
+        ('W152', 'Consumer executed voluntary withdrawal of coverage', None, None),
+        ('E153', 'Unable to be processed causing a gap or overlap in coverage dates', None, None),
+        ('W153', 'Unable to be processed causing a gap or overlap in coverage dates', None, None),
+        ('E154', 'Invoke the Enrollment Resolution and Reconciliation (ER&R) manual process', None, None),
+        ('W154', 'Invoke the Enrollment Resolution and Reconciliation (ER&R) manual process', None, None),
+        ('E155', 'Marketplace Coverage in Effect', None, None),
+        ('W155', 'Marketplace Coverage in Effect', None, None),
+        ('E156', 'Reinstatement transaction cannot be processed as it is outside of the allocated time period', None, None),
+        ('W156', 'Reinstatement transaction cannot be processed as it is outside of the allocated time period', None, None),
+        ('E157', 'Coverage', None, None),
+        ('W157', 'Coverage', None, None),
+        ('E158', 'Coverage End Date', None, None),
+        ('W158', 'Coverage End Date', None, None),
+        ('E159', 'Dependent/Member shall not be included in Policy Level', None, None),
+        ('W159', 'Dependent/Member shall not be included in Policy Level', None, None),
+        ('E160', 'One day coverage', None, None),
+        ('W160', 'One day coverage', None, None),
+        ('E161', 'Invalid', None, None),
+        ('W161', 'Invalid', None, None),
+        ('E162', 'Eligibility Begin Date', None, None),
+        ('W162', 'Eligibility Begin Date', None, None),
+        ('E163', 'Associated submission not found', None, None),
+        ('W163', 'Associated submission not found', None, None),
+        ('E164', 'Exceeds Receiver Allowed Occurrences', None, None),
+        ('W164', 'Exceeds Receiver Allowed Occurrences', None, None),
+        ('E165', 'HL7 US Realm Header Legal Authenticator data is missing', None, None),
+        ('W165', 'HL7 US Realm Header Legal Authenticator data is missing', None, None),
+        ('E166', 'HL7 US Realm Header Author data is missing', None, None),
+        ('W166', 'HL7 US Realm Header Author data is missing', None, None),
+        ('E167', 'HL7 US Realm Header SetID data is missing', None, None),
+        ('W167', 'HL7 US Realm Header SetID data is missing', None, None),
+        ('E168', 'HL7 US Realm Header VersionNumber data is missing', None, None),
+        ('W168', 'HL7 US Realm Header VersionNumber data is missing', None, None),
+        ('E169', 'HL7 C-CDA Structured document sections name data is missing', None, None),
+        ('W169', 'HL7 C-CDA Structured document sections name data is missing', None, None),
+        ('E170', 'HL7 C-CDA Structured document sections title data is missing', None, None),
+        ('W170', 'HL7 C-CDA Structured document sections title data is missing', None, None),
+        ('E171', 'HL7 C-CDA Structured document narrative block (text) data is missing', None, None),
+        ('W171', 'HL7 C-CDA Structured document narrative block (text) data is missing', None, None),
+        ('E172', 'HL7 C-CDA Unstructured document LOINC Code is missing', None, None),
+        ('W172', 'HL7 C-CDA Unstructured document LOINC Code is missing', None, None),
+        ('E173', 'HL7 C-CDA Unstructured document contained a reference to a URL or URI', None, None),
+        ('W173', 'HL7 C-CDA Unstructured document contained a reference to a URL or URI', None, None),
+        ('E174', 'HL7 C-CDA Unstructured document @mediaType (MIME type) is missing', None, None),
+        ('W174', 'HL7 C-CDA Unstructured document @mediaType (MIME type) is missing', None, None),
+        ('E175', 'HL7 C-CDA Unstructured document included more than 1 @mediaType (MIME type)', None, None),
+        ('W175', 'HL7 C-CDA Unstructured document included more than 1 @mediaType (MIME type)', None, None),
+        ('E176', 'HL7 C-CDA Unstructured document Base64 encoding does not meet the RFC 4648 requirements', None, None),
+        ('W176', 'HL7 C-CDA Unstructured document Base64 encoding does not meet the RFC 4648 requirements', None, None),
+        ('E177', 'HL7 C-CDA Unstructured document compression does not meet the RFC 1951 requirements', None, None),
+        ('W177', 'HL7 C-CDA Unstructured document compression does not meet the RFC 1951 requirements', None, None),
+        ('E178', 'HL7 C-CDA LOINC code does not match the LOINC code in the request', None, None),
+        ('W178', 'HL7 C-CDA LOINC code does not match the LOINC code in the request', None, None),
+        ('E179', 'HL7 Attachment Control Number is missing', None, None),
+        ('W179', 'HL7 Attachment Control Number is missing', None, None),
+        ('E180', 'Missing Billing provider affiliation for the Rendering provider(s).', None, None),
+        ('W180', 'Missing Billing provider affiliation for the Rendering provider(s).', None, None),
+        ('E181', 'Invalid affiliation between Rendering and Billing providers.', None, None),
+        ('W181', 'Invalid affiliation between Rendering and Billing providers.', None, None),
+        ('E182', 'System Delay-No Additional Action Required', None, None),
+        ('W182', 'System Delay-No Additional Action Required', None, None),
+        ('E183', 'System Delay-Resubmission Required', None, None),
+        ('W183', 'System Delay-Resubmission Required', None, None),
+        ('E184', "Fully Subsidized Policy - Policy's total premium is provided for by the Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM)", None, None),
+        ('W184', "Fully Subsidized Policy - Policy's total premium is provided for by the Federally Facilitated Marketplace (FFM) or State Based Marketplace (SBM)", None, None),
+    ],
+    'insurance_descriptor_codes': [
+        ('01', 'Short Term Insurance', None, None),
+        ('D', 'Disability Insurance', None, None),
+        ('M', 'Medicare Advantage Point of Service (POS) Plan that excludes Part D coverage', None, None),
+        ('12', 'Medicare is secondary, Working Aged Beneficiary or Spouse with employer group health plan is primary', None, None),
+        ('13', "Medicare is secondary, End-Stage Renal Disease Beneficiary in the mandated coordination period with an employer's group health plan is primary", None, None),
+        ('14', 'Medicare is secondary, no-fault insurance, including auto, is primary', None, None),
+        ('15', "Medicare is secondary, Worker's Compensation is primary", None, None),
+        ('16', 'Medicare is secondary, Public Health Service (PHS) or Other Federal Agency is primary', None, None),
+        ('17', 'Dental Insurance', None, None),
+        ('18', 'Vision Insurance', None, None),
+        ('19', 'Prescription Drug Insurance', None, None),
+        ('41', 'Medicare is secondary, Black Lung is primary', None, None),
+        ('42', "Medicare is secondary, Veteran's Administration is primary", None, None),
+        ('43', 'Medicare is secondary, Disabled Beneficiary Under Age 65 with a large group health plan (LGHP) is primary', None, None),
+        ('47', 'Medicare is secondary, other liability insurance is primary', None, None),
+        ('48', 'Medicaid', None, None),
+        ('49', 'Medicare and Medicaid Dual Eligible', None, None),
+        ('AP', 'Automobile Insurance', None, None),
+        ('C1', 'Commercial Insurance', None, None),
+        ('CO', 'Beneficiary is under Consolidated Omnibus Budget Reconciliation Act (COBRA) coverage', None, None),
+        ('EP', 'Exclusive Provider Organization (EPO) Plan', None, None),
+        ('HB', 'Health Insurance Exchange (HIX) Bronze', None, None),
+        ('HD', 'High Deductible Health Plan (HDHP)', None, None),
+        ('HG', 'Health Insurance Exchange (HIX) Gold', None, None),
+        ('HM', 'Health Maintenance Organization (HMO) Plan', None, None),
+        ('HP', 'Health Insurance Exchange (HIX) Platinum', None, None),
+        ('HS', 'Health Insurance Exchange (HIX) SilverAn individual eligible for Medicare for whom Medicaid pays only Medicare premiums.', None, None),
+        ('IN', 'Indemnity PlanGives a subscriber the choice to select any provider. Payment is fixed percentage of the cost for covered care after satisfying an annual deductible.', None, None),
+        ('LC', 'Long Term Care InsuranceCoverage designed to help pay for some or all long term care costs, reducing the risk that a policy-holder would need to deplete all of his or her assets to pay for long term care.', None, None),
+        ('LI', 'Life Insurance', None, None),
+        ('LT', 'Impacted by litigation', None, None),
+        ('MA', 'Medicare Part A', None, None),
+        ('MB', 'Medicare Part B', None, None),
+        ('MD', 'Medicare Part D', None, None),
+        ('ME', 'Medicare Advantage Preferred Provider Organization (PPO) Plan that excludes Part D Coverage', None, None),
+        ('MJ', 'Medicare Advantage Health Maintenance Organization (HMO) Plan that includes Part D Coverage', None, None),
+        ('MK', 'Medicare Advantage Health Maintenance Organization (HMO) Risk Plan that includes Part D Coverage', None, None),
+        ('ML', 'Medicare Advantage Indemnity Plan that includes Part D Coverage', None, None),
+        ('MM', 'Medicare Advantage Preferred Provider Organization (PPO) Plan that includes Part D Coverage', None, None),
+        ('MN', 'Medicare Advantage Indemnity Plan that excludes Part D coverage', None, None),
+        ('MO', 'Medicare Advantage Point of Service (POS) Plan that includes Part D Coverage', None, None),
+        ('MR', 'Medicare Advantage Health Maintenance Organization (HMO) Risk Plan that excludes Part D coverage', None, None),
+        ('MT', 'Medicare Advantage Health Maintenance Organization (HMO) Plan that excludes Part D coverage', None, None),
+        ('OA', 'Open Access Point of Service Plan (POS) Plan', None, None),
+        ('PE', 'Property Insurance - Personal', None, None),
+        ('PR', 'Preferred Provider Organization (PPO) Plan', None, None),
+        ('PS', 'Point of Service (POS) Plan', None, None),
+        ('RP', 'Property Insurance - Real', None, None),
+        ('SA', 'Set Aside ArrangementSet aside funds arrangement that exists for patients that are identified for Insurance Type Code 14, 15 or 47.', None, None),
+        ('SP', 'Supplemental InsuranceAn insurance policy intended to cover non-covered charges of another insurance policy.', None, None),
+        ('WC', 'Workers Compensation InsuranceCoverage provides medical treatment, rehabilitation, lost wages and related expenses arising from a job related injury or disease.', None, None),
+        ('WU', 'Wrap-Up InsuranceA Workers Compensation Policy written for a specific job site, which will include or cover more than one insured.', None, None),
+    ],
+    'payment_type_codes': [
+        ('ADM', 'Administrative Fees used for a debt owed by the payee. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. The Administrative Fee is $15. Negative Amounts Only', None, None),
+        ('APTC', 'Advance Payment of Premium Tax Credit. RMR04 will be positive.', None, None),
+        ('APTCADJ', 'Advance Payment of Premium Tax Credit Adjustment. RMR04 will be positive or negative.', None, None),
+        ('APTCMADJ', 'APTC Manual Adjustment. Used to show APTC manual adjustment when enrollment group level information is not applicable. RMR04 will be positive or negative and may be reversed in the future. This is a program-level code only and no enrollment group (policy) level information will be provided with this code.', None, None),
+        ('BAL', 'When an AR invoice is split between multiple HIX 820 reports, this adjustment balances the reports.  Negative Amounts & Positive Amounts', None, None),
+        ('CSR', 'Advance Payment of Cost Sharing Reduction. RMR04 will be positive.', None, None),
+        ('CSRADJ', 'Advance Payment of Cost Sharing Reduction Adjustment. RMR04 will be positive or negative.', None, None),
+        ('CSRMADJ', 'CSR Manual Adjustment. Used to show CSR manual adjustment when enrollment group level information is not provided. RMR04 will be positive or negative and may be reversed in the future. This is a program-level code only and no enrollment group (policy) level information will be provided with this code.', None, None),
+        ('CSRN', 'Cost Sharing Reduction Reconciliation. Negative Amounts & Positive Amounts', None, None),
+        ('CSRNADJ', 'Cost Sharing Reduction Reconciliation Adjustment. RMR04 will be positive or negative.', None, None),
+        ('DDVC', 'Default Data Validation Charge or Allocation Payment. If DDVC is the Payment Type Code, a corresponding Report Type Code of DDVCRPT will also be included. (Invoice Number and specific detail may be provided in the Document Control Number in the payment reports effective July 2017). Negative Amounts & Positive Amounts', None, None),
+        ('DEBTADJ', "Payee's debt amount covered by an affiliate's payment. RMR04 will be positive. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. When used to report that a prior debt was covered, RMR04 with the payment type code of BAL will also be used.", None, None),
+        ('DEPENDENTPREM', 'Dependent responsible premium amount. RMR04 will be positive.', None, None),
+        ('DEPENDENTPREMADJCANCEL', 'Dependent premium amount adjustment due to cancellation. RMR04 will positive or negative', None, None),
+        ('DEPENDENTPREMADJNSF', 'Dependent responsible premium amount due to non-sufficient funds. RMR04 will be positive or negative.', None, None),
+        ('DEPENDENTPREMADJTERMINATE', 'Dependent responsible premium amount due to the termination of a policy. RMR04 will be positive or negative.', None, None),
+        ('EMPLOYEEPREM', 'Employee responsible premium amount. RMR04 will be positive.', None, None),
+        ('EMPLOYEEPREMADJCANCEL', 'Employee responsible premium amount adjustment due to cancellation. RMR04 will be positive or negative', None, None),
+        ('EMPLOYEEPREMADJNSF', 'Employee responsible premium amount adjustment due to non-sufficient funds. RMR04 will be positive or negative.', None, None),
+        ('EMPLOYEEPREMADJTERMINATE', 'Employee responsible premium amount adjustment due to the termination of a policy. RMR04 will be positive or negative.', None, None),
+        ('EMPLOYERPREM', 'Employer responsible premium amount. RMR04 will be positive.', None, None),
+        ('EMPLOYERPREMADJCANCEL', 'Employer responsible premium amount adjustment due to cancellation.  RMR04 will be positive or negative', None, None),
+        ('EMPLOYERPREMADJNSF', 'Employer responsible premium amount adjustment due to non-sufficient funds. RMR04 will be positive or negative.', None, None),
+        ('EMPLOYERPREMADJTERMINATE', 'Employer responsible premium amount adjustment due to the termination of a policy. RMR04 will be positive or negative.', None, None),
+        ('EXTLOAN', 'Payment Offsets For Co-op Loan. Negative Amounts Only', None, None),
+        ('HCRPC', 'High Cost Risk Pool Contribution Amount. Negative Amounts & Positive Amounts', None, None),
+        ('HCRPP', 'High Cost Risk Pool Payment Amount. Negative Amounts & Positive Amounts', None, None),
+        ('HCRPPYREF', 'High Cost Risk Pool Refund For Prior Fiscal Years. Positive Amounts Only', None, None),
+        ('HCRPADMIN', 'High Cost Risk Pool Refund of Admin Charge. Positive Amounts Only', None, None),
+        ('HCRPINT', 'High Cost Risk Pool Refund of Interest Charge. Positive Amounts Only', None, None),
+        ('INT', 'Interest charges for a debt owed by the payee. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. The Secretary of Treasury certifies and updates an interest rate on a quarterly basis. Negative Amounts Only', None, None),
+        ('INVOICE', 'Used to show a total amount that will be billed or otherwise collected. Only used when BPR02 would otherwise be negative. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. Negative Amounts Only', None, None),
+        ('PEN', 'Penalty charges for a debt owed by the payee. The Treasury will add additional administrative fees of up to 30 percent and accrue the required penalty charge of 6 percent per year on any amount outstanding. Interest will continue to accrue. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. Negative Amounts Only', None, None),
+        ('RA', 'Risk Adjustment Charge or Payment. If RA is the Payment Type Code, a corresponding Report Type Code of RARPT will also be included. (Invoice Number and specific detail may be provided in the Document Control Number in the payment reports effective July 2017).\nNegative Amounts & Positive Amounts', None, None),
+        ('RAADJ', 'Risk Adjustment Payment or Charge Adjustment. RMR04 will be positive or negative.', None, None),
+        ('RAAR', 'Risk Adjustment Administration Fee Refund. A Risk Adjustment Admin Fee is only charged if an Issuer does not pay their RA Charges within 30 days. Positive Amounts Only', None, None),
+        ('RACR', 'Risk Adjustment Refund For Prior Fiscal Years. Positive Amounts Only', None, None),
+        ('RAD', 'Risk Adjustment Default Charge or Allocation Payment. (Invoice Number and specific detail may be provided in the Document Control Number in the payment reports effective July 2017). Negative Amounts & Positive Amounts', None, None),
+        ('RADV', 'Risk Adjustment Data Validation Adjustment Charge or Payment. If RADV is the Payment Type Code, a corresponding Report Type Code of RADVRPT will also be included. (Invoice Number and specific detail may be provided in the Document Control Number in the payment reports effective July 2017).\n Negative Amounts & Positive Amounts', None, None),
+        ('RAIR', 'Risk Adjustment Interest Charge Refund. A Risk Adjustment Interest Charge is only assessed if an Issuer does not pay their RA Charges within 30 days. Negative Amounts & Positive Amounts', None, None),
+        ('RAREF', 'Risk Adjustment Refund For Current Fiscal Year. Positive Amounts Only', None, None),
+        ('RAUF', 'Risk Adjustment User Fee. Negative Amounts Only', None, None),
+        ('RAUFADJ', 'Risk Adjustment User Fee Adjustment. RMR04 will be positive or negative.', None, None),
+        ('RAUFAR', 'Risk Adjustment User Fee Refund of admin charge. Positive Amounts Only', None, None),
+        ('RAUFIR', 'Risk Adjustment User Fee Refund of interest charge. Positive Amounts Only', None, None),
+        ('RAUFR', 'Risk Adjustment User Fee Refund. Positive Amounts Only', None, None),
+        ('RAUFR2PY', 'Risk Adjustment User Fee Refund. Positive Amounts Only', None, None),
+        ('RAUFREF', 'Risk Adjustment User Fee refund for current fiscal year. Positive Amounts Only', None, None),
+        ('RAUFRN', 'Risk Adjustment User Fee Refund. Positive Amounts Only', None, None),
+        ('RC', 'Risk Corridor Program payment or charge amount. Negative Amounts & Positive Amounts', None, None),
+        ('RC15', 'Risk Corridors Charges. Negative Amounts Only', None, None),
+        ('RCADJ', 'Risk Corridor Adjustment. RMR04 will be positive or negative.', None, None),
+        ('RCAR', 'Risk Corridors Refund Of Admin Charge. Positive Amounts Only', None, None),
+        ('RCCR15', 'Risk Corridors Refund For Prior Fiscal Years. Positive Amounts Only', None, None),
+        ('RCCR16', 'Risk Corridors Refund For Current Fiscal Year. Positive Amounts Only', None, None),
+        ('RCIR', 'Risk Corridors Refund Of Interest Charge. Positive Amounts Only', None, None),
+        ('RCREF', 'Risk Corridors Refund For Current Fiscal Year. Positive Amounts Only', None, None),
+        ('REDUCED', 'Payment reduced to cover a debt owed by the payee. RMR04 will be negative. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. Negative Amounts Only', None, None),
+        ('RIC', 'Reinsurance Contribution Amount. Negative Amounts & Positive Amounts', None, None),
+        ('RICADJ', 'Reinsurance Contribution Adjustment. RMR04 will be positive or negative.', None, None),
+        ('RICAR', 'Reinsurance Contribution Refund Of Admin Charge. Positive Amounts Only', None, None),
+        ('RICIR', 'Reinsurance Contribution Refund Of Interest Charge. Positive Amounts Only', None, None),
+        ('RICR', 'Reinsurance Contribution Refund For Prior Fiscal Years. Positive Amounts Only', None, None),
+        ('RICREF', 'Reinsurance Contribution Refund For Current Fiscal Year. Positive Amounts Only', None, None),
+        ('RIP', 'Reinsurance Payment Amount. Negative Amounts & Positive Amounts', None, None),
+        ('RIPADJ', 'Reinsurance Payment Adjustment. RMR04 will be positive or negative.', None, None),
+        ('SHOPUF', 'Federally-facilitated Marketplace User Fee for SHOP plans. (SHOP HIX 820 Trace Number may be provided in the Document Control Number in the payment reports). Negative Amounts & Positive Amounts', None, None),
+        ('SHOPUFADJ', 'Federally-facilitated Marketplace User Fee Adjustment for SHOP plans. RMR04 will be positive or negative. This code will not be used.', None, None),
+        ('SHOPUFMADJ', 'Federally-facilitated Marketplace User Fee Manual Adjustment for SHOP Plans.', None, None),
+        ('UF', 'Federally-facilitated Marketplace User Fee. RMR04 will be negative.', None, None),
+        ('UFADJ', 'Federally-facilitated Marketplace User Fee Adjustment. RMR04 will be positive or negative.', None, None),
+        ('UFAR', 'FFM User Fee refund of admin charges. Positive Amounts Only', None, None),
+        ('UFIR', 'FFM User Fee Refund of interest charges. Positive Amounts Only', None, None),
+        ('UFMADJ', 'Federally-facilitated Marketplace User Fee Manual Adjustment. Used to show user fee manual adjustment when enrollment group level information is not provided. RMR04 will be positive or negative and may be reversed in the future. This is a program-level code only and no enrollment group (policy) level information will be provided with this code.', None, None),
+        ('UFR', 'Federally-facilitated Marketplace User Fee Adjustment related to providing contraceptive care coverage. This is a program-level code only and no enrollment group (policy) level information will be provided with this code. Positive Amounts Only', None, None),
+        ('UFR2PY', 'FFM User Fee Refund. Positive Amounts Only', None, None),
+        ('UFRP', 'FFM User Fee Refund. Positive Amounts Only', None, None),
+        ('UFRPN', 'FFM User Fee Refund. Positive Amounts Only', None, None),
+        ('COMM', 'Any commissions withheld by the Exchange. RMR04 will be negative.', None, None),
+        ('COMMADJ', 'Any commissions adjustment. RMR04 will be positive or negative.', None, None),
+        ('DEDUCT', 'Deductible amount due to the Payer. RMR04 will be positive or negative.', None, None),
+        ('INTPREM', 'Initial premium payment received by the Exchange from the customer. This amount will be the gross premium received from the customer. RMR04 will be positive.', None, None),
+        ('MDCAID', 'State Medicaid Subsidy. RMR04 will be positive.', None, None),
+        ('MDCAIDADJ', 'State Medicaid Subsidy Adjustment. RMR04 will be positive or negative.', None, None),
+        ('MISC', 'Used to indicate miscellaneous amounts (i.e. write-offs, etc.) RMR04 will be positive or negative.', None, None),
+        ('MRF', 'Marketplace-Related Fee. This is the amount that is being paid not attributable to an individual coverage but at a plan or carrier level. If negative, the fee was withheld from carrier payments. If positive, the fee was paid to the carrier. RMR04 will be positive or negative.', None, None),
+        ('MRFADJ', 'Adjustments to a previously sent MRF. The MRFADJ is not attributable to an individual coverage level but at a plan or carrier level. RMR04 will be positive or negative.', None, None),
+        ('NONPAYADJ', 'Code use to indicate an adjustment is being made due to a NSF or stop payment. Amount will always be negative.', None, None),
+        ('OPMUF', 'OPM Multi-State Plan user fee. RMR04 will be negative.', None, None),
+        ('OPMUFADJ', 'OPM Multi-State Plan user fee manual adjustment. Used to show user fee manual adjustment when enrollment group level information is not provided. RMR04 will be positive or negative and may be reversed in the future.', None, None),
+        ('PREM', 'Premium payment amount received for the enrollment group for coverage (excluding APTC and Exchange-Related Fees). RMR04 will be positive.', None, None),
+        ('PREMADJ', 'Adjustments to premium payment amount received for the enrollment group for coverage (excluding APTC and Marketplace-Related Fees). RMR04 will be positive or negative.', None, None),
+        ('PREMALL', 'Premium payment amount received for the enrollment group for coverage (including APTC and Marketplace-Related Fees). RMR04 will be positive.', None, None),
+        ('PREMALLADJ', 'Adjustments to premium payment amount received for the enrollment group for coverage (including APTC and Marketplace-Related Fees). RMR04 will be positive or negative.', None, None),
+        ('REFUND', 'Total refunded amount sent back to the customer. RMR04 will be negative.', None, None),
+        ('RETURN', 'Total returned payment (i.e. returned due to non-sufficient funds). RMR04 will be negative.', None, None),
+        ('SBMUF', 'State Based Marketplace User Fee. RMR04 will be negative.', None, None),
+        ('SBMUFADJ', 'State Based Marketplace User Fee Adjustment. RMR04 will be positive or negative.', None, None),
+        ('SMAND', 'State Mandate Benefit Subsidy. RMR04 will be positive.', None, None),
+        ('SMANDADJ', 'State Mandate Benefit Subsidy Adjustment. RMR04 will be positive or negative.', None, None),
+        ('TPP', 'Money paid by a third party payer as a subsidy to Subscriber coverage in the individual market.', None, None),
+        ('TPPADJ', 'Adjustments to Money paid by a third party payer as a subsidy to Subscriber coverage in the individual market.', None, None),
+        ('TRIBE', 'Money paid by a registered Tribe as a subsidy to Subscriber coverage in the individual market.', None, None),
+        ('TRIBEADJ', 'Adjustments to Money paid by a registered Tribe as a subsidy to Subscriber coverage in the individual market.', None, None),
+        ('WRITEOFF', 'Write off amount', None, None),
+    ],
+    'property_casualty_codes': [
+        ('NPP', 'Non Payment of Premium', None, None),
+        ('COC', 'Company Cancelled or Underwriting Reasons', None, None),
+        ('CRQ', 'Customer Request, Competition , Voluntary', None, None),
+        ('FRD', 'Fraud by Insured', None, None),
+        ('NPS', 'Failure to Pay Surcharge', None, None),
+        ('REV', 'License or Registration Revoked', None, None),
+        ('VOC', 'Void Cancellation', None, None),
+        ('DIS', 'Dissatisfaction', None, None),
+        ('SLD', 'Vehicle Sold', None, None),
+        ('XFR', 'Transfer', None, None),
+        ('ACT', 'Financed Account', None, None),
+        ('CAN', 'Cancel/Rewrite', None, None),
+        ('BDT', 'Back Dated', None, None),
+        ('ITC', 'Intent to Cancel', None, None),
+        ('MCR', 'Mortgagee Cancellation Foreclosure', None, None),
+        ('MIR', 'Mortgagee Interest Removed', None, None),
+        ('FLE', 'Flood Expiration', None, None),
+        ('FLS', 'Flood Community Suspension', None, None),
+        ('OTH', 'All Other', None, None),
+        ('AIR', 'aircraft', None, None),
+        ('ANI', 'animal(s)', None, None),
+        ('AST', 'assault', None, None),
+        ('BDS', 'backup from sewer/drain', None, None),
+        ('BGL', 'burglary', None, None),
+        ('BRH', 'breakage/rough handling', None, None),
+        ('CLP', 'collapse', None, None),
+        ('CLS', 'collision', None, None),
+        ('CLV', 'collision of vessel', None, None),
+        ('CTM', 'contamination/pollution', None, None),
+        ('CVR', 'civil riot', None, None),
+        ('EQK', 'earthquake', None, None),
+        ('EXP', 'explosion', None, None),
+        ('FIR', 'fire', None, None),
+        ('FLD', 'flood', None, None),
+        ('FLO', 'falling objects', None, None),
+        ('FLV', 'fire of vessel', None, None),
+        ('FRZ', 'freezing', None, None),
+        ('GAV', 'general average', None, None),
+        ('GLS', 'glass', None, None),
+        ('GVA', 'government action', None, None),
+        ('HAL', 'hail', None, None),
+        ('HEC', 'heat expansion/contraction', None, None),
+        ('HUR', 'hurricane', None, None),
+        ('ICE', 'weight of ice/snow/sleet', None, None),
+        ('LGT', 'lightning', None, None),
+        ('LSL', 'landslide', None, None),
+        ('LST', 'lost overboard', None, None),
+        ('MEC', 'mechanical breakdown', None, None),
+        ('MUD', 'mudslide', None, None),
+        ('MVS', 'Moving and Storage', None, None),
+        ('MYD', 'mysterious disappearance', None, None),
+        ('NUC', 'nuclear hazard', None, None),
+        ('OTH', 'other', None, None),
+        ('PWI', 'power interruption', None, None),
+        ('PWS', 'power surge', None, None),
+        ('RIO', 'riot', None, None),
+        ('ROB', 'robbery', None, None),
+        ('SEA', 'sea water', None, None),
+        ('SHC', 'sinkhole collapse', None, None),
+        ('SHS', 'shortage/slackage', None, None),
+        ('SKV', 'sinking of the vessel', None, None),
+        ('SMK', 'smoke', None, None),
+        ('STV', 'standing of the vessel', None, None),
+        ('SUB', 'subsidence', None, None),
+        ('THF', 'theft', None, None),
+        ('TOR', 'tornado', None, None),
+        ('VEH', 'vehicles', None, None),
+        ('VMM', 'vandalism/malicious mischief', None, None),
+        ('VOL', 'volcanic', None, None),
+        ('WAR', 'war/military action', None, None),
+        ('WND', 'windstorm', None, None),
+        ('WTR', 'water/steam', None, None),
+        ('ZZZ', 'Mutually Defined', None, None),
+        ('CNC', 'Conical', None, None),
+        ('DOM', 'Domed', None, None),
+        ('GBL', 'Gabled', None, None),
+        ('NRM', 'Normal (flat)', None, None),
+        ('PYR', 'Pyramidal', None, None),
+        ('SLP', 'Sloped', None, None),
+        ('UPP', 'Unpaid Premium', None, None),
+        ('EUP', 'Recording of Unpaid Premium Done in Error', None, None),
+        ('-', 'Concurrent Causation - Ca. Only', None, None),
+        ('z', '43 not concurrent causation', None, None),
+        ('BC', 'Building Construction Defect', None, None),
+        ('EM', 'Earth Movement Excluding Earthquake', None, None),
+        ('FD', 'Flood, Non-insured Peril', None, None),
+        ('XC', 'All other, claims using cause of loss', None, None),
+        ('Dwell', 'Dwelling (Coverage A)', None, None),
+        ('OS', 'Other Structures (Coverage B)', None, None),
+        ('PP', 'Personal Property (Coverage C - HO 1,2,3,5)', None, None),
+        ('PPTC', 'Personal Liability (Coverage C - HO 4,6)', None, None),
+        ('LOU', 'Loss of Use (Coverage D)', None, None),
+        ('PL', 'Personal Liability (Coverage E)', None, None),
+        ('MEDPM', 'Medical Payments (Coverage F)', None, None),
+        ('SPPP', 'Special Personal Property (HO15)', None, None),
+        ('AALMT', 'Unit-Owners Additions & Alternations Increase Limits (HO31)', None, None),
+        ('AASPC', 'Unit-Owners Additions & Alternations Special Coverage (HO32)', None, None),
+        ('RNTOT', 'Unit-Owners Rental to Others (HO33)', None, None),
+        ('OTSTR', 'Unit-Owners Other Structures (HO34)', None, None),
+        ('LAC', 'Loss Assessment (HO35)', None, None),
+        ('LACEQ', 'Loss Assessment For Earthquake (HO35A, AN)', None, None),
+        ('GLABR', 'Glass Breakage (HO37)', None, None),
+        ('MISBD', 'Miscellaneous Building Real Property Coverage (HO38-HO6)', None, None),
+        ('SRORP', 'Structures Rented to Others (HO40)', None, None),
+        ('ADDRP', 'Additional Insured (HO41)', None, None),
+        ('OFFRP', 'Office, Professional Private School, Studio-Residence Premises (HO42)', None, None),
+        ('OFFNR', 'Office, Professional Private School, Studio-Other Residence (HO43)', None, None),
+        ('RESPR', 'Residence Premises 3 or 4 Family Dwelling (HO44)', None, None),
+        ('THEFT', 'Theft Extension (HO46)', None, None),
+        ('OTSRP', 'Other Structures Residence Premises (HO48)##', None, None),
+        ('SRBAA', 'Secondary Residence Building Addition & Alteration (HO49)', None, None),
+        ('APPSR', 'Additional Personal Property Secondary Residence (HO50)', None, None),
+        ('BAA', 'Building Additions & Alterations (H04 or 4A)  (HO54)', None, None),
+        ('CDTCD', 'Credit Card Forgery & Counterfeit Money Including Limits (HO53)', None, None),
+        ('ERQK', 'Earthquake (HO54, 55)', None, None),
+        ('SPP', 'Scheduled Personal Property (HO61)', None, None),
+        ('APPAW', 'Additional Amount of Personal Property Away From Premises (HO66)', None, None),
+        ('GLASS', 'Scheduled Glass (HO68)', None, None),
+        ('ADDRR', 'Additional Residence Rented To Others (HO70) 1 or 2 Family', None, None),
+        ('BUSNS', 'Business Pursuits (HO71)', None, None),
+        ('IFPL', 'Incidentals Farming Personal Liability (HO72)', None, None),
+        ('FCPL', 'Farmers CPL (HO73, HO296)', None, None),
+        ('TFFDP', '3 or 4 Family Dwelling Premises Liability HO4 (HO74)', None, None),
+        ('WATER', 'Watercraft (HO75)', None, None),
+        ('RRT', 'Residence Rental Theft (HO80)', None, None),
+        ('PIHOM', 'Personal Injury (HO82)', None, None),
+        ('SINK', 'Sinkhole Collapse (HO99)', None, None),
+        ('SNOWM', 'Snowmobile (HO-164)', None, None),
+        ('STLD', 'Special Theft Loss With Deductible Form # Varies (HO188NY)', None, None),
+        ('WINDX', 'Windstorm Exclusion (HO194)', None, None),
+        ('SEWER', 'Water Backup of Sewers & Drains (HO208)', None, None),
+        ('UNJWP', 'Unscheduled Jewelry, Watches, Furs (HO210, 65)', None, None),
+        ('ALARM', 'Premises Alarm (HO216)', None, None),
+        ('INFGD', 'Inflation Guard (Form # Varies) EX.-HO241 for 6%', None, None),
+        ('SPLSO', 'Special Loss Settlement (HO256)', None, None),
+        ('SOUND', 'Sound Receiving & Transmitting Equipment (HO257)', None, None),
+        ('BOLAW', 'Building Ordinance or Law Coverage (HO277)', None, None),
+        ('MINES', 'Mines Subsidence (HO287)', None, None),
+        ('PPREP', 'Personal Property Replacement Cost Form # Varies (HO290, 299)', None, None),
+        ('BUSPR', 'Business Property (HO287)', None, None),
+        ('LNDFR', 'Landlords Furnishings (HO308)', None, None),
+        ('PDOC', 'Physicians & Dentist Outside Coverage (HO313) Texas Only', None, None),
+        ('ADEXC', 'Additional Extended Coverage - Texas (HO366)', None, None),
+        ('FVREP', 'Full Value Replacement Cost', None, None),
+        ('FDC', 'Fire Department Service Charge (DP0012)', None, None),
+        ('EXTCV', 'Extension of Coverage', None, None),
+        ('WTRBD', 'Waterbed Liability', None, None),
+        ('MUINS', 'Multiple Insurance Companies (HO178)', None, None),
+        ('SUBRT', 'Suburban Home Rating Credit', None, None),
+        ('HLFC', 'Loss Free Credit', None, None),
+        ('ADDRL', 'Additional Premises Liability Extension', None, None),
+        ('PSVD', 'Physicians, Surgeons, Veterinarians, Dentists (HO69)', None, None),
+        ('WHFEN', 'Windstorm/Hail - Fences or Walls (HO288)', None, None),
+        ('WHGRN', 'Windstorm/Hail - Green Houses/Hot Houses (HO288)', None, None),
+        ('WHSLT', 'Windstorm/Hail - Slatehouses or Pergolas (HO288)', None, None),
+        ('WHCAB', 'Windstorm/Hail - Cabanas (HO288)', None, None),
+        ('WHBOT', 'Windstorm/Hail - Boathouses or Docks (HO288)', None, None),
+        ('WHOUT', 'Windstorm/Hail - Outdoor Equipment (HO288)', None, None),
+        ('WCFIN', 'Workers Compensation - Full Time Inservant (HO90, HO91)', None, None),
+        ('WCPIN', 'Workers Compensation - Part-Time Inservant (HO90, HO91)', None, None),
+        ('WCFOT', 'Workers Compensation - Full Time Outservant (HO90, HO91)', None, None),
+        ('WCPOT', 'Workers Compensation - Part-Time Outservant (HO90, HO91)', None, None),
+        ('WCDRV', 'Workers Compensation - Driver (HO91, HO91)', None, None),
+        ('WCINC', 'Workers Compensation - Incidental (HO90, HO91)', None, None),
+        ('WHAWN', 'Windstorm/Hail Coverage - Awnings (HO288)', None, None),
+        ('WHSCR', 'Windstorm/Hail Coverage - Screens (HO288)', None, None),
+        ('WHSGN', 'Windstorm/Hail Coverage - Signs (HO288)', None, None),
+        ('WHANT', 'Windstorm/Hail Coverage - Antennas (HO288)', None, None),
+        ('EGCTX', 'Texas Engaged Couples Endorsement (HO357)', None, None),
+        ('SWHTX', 'Texas Windstorm Hurricane and Hail Exclusion (HO361)', None, None),
+        ('PC', 'Home Computer (HO314)', None, None),
+        ('CCMO', 'Included Coverage C Special Liability Limit - Money (HO65)', None, None),
+        ('CCSV', 'Included Coverage C Special Liability Limit - Silverware (HO65)', None, None),
+        ('CCSC', 'Included Coverage C Special Liability Limit - Securities (HO65)', None, None),
+        ('CCGU', 'Included Coverage C Special Liability Limit - Guns (HO65)', None, None),
+        ('PLC', 'Personal Umbrella', None, None),
+        ('NHDIS', 'New Home Discount', None, None),
+        ('RDIS', 'Renovation Discount', None, None),
+        ('HABCD', 'Homeowners Form 7', None, None),
+        ('HDACA', 'Home Day Care Coverage in Residence', None, None),
+        ('FREEZ', 'Refrigerated Foods Products Clause', None, None),
+        ('SCCND', 'Security Condominium Credit', None, None),
+        ('LNDMV', 'Land Movement', None, None),
+        ('NSMKR', "Nonsmoker's Discount", None, None),
+        ('MATUR', 'Experienced Homeowner', None, None),
+        ('WOODS', 'Woodstove Surcharge', None, None),
+        ('SECUR', 'Safe Home Credit', None, None),
+        ('CTTX1', 'City Tax', None, None),
+        ('STSR1', 'State Surcharge 1', None, None),
+        ('STSR2', 'State Surcharge 2', None, None),
+        ('ACCT', 'Multi Policy Credit', None, None),
+        ('STSR3', 'Surcharge 3', None, None),
+        ('STSR4', 'Surcharge 4', None, None),
+        ('CTTX2', 'City Tax 2', None, None),
+        ('OPTE', 'Off Premises Theft Exclusion', None, None),
+        ('PRDED', 'Deductible Adjustment', None, None),
+        ('OCCUP', 'Occupancy', None, None),
+        ('FELIA', 'Fellow Employee Liability', None, None),
+        ('PCLUM', 'Personal Umbrella Uninsured Motorist', None, None),
+        ('INSPC', 'Inspected Dwellings Credit', None, None),
+        ('COLAP', 'Collapse Coverage Endorsement', None, None),
+        ('THFTB', 'Theft of Building Materials (HO266)', None, None),
+        ('RELOC', 'Relocation Expenses for Tenants (HO270)', None, None),
+        ('CCEAV', 'Electronic Apparatus in Vehicle (HO65)', None, None),
+        ('CCEAB', 'Coverage C Electronic Apparatus Business Use (HO65)', None, None),
+        ('OSOPB', 'Off Premises Blanket Coverage (HO91)', None, None),
+        ('OSOPS', 'Off Premises Structure Specific coverage (HO92)', None, None),
+        ('IFPLA', 'Incidental Farming Away From Residence Premises (HO72)', None, None),
+        ('OTSRA', 'Specific Structure Away From Residence Premises (HO92)', None, None),
+        ('ROOF', 'Roof Type Credit/Surcharge', None, None),
+        ('CRERF', 'Residential Earthquake Recover Fund', None, None),
+        ('FVS##', 'Guaranteed Replacement Cost on Other Structures on Premises', None, None),
+        ('ERQKF', 'Earthquake and Flood (Mobile Homes)', None, None),
+        ('FAIRP', 'Fair Plan Credit (California)', None, None),
+        ('TOTEC', 'Total Electric Credit', None, None),
+        ('CCFU', 'Increased Coverage C Special Liability Limit - Fur (HO65)', None, None),
+        ('LANDC', 'Incidental Motorized Land Conveyances - Liability Only', None, None),
+        ('GOLF', 'Golfcart Physical Damage', None, None),
+        ('BUS##', 'Business Pursuits (HO71)', None, None),
+        ('EQP##', 'Equipment', None, None),
+        ('MIN##', 'Mines Subsidence (HO287)', None, None),
+        ('LLF##', 'Landlords Furnishings (HO308)', None, None),
+        ('DWLEX', 'Dwelling Extension', None, None),
+        ('FARM', 'Farm and Farm Equipment', None, None),
+        ('BL', 'Business Liability', None, None),
+        ('FLIAB', 'Farm Liability', None, None),
+        ('WLIAB', 'Watercraft Liability', None, None),
+        ('PCO', 'Products Completed Operations', None, None),
+        ('GNEAG', 'General Aggregate', None, None),
+        ('LOR', 'Loss of Rents', None, None),
+        ('EMPD', 'Employee Dishonesty', None, None),
+        ('DO', 'Directors and Officers', None, None),
+        ('BM', 'Boiler and Machinery', None, None),
+        ('EQUIP', 'Equipment', None, None),
+        ('PHYS', 'Physical Damage Unit at Risk', None, None),
+        ('POWSQ', 'Power Squadron Training Credit', None, None),
+        ('CGAUX', 'Coast Guard Auxiliary Credit', None, None),
+        ('SAIL', 'Sailboat Credit', None, None),
+        ('DIESL', 'Diesel Engine Credit', None, None),
+        ('COAST', 'Coastal Water Surcharge', None, None),
+        ('OLDBT', 'Older Boat Surcharge', None, None),
+        ('SAFEQ', 'Safety Equipment', None, None),
+        ('WSKI', 'Waterski medical', None, None),
+        ('CSL', 'Single Limit Liability', None, None),
+        ('UNISG', 'Uninsured Motorists Liability - Single Limit', None, None),
+        ('MEXCO', 'Mexico Coverage', None, None),
+        ('HULL', 'Hull Coverage - Physical Damage', None, None),
+        ('MOTR1', 'Outboard Motor 1', None, None),
+        ('MOTR2', 'Outboard Motor 2', None, None),
+        ('DNGHY', 'Dinghy Coverage', None, None),
+        ('TRLR', 'Boat Trailer', None, None),
+        ('LAYCP', 'Layup Credit', None, None),
+        ('BCL', 'Building - Fire & Lightning', None, None),
+        ('BEC', 'Building - Extended Coverage', None, None),
+        ('BVMM', 'Building Vandalism & Malicious Mischief', None, None),
+        ('PPFL', 'Personal Property Fire & Lightning', None, None),
+        ('PPEC', 'Personal Property - Extended Coverage', None, None),
+        ('PPVMM', 'Personal Property - Vandalism & Malicious Mischief', None, None),
+        ('RCC', 'Replacement Cost Contents', None, None),
+        ('LRFL', 'Loss of Rental Income - Fire & Lightning', None, None),
+        ('LREC', 'Loss of Rental Income - Extended Coverage', None, None),
+        ('LRVMM', 'Loss of Rental Income - Vandalism & malicious Mischief', None, None),
+        ('LRRC', 'Loss of Rental Income - Replacement Cost', None, None),
+        ('FRV', 'Fair Rental Value', None, None),
+        ('ALEXP', 'Additional Living Expense', None, None),
+        ('GENEN', 'General Endorsement', None, None),
+        ('PST', 'Plants, Shrubs and Trees - Form DP - 1 only', None, None),
+        ('WHBSF', 'Windstorm/Hail Broad and Special Forms', None, None),
+        ('PIOCC', 'Permitted Incidental Occupancies', None, None),
+        ('PRESH', 'Premium Sharing Two or More Policies', None, None),
+        ('IAADD', 'Improvements, Alterations and Additions', None, None),
+        ('DPPAY', 'Deferred Premium Payment', None, None),
+        ('RENL', 'Renewal Plan', None, None),
+        ('SPPRV', 'Special Provision', None, None),
+        ('WHODC', 'Windstorm/Hail 1% Deductible Clause', None, None),
+        ('WHTDC', 'Windstorm/Hail 2% Deductible Clause', None, None),
+        ('LAP', 'Loss Assessment Property', None, None),
+        ('LAPEQ', 'Loss Assessment Property (Including Earthquake/Volcanic Eruption)', None, None),
+        ('BDGIT', 'Building Items Coverage (Special Coverage)', None, None),
+        ('BDGNP', 'Building Items Coverage  (Named Perils)', None, None),
+        ('DEBRL', 'Debris Removal', None, None),
+        ('PWEXC', 'Paint and Waterproofing Exclusion - Windstorm Exterior', None, None),
+        ('WWCOV', 'World-Wide Coverages', None, None),
+        ('RREP', 'Reasonable Repairs', None, None),
+        ('PRML', 'Property Removal', None, None),
+        ('MERCH', 'Merchandise in Storage', None, None),
+        ('RCMT', 'Riot and Civil Commotion', None, None),
+        ('EXP', 'Explosion', None, None),
+        ('VAC', 'Ordinary Vacancy Clause', None, None),
+        ('BBRD', 'Building -  Broad Form', None, None),
+        ('BSPL', 'Building - Special', None, None),
+        ('BAEC', 'Building - Additional Extended Coverage', None, None),
+        ('PPBRD', 'Personal Property - Broad Form', None, None),
+        ('PPSPL', 'Personal Property - Special', None, None),
+        ('PPACEC', 'Personal Property - Additional Extended Coverage', None, None),
+        ('BEQK', 'Building - Earthquake', None, None),
+        ('PPEQK', 'Contents - Earthquake', None, None),
+        ('COC', 'Course of Construction', None, None),
+        ('CPL', 'Comprehensive Personal Liability', None, None),
+        ('CPLA', 'Comprehensive Personal Liability Additional Locations', None, None),
+        ('LIAB', 'Premium Liability', None, None),
+        ('LIABA', 'Premises Liability Additional Locations', None, None),
+        ('THEFA', 'Broad Form Theft - Loss Away From Premises', None, None),
+        ('VSI', "Lienholder's Single Interest", None, None),
+        ('BI', 'Bodily Injury Liability', None, None),
+        ('CSL', 'Combined Single Limit Liability', None, None),
+        ('PD', 'Property Damage- Single Limit', None, None),
+        ('MEDPM', 'Medical Payments', None, None),
+        ('UMISG', 'Uninsured Motorist BI Single Limit', None, None),
+        ('UMISP', 'Uninsured Motorist BI Split Limit', None, None),
+        ('UMIPD', 'Uninsured Motorist Property Damage', None, None),
+        ('UNDSG', 'Underinsured Motorist BI Single', None, None),
+        ('UNDSP', 'Underinsured Motorist BI Split Limit', None, None),
+        ('UNDPD', 'Underinsured Motorist Property Damage', None, None),
+        ('ADDA', 'Automobile Death Indemnity or Benefits', None, None),
+        ('ADDAB', 'Automobile Death Indemnity and Special Disability Benefits', None, None),
+        ('ADDC', 'Total Disability Benefits', None, None),
+        ('ADDD', 'Total Disability Benefits Max 200 weeks', None, None),
+        ('MEXCO', 'Mexico Coverage', None, None),
+        ('ADDG', 'Total Disability for Persons Gainfully Employed', None, None),
+        ('ADDN', 'Total Disability for Persons Not Gainfully Employed', None, None),
+        ('PHE', 'Passenger Hazard Exclusion', None, None),
+        ('ASUMP', 'Accident Supplement', None, None),
+        ('UMCSL', 'Uninsured Combined Single Limit', None, None),
+        ('UNCSL', 'Underinsured Combined Single Limit', None, None),
+        ('PCL', 'Personal Umbrella', None, None),
+        ('COLL', 'Collision Coverage', None, None),
+        ('CCOL', 'Customized Coverage - Collision', None, None),
+        ('CCOMP', 'Customized Coverage - Comprehensive', None, None),
+        ('COMP', 'Comprehensive Coverage', None, None),
+        ('LUSE', 'Loss of Use', None, None),
+        ('RREIM', 'Rental Reimbursement', None, None),
+        ('TL', 'Towing and Labor', None, None),
+        ('SORCV', 'Sound Receiving and Transmitting', None, None),
+        ('TR', 'Tapes and Records', None, None),
+        ('MHC', 'Motor Home Content', None, None),
+        ('FTWFR', 'Fire, Theft, Windstorm, Floor or Riot (Texas Only)', None, None),
+        ('FTC', 'Fire, Theft, and Combined Additional Coverage (Texas Only)', None, None),
+        ('CAC', 'Combined Additional Coverages', None, None),
+        ('PARK', 'Parked Car Collision', None, None),
+        ('RR', 'Repair/Replacement', None, None),
+        ('THEFT', 'Theft', None, None),
+        ('PFRTH', 'Fire and Theft', None, None),
+        ('FTV', 'Fire, Theft and  Vandalism', None, None),
+        ('PIP', 'Basic PIP', None, None),
+        ('APIP', 'Additional PIP', None, None),
+        ('EPIP', 'Extended PIP', None, None),
+        ('BPIP', 'Broadened PIP or PIP for Named Individuals', None, None),
+        ('FPBPA', 'First Party Benefits (Pennsylvania)', None, None),
+        ('MEBPA', 'Medical Expense Benefits (Pennsylvania)', None, None),
+        ('WLBPA', 'Work Loss Benefits (Pennsylvania)', None, None),
+        ('FEBPA', 'Funeral Expense Benefits (Pennsylvania)', None, None),
+        ('ADBPA', 'Accidental Death Benefit (Pennsylvania)', None, None),
+        ('CPBPA', 'Combined First Party Benefits (Pennsylvania)', None, None),
+        ('LP', 'Loss Payee', None, None),
+        ('BAY', 'Bay', None, None),
+        ('BOX', 'Box/rectangular', None, None),
+        ('CIR', 'Circular', None, None),
+        ('CLE', 'Clerestory', None, None),
+        ('CRC', 'Semi Circular', None, None),
+        ('EXT', 'Exterior', None, None),
+        ('FLT', 'Flat Roof', None, None),
+        ('GBD', 'Gable Dormer', None, None),
+        ('GBL', 'Gable Roof and Box', None, None),
+        ('GBT', 'Gable Roof and Box with Tie In', None, None),
+        ('GMB', 'Gamble Roof', None, None),
+        ('HIP', 'Hip Roof', None, None),
+        ('INC', 'Intersecting Cubes', None, None),
+        ('MSD', 'Mansard Roof', None, None),
+        ('OFF', 'Offset', None, None),
+        ('OTH', 'Other', None, None),
+        ('PKR', 'Peaked Room', None, None),
+        ('PLY', 'Polygon (assume all sides equal)', None, None),
+        ('SHD', 'Shed Roof', None, None),
+        ('SLP', 'Sloped Ceiling Room', None, None),
+        ('TRI', 'Triangular Room', None, None),
+        ('TRP', 'Trapezoid Room', None, None),
+        ('CE', 'Coverage endorsement', None, None),
+        ('PE', 'Policy Endorsement', None, None),
+        ('PF', 'Policy Form', None, None),
+        ('FPM', 'payment made', None, None),
+        ('FU', 'frequently used', None, None),
+        ('GFT', 'gift', None, None),
+        ('IAL', 'included in another line item', None, None),
+        ('IFU', 'infrequently used', None, None),
+        ('LTI', 'labor tax included', None, None),
+        ('MTI', 'material tax included', None, None),
+        ('NCI', 'not covered', None, None),
+        ('NU', 'never used', None, None),
+        ('SAL', 'salvage', None, None),
+        ('SLB', 'salvageable', None, None),
+        ('SU', 'seldom used', None, None),
+        ('TXL', 'taxable labor', None, None),
+        ('TXM', 'taxable material', None, None),
+        ('UAB', 'used on an average basis', None, None),
+        ('DFIRE', 'Fire', None, None),
+        ('EQKP', 'Earthquake', None, None),
+        ('FLOOD', 'Flood', None, None),
+        ('HOME', 'Home', None, None),
+        ('MOS', 'Mercantile', None, None),
+        ('PPART', 'Apartment', None, None),
+        ('PPCHO', 'Condominium Association', None, None),
+        ('PPCHR', 'Church', None, None),
+        ('PPMBH', 'Mobile Home', None, None),
+        ('PPTHO', 'Renters', None, None),
+        ('RNTOT', 'Rental Dwelling to Others', None, None),
+        ('RCUP', 'Rental Condominium Unit Owner', None, None),
+        ('FARM', 'Farm Ranch Owners', None, None),
+        ('BOAT', 'Boat Owner', None, None),
+        ('COTHR', 'Other Commercial', None, None),
+        ('BOP', 'Business Owners', None, None),
+        ('HURC', 'Hurricane', None, None),
+        ('WIND', 'Windstorm', None, None),
+        ('CNT', 'Contractors', None, None),
+        ('PLU', 'Personal Liability Umbrella', None, None),
+        ('PPUHO', 'Condominium Unit', None, None),
+        ('RCBAP', 'Flood Condominium Association', None, None),
+        ('PRP', 'Flood Preferred Risk', None, None),
+        ('STAND', 'Flood Standard Policy', None, None),
+        ('MPPP', 'Flood Mortgage Protection Portfolio Plan', None, None),
+        ('PAP', 'Personal Articles', None, None),
+        ('CUM', 'Cumulative', None, None),
+        ('HA', 'Hazardous activity', None, None),
+        ('HC', 'Hazardous condition', None, None),
+        ('IA', 'Insured agreed to Estimate', None, None),
+        ('NCM', 'not cumulative', None, None),
+        ('OC', 'Occupancy Compatible w/ type', None, None),
+        ('OCC', 'Occupied', None, None),
+        ('OI', 'Overinsured', None, None),
+        ('PM', 'Poor maintenance', None, None),
+        ('RA', 'Risk alert', None, None),
+        ('RD', 'Risk details', None, None),
+        ('UI', 'Underinsured', None, None),
+        ('UNF', 'Unfurnished', None, None),
+        ('UO', 'Unoccupied', None, None),
+        ('VA', 'Vacant', None, None),
+        ('APP', 'Appliances', None, None),
+        ('ART', 'Art', None, None),
+        ('ATH', 'Athletic/sports', None, None),
+        ('BKS', 'Books/Cards/Photos', None, None),
+        ('BTS', 'Fishing/Boats', None, None),
+        ('CAM', 'Camera equipment', None, None),
+        ('CLC', 'Collectibles', None, None),
+        ('CLE', 'Cleaning Supplies/Accessories', None, None),
+        ('CLO', 'Clothing', None, None),
+        ('CMP', 'Camping/Hiking', None, None),
+        ('COS', 'Cosmetics/Medicines/Toiletries', None, None),
+        ('CPT', 'Computers', None, None),
+        ('CRN', 'Currency', None, None),
+        ('DEC', 'Decorative Items', None, None),
+        ('DRP', 'Draperies/Curtains', None, None),
+        ('EXR', 'Exercise Equipment', None, None),
+        ('FDS', 'Foods', None, None),
+        ('FRN', 'Furniture', None, None),
+        ('FUR', 'Furs', None, None),
+        ('GAR', 'Garden/Patio', None, None),
+        ('GUN', 'Hunting/Bows/guns', None, None),
+        ('HOB', 'Games/Hobbies', None, None),
+        ('JLR', 'Jewelry', None, None),
+        ('KIT', 'Kitchenware/tools', None, None),
+        ('LGG', 'Luggage', None, None),
+        ('LIN', 'Bedding/Linens', None, None),
+        ('MLL', 'Military List', None, None),
+        ('MUS', 'Musical Instruments', None, None),
+        ('RUG', 'Carpets/Rugs', None, None),
+        ('SLV', 'Silverware', None, None),
+        ('SUP', 'Office Equipment/Supplies', None, None),
+        ('TLS', 'Tools/Automotive', None, None),
+        ('TOY', 'Toys', None, None),
+        ('TVR', 'TV/Radio/Recorders/Electronics', None, None),
+        ('ACV', 'Actual cash value', None, None),
+        ('APT', 'Apartment', None, None),
+        ('BO', 'Boat Owners', None, None),
+        ('BUS', 'Business Policy', None, None),
+        ('CHR', 'Church policy', None, None),
+        ('CND', 'Condo', None, None),
+        ('CNT', 'contractors policy', None, None),
+        ('FIR', 'Fire', None, None),
+        ('FLD', 'Flood policy', None, None),
+        ('FRM', 'Farm and Ranch Policy', None, None),
+        ('GUA', 'Guaranteed', None, None),
+        ('HO', 'Homeowner', None, None),
+        ('MMH', 'Manufacture or Mobile Home', None, None),
+        ('NA', 'No policy applicable', None, None),
+        ('OTH', 'Other policy type', None, None),
+        ('PAP', 'Personal Articles Policy', None, None),
+        ('PLU', 'Personal Liability Umbrella Policy', None, None),
+        ('RCV', 'Replacement Cash Value', None, None),
+        ('RNT', 'Renters', None, None),
+        ('NBS', 'New Business', None, None),
+        ('BND', 'Binder', None, None),
+        ('RWL', 'Renewal', None, None),
+        ('PCH', 'Policy ChangeIf the policy change can be identified, the DRC, CVC, or VHC codes should be used, if applicable. If unable to identify the type of policy change or it does not apply to those areas, use the PCH code.', None, None),
+        ('XLC', 'Cancellation', None, None),
+        ('REI', 'Reinstatement', None, None),
+        ('ACK', 'Insurance Verification', None, None),
+        ('NIS', 'No Insurance', None, None),
+        ('DRC', 'Driver Changed', None, None),
+        ('CVC', 'Coverage Changed', None, None),
+        ('VHC', 'Vehicle Changed', None, None),
+        ('CUP', 'Clear Unpaid Premium', None, None),
+        ('INQ', 'Policy Inquiry', None, None),
+        ('LOD', 'Initial Load', None, None),
+        ('UNH', 'Unresolved No Hit', None, None),
+        ('RCL', 'Recall', None, None),
+        ('EPI', 'Insurance Verification', None, None),
+        ('RWF', 'Renewal Forthcoming', None, None),
+        ('OTH', 'All Other', None, None),
+        ('NPP', 'Non Payment of Premium', None, None),
+        ('REV', 'Reversal of Cancellation', None, None),
+        ('ERR', 'Cancellation Done in Error', None, None),
+        ('005', 'Submission date', None, None),
+        ('010', 'Reporting start date', None, None),
+        ('015', 'Reporting end date', None, None),
+        ('020', 'Insured last name', None, None),
+        ('025', 'Insured first name', None, None),
+        ('030', 'Insured middle name', None, None),
+        ('035', 'Insured name prefix', None, None),
+        ('040', 'Insured name suffix', None, None),
+        ('045', 'Insured drivers license number', None, None),
+        ('050', 'Insured street address', None, None),
+        ('055', 'Insured city address', None, None),
+        ('060', 'Insured state or province address', None, None),
+        ('065', 'Insured postal code address', None, None),
+        ('070', 'Insured country code address', None, None),
+        ('075', 'Transaction type code', None, None),
+        ('080', 'Transaction sub type code', None, None),
+        ('085', 'Insurance policy or binder number', None, None),
+        ('090', 'Fleet policy code', None, None),
+        ('095', 'Voluntary or assigned risk code', None, None),
+        ('100', 'Liability or collision code', None, None),
+        ('105', 'Insureds drivers licensing state code', None, None),
+        ('107', 'Vehicle specific information', None, None),
+        ('110', 'Insureds date of birth', None, None),
+        ('115', 'Policy effective date', None, None),
+        ('120', 'Transaction effective date', None, None),
+        ('125', 'Policy expiration date', None, None),
+        ('130', 'Premium amount paid/unpaid', None, None),
+        ('135', 'Operator # date of birth', None, None),
+        ('140', 'Operator # drivers licensing state code', None, None),
+        ('145', 'Operator # last name', None, None),
+        ('150', 'Operator # first name', None, None),
+        ('155', 'Operator # middle name', None, None),
+        ('160', 'Operator # name prefix', None, None),
+        ('165', 'Operator # name suffix', None, None),
+        ('170', 'Operator # drivers license number', None, None),
+        ('175', 'Operator # street address', None, None),
+        ('180', 'Operator # city address', None, None),
+        ('185', 'Operator # state or province address', None, None),
+        ('190', 'Operator # postal code address', None, None),
+        ('195', 'Operator # country code address', None, None),
+        ('200', 'Vehicle identification number', None, None),
+        ('202', 'LOD/NBS sent and record already on file', None, None),
+        ('203', 'VIN passed check digit validation', None, None),
+        ('204', 'VIN failed check digit validation', None, None),
+        ('205', 'Vehicle make', None, None),
+        ('206', 'No match after extended VIN search', None, None),
+        ('210', 'Vehicle model', None, None),
+        ('215', 'Vehicle century', None, None),
+        ('220', 'Vehicle year', None, None),
+        ('221', 'Vehicle license plate number', None, None),
+        ('225', 'Owner # date of birth', None, None),
+        ('230', 'Owner # drivers licensing state code', None, None),
+        ('235', 'Owner # last name', None, None),
+        ('240', 'Owner # first name', None, None),
+        ('245', 'Owner # middle name', None, None),
+        ('250', 'Owner # name prefix', None, None),
+        ('255', 'Owner # name suffix', None, None),
+        ('260', 'Owner # drivers license number', None, None),
+        ('265', 'Owner # street address', None, None),
+        ('270', 'Owner # city address', None, None),
+        ('275', 'Owner # state or province address', None, None),
+        ('280', 'Owner # postal code address', None, None),
+        ('285', 'Owner # country code address', None, None),
+        ('286', 'XLC sent and record not found', None, None),
+        ('290', 'Excluded operator # date of birth', None, None),
+        ('295', 'Excluded operator # drivers licensing state code', None, None),
+        ('300', 'Excluded operator # last name', None, None),
+        ('305', 'Excluded operator # first name', None, None),
+        ('310', 'Excluded operator # middle name', None, None),
+        ('315', 'Excluded operator # name prefix', None, None),
+        ('320', 'Excluded operator # name suffix', None, None),
+        ('325', 'Excluded operator # drivers license number', None, None),
+        ('330', 'Excluded operator # street address', None, None),
+        ('335', 'Excluded operator # city address', None, None),
+        ('340', 'Excluded operator # state or province address', None, None),
+        ('345', 'Excluded operator # postal code address', None, None),
+        ('350', 'Excluded operator # country code address', None, None),
+        ('355', 'Total number of transactions', None, None),
+        ('500', 'Matched after extended VIN search', None, None),
+        ('CEI', 'Ceiling', None, None),
+        ('CPR', 'Ceiling Perimeter', None, None),
+        ('ELV', 'Elevation', None, None),
+        ('FLR', 'Flooring', None, None),
+        ('FPR', 'Floor Perimeter', None, None),
+        ('OLH', 'One Long Wall', None, None),
+        ('OPN', 'Opening', None, None),
+        ('OSW', 'One Short Wall', None, None),
+        ('PER', 'Perimeter', None, None),
+        ('RDG', 'Ridge', None, None),
+        ('RFG', 'Roofing', None, None),
+        ('WAL', 'Walls', None, None),
+        ('WCC', 'Walls and ceiling combined', None, None),
+        ('EPI', 'Insurance Verification', None, None),
+        ('NBS', 'New Business', None, None),
+        ('PCH', 'Endorsement or Policy Change', None, None),
+        ('REI', 'Reinstatement', None, None),
+        ('RWL', 'Renewal', None, None),
+        ('XLC', 'Cancellation', None, None),
+        ('CRQ', 'Customer Request', None, None),
+        ('NPP', 'Non-Payment of Premium', None, None),
+        ('COC', 'Company Cancelled', None, None),
+        ('MIR', 'Mortgage Interest Removed', None, None),
+        ('IN', 'Insured', None, None),
+        ('MG', 'Mortgagee', None, None),
+        ('BDN', 'Balance Due Notice', None, None),
+        ('CEI', 'Ceiling', None, None),
+        ('CPR', 'Ceiling Perimeter', None, None),
+        ('ELV', 'Elevation', None, None),
+        ('FLR', 'Flooring', None, None),
+        ('FPR', 'Floor Perimeter', None, None),
+        ('OLH', 'One Long Wall', None, None),
+        ('OPN', 'Opening', None, None),
+        ('OSW', 'One Short Wall', None, None),
+        ('PER', 'Perimeter', None, None),
+        ('RDG', 'Ridge', None, None),
+        ('RFG', 'Roofing', None, None),
+        ('WAL', 'Walls', None, None),
+        ('WCC', 'Walls and ceiling combined', None, None),
+        ('ACO', 'Acoustical', None, None),
+        ('APP', 'Appliances', None, None),
+        ('AWN', 'Awning/canopies', None, None),
+        ('CAB', 'Cabinets', None, None),
+        ('CLN', 'Clean', None, None),
+        ('CON', 'Concrete', None, None),
+        ('CRF', 'Carpentry, finish', None, None),
+        ('CRR', 'Carpentry, rough', None, None),
+        ('CTP', 'Cabinet tops', None, None),
+        ('DER', 'Debris removal', None, None),
+        ('DET', 'Demolition/ Tear Out', None, None),
+        ('DOR', 'Doors/Jambs', None, None),
+        ('DRY', 'Drywalls', None, None),
+        ('ELE', 'Electrical', None, None),
+        ('ELF', 'Electrical Fixtures', None, None),
+        ('EQU', 'Equipment/  Rental', None, None),
+        ('FCC', 'Flooring Carpet', None, None),
+        ('FCP', 'Flooring Pad', None, None),
+        ('FCW', 'Flooring wood', None, None),
+        ('FEE', 'Permits', None, None),
+        ('FEN', 'Fencing', None, None),
+        ('FLP', 'Fireplace', None, None),
+        ('FSQ', 'Flooring - Slate or Quarry Tile', None, None),
+        ('FVS', 'Flooring - sheet vinyl', None, None),
+        ('FVT', 'Flooring - vinyl title', None, None),
+        ('HRD', 'Hardware', None, None),
+        ('HVC', 'HVAC', None, None),
+        ('INB', 'Insulation - batt or blown', None, None),
+        ('INR', 'Insulation - rigid', None, None),
+        ('INS', 'Insulation - sprayed', None, None),
+        ('JSB', 'Jack/Shore/brace', None, None),
+        ('MAS', 'Masonry', None, None),
+        ('MOB', 'Mobile Home - skirting and setup', None, None),
+        ('MOV', 'Moving and Storage', None, None),
+        ('MSC', 'Miscellaneous', None, None),
+        ('MSD', 'Mirrors and shower doors', None, None),
+        ('PLA', 'Plaster', None, None),
+        ('PLB', 'Plumbing', None, None),
+        ('PLG', 'Pilings', None, None),
+        ('PNL', 'Paneling', None, None),
+        ('PNT', 'Painting', None, None),
+        ('RFA', 'Roofing- Asphalt', None, None),
+        ('RFB', 'Roofing- Built up', None, None),
+        ('RFM', 'Roofing- Metal', None, None),
+        ('RFT', 'Roofing- Tile', None, None),
+        ('RFW', 'Roofing- Wood', None, None),
+        ('SCF', 'Scaffolding', None, None),
+        ('SDA', 'Siding- Aluminum', None, None),
+        ('SDV', 'Siding-Vinyl', None, None),
+        ('SDW', 'Siding - Wood', None, None),
+        ('SFG', 'Soffit, fascia and gutter', None, None),
+        ('SLT', 'Shrubs/Lawn/Trees', None, None),
+        ('STR', 'Stairs', None, None),
+        ('STU', 'Stucco and exterior plaster', None, None),
+        ('TEX', 'Texture', None, None),
+        ('TLE', 'Tile', None, None),
+        ('TMP', 'Temporary repairs', None, None),
+        ('WDN', 'Windows/Skylights/Repairs', None, None),
+        ('WPR', 'Wallpaper', None, None),
+        ('010', 'Policy Premium', None, None),
+        ('015', 'Premium Rewrite', None, None),
+        ('020', 'Premium Transfer', None, None),
+        ('025', 'Renewal Premium', None, None),
+        ('030', 'Policy Adjustment', None, None),
+        ('035', 'Reinstated Policy', None, None),
+        ('040', 'Cancellation', None, None),
+        ('045', 'Cancellation or Rewrite', None, None),
+        ('050', 'Discount', None, None),
+        ('055', 'Dividend', None, None),
+        ('060', 'Discount Adjustment', None, None),
+        ('065', 'Cancellation Prior Policy Period', None, None),
+        ('070', 'Tax/Surcharge', None, None),
+        ('080', 'Payment', None, None),
+        ('090', 'Payment Rejected', None, None),
+        ('100', 'Refunded to Insured', None, None),
+        ('105', 'Refunded to Third Party', None, None),
+        ('110', 'Transfer Credit from Another Policy', None, None),
+        ('115', 'Transfer Debit from Another Policy', None, None),
+        ('120', 'Transfer Credit to Another Policy', None, None),
+        ('125', 'Transfer Debit to Another Policy', None, None),
+        ('130', 'Decrease in Coverage', None, None),
+        ('135', 'Increase in Coverage', None, None),
+        ('ACV', 'Actual cash value', None, None),
+        ('GUA', 'Guaranteed', None, None),
+        ('RCV', 'Replacement Cash Value', None, None),
+        ('01', 'Fire', None, None),
+        ('02', 'Windstorm', None, None),
+        ('03', 'Hail', None, None),
+        ('04', 'Explosion', None, None),
+        ('05', 'Lightening', None, None),
+        ('06', 'Riots', None, None),
+        ('07', 'Smoke', None, None),
+        ('08', 'Aircraft', None, None),
+        ('09', 'Vehicles', None, None),
+        ('10', 'Volcanic Eruption', None, None),
+        ('30', 'Earthquake', None, None),
+        ('31', 'Sinkhole', None, None),
+        ('32', 'Flood', None, None),
+        ('33', 'Mine Subsidence', None, None),
+        ('34', 'Sewer and Drain', None, None),
+        ('35', 'Hurricane', None, None),
+        ('36', 'Windstorm and Hail', None, None),
+        ('37', 'Tropical Occurrence', None, None),
+        ('38', 'Roof Exclusion', None, None),
+        ('39', 'Fungus', None, None),
+        ('40', 'Named Storm', None, None),
+        ('41', 'Wildfire', None, None),
+    ],
+    'provider_adjustment_reason_codes': [
+        ('01', 'Card interchange fee amount', None, None),
+        ('02', 'Advanced or accelerated payment recoupment amount', None, None),
+        ('03', 'Claim transmission fee amount', None, None),
+        ('04', 'Real-time adjudication resulting in a payment that will follow separately.', None, None),
+        ('05', 'Penalty amount withheld due to reports that were not filed', None, None),
+        ('06', 'Penalty amount withheld due to reports that were filed incorrectly', None, None),
+        ('07', 'Non-Internal Revenue Service third-party  withholding amount unrelated to a federal payment levy program', None, None),
+        ('08', 'Penalty Withholding for Bankruptcy/Termination', None, None),
+        ('50', 'The amount of the late charge, late claim filing penalty, or  Medicare late cost report penalty.', None, None),
+        ('51', 'Late filing interest penalty assessment amount', None, None),
+        ('72', 'Provider refund amountThis adjustment acknowledges a refund received from a provider for previous overpayment.', None, None),
+        ('90', 'Early payment allowance amount', None, None),
+        ('AH', 'Claim transmission fee amountThis code is used for transmission fees that are not specific to or dependent upon individual claims.', None, None),
+        ('AM', 'Loan repayment amount', None, None),
+        ('AP', 'Advanced or accelerated payment amount', None, None),
+        ('B2', 'Rebate amountApplies when a provider has remitted an over payment to a health plan in excess of the amount requested by the health plan.', None, None),
+        ('B3', 'Recovery amountThis represents the amount received from the provider for an overpayment based on payments from other payers. This code is not used for other provider refund adjustment amounts.', None, None),
+        ('BD', 'Bad debt amount', None, None),
+        ('BN', 'Bonus amount', None, None),
+        ('CR', 'Capitation interest amount', None, None),
+        ('CS', 'Adjustment amount, detailed information is provided separately to explain the adjustment.', None, None),
+        ('CT', 'Capitation payment amount', None, None),
+        ('E3', 'Withholding amount', None, None),
+        ('FB', 'Non-claim related balance forward amount', None, None),
+        ('FC', 'Allocation of prepaid funds against which deductions are drawn as services are provided.', None, None),
+        ('FR', 'Claim-related balance forward amount', None, None),
+        ('HM', 'Hemophilia clotting factor add-on payment amount', None, None),
+        ('IP', 'Incentive payment amount', None, None),
+        ('IR', 'Internal Revenue Service 1099 withholding amount', None, None),
+        ('IS', 'Lump sum based on an interim rate', None, None),
+        ('J1', 'Amount not reimbursed based on a demonstration program or other limitation that prevents issuance of payment.', None, None),
+        ('L3', 'Penalty amount', None, None),
+        ('L6', 'Interest amount', None, None),
+        ('LE', 'Internal Revenue Service non-1099 withholding amount', None, None),
+        ('OB', 'Affiliated provider(s) offset amount', None, None),
+        ('PI', 'Periodic Interim Payment (PIP) lump sum amount', None, None),
+        ('PL', 'Final payment or settlement amount', None, None),
+        ('RA', 'Retroactive adjustment amount', None, None),
+        ('SL', 'Student loan garnishment amount', None, None),
+        ('TL', 'Third party liability determination amount', None, None),
+        ('WO', 'Overpayment recovery amount', None, None),
+        ('WU', 'Non-Internal Revenue Service withholding amount related to a federal payment levy program', None, None),
+    ],
+    'remittance_advice_remark_codes': [
+        ('M1', 'X-ray not taken within the past 12 months or near enough to the start of treatment.', '1997-01-01', None),
+        ('M2', 'Not paid separately when the patient is an inpatient.', '1997-01-01', None),
+        ('M3', 'Equipment is the same or similar to equipment already being used.', '1997-01-01', None),
+        ('M4', 'Alert:This is the last monthly installment payment for this durable medical equipment.', '1997-01-01', None),
+        ('M5', 'Monthly rental payments can continue until the earlier of the 15th month from the first rental month, or the month when the equipment is no longer needed.', '1997-01-01', None),
+        ('M6', 'Alert:You must furnish and service this item for any period of medical need for the remainder of the reasonable useful lifetime of the equipment.', '1997-01-01', None),
+        ('M7', 'No rental payments after the item is purchased, returned or after the total of issued rental payments equals the purchase price.', '1997-01-01', None),
+        ('M8', 'We do not accept blood gas tests results when the test was conducted by a medical supplier or taken while the patient is on oxygen.', '1997-01-01', None),
+        ('M9', 'Alert:This is the tenth rental month. You must offer the patient the choice of changing the rental to a purchase agreement.', '1997-01-01', None),
+        ('M10', 'Equipment purchases are limited to the first or the tenth month of medical necessity.', '1997-01-01', None),
+        ('M11', "DME, orthotics and prosthetics must be billed to the DME carrier who services the patient's zip code.", '1997-01-01', None),
+        ('M12', 'Diagnostic tests performed by a physician must indicate whether purchased services are included on the claim.', '1997-01-01', None),
+        ('M13', 'Only one initial visit is covered per specialty per medical group.', '1997-01-01', None),
+        ('M14', 'No separate payment for an injection administered during an office visit, and no payment for a full office visit if the patient only received an injection.', '1997-01-01', None),
+        ('M15', 'Separately billed services/tests have been bundled as they are considered components of the same procedure. Separate payment is not allowed.', '1997-01-01', None),
+        ('M16', 'Alert:Please see our web site, mailings, or bulletins for more details concerning this policy/procedure/decision.', '1997-01-01', None),
+        ('M17', 'Alert:Payment approved as you did not know, and could not reasonably have been expected to know, that this would not normally have been covered for this patient.  In the future, you will be liable for charges for the same service(s) under the same or similar conditions.', '1997-01-01', None),
+        ('M18', "Certain services may be approved for home use.  Neither a hospital nor a Skilled Nursing Facility (SNF) is considered to be a patient's home.", '1997-01-01', None),
+        ('M19', 'Missing oxygen certification/re-certification.', '1997-01-01', None),
+        ('M20', 'Missing/incomplete/invalid HCPCS.', '1997-01-01', None),
+        ('M21', 'Missing/incomplete/invalid place of residence for this service/item provided in a home.', '1997-01-01', None),
+        ('M22', 'Missing/incomplete/invalid number of miles traveled.', '1997-01-01', None),
+        ('M23', 'Missing invoice.', '1997-01-01', None),
+        ('M24', 'Missing/incomplete/invalid number of doses per vial.', '1997-01-01', None),
+        ('M25', 'The information furnished does not substantiate the need for this level of service. If you believe the service should have been fully covered as billed, or if you did not know and could not reasonably have been expected to know that we would not pay for this level of service, or if you notified the patient in writing in advance that we would not pay for this level of service and he/she agreed in writing to pay, ask us to review your claim within 120 days of the date of this notice.  If you do not request an appeal, we will, upon application from the patient, reimburse him/her for the amount you have collected from him/her in excess of any deductible and coinsurance amounts. We will recover the reimbursement from you as an overpayment.', '1997-01-01', None),
+        ('M26', 'The information furnished does not substantiate the need for this level of service. If you have collected any amount from the patient for this level of service/any amount that exceeds the limiting charge for the less extensive service, the law requires you to refund that amount to the patient within 30 days of receiving this notice.The requirements for refund are in 1824(I) of the Social Security Act and 42CFR411.408. The section specifies that physicians who knowingly and willfully fail to make appropriate refunds may be subject to civil monetary penalties and/or exclusion from the program. If you have any questions about this notice, please contact this office.', '1997-01-01', None),
+        ('M27', "Alert:The patient has been relieved of liability of payment of these items and services under the limitation of liability provision of the law. The provider is ultimately liable for the patient's waived charges, including any charges for coinsurance, since the items or services were not reasonable and necessary or constituted custodial care, and you knew or could reasonably have been expected to know, that they were not covered. You may appeal this determination. You may ask for an appeal regarding both the coverage determination and the issue of whether you exercised due care. The appeal request must be filed within 120 days of the date you receive this notice. You must make the request through this office.", '1997-01-01', None),
+        ('M28', 'This does not qualify for payment under Part B when Part A coverage is exhausted or not otherwise available.', '1997-01-01', None),
+        ('M29', 'Missing operative note/report.', '1997-01-01', None),
+        ('M30', 'Missing pathology report.', '1997-01-01', None),
+        ('M31', 'Missing radiology report.', '1997-01-01', None),
+        ('M32', "Alert:This is a conditional payment made pending a decision on this service by the patient's primary payer. This payment may be subject to refund upon your receipt of any additional payment for this service from another payer. You must contact this office immediately upon receipt of an additional payment for this service.", '1997-01-01', None),
+        ('M33', 'Missing/incomplete/invalid UPIN for the ordering/referring/performing provider.', '1997-01-01', '2004-08-01'),
+        ('M34', 'Claim lacks the CLIA certification number.', '1997-01-01', '2004-08-01'),
+        ('M35', 'Missing/incomplete/invalid pre-operative photos or visual field results.', '1997-01-01', '2005-02-05'),
+        ('M36', 'This is the 11th rental month.  We cannot pay for this until you indicate that the patient has been given the option of changing the rental to a purchase.', '1997-01-01', None),
+        ('M37', 'Not covered when the patient is under age 35.', '1997-01-01', None),
+        ('M38', 'Alert:The patient is liable for the charges for this service as they were informed in writing before the service was furnished that we would not pay for it and the patient agreed to be responsible for the charges.', '1997-01-01', None),
+        ('M39', 'Alert:The patient is not liable for payment of this service as the advance notice of non-coverage you provided the patient did not comply with program requirements.', '1997-01-01', None),
+        ('M40', "Claim must be assigned and must be filed by the practitioner's employer.", '1997-01-01', None),
+        ('M41', 'We do not pay for this as the patient has no legal obligation to pay for this.', '1997-01-01', None),
+        ('M42', 'The medical necessity form must be personally signed by the attending physician.', '1997-01-01', None),
+        ('M43', 'Payment for this service previously issued to you or another provider by another carrier/intermediary.', '1997-01-01', '2004-01-31'),
+        ('M44', 'Missing/incomplete/invalid condition code.', '1997-01-01', None),
+        ('M45', 'Missing/incomplete/invalid occurrence code(s).', '1997-01-01', None),
+        ('M46', 'Missing/incomplete/invalid occurrence span code(s).', '1997-01-01', None),
+        ('M47', 'Missing/incomplete/invalid Payer Claim Control Number. Other terms exist for this element including, but not limited to, Internal Control Number (ICN), Claim Control Number (CCN), Document Control Number (DCN).', '1997-01-01', None),
+        ('M48', 'Payment for services furnished to hospital inpatients (other than professional services of physicians) can only be made to the hospital.  You must request payment from the hospital rather than the patient for this service.', '1997-01-01', '2004-01-31'),
+        ('M49', 'Missing/incomplete/invalid value code(s) or amount(s).', '1997-01-01', None),
+        ('M50', 'Missing/incomplete/invalid revenue code(s).', '1997-01-01', None),
+        ('M51', 'Missing/incomplete/invalid procedure code(s).', '1997-01-01', None),
+        ('M52', "Missing/incomplete/invalid 'from' date(s) of service.", '1997-01-01', None),
+        ('M53', 'Missing/incomplete/invalid days or units of service.', '1997-01-01', None),
+        ('M54', 'Missing/incomplete/invalid total charges.', '1997-01-01', None),
+        ('M55', 'We do not pay for self-administered anti-emetic drugs that are not administered with a covered oral anti-cancer drug.', '1997-01-01', None),
+        ('M56', 'Missing/incomplete/invalid payer identifier.', '1997-01-01', None),
+        ('M57', 'Missing/incomplete/invalid provider identifier.', '1997-01-01', '2005-06-02'),
+        ('M58', 'Missing/incomplete/invalid claim information.  Resubmit claim after corrections.', '1997-01-01', '2005-02-05'),
+        ('M59', "Missing/incomplete/invalid 'to' date(s) of service.", '1997-01-01', None),
+        ('M60', 'Missing Certificate of Medical Necessity.', '1997-01-01', None),
+        ('M61', 'We cannot pay for this as the approval period for the FDA clinical trial has expired.', '1997-01-01', None),
+        ('M62', 'Missing/incomplete/invalid treatment authorization code.', '1997-01-01', None),
+        ('M63', 'We do not pay for more than one of these on the same day.', '1997-01-01', '2004-01-31'),
+        ('M64', 'Missing/incomplete/invalid other diagnosis.', '1997-01-01', None),
+        ('M65', 'One interpreting physician charge can be submitted per claim when a purchased diagnostic test is indicated. Please submit a separate claim for each interpreting physician.', '1997-01-01', None),
+        ('M66', 'Our records indicate that you billed diagnostic tests subject to price limitations and the procedure code submitted includes a professional component. Only the technical component is subject to price limitations.  Please submit the technical and professional components of this service as separate line items.', '1997-01-01', None),
+        ('M67', 'Missing/incomplete/invalid other procedure code(s).', '1997-01-01', None),
+        ('M68', 'Missing/incomplete/invalid attending, ordering, rendering, supervising or referring physician identification.', '1997-01-01', '2005-06-02'),
+        ('M69', 'Paid at the regular rate as you did not submit documentation to justify the modified procedure code.', '1997-01-01', None),
+        ('M70', 'Alert:The NDC code submitted for this service was translated to a HCPCS code for processing, but please continue to submit the NDC on future claims for this item.', '1997-01-01', None),
+        ('M71', 'Total payment reduced due to overlap of tests billed.', '1997-01-01', None),
+        ('M72', 'Did not enter full 8-digit date (MM/DD/CCYY).', '1997-01-01', '2003-10-16'),
+        ('M73', 'The HPSA/Physician Scarcity bonus can only be paid on the professional component of this service. Rebill as separate professional and technical components.', '1997-01-01', None),
+        ('M74', 'This service does not qualify for a HPSA/Physician Scarcity bonus payment.', '1997-01-01', None),
+        ('M75', 'Multiple automated multichannel tests performed on the same day combined for payment.', '1997-01-01', None),
+        ('M76', 'Missing/incomplete/invalid diagnosis or condition.', '1997-01-01', None),
+        ('M77', 'Missing/incomplete/invalid/inappropriate place of service.', '1997-01-01', None),
+        ('M78', 'Missing/incomplete/invalid HCPCS modifier.', '1997-01-01', '2006-05-18'),
+        ('M79', 'Missing/incomplete/invalid charge.', '1997-01-01', None),
+        ('M80', 'Not covered when performed during the same session/date as a previously processed service for the patient.', '1997-01-01', None),
+        ('M81', 'You are required to code to the highest level of specificity.', '1997-01-01', None),
+        ('M82', 'Service is not covered when patient is under age 50.', '1997-01-01', None),
+        ('M83', 'Service is not covered unless the patient is classified as at high risk.', '1997-01-01', None),
+        ('M84', 'Medical code sets used must be the codes in effect at the time of service.', '1997-01-01', None),
+        ('M85', 'Subjected to review of physician evaluation and management services.', '1997-01-01', None),
+        ('M86', 'Service denied because payment already made for same/similar procedure within set time frame.', '1997-01-01', None),
+        ('M87', 'Claim/service(s) subjected to CFO-CAP prepayment review.', '1997-01-01', None),
+        ('M88', 'We cannot pay for laboratory tests unless billed by the laboratory that did the work.', '1997-01-01', '2004-08-01'),
+        ('M89', 'Not covered more than once under age 40.', '1997-01-01', None),
+        ('M90', 'Not covered more than once in a 12 month period.', '1997-01-01', None),
+        ('M91', 'Lab procedures with different CLIA certification numbers must be billed on separate claims.', '1997-01-01', None),
+        ('M92', 'Services subjected to review under the Home Health Medical Review Initiative.', '1997-01-01', '2004-08-01'),
+        ('M93', 'Information supplied supports a break in therapy.  A new capped rental period began with delivery of this equipment.', '1997-01-01', None),
+        ('M94', 'Information supplied does not support a break in therapy.  A new capped rental period will not begin.', '1997-01-01', None),
+        ('M95', 'Services subjected to Home Health Initiative medical review/cost report audit.', '1997-01-01', None),
+        ('M96', 'The technical component of a service furnished to an inpatient may only be billed by that inpatient facility. You must contact the inpatient facility for technical component reimbursement.  If not already billed, you should bill us for the professional component only.', '1997-01-01', None),
+        ('M97', 'Not paid to practitioner when provided to patient in this place of service.  Payment included in the reimbursement issued the facility.', '1997-01-01', None),
+        ('M98', 'Begin to report the Universal Product Number on claims for items of this type. We will soon begin to deny payment for items of this type if billed without the correct UPN.', '1997-01-01', '2004-01-31'),
+        ('M99', 'Missing/incomplete/invalid Universal Product Number/Serial Number.', '1997-01-01', None),
+        ('M100', 'We do not pay for an oral anti-emetic drug that is not administered for use immediately before, at, or within 48 hours of administration of a covered chemotherapy drug.', '1997-01-01', None),
+        ('M101', 'Begin to report a G1-G5 modifier with this HCPCS.  We will soon begin to deny payment for this service if billed without a G1-G5 modifier.', '1997-01-01', '2004-01-31'),
+        ('M102', 'Service not performed on equipment approved by the FDA for this purpose.', '1997-01-01', None),
+        ('M103', 'Information supplied supports a break in therapy.  However, the medical information we have for this patient does not support the need for this item as billed.  We have approved payment for this item at a reduced level, and a new capped rental period will begin with the delivery of this equipment.', '1997-01-01', None),
+        ('M104', 'Information supplied supports a break in therapy.  A new capped rental period will begin with delivery of the equipment.  This is the maximum approved under the fee schedule for this item or service.', '1997-01-01', None),
+        ('M105', 'Information supplied does not support a break in therapy.  The medical information we have for this patient does not support the need for this item as billed. We have approved payment for this item at a reduced level, and a new capped rental period will not begin.', '1997-01-01', None),
+        ('M106', 'Information supplied does not support a break in therapy.  A new capped rental period will not begin. This is the maximum approved under the fee schedule for this item or service.', '1997-01-01', '2004-01-31'),
+        ('M107', 'Payment reduced as 90-day rolling average hematocrit for ESRD patient exceeded 36.5%.', '1997-01-01', None),
+        ('M108', 'Missing/incomplete/invalid provider identifier for the provider who interpreted the diagnostic test.', '1997-01-01', '2005-06-02'),
+        ('M109', 'We have provided you with a bundled payment for a teleconsultation. You must send 25 percent of the teleconsultation payment to the referring practitioner.', '1997-01-01', None),
+        ('M110', 'Missing/incomplete/invalid provider identifier for the provider from whom you purchased interpretation services.', '1997-01-01', '2005-06-02'),
+        ('M111', 'We do not pay for chiropractic manipulative treatment when the patient refuses to have an x-ray taken.', '1997-01-01', None),
+        ('M112', 'Reimbursement for this item is based on the single payment amount required under the DMEPOS Competitive Bidding Program for the area where the patient resides.', '1997-01-01', None),
+        ('M113', 'Our records indicate that this patient began using this item/service prior to the current contract period for the DMEPOS Competitive Bidding Program.', '1997-01-01', None),
+        ('M114', 'This service was processed in accordance with rules and guidelines under the DMEPOS Competitive Bidding Program or a Demonstration Project.  For more information regarding these projects, contact your local contractor.', '1997-01-01', None),
+        ('M115', 'This item is denied when provided to this patient by a non-contract or non-demonstration supplier.', '1997-01-01', None),
+        ('M116', 'Processed under a demonstration project or program. Project or program is ending and additional services may not be paid under this project or program.', '1997-01-01', None),
+        ('M117', 'Not covered unless submitted via electronic claim.', '1997-01-01', None),
+        ('M118', 'Letter to follow containing further information.', '1997-01-01', '2011-01-01'),
+        ('M119', 'Missing/incomplete/invalid/ deactivated/withdrawn National Drug Code (NDC).', '1997-01-01', None),
+        ('M120', 'Missing/incomplete/invalid provider identifier for the substituting physician who furnished the service(s) under a reciprocal billing or locum tenens arrangement.', '1997-01-01', '2005-06-02'),
+        ('M121', 'We pay for this service only when performed with a covered cryosurgical ablation.', '1997-01-01', None),
+        ('M122', 'Missing/incomplete/invalid level of subluxation.', '1997-01-01', None),
+        ('M123', 'Missing/incomplete/invalid name, strength, or dosage of the drug furnished.', '1997-01-01', None),
+        ('M124', 'Missing indication of whether the patient owns the equipment that requires the part or supply.', '1997-01-01', None),
+        ('M125', 'Missing/incomplete/invalid information on the period of time for which the service/supply/equipment will be needed.', '1997-01-01', None),
+        ('M126', 'Missing/incomplete/invalid individual lab codes included in the test.', '1997-01-01', None),
+        ('M127', 'Missing patient medical record for this service.', '1997-01-01', None),
+        ('M128', "Missing/incomplete/invalid date of the patient's last physician visit.", '1997-01-01', '2005-06-02'),
+        ('M129', 'Missing/incomplete/invalid indicator of x-ray availability for review.', '1997-01-01', None),
+        ('M130', 'Missing invoice or statement certifying the actual cost of the lens, less discounts, and/or the type of intraocular lens used.', '1997-01-01', None),
+        ('M131', 'Missing physician financial relationship form.', '1997-01-01', None),
+        ('M132', 'Missing pacemaker registration form.', '1997-01-01', None),
+        ('M133', 'Claim did not identify who performed the purchased diagnostic test or the amount you were charged for the test.', '1997-01-01', None),
+        ('M134', 'Performed by a facility/supplier in which the provider has a financial interest.', '1997-01-01', None),
+        ('M135', 'Missing/incomplete/invalid plan of treatment.', '1997-01-01', None),
+        ('M136', 'Missing/incomplete/invalid indication that the service was supervised or evaluated by a physician.', '1997-01-01', None),
+        ('M137', 'Part B coinsurance under a demonstration project or pilot program.', '1997-01-01', None),
+        ('M138', 'Patient identified as a demonstration participant but the patient was not enrolled in the demonstration at the time services were rendered.  Coverage is limited to demonstration participants.', '1997-01-01', None),
+        ('M139', 'Denied services exceed the coverage limit for the demonstration.', '1997-01-01', None),
+        ('M140', "Service not covered until after the patient's 50th birthday, i.e., no coverage prior to the day after the 50th birthday", '1997-01-01', '2004-01-30'),
+        ('M141', 'Missing physician certified plan of care.', '1997-01-01', None),
+        ('M142', 'Missing American Diabetes Association Certificate of Recognition.', '1997-01-01', None),
+        ('M143', 'The provider must update license information with the payer.', '1997-01-01', None),
+        ('M144', 'Pre-/post-operative care payment is included in the allowance for the surgery/procedure.', '1997-01-01', None),
+        ('MA01', 'Alert:If you do not agree with what we approved for these services, you may appeal our decision.  To make sure that we are fair to you, we require another individual that did not process your initial claim to conduct the appeal.  However, in order to be eligible for an appeal, you must write to us within 120 days of the date you received this notice, unless you have a good reason for being late.', '1997-01-01', None),
+        ('MA02', 'Alert:If you do not agree with this determination, you have the right to appeal. You must file a written request for an appeal within 180 days of the date you receive this notice.', '1997-01-01', None),
+        ('MA03', 'If you do not agree with the approved amounts and $100 or more is in dispute (less deductible and coinsurance), you may ask for a hearing within six months of the date of this notice. To meet the $100, you may combine amounts on other claims that have been denied, including reopened appeals if you received a revised decision. You must appeal each claim on time.', '1997-01-01', '2006-10-01'),
+        ('MA04', 'Secondary payment cannot be considered without the identity of or payment information from the primary payer.  The information was either not reported or was illegible.', '1997-01-01', None),
+        ('MA05', 'Incorrect admission date patient status or type of bill entry on claim.', '1997-01-01', '2003-10-16'),
+        ('MA06', 'Missing/incomplete/invalid beginning and/or ending date(s).', '1997-01-01', '2004-08-01'),
+        ('MA07', 'Alert:The claim information has also been forwarded to Medicaid for review.', '1997-01-01', None),
+        ('MA08', 'Alert:Claim information was not forwarded because the supplemental coverage is not with a Medigap plan, or you do not participate in Medicare.', '1997-01-01', None),
+        ('MA09', 'Alert:Claim submitted as unassigned but processed as assigned in accordance with our current assignment/participation agreement.', '1997-01-01', None),
+        ('MA10', "Alert:The patient's payment was in excess of the amount owed.  You must refund the overpayment to the patient.", '1997-01-01', None),
+        ('MA11', "Payment is being issued on a conditional basis.  If no-fault insurance, liability insurance, Workers' Compensation, Department of Veterans Affairs, or a group health plan for employees and dependents also covers this claim, a refund may be due us.  Please contact us if the patient is covered by any of these sources.", '1997-01-01', '2004-01-31'),
+        ('MA12', 'You have not established that you have the right under the law to bill for services furnished by the person(s) that furnished this (these) service(s).', '1997-01-01', None),
+        ('MA13', 'Alert:You may be subject to penalties if you bill the patient for amounts not reported with the PR (patient responsibility) group code.', '1997-01-01', None),
+        ('MA14', 'Alert:The patient is a member of an employer-sponsored prepaid health plan. Services from outside that health plan are not covered.  However, as you were not previously notified of this, we are paying this time.  In the future, we will not pay you for non-plan services.', '1997-01-01', None),
+        ('MA15', 'Alert:Your claim has been separated to expedite handling. You will receive a separate notice for the other services reported.', '1997-01-01', None),
+        ('MA16', 'The patient is covered by the Black Lung Program.  Send this claim to the Department of Labor, Federal Black Lung Program, P.O. Box 828, Lanham-Seabrook MD 20703.', '1997-01-01', None),
+        ('MA17', "We are the primary payer and have paid at the primary rate.  You must contact the patient's other insurer to refund any excess it may have paid due to its erroneous primary payment.", '1997-01-01', None),
+        ('MA18', "Alert:The claim information is also being forwarded to the patient's supplemental insurer. Send any questions regarding supplemental benefits to them.", '1997-01-01', None),
+        ('MA19', 'Alert:Information was not sent to the Medigap insurer due to incorrect/invalid information you submitted concerning that insurer. Please verify your information and submit your secondary claim directly to that insurer.', '1997-01-01', None),
+        ('MA20', 'Skilled Nursing Facility (SNF) stay not covered when care is primarily related to the use of an urethral catheter for convenience or the control of incontinence.', '1997-01-01', None),
+        ('MA21', 'SSA records indicate mismatch with name and sex.', '1997-01-01', None),
+        ('MA22', 'Payment of less than $1.00 suppressed.', '1997-01-01', None),
+        ('MA23', 'Demand bill approved as result of medical review.', '1997-01-01', None),
+        ('MA24', 'Christian Science Sanitarium/ Skilled Nursing Facility (SNF) bill in the same benefit period.', '1997-01-01', None),
+        ('MA25', 'A patient may not elect to change a hospice provider more than once in a benefit period.', '1997-01-01', None),
+        ('MA26', 'Alert:Our records indicate that you were previously informed of this rule.', '1997-01-01', None),
+        ('MA27', 'Missing/incomplete/invalid entitlement number or name shown on the claim.', '1997-01-01', None),
+        ('MA28', 'Alert:Receipt of this notice by a physician or supplier who did not accept assignment is for information only and does not make the physician or supplier a party to the determination.  No additional rights to appeal this decision, above those rights already provided for by regulation/instruction, are conferred by receipt of this notice.', '1997-01-01', None),
+        ('MA29', 'Missing/incomplete/invalid provider name, city, state, or zip code.', '1997-01-01', '2005-06-02'),
+        ('MA30', 'Missing/incomplete/invalid type of bill.', '1997-01-01', None),
+        ('MA31', 'Missing/incomplete/invalid beginning and ending dates of the period billed.', '1997-01-01', None),
+        ('MA32', 'Missing/incomplete/invalid number of covered days during the billing period.', '1997-01-01', None),
+        ('MA33', 'Missing/incomplete/invalid non-covered days during the billing period.', '1997-01-01', None),
+        ('MA34', 'Missing/incomplete/invalid number of coinsurance days during the billing period.', '1997-01-01', None),
+        ('MA35', 'Missing/incomplete/invalid number of lifetime reserve days.', '1997-01-01', None),
+        ('MA36', 'Missing/incomplete/invalid patient name.', '1997-01-01', None),
+        ('MA37', "Missing/incomplete/invalid patient's address.", '1997-01-01', None),
+        ('MA38', 'Missing/incomplete/invalid birth date.', '1997-01-01', '2005-06-02'),
+        ('MA39', 'Missing/incomplete/invalid gender.', '1997-01-01', None),
+        ('MA40', 'Missing/incomplete/invalid admission date.', '1997-01-01', None),
+        ('MA41', 'Missing/incomplete/invalid admission type.', '1997-01-01', None),
+        ('MA42', 'Missing/incomplete/invalid admission source.', '1997-01-01', None),
+        ('MA43', 'Missing/incomplete/invalid patient status.', '1997-01-01', None),
+        ('MA44', 'Alert:No appeal rights. Adjudicative decision based on law.', '1997-01-01', None),
+        ('MA45', 'Alert:As previously advised, a portion or all of your payment is being held in a special account.', '1997-01-01', None),
+        ('MA46', 'Alert:The new information was considered but additional payment will not be issued.', '1997-01-01', None),
+        ('MA47', 'Our records show you have opted out of Medicare, agreeing with the patient not to bill Medicare for services/tests/supplies furnished.  As result, we cannot pay this claim. The patient is responsible for payment.', '1997-01-01', None),
+        ('MA48', 'Missing/incomplete/invalid name or address of responsible party or primary payer.', '1997-01-01', None),
+        ('MA49', 'Missing/incomplete/invalid six-digit provider identifier for home health agency or hospice for physician(s) performing care plan oversight services.', '1997-01-01', '2004-08-01'),
+        ('MA50', 'Missing/incomplete/invalid Investigational Device Exemption number or Clinical Trial number.', '1997-01-01', None),
+        ('MA51', 'Missing/incomplete/invalid CLIA certification number for laboratory services billed by physician office laboratory.', '1997-01-01', '2005-02-05'),
+        ('MA52', 'Missing/incomplete/invalid date.', '1997-01-01', '2005-06-02'),
+        ('MA53', 'Missing/incomplete/invalid Competitive Bidding Demonstration Project identification.', '1997-01-01', None),
+        ('MA54', 'Physician certification or election consent for hospice care not received timely.', '1997-01-01', None),
+        ('MA55', 'Not covered as patient received medical health care services, automatically revoking his/her election to receive religious non-medical health care services.', '1997-01-01', None),
+        ('MA56', 'Our records show you have opted out of Medicare, agreeing with the patient not to bill Medicare for services/tests/supplies furnished.  As result, we cannot pay this claim. The patient is responsible for payment, but under Federal law, you cannot charge the patient more than the limiting charge amount.', '1997-01-01', None),
+        ('MA57', 'Patient submitted written request to revoke his/her election for religious non-medical health care services.', '1997-01-01', None),
+        ('MA58', 'Missing/incomplete/invalid release of information indicator.', '1997-01-01', None),
+        ('MA59', 'Alert:The patient overpaid you for these services. You must issue the patient a refund within 30 days for the difference between his/her payment and the total amount shown as patient responsibility on this notice.', '1997-01-01', None),
+        ('MA60', 'Missing/incomplete/invalid patient relationship to insured.', '1997-01-01', None),
+        ('MA61', 'Missing/incomplete/invalid social security number.', '1997-01-01', None),
+        ('MA62', 'Alert:This is a telephone review decision.', '1997-01-01', None),
+        ('MA63', 'Missing/incomplete/invalid principal diagnosis.', '1997-01-01', None),
+        ('MA64', 'Our records indicate that we should be the third payer for this claim.  We cannot process this claim until we have received payment information from the primary and secondary payers.', '1997-01-01', None),
+        ('MA65', 'Missing/incomplete/invalid admitting diagnosis.', '1997-01-01', None),
+        ('MA66', 'Missing/incomplete/invalid principal procedure code.', '1997-01-01', None),
+        ('MA67', 'Alert:Correction to a prior claim.', '1997-01-01', None),
+        ('MA68', 'Alert:We did not crossover this claim because the secondary insurance information on the claim was incomplete. Please supply complete information or use the PLANID of the insurer to assure correct and timely routing of the claim.', '1997-01-01', None),
+        ('MA69', 'Missing/incomplete/invalid remarks.', '1997-01-01', None),
+        ('MA70', 'Missing/incomplete/invalid provider representative signature.', '1997-01-01', None),
+        ('MA71', 'Missing/incomplete/invalid provider representative signature date.', '1997-01-01', None),
+        ('MA72', 'Alert:The patient overpaid you for these assigned services.  You must issue the patient a refund within 30 days for the difference between his/her payment to you and the total of the amount shown as patient responsibility and as paid to the patient on this notice.', '1997-01-01', None),
+        ('MA73', 'Informational remittance associated with a Medicare demonstration.  No payment issued under fee-for-service Medicare as patient has elected managed care.', '1997-01-01', None),
+        ('MA74', 'Alert:This payment replaces an earlier payment for this claim that was either lost, damaged or returned.', '1997-01-01', None),
+        ('MA75', 'Missing/incomplete/invalid patient or authorized representative signature.', '1997-01-01', None),
+        ('MA76', 'Missing/incomplete/invalid provider identifier for home health agency or hospice when physician is performing care plan oversight services.', '1997-01-01', None),
+        ('MA77', "Alert:The patient overpaid you. You must issue the patient a refund within 30 days for the difference between the patient's payment less the total of our and other payer payments and the amount shown as patient responsibility on this notice.", '1997-01-01', None),
+        ('MA78', 'The patient overpaid you.  You must issue the patient a refund within 30 days for the difference between our allowed amount total and the amount paid by the patient.', '1997-01-01', '2004-01-31'),
+        ('MA79', 'Billed in excess of interim rate.', '1997-01-01', None),
+        ('MA80', 'Informational notice. No payment issued for this claim with this notice. Payment issued to the hospital by its intermediary for all services for this encounter under a demonstration project.', '1997-01-01', None),
+        ('MA81', 'Missing/incomplete/invalid provider/supplier signature.', '1997-01-01', None),
+        ('MA82', 'Missing/incomplete/invalid provider/supplier billing number/identifier or billing name, address, city, state, zip code, or phone number.', '1997-01-01', '2005-06-02'),
+        ('MA83', 'Did not indicate whether we are the primary or secondary payer.', '1997-01-01', None),
+        ('MA84', 'Patient identified as participating in the National Emphysema Treatment Trial but our records indicate that this patient is either not a participant, or has not yet been approved for this phase of the study.  Contact Johns Hopkins University, the study coordinator, to resolve if there was a discrepancy.', '1997-01-01', None),
+        ('MA85', 'Our records indicate that a primary payer exists (other than ourselves); however, you did not complete or enter accurately the insurance plan/group/program name or identification number.  Enter the PlanID when effective.', '1997-01-01', '2004-08-01'),
+        ('MA86', 'Missing/incomplete/invalid group or policy number of the insured for the primary coverage.', '1997-01-01', '2004-08-01'),
+        ('MA87', "Missing/incomplete/invalid insured's name for the primary payer.", '1997-01-01', '2004-08-01'),
+        ('MA88', "Missing/incomplete/invalid insured's address and/or telephone number for the primary payer.", '1997-01-01', None),
+        ('MA89', "Missing/incomplete/invalid patient's relationship to the insured for the primary payer.", '1997-01-01', None),
+        ('MA90', 'Missing/incomplete/invalid employment status code for the primary insured.', '1997-01-01', None),
+        ('MA91', 'Alert:This determination is the result of the appeal you filed.', '1997-01-01', None),
+        ('MA92', 'Missing plan information for other insurance.', '1997-01-01', None),
+        ('MA93', 'Non-PIP (Periodic Interim Payment) claim.', '1997-01-01', None),
+        ('MA94', "Did not enter the statement 'Attending physician not hospice employee' on the claim form to certify that the rendering physician is not an employee of the hospice.", '1997-01-01', None),
+        ('MA95', 'A not otherwise classified or unlisted procedure code(s) was billed but a narrative description of the procedure was not entered on the claim.  Refer to item 19 on the HCFA-1500.', '1997-01-01', '2004-01-01'),
+        ('MA96', 'Claim rejected. Coded as a Medicare Managed Care Demonstration but patient is not enrolled in a Medicare managed care plan.', '1997-01-01', None),
+        ('MA97', 'Missing/incomplete/invalid Medicare Managed Care Demonstration contract number or clinical trial registry number.', '1997-01-01', None),
+        ('MA98', 'Claim Rejected. Does not contain the correct Medicare Managed Care Demonstration contract number for this beneficiary.', '1997-01-01', '2003-10-16'),
+        ('MA99', 'Missing/incomplete/invalid Medigap information.', '1997-01-01', None),
+        ('MA100', 'Missing/incomplete/invalid date of current illness or symptoms.', '1997-01-01', None),
+        ('MA101', 'A Skilled Nursing Facility (SNF) is responsible for payment of outside providers who furnish these services/supplies to residents.', '1997-01-01', '2011-01-01'),
+        ('MA102', 'Missing/incomplete/invalid name or provider identifier for the rendering/referring/ ordering/ supervising provider.', '1997-01-01', '2004-08-01'),
+        ('MA103', 'Hemophilia Add On.', '1997-01-01', None),
+        ('MA104', 'Missing/incomplete/invalid date the patient was last seen or the provider identifier of the attending physician.', '1997-01-01', '2004-01-31'),
+        ('MA105', 'Missing/incomplete/invalid provider number for this place of service.', '1997-01-01', '2005-06-02'),
+        ('MA106', 'PIP (Periodic Interim Payment) claim.', '1997-01-01', None),
+        ('MA107', 'Paper claim contains more than three separate data items in field 19.', '1997-01-01', None),
+        ('MA108', 'Paper claim contains more than one data item in field 23.', '1997-01-01', None),
+        ('MA109', 'Claim processed in accordance with ambulatory surgical guidelines.', '1997-01-01', None),
+        ('MA110', 'Missing/incomplete/invalid information on whether the diagnostic test(s) were performed by an outside entity or if no purchased tests are included on the claim.', '1997-01-01', None),
+        ('MA111', "Missing/incomplete/invalid purchase price of the test(s) and/or the performing laboratory's name and address.", '1997-01-01', None),
+        ('MA112', 'Missing/incomplete/invalid group practice information.', '1997-01-01', None),
+        ('MA113', 'Incomplete/invalid taxpayer identification number (TIN) submitted by you per the Internal Revenue Service. Your claims cannot be processed without your correct TIN, and you may not bill the patient pending correction of your TIN.  There are no appeal rights for unprocessable claims, but you may resubmit this claim after you have notified this office of your correct TIN.', '1997-01-01', None),
+        ('MA114', 'Missing/incomplete/invalid information on where the services were furnished.', '1997-01-01', None),
+        ('MA115', 'Missing/incomplete/invalid physical location (name and address, or PIN) where the service(s) were rendered in a Health Professional Shortage Area (HPSA).', '1997-01-01', None),
+        ('MA116', "Did not complete the statement 'Homebound' on the claim to validate whether laboratory services were performed at home or in an institution.", '1997-01-01', None),
+        ('MA117', 'This claim has been assessed a $1.00 user fee.', '1997-01-01', None),
+        ('MA118', 'Alert:No Medicare payment issued for this claim for services or supplies furnished to a Medicare-eligible veteran through a facility of the Department of Veterans Affairs. Coinsurance and/or deductible are applicable.', '1997-01-01', None),
+        ('MA119', 'Provider level adjustment for late claim filing applies to this claim.', '1997-01-01', '2008-05-01'),
+        ('MA120', 'Missing/incomplete/invalid CLIA certification number.', '1997-01-01', None),
+        ('MA121', 'Missing/incomplete/invalid x-ray date.', '1997-01-01', None),
+        ('MA122', 'Missing/incomplete/invalid initial treatment date.', '1997-01-01', None),
+        ('MA123', 'Your center was not selected to participate in this study, therefore, we cannot pay for these services.', '1997-01-01', None),
+        ('MA124', 'Processed for IME only.', '1997-01-01', '2004-01-31'),
+        ('MA125', 'Per legislation governing this program, payment constitutes payment in full.', '1997-01-01', None),
+        ('MA126', 'Pancreas transplant not covered unless kidney transplant performed.', '2001-10-12', None),
+        ('MA127', 'Reserved for future use.', '2001-10-12', '2005-06-02'),
+        ('MA128', 'Missing/incomplete/invalid FDA approval number.', '2001-10-12', None),
+        ('MA129', 'This provider was not certified for this procedure on this date of service.', '2001-10-12', '2004-01-31'),
+        ('MA130', 'Your claim contains incomplete and/or invalid information, and no appeal rights are afforded because the claim is unprocessable.  Please submit a new claim with the complete/correct information.', '2001-10-12', None),
+        ('MA131', 'Physician already paid for services in conjunction with this demonstration claim.  You must have the physician withdraw that claim and refund the payment before we can process your claim.', '2001-10-12', None),
+        ('MA132', 'Adjustment to the pre-demonstration rate.', '2001-10-12', None),
+        ('MA133', 'Claim overlaps inpatient stay. Rebill only those services rendered outside the inpatient stay.', '2001-10-12', None),
+        ('MA134', 'Missing/incomplete/invalid provider number of the facility where the patient resides.', '2001-10-12', None),
+        ('N1', 'Alert:You may appeal this decision in writing within the required time limits following receipt of this notice by following the instructions included in your contract, plan benefit documents or jurisdiction statutes. Refer to the URL provided in the ERA for the payer website to access the appeals process guidelines.', '2000-01-01', None),
+        ('N2', 'This allowance has been made in accordance with the most appropriate course of treatment provision of the plan.', '2000-01-01', None),
+        ('N3', 'Missing consent form.', '2000-01-01', None),
+        ('N4', 'Missing/Incomplete/Invalid prior Insurance Carrier(s) EOB.', '2000-01-01', None),
+        ('N5', 'EOB received from previous payer.  Claim not on file.', '2000-01-01', None),
+        ('N6', 'Under FEHB law (U.S.C. 8904(b)), we cannot pay more for covered care than the amount Medicare would have allowed if the patient were enrolled in Medicare Part A and/or Medicare Part B.', '2000-01-01', None),
+        ('N7', 'Alert:Processing of this claim/service has included consideration under Major Medical provisions.', '2000-01-01', None),
+        ('N8', 'Crossover claim denied by previous payer and complete claim data not forwarded. Resubmit this claim to this payer to provide adequate data for adjudication.', '2000-01-01', None),
+        ('N9', 'Adjustment represents the estimated amount a previous payer may pay.', '2000-01-01', None),
+        ('N10', 'Adjustment based on the findings of a review organization/professional consult/manual adjudication/medical advisor/dental advisor/peer review.', '2000-01-01', None),
+        ('N11', 'Denial reversed because of medical review.', '2000-01-01', None),
+        ('N12', 'Policy provides coverage supplemental to Medicare. As the member does not appear to be enrolled in the applicable part of Medicare, the member is responsible for payment of the portion of the charge that would have been covered by Medicare.', '2000-01-01', None),
+        ('N13', 'Payment based on professional/technical component modifier(s).', '2000-01-01', None),
+        ('N14', 'Payment based on a contractual amount or agreement, fee schedule, or maximum allowable amount.', '2000-01-01', '2007-10-01'),
+        ('N15', 'Services for a newborn must be billed separately.', '2000-01-01', None),
+        ('N16', 'Family/member Out-of-Pocket maximum has been met. Payment based on a higher percentage.', '2000-01-01', None),
+        ('N17', 'Per admission deductible.', '2000-01-01', '2004-08-01'),
+        ('N18', 'Payment based on the Medicare allowed amount.', '2000-01-01', '2004-01-31'),
+        ('N19', 'Procedure code incidental to primary procedure.', '2000-01-01', None),
+        ('N20', 'Service not payable with other service rendered on the same date.', '2000-01-01', None),
+        ('N21', 'Alert:Your line item has been separated into multiple lines to expedite handling.', '2000-01-01', None),
+        ('N22', 'Alert:This procedure code was added/changed because it more accurately describes the services rendered.', '2000-01-01', None),
+        ('N23', 'Alert:Patient liability may be affected due to coordination of benefits with other carriers and/or maximum benefit provisions.', '2000-01-01', None),
+        ('N24', 'Missing/incomplete/invalid Electronic Funds Transfer (EFT) banking information.', '2000-01-01', None),
+        ('N25', 'This company has been contracted by your benefit plan to provide administrative claims payment services only.  This company does not assume financial risk or obligation with respect to claims processed on behalf of your benefit plan.', '2000-01-01', None),
+        ('N26', 'Missing itemized bill/statement.', '2000-01-01', None),
+        ('N27', 'Missing/incomplete/invalid treatment number.', '2000-01-01', None),
+        ('N28', 'Consent form requirements not fulfilled.', '2000-01-01', None),
+        ('N29', 'Missing documentation/orders/notes/summary/report/chart.', '2000-01-01', '2016-03-01'),
+        ('N30', 'Patient ineligible for this service.', '2000-01-01', None),
+        ('N31', 'Missing/incomplete/invalid prescribing provider identifier.', '2000-01-01', None),
+        ('N32', 'Claim must be submitted by the provider who rendered the service.', '2000-01-01', None),
+        ('N33', 'No record of health check prior to initiation of treatment.', '2000-01-01', None),
+        ('N34', 'Incorrect claim form/format for this service.', '2000-01-01', None),
+        ('N35', 'Program integrity/utilization review decision.', '2000-01-01', None),
+        ('N36', "Claim must meet primary payer's processing requirements before we can consider payment.", '2000-01-01', None),
+        ('N37', 'Missing/incomplete/invalid tooth number/letter.', '2000-01-01', None),
+        ('N38', 'Missing/incomplete/invalid place of service.', '2000-01-01', '2005-02-05'),
+        ('N39', 'Procedure code is not compatible with tooth number/letter.', '2000-01-01', None),
+        ('N40', 'Missing radiology film(s)/image(s).', '2000-01-01', None),
+        ('N41', 'Authorization request denied.', '2000-01-01', '2003-10-16'),
+        ('N42', 'Missing mental health assessment.', '2000-01-01', None),
+        ('N43', 'Bed hold or leave days exceeded.', '2000-01-01', None),
+        ('N44', "Payer's share of regulatory surcharges, assessments, allowances or health care-related taxes paid directly to the regulatory authority.", '2000-01-01', '2003-10-16'),
+        ('N45', 'Payment based on authorized amount.', '2000-01-01', None),
+        ('N46', 'Missing/incomplete/invalid admission hour.', '2000-01-01', None),
+        ('N47', 'Claim conflicts with another inpatient stay.', '2000-01-01', None),
+        ('N48', 'Claim information does not agree with information received from other insurance carrier.', '2000-01-01', None),
+        ('N49', 'Court ordered coverage information needs validation.', '2000-01-01', None),
+        ('N50', 'Missing/incomplete/invalid discharge information.', '2000-01-01', None),
+        ('N51', 'Electronic interchange agreement not on file for provider/submitter.', '2000-01-01', None),
+        ('N52', "Patient not enrolled in the billing provider's managed care plan on the date of service.", '2000-01-01', None),
+        ('N53', 'Missing/incomplete/invalid point of pick-up address.', '2000-01-01', None),
+        ('N54', 'Claim information is inconsistent with pre-certified/authorized services.', '2000-01-01', None),
+        ('N55', 'Procedures for billing with group/referring/performing providers were not followed.', '2000-01-01', None),
+        ('N56', 'Procedure code billed is not correct/valid for the services billed or the date of service billed.', '2000-01-01', None),
+        ('N57', 'Missing/incomplete/invalid prescribing date.', '2000-01-01', None),
+        ('N58', 'Missing/incomplete/invalid patient liability amount.', '2000-01-01', None),
+        ('N59', 'Alert:Please refer to your provider manual for additional program and provider information.', '2000-01-01', None),
+        ('N60', 'A valid NDC is required for payment of drug claims effective October 02.', '2000-01-01', '2004-01-31'),
+        ('N61', 'Rebill services on separate claims.', '2000-01-01', None),
+        ('N62', 'Dates of service span multiple rate periods. Resubmit separate claims.', '2000-01-01', None),
+        ('N63', 'Rebill services on separate claim lines.', '2000-01-01', None),
+        ('N64', "The 'from' and 'to' dates must be different.", '2000-01-01', None),
+        ('N65', 'Procedure code or procedure rate count cannot be determined, or was not on file, for the date of service/provider.', '2000-01-01', None),
+        ('N66', 'Missing/incomplete/invalid documentation.', '2000-01-01', '2005-02-05'),
+        ('N67', "Professional provider services not paid separately.  Included in facility payment under a demonstration project.  Apply to that facility for payment, or resubmit your claim if: the facility notifies you the patient was excluded from this demonstration; or if you furnished these services in another location on the date of the patient's admission or discharge from a demonstration hospital. If services were furnished in a facility not involved in the demonstration on the same date the patient was discharged from or admitted to a demonstration facility, you must report the provider ID number for the non-demonstration facility on the new claim.", '2000-01-01', None),
+        ('N68', 'Prior payment being cancelled as we were subsequently notified this patient was covered by a demonstration project in this site of service.  Professional services were included in the payment made to the facility. You must contact the facility for your payment.  Prior payment made to you by the patient or another insurer for this claim must be refunded to the payer within 30 days.', '2000-01-01', None),
+        ('N69', 'Alert:PPS (Prospective Payment System) code changed by claims processing system.', '2000-01-01', None),
+        ('N70', 'Consolidated billing and payment applies.', '2000-01-01', None),
+        ('N71', 'Your unassigned claim for a drug or biological, clinical diagnostic laboratory services or ambulance service was processed as an assigned claim. You are required by law to accept assignment for these types of claims.', '2000-01-01', None),
+        ('N72', 'PPS (Prospective Payment System)  code changed by medical reviewers.  Not supported by clinical records.', '2000-01-01', None),
+        ('N73', 'A Skilled Nursing Facility is responsible for payment of outside providers who furnish these services/supplies under arrangement to its residents.', '2000-01-01', '2004-01-31'),
+        ('N74', 'Resubmit with multiple claims, each claim covering services provided in only one calendar month.', '2000-01-01', None),
+        ('N75', 'Missing/incomplete/invalid tooth surface information.', '2000-01-01', None),
+        ('N76', 'Missing/incomplete/invalid number of riders.', '2000-01-01', None),
+        ('N77', 'Missing/incomplete/invalid designated provider number.', '2000-01-01', None),
+        ('N78', 'The necessary components of the child and teen checkup (EPSDT) were not completed.', '2000-01-01', None),
+        ('N79', 'Service billed is not compatible with patient location information.', '2000-01-01', None),
+        ('N80', 'Missing/incomplete/invalid prenatal screening information.', '2000-01-01', None),
+        ('N81', 'Procedure billed is not compatible with tooth surface code.', '2000-01-01', None),
+        ('N82', 'Provider must accept insurance payment as payment in full when a third party payer contract specifies full reimbursement.', '2000-01-01', None),
+        ('N83', 'No appeal rights. Adjudicative decision based on the provisions of a demonstration project.', '2000-01-01', None),
+        ('N84', 'Alert:Further installment payments are forthcoming.', '2000-01-01', None),
+        ('N85', 'Alert:This is the final installment payment.', '2000-01-01', None),
+        ('N86', 'A failed trial of pelvic muscle exercise training is required in order for biofeedback training for the treatment of urinary incontinence to be covered.', '2000-01-01', None),
+        ('N87', 'Home use of biofeedback therapy is not covered.', '2000-01-01', None),
+        ('N88', "Alert:This payment is being made conditionally.  An HHA episode of care notice has been filed for this patient. When a patient is treated under a HHA episode of care, consolidated billing requires that certain therapy services and supplies, such as this, be included in the HHA's payment.  This payment will need to be recouped from you if we establish that the patient is concurrently receiving treatment under a HHA episode of care.", '2000-01-01', None),
+        ('N89', 'Alert:Payment information for this claim has been forwarded to more than one other payer, but format limitations permit only one of the secondary payers to be identified in this remittance advice.', '2000-01-01', None),
+        ('N90', 'Covered only when performed by the attending physician.', '2000-01-01', None),
+        ('N91', 'Services not included in the appeal review.', '2000-01-01', None),
+        ('N92', 'This facility is not certified for digital mammography.', '2000-01-01', None),
+        ('N93', 'A separate claim must be submitted for each place of service. Services furnished at multiple sites may not be billed in the same claim.', '2000-01-01', None),
+        ('N94', 'Claim/Service denied because a more specific taxonomy code is required for adjudication.', '2000-01-01', None),
+        ('N95', 'This provider type/provider specialty may not bill this service.', '2001-07-31', None),
+        ('N96', 'Patient must be refractory to conventional therapy (documented behavioral, pharmacologic and/or surgical corrective therapy) and be an appropriate surgical candidate such that implantation with anesthesia can occur.', '2001-08-24', None),
+        ('N97', 'Patients with stress incontinence, urinary obstruction, and specific neurologic diseases (e.g., diabetes with peripheral nerve involvement) which are associated with secondary manifestations of the above three indications are excluded.', '2001-08-24', None),
+        ('N98', 'Patient must have had a successful test stimulation in order to support subsequent implantation. Before a patient is eligible for permanent implantation, he/she must demonstrate a 50 percent or greater improvement through test stimulation. Improvement is measured through voiding diaries.', '2001-08-24', None),
+        ('N99', 'Patient must be able to demonstrate adequate ability to record voiding diary data such that clinical results of the implant procedure can be properly evaluated.', '2001-08-24', None),
+        ('N100', 'PPS (Prospect Payment System) code corrected during adjudication.', '2001-09-14', '2016-11-01'),
+        ('N101', "Additional information is needed in order to process this claim. Please resubmit the claim with the identification number of the provider where this service took place. The Medicare number of the site of service provider should be preceded with the letters 'HSP' and entered into item #32 on the claim form. You may bill only one site of service provider number per claim.", '2001-10-31', '2004-01-31'),
+        ('N102', 'This claim has been denied without reviewing the medical/dental record because the requested records were not received or were not received timely.', '2001-10-31', '2016-07-01'),
+        ('N103', 'Records indicate this patient was a prisoner or in custody of a Federal, State, or local authority when the service was rendered. This  payer does not cover items and services furnished to an individual while he or she is in custody under a penal statute or rule, unless under State or local law, the individual is personally liable for the cost of his or her health care while in custody and the State or local government pursues the collection of such debt in the same way and with the same vigor as the collection of its other debts. The provider can collect from the Federal/State/ Local Authority as appropriate.', '2001-10-31', None),
+        ('N104', 'This claim/service is not payable under our claims jurisdiction area. You can identify the correct Medicare contractor to process this claim/service through the CMS website at www.cms.gov.', '2002-01-29', None),
+        ('N105', 'This is a misdirected claim/service for an RRB beneficiary. Submit paper claims to the RRB carrier: Palmetto GBA, P.O. Box 10066, Augusta, GA 30999. Call 888-355-9165 for RRB EDI information for electronic claims processing.', '2002-01-29', None),
+        ('N106', 'Payment for services furnished to Skilled Nursing Facility (SNF) inpatients (except for excluded services) can only be made to the SNF. You must request payment from the SNF rather than the patient for this service.', '2002-01-31', None),
+        ('N107', 'Services furnished to Skilled Nursing Facility (SNF) inpatients must be billed on the inpatient claim. They cannot be billed separately as outpatient services.', '2002-01-31', None),
+        ('N108', 'Missing/incomplete/invalid upgrade information.', '2002-01-31', None),
+        ('N109', 'Alert:This claim/service was chosen for complex review.', '2002-02-28', None),
+        ('N110', 'This facility is not certified for film mammography.', '2002-02-28', None),
+        ('N111', 'No appeal right except duplicate claim/service issue. This service was included in a claim that has been previously billed and adjudicated.', '2002-02-28', None),
+        ('N112', 'This claim is excluded from your electronic remittance advice.', '2002-02-28', None),
+        ('N113', 'Only one initial visit is covered per physician, group practice or provider.', '2002-04-16', None),
+        ('N114', 'During the transition to the Ambulance Fee Schedule, payment is based on the lesser of a blended amount calculated using a percentage of the reasonable charge/cost and fee schedule amounts, or the submitted charge for the service.  You will be notified yearly what the percentages for the blended payment calculation will be.', '2002-05-30', None),
+        ('N115', 'This decision was based on a Local Coverage Determination (LCD).  An LCD provides a guide to assist in determining whether a particular item or service is covered. A copy of this policy is available at www.cms.gov/mcd, or if you do not have web access, you may contact the contractor to request a copy of the LCD.', '2002-05-30', None),
+        ('N116', "Alert:This payment is being made conditionally because the service was provided in the home, and it is possible that the patient is under a home health episode of care. When a patient is treated under a home health episode of care, consolidated billing requires that certain therapy services and supplies, such as this, be included in the home health agency's (HHA's) payment. This payment will need to be recouped from you if we establish that the patient is concurrently receiving treatment under an HHA episode of care.", '2002-06-30', None),
+        ('N117', "This service is paid only once in a patient's lifetime.", '2002-07-30', None),
+        ('N118', 'This service is not paid if billed more than once every 28 days.', '2002-07-30', None),
+        ('N119', 'This service is not paid if billed once every 28 days, and the patient has spent 5 or more consecutive days in any inpatient or Skilled /nursing Facility (SNF) within those 28 days.', '2002-07-30', None),
+        ('N120', 'Payment is subject to home health prospective payment system partial episode payment adjustment. Patient was transferred/discharged/readmitted during payment episode.', '2002-08-09', None),
+        ('N121', 'Medicare Part B does not pay for items or services provided by this type of practitioner for beneficiaries in a Medicare Part A covered Skilled Nursing Facility (SNF) stay.', '2002-09-09', None),
+        ('N122', 'Add-on code cannot be billed by itself.', '2002-09-12', None),
+        ('N123', 'Alert:This is a split service and represents a portion of the units from the originally submitted service.', '2002-09-24', None),
+        ('N124', 'Payment has been denied for the/made only for a less extensive service/item because the information furnished does not substantiate the need for the (more extensive) service/item. The patient is liable for the charges for this service/item as you informed the patient in writing before the service/item was furnished that we would not pay for it, and the patient agreed to pay.', '2002-09-26', None),
+        ('N125', 'Payment has been (denied for the/made only for a less extensive) service/item because the information furnished does not substantiate the need for the (more extensive) service/item. If you have collected any amount from the patient, you must refund that amount to the patient within 30 days of receiving this notice.The requirements for a refund are in §1834(a)(18) of the Social Security Act (and in §§1834(j)(4) and 1879(h) by cross-reference to §1834(a)(18)). Section 1834(a)(18)(B) specifies that suppliers which knowingly and willfully fail to make appropriate refunds may be subject to civil money penalties and/or exclusion from the Medicare program. If you have any questions about this notice, please contact this office.', '2002-09-26', None),
+        ('N126', 'Social Security Records indicate that this individual has been deported. This payer does not cover items and services furnished to individuals who have been deported.', '2002-10-17', None),
+        ('N127', 'This is a misdirected claim/service for a United Mine Workers of America (UMWA) beneficiary. Please submit claims to them.', '2007-10-31', None),
+        ('N128', 'This amount represents the prior to coverage portion of the allowance.', '2002-10-31', None),
+        ('N129', "Not eligible due to the patient's age.", '2002-10-31', None),
+        ('N130', 'Consult plan benefit documents/guidelines for information about restrictions for this service.', '2002-10-31', None),
+        ('N131', 'Total payments under multiple contracts cannot exceed the allowance for this service.', '2002-10-31', None),
+        ('N132', 'Alert:Payments will cease for services rendered by this US Government debarred or excluded provider after the 30 day grace period as previously notified.', '2002-10-31', None),
+        ('N133', 'Alert:Services for predetermination and services requesting payment are being processed separately.', '2002-10-31', None),
+        ('N134', 'Alert:This represents your scheduled payment for this service. If treatment has been discontinued, please contact Customer Service.', '2002-10-31', None),
+        ('N135', "Record fees are the patient's responsibility and limited to the specified co-payment.", '2002-10-31', None),
+        ('N136', "Alert:To obtain information on the process to file an appeal in Arizona, call the Department's Consumer Assistance Office at (602) 912-8444 or (800) 325-2548.", '2002-10-31', None),
+        ('N137', "Alert:The provider acting on the Member's behalf, may file an appeal with the Payer. The provider, acting on the Member's behalf, may file a complaint with the State Insurance Regulatory Authority without first filing an appeal, if the coverage decision involves an urgent condition for which care has not been rendered. The address may be obtained from the State Insurance Regulatory Authority.", '2002-10-31', None),
+        ('N138', "Alert:In the event you disagree with the Dental Advisor's opinion and have additional information relative to the case, you may submit radiographs to the Dental Advisor Unit at the subscriber's dental insurance carrier for a second Independent Dental Advisor Review.", '2002-10-31', None),
+        ('N139', "Alert:Under 32 CFR 199.13, a non-participating provider is not an appropriate appealing party. Therefore, if you disagree with the Dental Advisor's opinion, you may appeal the determination if appointed in writing, by the beneficiary, to act as his/her representative. Should you be appointed as a representative, submit a copy of this letter, a signed statement explaining the matter in which you disagree, and any radiographs and relevant information to the subscriber's Dental insurance carrier within 90 days from the date of this letter.", '2002-10-31', None),
+        ('N140', "Alert:You have not been designated as an authorized OCONUS provider therefore are not considered an appropriate appealing party. If the beneficiary has appointed you, in writing, to act as his/her representative and you disagree with the Dental Advisor's opinion, you may appeal by submitting a copy of this letter, a signed statement explaining the matter in which you disagree, and any relevant information to the subscriber's Dental insurance carrier within 90 days from the date of this letter.", '2002-10-31', None),
+        ('N141', 'The patient was not residing in a long-term care facility during all or part of the service dates billed.', '2002-10-31', None),
+        ('N142', 'The original claim was denied.  Resubmit a new claim, not a replacement claim.', '2002-10-31', None),
+        ('N143', 'The patient was not in a hospice program during all or part of the service dates billed.', '2002-10-31', None),
+        ('N144', 'The rate changed during the dates of service billed.', '2002-10-31', None),
+        ('N145', 'Missing/incomplete/invalid provider identifier for this place of service.', '2002-10-31', '2005-06-02'),
+        ('N146', 'Missing screening document.', '2002-10-31', None),
+        ('N147', 'Long term care case mix or per diem rate cannot be determined because the patient ID number is missing, incomplete, or invalid on the assignment request.', '2002-10-31', None),
+        ('N148', 'Missing/incomplete/invalid date of last menstrual period.', '2002-10-31', None),
+        ('N149', 'Rebill all applicable services on a single claim.', '2002-10-31', None),
+        ('N150', 'Missing/incomplete/invalid model number.', '2002-10-31', None),
+        ('N151', 'Telephone contact services will not be paid until the face-to-face contact requirement has been met.', '2002-10-31', None),
+        ('N152', 'Missing/incomplete/invalid replacement claim information.', '2002-10-31', None),
+        ('N153', 'Missing/incomplete/invalid room and board rate.', '2002-10-31', None),
+        ('N154', "Alert:This payment was delayed for correction of provider's mailing address.", '2002-10-31', None),
+        ('N155', 'Alert:Our records do not indicate that other insurance is on file.  Please submit other insurance information for our records.', '2002-10-31', None),
+        ('N156', 'Alert:The patient is responsible for the difference between the approved treatment and the elective treatment.', '2002-10-31', None),
+        ('N157', 'Transportation to/from this destination is not covered.', '2003-02-28', None),
+        ('N158', 'Transportation in a vehicle other than an ambulance is not covered.', '2003-02-28', None),
+        ('N159', 'Payment denied/reduced because mileage is not covered when the patient is not in the ambulance.', '2003-02-28', None),
+        ('N160', 'The patient must choose an option before a payment can be made for this procedure/ equipment/ supply/ service.', '2003-02-28', None),
+        ('N161', 'This drug/service/supply is covered only when the associated service is covered.', '2003-02-28', None),
+        ('N162', 'Alert:Although your claim was paid, you have billed for a test/specialty not included in your Laboratory Certification.  Your failure to correct the laboratory certification information will result in a denial of payment in the near future.', '2003-02-28', None),
+        ('N163', 'Medical record does not support code billed per the code definition.', '2003-02-28', None),
+        ('N164', 'Transportation to/from this destination is not covered.', '2003-02-28', '2004-01-31'),
+        ('N165', 'Transportation in a vehicle other than an ambulance is not covered.', '2003-02-28', '2004-01-31'),
+        ('N166', 'Payment denied/reduced because mileage is not covered when the patient is not in the ambulance.', '2003-02-28', '2004-01-31'),
+        ('N167', 'Charges exceed the post-transplant coverage limit.', '2003-02-28', None),
+        ('N168', 'The patient must choose an option before a payment can be made for this procedure/ equipment/ supply/ service.', '2003-02-28', '2004-01-31'),
+        ('N169', 'This drug/service/supply is covered only when the associated service is covered.', '2003-02-28', '2004-01-31'),
+        ('N170', 'A new/revised/renewed certificate of medical necessity is needed.', '2003-02-28', None),
+        ('N171', 'Payment for repair or replacement is not covered or has exceeded the purchase price.', '2003-02-28', None),
+        ('N172', 'The patient is not liable for the denied/adjusted charge(s) for receiving any updated service/item.', '2003-02-28', None),
+        ('N173', 'No qualifying hospital stay dates were provided for this episode of care.', '2003-02-28', None),
+        ('N174', "This is not a covered service/procedure/ equipment/bed, however patient liability is limited to amounts shown in the adjustments under group 'PR'.", '2003-02-28', None),
+        ('N175', 'Missing review organization approval.', '2003-02-28', None),
+        ('N176', 'Services provided aboard a ship are covered only when the ship is of United States registry and is in United States waters. In addition, a doctor licensed to practice in the United States must provide the service.', '2003-02-28', None),
+        ('N177', "Alert:We did not send this claim to patient's other insurer. They have indicated no additional payment can be made.", '2003-02-28', None),
+        ('N178', 'Missing pre-operative images/visual field results.', '2003-02-28', None),
+        ('N179', 'Additional information has been requested from the member.  The charges will be reconsidered upon receipt of that information.', '2003-02-28', None),
+        ('N180', 'This item or service does not meet the criteria for the category under which it was billed.', '2003-02-28', None),
+        ('N181', 'Additional information is required from another provider involved in this service.', '2003-02-28', None),
+        ('N182', 'This claim/service must be billed according to the schedule for this plan.', '2003-02-28', None),
+        ('N183', 'Alert:This is a predetermination advisory message, when this service is submitted for payment additional documentation as specified in plan documents will be required to process benefits.', '2003-02-28', None),
+        ('N184', 'Rebill technical and professional components separately.', '2003-02-28', None),
+        ('N185', 'Alert:Do not resubmit this claim/service.', '2003-02-28', None),
+        ('N186', 'Non-Availability Statement (NAS) required for this service. Contact the nearest Military Treatment Facility (MTF) for assistance.', '2003-02-28', None),
+        ('N187', 'Alert:You may request a review in writing within the required time limits following receipt of this notice by following the instructions included in your contract or plan benefit documents.', '2003-02-28', None),
+        ('N188', 'The approved level of care does not match the procedure code submitted.', '2003-02-28', None),
+        ('N189', "Alert:This service has been paid as a one-time exception to the plan's benefit restrictions.", '2003-02-28', None),
+        ('N190', 'Missing contract indicator.', '2003-02-28', None),
+        ('N191', 'The provider must update insurance information directly with payer.', '2003-02-28', None),
+        ('N192', 'Alert:Patient is a Medicaid/Qualified Medicare Beneficiary.', '2003-02-28', None),
+        ('N193', 'Alert:Specific federal/state/local program may cover this service through another payer.', '2003-02-28', None),
+        ('N194', 'Technical component not paid if provider does not own the equipment used.', '2003-02-25', None),
+        ('N195', 'The technical component must be billed separately.', '2003-02-25', None),
+        ('N196', 'Alert:Patient eligible to apply for other coverage which may be primary.', '2003-02-25', None),
+        ('N197', 'The subscriber must update insurance information directly with payer.', '2003-02-25', None),
+        ('N198', 'Rendering provider must be affiliated with the pay-to provider.', '2003-02-25', None),
+        ('N199', 'Additional payment/recoupment approved based on payer-initiated review/audit.', '2003-02-25', None),
+        ('N200', 'The professional component must be billed separately.', '2003-02-25', None),
+        ('N201', 'A mental health facility is responsible for payment of outside providers who furnish these services/supplies to residents.', '2003-02-25', '2011-01-01'),
+        ('N202', 'Alert:Additional information/explanation will be sent separately.', '2003-06-30', None),
+        ('N203', 'Missing/incomplete/invalid anesthesia time/units.', '2003-06-30', None),
+        ('N204', 'Services under review for possible pre-existing condition. Send medical records for prior 12 months', '2003-06-30', None),
+        ('N205', 'Information provided was illegible.', '2003-06-30', None),
+        ('N206', 'The supporting documentation does not match the information sent on the claim.', '2003-06-30', None),
+        ('N207', 'Missing/incomplete/invalid weight.', '2003-06-30', None),
+        ('N208', 'Missing/incomplete/invalid DRG code.', '2003-06-30', None),
+        ('N209', 'Missing/incomplete/invalid taxpayer identification number (TIN).', '2003-06-30', None),
+        ('N210', 'Alert:You may appeal this decision.', '2003-06-30', None),
+        ('N211', 'Alert:You may not appeal this decision.', '2003-06-30', None),
+        ('N212', 'Charges processed under a Point of Service benefit.', '2004-02-01', None),
+        ('N213', 'Missing/incomplete/invalid facility/discrete unit DRG/DRG exempt status information.', '2004-04-01', None),
+        ('N214', 'Missing/incomplete/invalid history of the related initial surgical procedure(s).', '2004-04-01', None),
+        ('N215', 'Alert:A payer providing supplemental or secondary coverage shall not require a claims determination for this service from a primary payer as a condition of making its own claims determination.', '2004-04-01', None),
+        ('N216', 'We do not offer coverage for this type of service or the patient is not enrolled in this portion of our benefit package.', '2004-04-01', None),
+        ('N217', 'We pay only one site of service per provider per claim.', '2004-08-01', None),
+        ('N218', 'You must furnish and service this item for as long as the patient continues to need it.  We can pay for maintenance and/or servicing for the time period specified in the contract or coverage manual.', '2004-08-01', None),
+        ('N219', "Payment based on previous payer's allowed amount.", '2004-08-01', None),
+        ('N220', "Alert:See the payer's web site or contact the payer's Customer Service department to obtain forms and instructions for filing a provider dispute.", '2004-08-01', None),
+        ('N221', 'Missing Admitting History and Physical report.', '2004-08-01', None),
+        ('N222', 'Incomplete/invalid Admitting History and Physical report.', '2004-08-01', None),
+        ('N223', 'Missing documentation of benefit to the patient during initial treatment period.', '2004-08-01', None),
+        ('N224', 'Incomplete/invalid documentation of benefit to the patient during initial treatment period.', '2004-08-01', None),
+        ('N225', 'Incomplete/invalid documentation/orders/notes/summary/report/chart.', '2004-08-01', '2016-03-01'),
+        ('N226', 'Incomplete/invalid American Diabetes Association Certificate of Recognition.', '2004-08-01', None),
+        ('N227', 'Incomplete/invalid Certificate of Medical Necessity.', '2004-08-01', None),
+        ('N228', 'Incomplete/invalid consent form.', '2004-08-01', None),
+        ('N229', 'Incomplete/invalid contract indicator.', '2004-08-01', None),
+        ('N230', 'Incomplete/invalid indication of whether the patient owns the equipment that requires the part or supply.', '2004-08-01', None),
+        ('N231', 'Incomplete/invalid invoice or statement certifying the actual cost of the lens, less discounts, and/or the type of intraocular lens used.', '2004-08-01', None),
+        ('N232', 'Incomplete/invalid itemized bill/statement.', '2004-08-01', None),
+        ('N233', 'Incomplete/invalid operative note/report.', '2004-08-01', None),
+        ('N234', 'Incomplete/invalid oxygen certification/re-certification.', '2004-08-01', None),
+        ('N235', 'Incomplete/invalid pacemaker registration form.', '2004-08-01', None),
+        ('N236', 'Incomplete/invalid pathology report.', '2004-08-01', None),
+        ('N237', 'Incomplete/invalid patient medical record for this service.', '2004-08-01', None),
+        ('N238', 'Incomplete/invalid physician certified plan of care.', '2004-08-01', None),
+        ('N239', 'Incomplete/invalid physician financial relationship form.', '2004-08-01', None),
+        ('N240', 'Incomplete/invalid radiology report.', '2004-08-01', None),
+        ('N241', 'Incomplete/invalid review organization approval.', '2004-08-01', None),
+        ('N242', 'Incomplete/invalid radiology film(s)/image(s).', '2004-08-01', None),
+        ('N243', 'Incomplete/invalid/not approved screening document.', '2004-08-01', None),
+        ('N244', 'Incomplete/Invalid pre-operative  images/visual field results.', '2004-08-01', None),
+        ('N245', 'Incomplete/invalid plan information for other insurance.', '2004-08-01', None),
+        ('N246', 'State regulated patient payment limitations apply to this service.', '2004-12-02', None),
+        ('N247', 'Missing/incomplete/invalid assistant surgeon taxonomy.', '2004-12-02', None),
+        ('N248', 'Missing/incomplete/invalid assistant surgeon name.', '2004-12-02', None),
+        ('N249', 'Missing/incomplete/invalid assistant surgeon primary identifier.', '2004-12-02', None),
+        ('N250', 'Missing/incomplete/invalid assistant surgeon secondary identifier.', '2004-12-02', None),
+        ('N251', 'Missing/incomplete/invalid attending provider taxonomy.', '2004-12-02', None),
+        ('N252', 'Missing/incomplete/invalid attending provider name.', '2004-12-02', None),
+        ('N253', 'Missing/incomplete/invalid attending provider primary identifier.', '2004-12-02', None),
+        ('N254', 'Missing/incomplete/invalid attending provider secondary identifier.', '2004-12-02', None),
+        ('N255', 'Missing/incomplete/invalid billing provider taxonomy.', '2004-12-02', None),
+        ('N256', 'Missing/incomplete/invalid billing provider/supplier name.', '2004-12-02', None),
+        ('N257', 'Missing/incomplete/invalid billing provider/supplier primary identifier.', '2004-12-02', None),
+        ('N258', 'Missing/incomplete/invalid billing provider/supplier address.', '2004-12-02', None),
+        ('N259', 'Missing/incomplete/invalid billing provider/supplier secondary identifier.', '2004-12-02', None),
+        ('N260', 'Missing/incomplete/invalid billing provider/supplier contact information.', '2004-12-02', None),
+        ('N261', 'Missing/incomplete/invalid operating provider name.', '2004-12-02', None),
+        ('N262', 'Missing/incomplete/invalid operating provider primary identifier.', '2004-12-02', None),
+        ('N263', 'Missing/incomplete/invalid operating provider secondary identifier.', '2004-12-02', None),
+        ('N264', 'Missing/incomplete/invalid ordering provider name.', '2004-12-02', None),
+        ('N265', 'Missing/incomplete/invalid ordering provider primary identifier.', '2004-12-02', None),
+        ('N266', 'Missing/incomplete/invalid ordering provider address.', '2004-12-02', None),
+        ('N267', 'Missing/incomplete/invalid ordering provider secondary identifier.', '2004-12-02', None),
+        ('N268', 'Missing/incomplete/invalid ordering provider contact information.', '2004-12-02', None),
+        ('N269', 'Missing/incomplete/invalid other provider name.', '2004-12-02', None),
+        ('N270', 'Missing/incomplete/invalid other provider primary identifier.', '2004-12-02', None),
+        ('N271', 'Missing/incomplete/invalid other provider secondary identifier.', '2004-12-02', None),
+        ('N272', 'Missing/incomplete/invalid other payer attending provider identifier.', '2004-12-02', None),
+        ('N273', 'Missing/incomplete/invalid other payer operating provider identifier.', '2004-12-02', None),
+        ('N274', 'Missing/incomplete/invalid other payer other provider identifier.', '2004-12-02', None),
+        ('N275', 'Missing/incomplete/invalid other payer purchased service provider identifier.', '2004-12-02', None),
+        ('N276', 'Missing/incomplete/invalid other payer referring provider identifier.', '2004-12-02', None),
+        ('N277', 'Missing/incomplete/invalid other payer rendering provider identifier.', '2004-12-02', None),
+        ('N278', 'Missing/incomplete/invalid other payer service facility provider identifier.', '2004-12-02', None),
+        ('N279', 'Missing/incomplete/invalid pay-to provider name.', '2004-12-02', None),
+        ('N280', 'Missing/incomplete/invalid pay-to provider primary identifier.', '2004-12-02', None),
+        ('N281', 'Missing/incomplete/invalid pay-to provider address.', '2004-12-02', None),
+        ('N282', 'Missing/incomplete/invalid pay-to provider secondary identifier.', '2004-12-02', None),
+        ('N283', 'Missing/incomplete/invalid purchased service provider identifier.', '2004-12-02', None),
+        ('N284', 'Missing/incomplete/invalid referring provider taxonomy.', '2004-12-02', None),
+        ('N285', 'Missing/incomplete/invalid referring provider name.', '2004-12-02', None),
+        ('N286', 'Missing/incomplete/invalid referring provider primary identifier.', '2004-12-02', None),
+        ('N287', 'Missing/incomplete/invalid referring provider secondary identifier.', '2004-12-02', None),
+        ('N288', 'Missing/incomplete/invalid rendering provider taxonomy.', '2004-12-02', None),
+        ('N289', 'Missing/incomplete/invalid rendering provider name.', '2004-12-02', None),
+        ('N290', 'Missing/incomplete/invalid rendering provider primary identifier.', '2004-12-02', None),
+        ('N291', 'Missing/incomplete/invalid rendering provider secondary identifier.', '2004-12-02', None),
+        ('N292', 'Missing/incomplete/invalid service facility name.', '2004-12-02', None),
+        ('N293', 'Missing/incomplete/invalid service facility primary identifier.', '2004-12-02', None),
+        ('N294', 'Missing/incomplete/invalid service facility primary address.', '2004-12-02', None),
+        ('N295', 'Missing/incomplete/invalid service facility secondary identifier.', '2004-12-02', None),
+        ('N296', 'Missing/incomplete/invalid supervising provider name.', '2004-12-02', None),
+        ('N297', 'Missing/incomplete/invalid supervising provider primary identifier.', '2004-12-02', None),
+        ('N298', 'Missing/incomplete/invalid supervising provider secondary identifier.', '2004-12-02', None),
+        ('N299', 'Missing/incomplete/invalid occurrence date(s).', '2004-12-02', None),
+        ('N300', 'Missing/incomplete/invalid occurrence span date(s).', '2004-12-02', None),
+        ('N301', 'Missing/incomplete/invalid procedure date(s).', '2004-12-02', None),
+        ('N302', 'Missing/incomplete/invalid other procedure date(s).', '2004-12-02', None),
+        ('N303', 'Missing/incomplete/invalid principal procedure date.', '2004-12-02', None),
+        ('N304', 'Missing/incomplete/invalid dispensed date.', '2004-12-02', None),
+        ('N305', 'Missing/incomplete/invalid injury/accident date.', '2004-12-02', None),
+        ('N306', 'Missing/incomplete/invalid acute manifestation date.', '2004-12-02', None),
+        ('N307', 'Missing/incomplete/invalid adjudication or payment date.', '2004-12-02', None),
+        ('N308', 'Missing/incomplete/invalid appliance placement date.', '2004-12-02', None),
+        ('N309', 'Missing/incomplete/invalid assessment date.', '2004-12-02', None),
+        ('N310', 'Missing/incomplete/invalid assumed or relinquished care date.', '2004-12-02', None),
+        ('N311', 'Missing/incomplete/invalid authorized to return to work date.', '2004-12-02', None),
+        ('N312', 'Missing/incomplete/invalid begin therapy date.', '2004-12-02', None),
+        ('N313', 'Missing/incomplete/invalid certification revision date.', '2004-12-02', None),
+        ('N314', 'Missing/incomplete/invalid diagnosis date.', '2004-12-02', None),
+        ('N315', 'Missing/incomplete/invalid disability from date.', '2004-12-02', None),
+        ('N316', 'Missing/incomplete/invalid disability to date.', '2004-12-02', None),
+        ('N317', 'Missing/incomplete/invalid discharge hour.', '2004-12-02', None),
+        ('N318', 'Missing/incomplete/invalid discharge or end of care date.', '2004-12-02', None),
+        ('N319', 'Missing/incomplete/invalid hearing or vision prescription date.', '2004-12-02', None),
+        ('N320', 'Missing/incomplete/invalid Home Health Certification Period.', '2004-12-02', None),
+        ('N321', 'Missing/incomplete/invalid last admission period.', '2004-12-02', None),
+        ('N322', 'Missing/incomplete/invalid last certification date.', '2004-12-02', None),
+        ('N323', 'Missing/incomplete/invalid last contact date.', '2004-12-02', None),
+        ('N324', 'Missing/incomplete/invalid last seen/visit date.', '2004-12-02', None),
+        ('N325', 'Missing/incomplete/invalid last worked date.', '2004-12-02', None),
+        ('N326', 'Missing/incomplete/invalid last x-ray date.', '2004-12-02', None),
+        ('N327', 'Missing/incomplete/invalid other insured birth date.', '2004-12-02', None),
+        ('N328', 'Missing/incomplete/invalid Oxygen Saturation Test date.', '2004-12-02', None),
+        ('N329', 'Missing/incomplete/invalid patient birth date.', '2004-12-02', None),
+        ('N330', 'Missing/incomplete/invalid patient death date.', '2004-12-02', None),
+        ('N331', 'Missing/incomplete/invalid physician order date.', '2004-12-02', None),
+        ('N332', 'Missing/incomplete/invalid prior hospital discharge date.', '2004-12-02', None),
+        ('N333', 'Missing/incomplete/invalid prior placement date.', '2004-12-02', None),
+        ('N334', 'Missing/incomplete/invalid re-evaluation date.', '2004-12-02', None),
+        ('N335', 'Missing/incomplete/invalid referral date.', '2004-12-02', None),
+        ('N336', 'Missing/incomplete/invalid replacement date.', '2004-12-02', None),
+        ('N337', 'Missing/incomplete/invalid secondary diagnosis date.', '2004-12-02', None),
+        ('N338', 'Missing/incomplete/invalid shipped date.', '2004-12-02', None),
+        ('N339', 'Missing/incomplete/invalid similar illness or symptom date.', '2004-12-02', None),
+        ('N340', 'Missing/incomplete/invalid subscriber birth date.', '2004-12-02', None),
+        ('N341', 'Missing/incomplete/invalid surgery date.', '2004-12-02', None),
+        ('N342', 'Missing/incomplete/invalid test performed date.', '2004-12-02', None),
+        ('N343', 'Missing/incomplete/invalid Transcutaneous Electrical Nerve Stimulator (TENS) trial start date.', '2004-12-02', None),
+        ('N344', 'Missing/incomplete/invalid Transcutaneous Electrical Nerve Stimulator (TENS) trial end date.', '2004-12-02', None),
+        ('N345', 'Date range not valid with units submitted.', '2005-03-30', None),
+        ('N346', 'Missing/incomplete/invalid oral cavity designation code.', '2005-03-30', None),
+        ('N347', 'Your claim for a referred or purchased service cannot be paid because payment has already been made for this same service to another provider by a payment contractor representing the payer.', '2005-03-30', None),
+        ('N348', 'You chose that this service/supply/drug would be rendered/supplied and billed by a different practitioner/supplier.', '2005-08-01', None),
+        ('N349', 'The administration method and drug must be reported to adjudicate this service.', '2005-08-01', None),
+        ('N350', 'Missing/incomplete/invalid description of service for a Not Otherwise Classified (NOC) code or for an Unlisted/By Report procedure.', '2005-08-01', None),
+        ('N351', 'Service date outside of the approved treatment plan service dates.', '2005-08-01', None),
+        ('N352', 'Alert:There are no scheduled payments for this service. Submit a claim for each patient visit.', '2005-08-01', None),
+        ('N353', 'Alert:Benefits have been estimated, when the actual services have been rendered, additional payment will be considered based on the submitted claim.', '2005-08-01', None),
+        ('N354', 'Incomplete/invalid invoice.', '2005-08-01', None),
+        ('N355', 'Alert:The law permits exceptions to the refund requirement in two cases: - If you did not know, and could not have reasonably been expected to know, that we would not pay for this service; or - If you notified the patient in writing before providing the service that you believed that we were likely to deny the service, and the patient signed a statement agreeing to pay for the service.If you come within either exception, or if you believe the carrier was wrong in its determination that we do not pay for this service, you should request appeal of this determination within 30 days of the date of this notice. Your request for review should include any additional information necessary to support your position.If you request an appeal within 30 days of receiving this notice, you may delay refunding the amount to the patient until you receive the results of the review. If the review decision is favorable to you, you do not need to make any refund. If, however, the review is unfavorable, the law specifies that you must make the refund within 15 days of receiving the unfavorable review decision.The law also permits you to request an appeal at any time within 120 days of the date you receive this notice. However, an appeal request that is received more than 30 days after the date of this notice, does not permit you to delay making the refund. Regardless of when a review is requested, the patient will be notified that you have requested one, and will receive a copy of the determination.The patient has received a separate notice of this denial decision. The notice advises that he/she may be entitled to a refund of any amounts paid, if you should have known that we would not pay and did not tell him/her. It also instructs the patient to contact our office if he/she does not hear anything about a refund within 30 days', '2005-08-01', None),
+        ('N356', 'Not covered when performed with, or subsequent to, a non-covered service.', '2005-08-01', None),
+        ('N357', 'Time frame requirements between this service/procedure/supply and a related service/procedure/supply have not been met.', '2005-11-18', None),
+        ('N358', 'Alert:This decision may be reviewed if additional documentation as described in the contract or plan benefit documents is submitted.', '2005-11-18', None),
+        ('N359', 'Missing/incomplete/invalid height.', '2005-11-18', None),
+        ('N360', 'Alert:Coordination of benefits has not been calculated when estimating benefits for this pre-determination. Submit payment information from the primary payer with the secondary claim.', '2005-11-18', None),
+        ('N361', 'Payment adjusted based on multiple diagnostic imaging procedure rules', '2005-11-18', '2007-10-01'),
+        ('N362', 'The number of Days or Units of Service exceeds our acceptable maximum.', '2005-11-18', None),
+        ('N363', 'Alert:in the near future we are implementing new policies/procedures that would affect this determination.', '2005-11-18', None),
+        ('N364', 'Alert:According to our agreement, you must waive the deductible and/or coinsurance amounts.', '2005-11-18', None),
+        ('N365', 'This procedure code is not payable. It is for reporting/information purposes only.', '2006-04-01', '2014-07-01'),
+        ('N366', 'Requested information not provided. The claim will be reopened if the information previously requested is submitted within one year after the date of this denial notice.', '2006-04-01', None),
+        ('N367', 'Alert:The claim information has been forwarded to a Consumer Spending Account processor for review; for example, flexible spending account or health savings account.', '2006-04-01', None),
+        ('N368', 'You must appeal the determination of the previously adjudicated claim.', '2006-04-01', None),
+        ('N369', 'Alert:Although this claim has been processed, it is deficient according to state legislation/regulation.', '2006-04-01', None),
+        ('N370', 'Billing exceeds the rental months covered/approved by the payer.', '2006-08-01', None),
+        ('N371', 'Alert:title of this equipment must be transferred to the patient.', '2006-08-01', None),
+        ('N372', 'Only reasonable and necessary maintenance/service charges are covered.', '2006-08-01', None),
+        ('N373', 'It has been determined that another payer paid the services as primary when they were not the primary payer. Therefore, we are refunding to the payer that paid as primary on your behalf.', '2006-12-01', None),
+        ('N374', 'Primary Medicare Part A insurance has been exhausted and a Part B Remittance Advice is required.', '2006-12-01', None),
+        ('N375', 'Missing/incomplete/invalid questionnaire/information required to determine dependent eligibility.', '2006-12-01', None),
+        ('N376', 'Subscriber/patient is assigned to active military duty, therefore primary coverage may be TRICARE.', '2006-12-01', None),
+        ('N377', 'Payment based on a processed replacement claim.', '2006-12-01', None),
+        ('N378', 'Missing/incomplete/invalid prescription quantity.', '2006-12-01', None),
+        ('N379', 'Claim level information does not match line level information.', '2006-12-01', None),
+        ('N380', 'The original claim  has been processed, submit a corrected claim.', '2007-04-01', None),
+        ('N381', 'Alert:Consult our contractual agreement for restrictions/billing/payment information related to these charges.', '2007-04-01', None),
+        ('N382', 'Missing/incomplete/invalid patient identifier.', '2007-04-01', None),
+        ('N383', 'Not covered when deemed cosmetic.', '2007-04-01', None),
+        ('N384', 'Records indicate that the referenced body part/tooth has been removed in a previous procedure.', '2007-04-01', None),
+        ('N385', 'Notification of admission was not timely according to published plan procedures.', '2007-04-01', None),
+        ('N386', 'This decision was based on a National Coverage Determination (NCD). An NCD provides a coverage determination as to whether a particular item or service is covered. A copy of this policy is available at www.cms.gov/mcd/search.asp. If you do not have web access, you may contact the contractor to request a copy of the NCD.', '2007-04-01', None),
+        ('N387', "Alert:Submit this claim to the patient's other insurer for potential payment of supplemental benefits. We did not forward the claim information.", '2007-04-01', None),
+        ('N388', 'Missing/incomplete/invalid prescription number.', '2007-08-01', None),
+        ('N389', 'Duplicate prescription number submitted.', '2007-08-01', None),
+        ('N390', 'This service/report cannot be billed separately.', '2007-08-01', None),
+        ('N391', 'Missing emergency department records.', '2007-08-01', None),
+        ('N392', 'Incomplete/invalid emergency department records.', '2007-08-01', None),
+        ('N393', 'Missing progress notes/report.', '2007-08-01', None),
+        ('N394', 'Incomplete/invalid progress notes/report.', '2007-08-01', None),
+        ('N395', 'Missing laboratory report.', '2007-08-01', None),
+        ('N396', 'Incomplete/invalid laboratory report.', '2007-08-01', None),
+        ('N397', 'Benefits are not available for incomplete service(s)/undelivered item(s).', '2007-08-01', None),
+        ('N398', 'Missing elective consent form.', '2007-08-01', None),
+        ('N399', 'Incomplete/invalid elective consent form.', '2007-08-01', None),
+        ('N400', 'Alert:Electronically enabled providers should submit claims electronically.', '2007-08-01', None),
+        ('N401', 'Missing periodontal charting.', '2007-08-01', None),
+        ('N402', 'Incomplete/invalid periodontal charting.', '2007-08-01', None),
+        ('N403', 'Missing facility certification.', '2007-08-01', None),
+        ('N404', 'Incomplete/invalid facility certification.', '2007-08-01', None),
+        ('N405', "This service is only covered when the donor's insurer(s) do not provide coverage for the service.", '2007-08-01', None),
+        ('N406', "This service is only covered when the recipient's insurer(s) do not provide coverage for the service.", '2007-08-01', None),
+        ('N407', 'You are not an approved submitter for this transmission format.', '2007-08-01', None),
+        ('N408', 'This payer does not cover deductibles assessed by a previous payer.', '2007-08-01', None),
+        ('N409', 'This service is related to an accidental injury and is not covered unless provided within a specific time frame from the date of the accident.', '2007-08-01', None),
+        ('N410', 'Not covered unless the prescription changes.', '2007-08-01', None),
+        ('N411', 'This service is allowed one time in a 6-month period.', '2007-08-01', None),
+        ('N412', 'This service is allowed 2 times in a 12-month period.', '2007-08-01', None),
+        ('N413', 'This service is allowed 2 times in a benefit year.', '2007-08-01', None),
+        ('N414', 'This service is allowed 4 times in a 12-month period.', '2007-08-01', None),
+        ('N415', 'This service is allowed 1 time in an 18-month period.', '2007-08-01', None),
+        ('N416', 'This service is allowed 1 time in a 3-year period.', '2007-08-01', None),
+        ('N417', 'This service is allowed 1 time in a 5-year period.', '2007-08-01', None),
+        ('N418', "Misrouted claim.  See the payer's claim submission instructions.", '2007-08-01', None),
+        ('N419', "Claim payment was the result of a payer's retroactive adjustment due to a retroactive rate change.", '2007-08-01', None),
+        ('N420', "Claim payment was the result of a payer's retroactive adjustment due to a Coordination of Benefits or Third Party Liability Recovery.", '2007-08-01', None),
+        ('N421', "Claim payment was the result of a payer's retroactive adjustment due to a review organization decision.", '2007-08-01', None),
+        ('N422', "Claim payment was the result of a payer's retroactive adjustment due to a payer's contract incentive program.", '2007-08-01', None),
+        ('N423', "Claim payment was the result of a payer's retroactive adjustment due to a non standard program.", '2007-08-01', None),
+        ('N424', 'Patient does not reside in the geographic area required for this type of payment.', '2007-08-01', None),
+        ('N425', 'Statutorily excluded service(s).', '2007-08-01', None),
+        ('N426', 'No coverage when self-administered.', '2007-08-01', None),
+        ('N427', 'Payment for eyeglasses or contact lenses can be made only after cataract surgery.', '2007-08-01', None),
+        ('N428', 'Not covered when performed in this place of service.', '2007-08-01', None),
+        ('N429', 'Not covered when considered routine.', '2007-08-01', None),
+        ('N430', 'Procedure code is inconsistent with the units billed.', '2007-11-05', None),
+        ('N431', 'Not covered with this procedure.', '2007-11-05', None),
+        ('N432', 'Alert:Adjustment based on a Recovery Audit.', '2007-11-05', None),
+        ('N433', 'Resubmit this claim using only your National Provider Identifier (NPI).', '2008-02-29', None),
+        ('N434', 'Missing/Incomplete/Invalid Present on Admission indicator.', '2008-07-01', None),
+        ('N435', 'Exceeds number/frequency approved /allowed within time period without support documentation.', '2008-07-01', None),
+        ('N436', 'The injury claim has not been accepted and a mandatory medical reimbursement has been made.', '2008-07-01', None),
+        ('N437', 'Alert:If the injury claim is accepted, these charges will be reconsidered.', '2008-07-01', None),
+        ('N438', 'This jurisdiction only accepts paper claims.', '2008-07-01', None),
+        ('N439', 'Missing anesthesia physical status report/indicators.', '2008-07-01', None),
+        ('N440', 'Incomplete/invalid anesthesia physical status report/indicators.', '2008-07-01', None),
+        ('N441', 'This missed/cancelled appointment is not covered.', '2008-07-01', None),
+        ('N442', 'Payment based on an alternate fee schedule.', '2008-07-01', None),
+        ('N443', 'Missing/incomplete/invalid total time or begin/end time.', '2008-07-01', None),
+        ('N444', "Alert:This facility has not filed the Election for High Cost Outlier form with the Division of Workers' Compensation.", '2008-07-01', None),
+        ('N445', 'Missing document for actual cost or paid amount.', '2008-07-01', None),
+        ('N446', 'Incomplete/invalid document for actual cost or paid amount.', '2008-07-01', None),
+        ('N447', 'Payment is based on a generic equivalent as required documentation was not provided.', '2008-07-01', None),
+        ('N448', 'This drug/service/supply is not included in the fee schedule or contracted/legislated fee arrangement.', '2008-07-01', None),
+        ('N449', 'Payment based on a comparable drug/service/supply.', '2008-07-01', None),
+        ('N450', 'Covered only when performed by the primary treating physician or the designee.', '2008-07-01', None),
+        ('N451', 'Missing Admission Summary Report.', '2008-07-01', None),
+        ('N452', 'Incomplete/invalid Admission Summary Report.', '2008-07-01', None),
+        ('N453', 'Missing Consultation Report.', '2008-07-01', None),
+        ('N454', 'Incomplete/invalid Consultation Report.', '2008-07-01', None),
+        ('N455', 'Missing Physician Order.', '2008-07-01', None),
+        ('N456', 'Incomplete/invalid Physician Order.', '2008-07-01', None),
+        ('N457', 'Missing Diagnostic Report.', '2008-07-01', None),
+        ('N458', 'Incomplete/invalid Diagnostic Report.', '2008-07-01', None),
+        ('N459', 'Missing Discharge Summary.', '2008-07-01', None),
+        ('N460', 'Incomplete/invalid Discharge Summary.', '2008-07-01', None),
+        ('N461', 'Missing Nursing Notes.', '2008-07-01', None),
+        ('N462', 'Incomplete/invalid Nursing Notes.', '2008-07-01', None),
+        ('N463', 'Missing support data for claim.', '2008-07-01', None),
+        ('N464', 'Incomplete/invalid support data for claim.', '2008-07-01', None),
+        ('N465', 'Missing Physical Therapy Notes/Report.', '2008-07-01', None),
+        ('N466', 'Incomplete/invalid Physical Therapy Notes/Report.', '2008-07-01', None),
+        ('N467', 'Missing Tests and Analysis Report.', '2008-07-01', None),
+        ('N468', 'Incomplete/invalid Report of Tests and Analysis Report.', '2008-07-01', None),
+        ('N469', 'Alert:Claim/Service(s) subject to appeal process, see section 935 of Medicare Prescription Drug, Improvement, and Modernization Act of 2003 (MMA).', '2008-07-01', None),
+        ('N470', 'This payment will complete the mandatory medical reimbursement limit.', '2008-07-01', None),
+        ('N471', 'Missing/incomplete/invalid HIPPS Rate Code.', '2008-07-01', None),
+        ('N472', 'Payment for this service has been issued to another provider.', '2008-07-01', None),
+        ('N473', 'Missing certification.', '2008-07-01', None),
+        ('N474', 'Incomplete/invalid certification.', '2008-07-01', None),
+        ('N475', 'Missing completed referral form.', '2008-07-01', None),
+        ('N476', 'Incomplete/invalid completed referral form.', '2008-07-01', None),
+        ('N477', 'Missing Dental Models.', '2008-07-01', None),
+        ('N478', 'Incomplete/invalid Dental Models.', '2008-07-01', None),
+        ('N479', 'Missing Explanation of Benefits (Coordination of Benefits or Medicare Secondary Payer).', '2008-07-01', None),
+        ('N480', 'Incomplete/invalid Explanation of Benefits (Coordination of Benefits or Medicare Secondary Payer).', '2008-07-01', None),
+        ('N481', 'Missing Models.', '2008-07-01', None),
+        ('N482', 'Incomplete/invalid Models.', '2008-07-01', None),
+        ('N483', 'Missing Periodontal Charts.', '2008-07-01', '2015-05-01'),
+        ('N484', 'Incomplete/invalid Periodontal Charts.', '2008-07-01', '2015-05-01'),
+        ('N485', 'Missing Physical Therapy Certification.', '2008-07-01', None),
+        ('N486', 'Incomplete/invalid Physical Therapy Certification.', '2008-07-01', None),
+        ('N487', 'Missing Prosthetics or Orthotics Certification.', '2008-07-01', None),
+        ('N488', 'Incomplete/invalid Prosthetics or Orthotics Certification.', '2008-07-01', None),
+        ('N489', 'Missing referral form.', '2008-07-01', None),
+        ('N490', 'Incomplete/invalid referral form.', '2008-07-01', None),
+        ('N491', 'Missing/Incomplete/Invalid Exclusionary Rider Condition.', '2008-07-01', None),
+        ('N492', 'Alert:A network provider may bill the member for this service if the member requested the service and agreed in writing, prior to receiving the service, to be financially responsible for the billed charge.', '2008-07-01', None),
+        ('N493', 'Missing Doctor First Report of Injury.', '2008-07-01', None),
+        ('N494', 'Incomplete/invalid Doctor First Report of Injury.', '2008-07-01', None),
+        ('N495', 'Missing Supplemental Medical Report.', '2008-07-01', None),
+        ('N496', 'Incomplete/invalid Supplemental Medical Report.', '2008-07-01', None),
+        ('N497', 'Missing Medical Permanent Impairment or Disability Report.', '2008-07-01', None),
+        ('N498', 'Incomplete/invalid Medical Permanent Impairment or Disability Report.', '2008-07-01', None),
+        ('N499', 'Missing Medical Legal Report.', '2008-07-01', None),
+        ('N500', 'Incomplete/invalid Medical Legal Report.', '2008-07-01', None),
+        ('N501', 'Missing Vocational Report.', '2008-07-01', None),
+        ('N502', 'Incomplete/invalid Vocational Report.', '2008-07-01', None),
+        ('N503', 'Missing Work Status Report.', '2008-07-01', None),
+        ('N504', 'Incomplete/invalid Work Status Report.', '2008-07-01', None),
+        ('N505', 'Alert:This response includes only services that could be estimated in real-time. No estimate will be provided for the services that could not be estimated in real-time.', '2008-11-01', None),
+        ('N506', "Alert:This is an estimate of the member's liability based on the information available at the time the estimate was processed. Actual coverage and member liability amounts will be determined when the claim is processed. This is not a pre-authorization or a guarantee of payment.", '2008-11-01', None),
+        ('N507', 'Plan distance requirements have not been met.', '2008-11-01', None),
+        ('N508', 'Alert:This real-time claim adjudication response represents the member responsibility to the provider for services reported. The member will receive an Explanation of Benefits electronically or in the mail. Contact the insurer if there are any questions.', '2008-11-01', None),
+        ('N509', "Alert:A current inquiry shows the member's Consumer Spending Account contains sufficient funds to cover the member liability for this claim/service.  Actual payment from the Consumer Spending Account will depend on the availability of funds and determination of eligible services at the time of payment processing.", '2008-11-01', None),
+        ('N510', "Alert:A current inquiry shows the member's Consumer Spending Account does not contain sufficient funds to cover the member's liability for this claim/service. Actual payment from the Consumer Spending Account will depend on the availability of funds and determination of eligible services at the time of payment processing.", '2008-11-01', None),
+        ('N511', 'Alert:Information on the availability of Consumer Spending Account funds to cover the member liability on this claim/service is not available at this time.', '2008-11-01', None),
+        ('N512', 'Alert:This is the initial remit of a non-NCPDP claim originally submitted real-time without change to the adjudication.', '2008-11-01', None),
+        ('N513', 'Alert:This is the initial remit of a non-NCPDP claim originally submitted real-time with a change to the adjudication.', '2008-11-01', None),
+        ('N514', 'Consult plan benefit documents/guidelines for information about restrictions for this service.', '2008-11-01', '2011-01-01'),
+        ('N515', "Alert:Submit this claim to the patient's other insurer for potential payment of supplemental benefits. We did not forward the claim information. (use N387 instead)", '2008-11-01', '2009-10-01'),
+        ('N516', 'Records indicate a mismatch between the submitted NPI and EIN.', '2009-03-01', None),
+        ('N517', 'Resubmit a new claim with the requested information.', '2009-03-01', None),
+        ('N518', 'No separate payment for accessories when furnished for use with oxygen equipment.', '2009-03-01', None),
+        ('N519', 'Invalid combination of HCPCS modifiers.', '2009-07-01', None),
+        ('N520', 'Alert:Payment made from a Consumer Spending Account.', '2009-07-01', None),
+        ('N521', 'Mismatch between the submitted provider information and the provider information stored in our system.', '2009-11-01', None),
+        ('N522', 'Duplicate of a claim processed, or to be processed, as a crossover claim.', '2009-11-01', None),
+        ('N523', 'The limitation on outlier payments defined by this payer for this service period has been met. The outlier payment otherwise applicable to this claim has not been paid.', '2010-03-01', None),
+        ('N524', 'Based on policy this payment constitutes payment in full.', '2010-03-01', None),
+        ('N525', 'These services are not covered when performed within the global period of another service.', '2010-03-01', None),
+        ('N526', 'Not qualified for recovery based on employer size.', '2010-03-01', None),
+        ('N527', 'We processed this claim as the primary payer prior to receiving the recovery demand.', '2010-03-01', None),
+        ('N528', 'Patient is entitled to benefits for Institutional Services only.', '2010-03-01', None),
+        ('N529', 'Patient is entitled to benefits for Professional Services only.', '2010-03-01', None),
+        ('N530', 'Not Qualified for Recovery based on enrollment information.', '2010-03-01', None),
+        ('N531', 'Not qualified for recovery based on direct payment of premium.', '2010-03-01', None),
+        ('N532', 'Not qualified for recovery based on disability and working status.', '2010-03-01', None),
+        ('N533', 'Services performed in an Indian Health Services facility under a self-insured tribal Group Health Plan.', '2010-07-01', None),
+        ('N534', 'This is an individual policy, the employer does not participate in plan sponsorship.', '2010-07-01', None),
+        ('N535', 'Payment is adjusted when procedure is performed in this place of service based on the submitted procedure code and place of service.', '2010-07-01', None),
+        ('N536', "We are not changing the prior payer's determination of patient responsibility, which you may collect, as this service is not covered by us.", '2010-07-01', None),
+        ('N537', 'We have examined claims history and no records of the services have been found.', '2010-07-01', None),
+        ('N538', 'A facility is responsible for payment to outside providers who furnish these services/supplies/drugs to its patients/residents.', '2010-07-01', None),
+        ('N539', 'Alert:We processed appeals/waiver requests on your behalf and that request has been denied.', '2010-07-01', None),
+        ('N540', 'Payment adjusted based on the interrupted stay policy.', '2010-11-01', None),
+        ('N541', 'Mismatch between the submitted insurance type code and the information stored in our system.', '2010-11-01', None),
+        ('N542', 'Missing income verification.', '2011-03-08', None),
+        ('N543', 'Incomplete/invalid income verification.', '2011-03-08', None),
+        ('N544', 'Alert:Although this was paid, you have billed with a referring/ordering provider that does not match our system record. Unless corrected this will not be paid in the future.', '2011-07-01', None),
+        ('N545', 'Payment reduced based on status as an unsuccessful eprescriber per the Electronic Prescribing (eRx) Incentive Program.', '2011-07-01', None),
+        ('N546', 'Payment represents a previous reduction based on the Electronic Prescribing (eRx) Incentive Program.', '2011-07-01', None),
+        ('N547', 'A refund request (Frequency Type Code 8) was processed previously.', '2012-03-06', None),
+        ('N548', "Alert:Patient's calendar year deductible has been met.", '2012-03-06', None),
+        ('N549', "Alert:Patient's calendar year out-of-pocket maximum has been met.", '2012-03-06', None),
+        ('N550', 'Alert:You have not responded to requests to revalidate your provider/supplier enrollment information. Your failure to revalidate your enrollment information will result in a payment hold in the near future.', '2012-03-06', None),
+        ('N551', 'Payment adjusted based on the Ambulatory Surgical Center (ASC) Quality Reporting Program.', '2012-03-06', None),
+        ('N552', 'Payment adjusted to reverse a previous withhold/bonus amount.', '2012-03-06', None),
+        ('N553', 'Payment adjusted based on a Low Income Subsidy (LIS) retroactive coverage or status change.', '2012-03-06', '2012-11-01'),
+        ('N554', 'Missing/Incomplete/Invalid Family Planning Indicator.', '2012-07-01', None),
+        ('N555', 'Missing medication list.', '2012-07-01', None),
+        ('N556', 'Incomplete/invalid medication list.', '2012-07-01', None),
+        ('N557', 'This claim/service is not payable under our service area. The claim must be filed to the Payer/Plan in whose service area the specimen was collected.', '2012-07-01', None),
+        ('N558', 'This claim/service is not payable under our service area. The claim must be filed to the Payer/Plan in whose service area the equipment was received.', '2012-07-01', None),
+        ('N559', 'This claim/service is not payable under our service area. The claim must be filed to the Payer/Plan in whose service area the Ordering Physician is located.', '2012-07-01', None),
+        ('N560', 'The pilot program requires an interim or final claim within 60 days of the Notice of  Admission. A claim was not received.', '2012-11-01', None),
+        ('N561', 'The bundled claim originally submitted for this episode of care includes related readmissions. You may resubmit the original claim to receive a corrected payment based on this readmission.', '2012-11-01', None),
+        ('N562', 'The provider number of your incoming claim does not match the provider number on the processed Notice of Admission (NOA) for this bundled payment.', '2012-11-01', None),
+        ('N563', 'Alert:Missing required provider/supplier issuance of advance patient notice of non-coverage. The patient is not liable for payment for this service.', '2012-11-01', None),
+        ('N564', 'Patient did not meet the inclusion criteria for the demonstration project or pilot program.', '2012-11-01', None),
+        ('N565', 'Alert:This non-payable reporting code requires a modifier. Future claims containing this non-payable reporting code must include an appropriate modifier for the claim to be processed.', '2012-11-01', None),
+        ('N566', 'Alert:This procedure code requires functional reporting. Future claims containing this procedure code must include an applicable non-payable code and appropriate modifiers for the claim to be processed.', '2012-11-01', None),
+        ('N567', 'Not covered when considered preventative.', '2013-03-01', None),
+        ('N568', 'Alert:Initial payment based on the Notice of Admission (NOA) under the Bundled Payment Model IV initiative.', '2013-03-01', None),
+        ('N569', 'Not covered when performed for the reported diagnosis.', '2013-03-01', None),
+        ('N570', 'Missing/incomplete/invalid credentialing data.', '2013-03-01', None),
+        ('N571', 'Alert:Payment will be issued quarterly by another payer/contractor.', '2013-03-01', None),
+        ('N572', 'This procedure is not payable unless appropriate non-payable reporting codes and associated modifiers are submitted.', '2013-03-01', None),
+        ('N573', 'Alert:You have been overpaid and must refund the overpayment. The refund will be requested separately by another payer/contractor.', '2013-03-01', None),
+        ('N574', 'Our records indicate the ordering/referring provider is of a type/specialty that cannot order or refer. Please verify that the claim ordering/referring provider information is accurate or contact the ordering/referring provider.', '2013-07-15', None),
+        ('N575', 'Mismatch between the submitted ordering/referring provider name and the ordering/referring provider name stored in our records.', '2013-07-15', None),
+        ('N576', 'Services not related to the specific incident/claim/accident/loss being reported.', '2013-07-15', None),
+        ('N577', 'Personal Injury Protection (PIP) Coverage.', '2013-07-15', None),
+        ('N578', 'Coverages do not apply to this loss.', '2013-07-15', None),
+        ('N579', 'Medical Payments Coverage (MPC).', '2013-07-15', None),
+        ('N580', 'Determination based on the provisions of the insurance policy.', '2013-07-15', None),
+        ('N581', 'Investigation of coverage eligibility is pending.', '2013-07-15', None),
+        ('N582', "Benefits suspended pending the patient's cooperation.", '2013-07-15', None),
+        ('N583', 'Patient was not an occupant of our insured vehicle and therefore, is not an eligible injured person.', '2013-07-15', None),
+        ('N584', "Not covered based on the insured's noncompliance with policy or statutory conditions.", '2013-07-15', None),
+        ('N585', 'Benefits are no longer available based on a final injury settlement.', '2013-07-15', None),
+        ('N586', 'The injured party does not qualify for benefits.', '2013-07-15', None),
+        ('N587', 'Policy benefits have been exhausted.', '2013-07-15', None),
+        ('N588', 'The patient has instructed that medical claims/bills are not to be paid.', '2013-07-15', None),
+        ('N589', 'Coverage is excluded to any person injured as a result of operating a motor vehicle while in an intoxicated condition or while the ability to operate such a vehicle is impaired by the use of a drug.', '2013-07-15', None),
+        ('N590', 'Missing independent medical exam detailing the cause of injuries sustained and medical necessity of services rendered.', '2013-07-15', None),
+        ('N591', 'Payment based on an Independent Medical Examination (IME) or Utilization Review (UR).', '2013-07-15', None),
+        ('N592', 'Adjusted because this is not the initial prescription or exceeds the amount allowed for the initial prescription.', '2013-07-15', None),
+        ('N593', 'Not covered based on failure to attend  a scheduled Independent Medical Exam (IME).', '2013-07-15', None),
+        ('N594', 'Records reflect the injured party did not complete an Application for Benefits for this loss.', '2013-07-15', None),
+        ('N595', 'Records reflect the injured party did not complete an Assignment of Benefits for this loss.', '2013-07-15', None),
+        ('N596', 'Records reflect the injured party did not complete a Medical Authorization for this loss.', '2013-07-15', None),
+        ('N597', "Adjusted based on a medical/dental provider's apportionment of care between related injuries and other unrelated medical/dental conditions/injuries.", '2013-07-15', None),
+        ('N598', 'Health care policy coverage is primary.', '2013-07-15', None),
+        ('N599', 'Our payment for this service is based upon a reasonable amount pursuant to both the terms and conditions of the policy of insurance under which the subject claim is being made as well as the Florida No-Fault Statute, which permits, when determining a reasonable charge for a service, an insurer to consider usual and customary charges and payments accepted by the provider, reimbursement levels in the community and various federal and state fee schedules applicable to automobile and other insurance coverages, and other information relevant to the reasonableness of the reimbursement for the service. The payment for this service is based upon 200% of the Participating Level of Medicare Part B fee schedule for the locale in which the services were rendered.', '2013-07-15', None),
+        ('N600', 'Adjusted based on the applicable fee schedule for the region in which the service was rendered.', '2013-07-15', None),
+        ('N601', 'In accordance with Hawaii Administrative Rules, Title 16, Chapter 23 Motor Vehicle Insurance Law payment is recommended based on Medicare Resource Based Relative Value Scale System applicable to Hawaii.', '2013-07-15', None),
+        ('N602', 'Adjusted based on the Redbook maximum allowance.', '2013-07-15', None),
+        ('N603', 'This fee is calculated according to the New Jersey medical fee schedules for Automobile Personal Injury Protection and Motor Bus Medical Expense Insurance Coverage.', '2013-07-15', None),
+        ('N604', "In accordance with New York No-Fault Law, Regulation 68, this base fee was calculated according to the New York Workers' Compensation Board Schedule of Medical Fees, pursuant to Regulation 83 and / or Appendix 17-C of 11 NYCRR.", '2013-07-15', None),
+        ('N605', 'This fee was calculated based upon New York All Patients Refined Diagnosis Related Groups (APR-DRG), pursuant to Regulation 68.', '2013-07-15', None),
+        ('N606', 'The Oregon allowed amount for this procedure is based upon the Workers Compensation Fee Schedule (OAR 436-009).  The allowed amount has been calculated in accordance with Section 4 of ORS 742.524.', '2013-07-15', None),
+        ('N607', 'Service provided for non-compensable condition(s).', '2013-07-15', None),
+        ('N608', 'The fee schedule amount allowed is calculated at 110% of the Medicare Fee Schedule for this region, specialty and type of service.  This fee is calculated in compliance with Act 6.', '2013-07-15', None),
+        ('N609', "80% of the provider's billed amount is being recommended for payment according to Act 6.", '2013-07-15', None),
+        ('N610', 'Alert:Payment based on an appropriate level of care.', '2013-07-15', None),
+        ('N611', 'Claim in litigation.  Contact insurer for more information.', '2013-07-15', None),
+        ('N612', 'Medical provider not authorized/certified to provide treatment to  injured workers in this jurisdiction.', '2013-07-15', None),
+        ('N613', 'Alert:Although this was paid, you have billed with an ordering provider that needs to update their enrollment record. Please verify that the ordering provider information you submitted on the claim is accurate and if it is, contact the ordering provider instructing them to update their enrollment record. Unless corrected, a claim with this ordering provider will not be paid in the future.', '2013-07-15', None),
+        ('N614', 'Alert:Additional information is included in the 835 Healthcare Policy Identification Segment (loop 2110 Service Payment Information).', '2013-07-15', None),
+        ('N615', 'Alert:This enrollee receiving advance payments of the premium tax credit is in the grace period of three consecutive months for non-payment of premium. Under 45 CFR 156.270, a Qualified Health Plan issuer must pay all appropriate claims for services rendered to the enrollee during the first month of the grace period and may pend claims for services rendered to the enrollee in the second and third months of the grace period.', '2013-07-15', None),
+        ('N616', 'Alert:This enrollee is in the first month of the advance premium tax credit grace period.', '2013-07-15', None),
+        ('N617', 'This enrollee is in the second or third month of the advance premium tax credit grace period.', '2013-07-15', None),
+        ('N618', 'Alert:This claim will automatically be reprocessed if the enrollee pays their premiums.', '2013-07-15', None),
+        ('N619', 'Coverage terminated for non-payment of premium.', '2013-07-15', None),
+        ('N620', 'Alert:This procedure code is for quality reporting/informational purposes only.', '2013-07-15', None),
+        ('N621', 'Charges for Jurisdiction required forms, reports, or chart notes are not payable.', '2013-07-15', None),
+        ('N622', 'Not covered based on the date of injury/accident.', '2013-07-15', None),
+        ('N623', 'Not covered when deemed unscientific/unproven/outmoded/experimental/excessive/inappropriate.', '2013-07-15', None),
+        ('N624', "The associated Workers' Compensation claim has been withdrawn.", '2013-07-15', None),
+        ('N625', "Missing/Incomplete/Invalid Workers' Compensation Claim Number.", '2013-07-15', None),
+        ('N626', 'New or established patient E/M codes are not payable with chiropractic care codes.', '2013-07-15', None),
+        ('N627', 'Service not payable per managed care contract.', '2013-07-15', '2014-07-01'),
+        ('N628', 'Out-patient follow up visits on the same date of service as a scheduled test or treatment is disallowed.', '2013-07-15', None),
+        ('N629', 'Reviews/documentation/notes/summaries/reports/charts not requested.', '2013-07-15', None),
+        ('N630', 'Referral not authorized by attending physician.', '2013-07-15', None),
+        ('N631', 'Medical Fee Schedule does not list this code. An allowance was made for a comparable service.', '2013-07-15', None),
+        ('N632', 'According to the Official Medical Fee Schedule this service has a relative value of zero and therefore no payment is due.', '2013-07-15', '2014-07-01'),
+        ('N633', 'Additional anesthesia time units are not allowed.', '2013-07-15', None),
+        ('N634', 'The allowance is calculated based on anesthesia time units.', '2013-07-15', None),
+        ('N635', 'The Allowance is calculated based on the anesthesia base units plus time.', '2013-07-15', None),
+        ('N636', 'Adjusted because this is reimbursable only once per injury.', '2013-07-15', None),
+        ('N637', 'Consultations are not allowed once treatment has been rendered by the same provider.', '2013-07-15', None),
+        ('N638', 'Reimbursement has been made according to the home health fee schedule.', '2013-07-15', None),
+        ('N639', 'Reimbursement has been made according to the inpatient rehabilitation facilities fee schedule.', '2013-07-15', None),
+        ('N640', 'Exceeds number/frequency approved/allowed within time period.', '2013-07-15', None),
+        ('N641', 'Reimbursement has been based on the number of body areas rated.', '2013-07-15', None),
+        ('N642', 'Adjusted when billed as individual tests instead of as a panel.', '2013-07-15', None),
+        ('N643', 'The services billed are considered Not Covered or Non-Covered (NC) in the applicable state fee schedule.', '2013-07-15', None),
+        ('N644', 'Reimbursement has been made according to the bilateral procedure rule.', '2013-07-15', None),
+        ('N645', 'Mark-up allowance.', '2013-07-15', None),
+        ('N646', 'Reimbursement has been adjusted based on the guidelines for an assistant.', '2013-07-15', None),
+        ('N647', 'Adjusted based on diagnosis-related group (DRG).', '2013-07-15', None),
+        ('N648', 'Adjusted based on Stop Loss.', '2013-07-15', None),
+        ('N649', 'Payment based on invoice.', '2013-07-15', None),
+        ('N650', 'This policy was not in effect for this date of loss. No coverage is available.', '2013-07-15', None),
+        ('N651', 'No Personal Injury Protection/Medical Payments Coverage on the policy at the time of the loss.', '2013-07-15', None),
+        ('N652', 'The date of service is before the date of loss.', '2013-07-15', None),
+        ('N653', 'The date of injury does not match the reported date of loss.', '2013-07-15', None),
+        ('N654', 'Adjusted based on achievement of maximum medical improvement (MMI).', '2013-07-15', None),
+        ('N655', "Payment based on provider's geographic region.", '2013-07-15', None),
+        ('N656', 'An interest payment is being made because benefits are being paid outside the statutory requirement.', '2013-07-15', None),
+        ('N657', 'This should be billed with the appropriate code for these services.', '2013-07-15', None),
+        ('N658', 'The billed service(s) are not considered medical expenses.', '2013-07-15', None),
+        ('N659', 'This item is exempt from sales tax.', '2013-07-15', None),
+        ('N660', 'Sales tax has been included in the reimbursement.', '2013-07-15', None),
+        ('N661', 'Documentation does not support that the services rendered were medically necessary.', '2013-07-15', None),
+        ('N662', 'Alert:Consideration of payment will be made upon receipt of a final bill.', '2013-07-15', None),
+        ('N663', 'Adjusted based on an agreed amount.', '2013-07-15', None),
+        ('N664', 'Adjusted based on a legal settlement.', '2013-07-15', None),
+        ('N665', 'Services by an unlicensed provider are not reimbursable.', '2013-07-15', None),
+        ('N666', 'Only one evaluation and management code at this service level is covered during the course of care.', '2013-07-15', None),
+        ('N667', 'Missing prescription.', '2013-07-15', None),
+        ('N668', 'Incomplete/invalid prescription.', '2013-07-15', None),
+        ('N669', 'Adjusted based on the Medicare fee schedule.', '2013-07-15', None),
+        ('N670', 'This service code has been identified as the primary procedure code subject to the Medicare Multiple Procedure Payment Reduction (MPPR) rule.', '2013-07-15', None),
+        ('N671', 'Payment based on a jurisdiction cost-charge ratio.', '2013-07-15', None),
+        ('N672', 'Alert:Amount applied to Health Insurance Offset.', '2013-07-15', None),
+        ('N673', 'Reimbursement has been calculated based on an outpatient per diem or an outpatient factor and/or fee schedule amount.', '2013-07-15', None),
+        ('N674', 'Not covered unless a pre-requisite procedure/service has been provided.', '2013-07-15', None),
+        ('N675', 'Additional information is required from the injured party.', '2013-07-15', None),
+        ('N676', 'Service does not qualify for payment under the Outpatient Facility Fee Schedule.', '2013-07-15', None),
+        ('N677', 'Alert:Films/Images will not be returned.', '2013-11-01', None),
+        ('N678', 'Missing post-operative images/visual field results.', '2013-11-01', None),
+        ('N679', 'Incomplete/Invalid post-operative images/visual field results.', '2013-11-01', None),
+        ('N680', 'Missing/Incomplete/Invalid date of previous dental extractions.', '2013-11-01', None),
+        ('N681', 'Missing/Incomplete/Invalid full arch series.', '2013-11-01', None),
+        ('N682', 'Missing/Incomplete/Invalid history of prior periodontal therapy/maintenance.', '2013-11-01', None),
+        ('N683', 'Missing/Incomplete/Invalid prior treatment documentation.', '2013-11-01', None),
+        ('N684', 'Payment denied as this is a specialty claim submitted as a general claim.', '2013-11-01', None),
+        ('N685', 'Missing/Incomplete/Invalid Prosthesis, Crown or Inlay Code.', '2013-11-01', None),
+        ('N686', 'Missing/incomplete/Invalid questionnaire needed to complete payment determination.', '2013-11-01', None),
+        ('N687', 'Alert:This reversal is due to a retroactive disenrollment.', '2013-11-01', None),
+        ('N688', 'Alert:This reversal is due to a medical or utilization review decision.', '2013-11-01', None),
+        ('N689', 'Alert:This reversal is due to a retroactive rate change.', '2013-11-01', None),
+        ('N690', 'Alert:This reversal is due to a provider submitted appeal.', '2013-11-01', None),
+        ('N691', 'Alert:This reversal is due to a patient submitted appeal.', '2013-11-01', None),
+        ('N692', 'Alert:This reversal is due to an incorrect rate on the initial adjudication.', '2013-11-01', None),
+        ('N693', 'Alert:This reversal is due to a cancellation of the claim by the provider.', '2013-11-01', None),
+        ('N694', 'Alert:This reversal is due to a resubmission/change to the claim by the provider.', '2013-11-01', None),
+        ('N695', 'Alert:This reversal is due to incorrect patient financial responsibility information on the initial adjudication.', '2013-11-01', None),
+        ('N696', 'Alert:This reversal is due to a Coordination of Benefits or Third Party Liability Recovery retroactive adjustment.', '2013-11-01', None),
+        ('N697', "Alert:This reversal is due to a payer's retroactive contract incentive program adjustment.", '2013-11-01', None),
+        ('N698', 'Alert:This reversal is due to non-payment of the health insurance premiums (Health Insurance Exchange or other) by the end of the premium payment grace period, resulting in loss of coverage.', '2013-11-01', None),
+        ('N699', 'Payment adjusted based on the Physician Quality Reporting System (PQRS) Incentive Program.', '2014-03-01', None),
+        ('N700', 'Payment adjusted based on the Electronic Health Records (EHR) Incentive Program.', '2014-03-01', None),
+        ('N701', 'Payment adjusted based on the Value-based Payment Modifier.', '2014-03-01', None),
+        ('N702', 'Decision based on review of previously adjudicated claims or for claims in process for the same/similar type of services.', '2014-03-01', None),
+        ('N703', 'This service is incompatible with previously  adjudicated claims or claims in process.', '2014-03-01', None),
+        ('N704', 'Alert:You may not appeal this decision but can resubmit this claim/service with corrected information if warranted.', '2014-03-01', None),
+        ('N705', 'Incomplete/invalid documentation.', '2014-03-01', None),
+        ('N706', 'Missing documentation.', '2014-03-01', None),
+        ('N707', 'Incomplete/invalid orders.', '2014-03-01', None),
+        ('N708', 'Missing orders.', '2014-03-01', None),
+        ('N709', 'Incomplete/invalid notes.', '2014-03-01', None),
+        ('N710', 'Missing notes.', '2014-03-01', None),
+        ('N711', 'Incomplete/invalid summary.', '2014-03-01', None),
+        ('N712', 'Missing summary.', '2014-03-01', None),
+        ('N713', 'Incomplete/invalid report.', '2014-03-01', None),
+        ('N714', 'Missing report.', '2014-03-01', None),
+        ('N715', 'Incomplete/invalid chart.', '2014-03-01', None),
+        ('N716', 'Missing chart.', '2014-03-01', None),
+        ('N717', 'Incomplete/Invalid documentation of face-to-face examination.', '2014-03-01', None),
+        ('N718', 'Missing documentation of face-to-face examination.', '2014-03-01', None),
+        ('N719', 'Penalty applied based on plan requirements not being met.', '2014-03-01', None),
+        ('N720', "Alert:The patient overpaid you. You may need to issue the patient a refund for the difference between the patient's payment and the amount shown as patient responsibility on this notice.", '2014-03-01', None),
+        ('N721', 'This service is only covered when performed as part of a clinical trial.', '2014-03-01', None),
+        ('N722', "Patient must use Workers' Compensation Set-Aside (WCSA) funds to pay for the medical service or item.", '2014-03-01', None),
+        ('N723', 'Patient must use Liability set-aside (LSA) funds to pay for the medical service or item.', '2014-03-01', None),
+        ('N724', 'Patient must use No-Fault set-aside (NFSA) funds to pay for the medical service or item.', '2014-03-01', None),
+        ('N725', 'A liability insurer has reported having ongoing responsibility for medical services (ORM) for this diagnosis.', '2014-03-01', None),
+        ('N726', 'A conditional payment is not allowed.', '2014-03-01', None),
+        ('N727', 'A no-fault insurer has reported having ongoing responsibility for medical services (ORM) for this diagnosis.', '2014-03-01', None),
+        ('N728', "A workers' compensation insurer has reported having ongoing responsibility for medical services (ORM) for this diagnosis.", '2014-03-01', None),
+        ('N729', 'Missing patient medical/dental record for this service.', '2014-11-01', None),
+        ('N730', 'Incomplete/invalid patient medical/dental record for this service.', '2014-11-01', None),
+        ('N731', 'Incomplete/Invalid mental health assessment.', '2014-11-01', None),
+        ('N732', 'Services performed at an unlicensed facility are not reimbursable.', '2014-11-01', None),
+        ('N733', 'Regulatory surcharges are paid directly to the state.', '2014-11-01', None),
+        ('N734', 'The patient is eligible for these medical services only when unable to work or perform normal activities due to an illness or injury.', '2014-11-01', None),
+        ('N735', 'Adjustment without review of medical/dental record because the requested records were not received or were not received timely.', '2015-03-01', '2016-01-01'),
+        ('N736', 'Incomplete/invalid Sleep Study Report.', '2015-03-01', None),
+        ('N737', 'Missing Sleep Study Report.', '2015-03-01', None),
+        ('N738', 'Incomplete/invalid Vein Study Report.', '2015-03-01', None),
+        ('N739', 'Missing Vein Study Report.', '2015-03-01', None),
+        ('N740', "The member's Consumer Spending Account does not contain sufficient funds to cover the member's liability for this claim/service.", '2015-03-01', None),
+        ('N741', 'This is a site neutral payment.', '2015-03-01', None),
+        ('N742', 'Alert:This claim was processed based on one or more ICD-9 codes. The transition to ICD-10 is required by October 1, 2015, for health care providers, health plans, and clearinghouses. More information can be found at http://www.cms.gov/Medicare/Coding/ICD10/ProviderResources.html', '2015-03-01', '2016-11-01'),
+        ('N743', 'Adjusted because the services may be related to an employment accident.', '2015-03-01', None),
+        ('N744', 'Adjusted because the services may be related to an auto/other accident.', '2015-03-01', None),
+        ('N745', 'Missing Ambulance Report.', '2015-03-01', None),
+        ('N746', 'Incomplete/invalid Ambulance Report.', '2015-03-01', None),
+        ('N747', 'This is a misdirected claim/service. Submit the claim to the payer/plan where the patient resides.', '2015-03-01', None),
+        ('N748', 'Adjusted because the related hospital charges have not been received.', '2015-03-01', None),
+        ('N749', 'Missing Blood Gas Report.', '2015-03-01', None),
+        ('N750', 'Incomplete/invalid Blood Gas Report.', '2015-03-01', None),
+        ('N751', 'Adjusted because the patient is covered under a Medicare Part D plan.', '2015-03-01', None),
+        ('N752', 'Missing/incomplete/invalid HIPPS Treatment Authorization Code (TAC).', '2015-03-01', None),
+        ('N753', 'Missing/incomplete/invalid Attachment Control Number.', '2015-07-01', None),
+        ('N754', 'Missing/incomplete/invalid Referring Provider or Other Source Qualifier on the 1500 Claim Form.', '2015-07-01', None),
+        ('N755', 'Missing/incomplete/invalid ICD Indicator.', '2015-07-01', None),
+        ('N756', 'Missing/incomplete/invalid point of drop-off address.', '2015-07-01', None),
+        ('N757', 'Adjusted based on the Federal Indian Fees schedule (MLR).', '2015-07-01', None),
+        ('N758', 'Adjusted based on the prior authorization decision.', '2015-07-01', None),
+        ('N759', 'Payment adjusted based on the National Electrical Manufacturers Association (NEMA) Standard XR-29-2013.', '2015-07-01', None),
+        ('N760', 'This facility is not authorized to receive payment for the service(s).', '2015-11-01', None),
+        ('N761', 'This provider is not authorized to receive payment for the service(s).', '2015-11-01', None),
+        ('N762', 'This facility is not certified for Tomosynthesis (3-D) mammography.', '2015-11-01', None),
+        ('N763', 'The demonstration code is not appropriate for this claim; resubmit without a demonstration code.', '2015-11-01', None),
+        ('N764', 'Missing/incomplete/invalid Hematocrit (HCT) value.', '2016-03-01', None),
+        ('N765', 'This payer does not cover coinsurance assessed by a previous payer.', '2016-03-01', None),
+        ('N766', 'This payer does not cover co-payment assessed by a previous payer.', '2016-03-01', None),
+        ('N767', "The Medicaid state requires provider to be enrolled in the member's Medicaid state program prior to any claim benefits being processed.", '2016-03-01', None),
+        ('N768', 'Incomplete/invalid initial evaluation report.', '2016-03-01', None),
+        ('N769', 'A lateral diagnosis is required.', '2016-03-01', None),
+        ('N770', 'The adjustment request received from the provider has been processed. Your original claim has been adjusted based on the information received.', '2016-03-01', None),
+        ('N771', 'Alert:Under Federal law you cannot charge more than the limiting charge amount.', '2016-07-01', None),
+        ('N772', 'Alert:Rebill urgent/emergent and ancillary services separately.', '2016-07-01', None),
+        ('N773', 'Drug supplied not obtained from specialty vendor.', '2016-07-01', None),
+        ('N774', 'Alert:Refer to your Third Party Processor Agreement for specific information on fees associated with this payment type.', '2016-07-01', None),
+        ('N775', 'Payment adjusted based on x-ray radiograph on film.', '2016-11-01', None),
+        ('N776', 'This service is not a covered Telehealth service.', '2016-11-01', None),
+        ('N777', 'Missing Assignment of Benefits Indicator.', '2016-11-01', None),
+        ('N778', 'Missing Primary Care Physician Information.', '2016-11-01', None),
+        ('N779', 'Replacement/Void claims cannot be submitted until the original claim has finalized. Please resubmit once payment or denial is received.', '2016-11-01', None),
+        ('N780', 'Missing/incomplete/invalid end therapy date.', '2016-11-01', None),
+        ('N781', 'Alert:Patient is a Medicaid/ Qualified Medicare Beneficiary. Review your records for any wrongfully collected deductible. This amount may be billed to a subsequent payer.', '2016-11-01', None),
+        ('N782', 'Alert:Patient is a Medicaid/ Qualified Medicare Beneficiary. Review your records for any wrongfully collected coinsurance. This amount may be billed to a subsequent payer.', '2016-11-01', None),
+        ('N783', 'Alert:Patient is a Medicaid/ Qualified Medicare Beneficiary. Review your records for any wrongfully collected copayment. This amount may be billed to a subsequent payer.', '2016-11-01', None),
+        ('N784', 'Missing comprehensive procedure code.', '2016-11-01', None),
+        ('N785', 'Missing current radiology film/images.', '2016-11-01', None),
+        ('N786', 'Benefit limitation for the orthodontic active and/or retention phase of treatment.', '2016-11-01', None),
+        ('N787', 'Alert:Under 42 CFR 410.43, an eligible Partial Hospitalization Program (PHP) patient/beneficiary requires a minimum of 20 hours of PHP services per week, as evidenced in the plan of care. PHP services must be furnished in accordance with the plan of care.', '2017-03-01', None),
+        ('N788', 'Alert:The third-party administrator/review organization did not receive the required information.', '2017-03-01', None),
+        ('N789', 'Clinical Trial is not a covered benefit.', '2017-07-01', None),
+        ('N790', 'Provider/supplier not accredited for product/service.', '2017-07-01', None),
+        ('N791', 'Missing history & physical report.', '2017-07-01', None),
+        ('N792', 'Incomplete/invalid history & physical report.', '2017-07-01', None),
+        ('N793', 'Alert:Starting January 1, 2020, Medicare will ONLY accept claims submitted with the Medicare Beneficiary Identifier (MBI). Medicare will reject any claims submitted with the Health Insurance Claim Number (HICN) with a few exceptions. Please see www.cms.gov/Medicare/New-Medicare-Card/index.html for more information.', '2017-07-01', '2020-07-01'),
+        ('N794', 'Payment adjusted based on type of technology used.', '2017-07-01', None),
+        ('N795', 'Item must be resubmitted as a purchase.', '2017-11-01', None),
+        ('N796', 'Missing/incomplete/invalid Hemoglobin (Hb or Hgb) value.', '2017-11-01', None),
+        ('N797', 'Missing/incomplete/invalid date qualifier.', '2017-11-01', None),
+        ('N798', 'Submit a void request for the original claim and resubmit a new claim.', '2017-11-01', None),
+        ('N799', 'Submitted identifier must be an individual identifier, not group identifier.', '2017-11-01', None),
+        ('N800', 'Only one service date is allowed per claim.', '2018-03-01', None),
+        ('N801', 'Services performed in a Medicare participating or CAH facility under a self-insured tribal Group Health Plan, in accordance with Federal Regulation 42 CFR 136.', '2018-03-01', None),
+        ('N802', 'This claim/service is not payable under our service area. The claim must be filed to the Payer/Plan in whose service area the Rendering Physician is located.', '2018-03-01', None),
+        ('N803', 'Submission of the claim for the service rendered is the responsibility of the Contracted Medical Group or Hospital.', '2018-03-01', None),
+        ('N804', 'Alert:The claim/service was processed through the Outpatient Code Editor (OCE).', '2018-07-01', None),
+        ('N805', 'Alert:The claim/service was processed through the Correct Code Editor (CCE).', '2018-07-01', None),
+        ('N806', 'Payment is included in the Global transplant allowance.', '2018-07-01', None),
+        ('N807', 'Payment adjustment based on the Merit-based Incentive Payment System (MIPS).', '2018-07-01', None),
+        ('N808', 'Not covered for this provider type / provider specialty.', '2018-07-01', None),
+        ('N809', 'Alert:The fee schedule amount for this service was adjusted based on prior competitive bidding rates. For more information, contact your local contractor.', '2018-11-01', None),
+        ('N810', 'Alert:Due to federal, state or local disaster declaration, this claim has been processed at the in-network level of benefit. At the conclusion or expiration of the disaster declaration, network payment rules will be reinstated.', '2018-11-01', None),
+        ('N811', 'Missing Federal Sequestration Reduction from Prior Payer.', '2018-11-01', None),
+        ('N812', 'The start service date through end service date cannot span greater than 18 months.', '2018-11-01', None),
+        ('N815', 'Missing/Incomplete/Invalid NDC Unit Count', '2019-07-01', None),
+        ('N816', 'Missing/Incomplete/Invalid NDC Unit of Measure', '2019-07-01', None),
+        ('N817', 'Alert:Applicable laboratories are required to collect and report private payor data and report that data to CMS between January 1, 2020 - March 31, 2020.', '2019-07-01', None),
+        ('N818', 'Claims Dates of Service do not match Electronic Visit Verification System.', '2019-07-01', None),
+        ('N819', 'Patient not enrolled in Electronic Visit Verification System.', '2019-07-01', None),
+        ('N820', 'Electronic Visit Verification System units do not meet requirements of visit.', '2019-07-01', None),
+        ('N821', 'Electronic Visit Verification System visit not found.', '2019-07-01', None),
+        ('N822', 'Missing procedure modifier(s).', '2019-07-01', None),
+        ('N823', 'Incomplete/Invalid procedure modifier(s).', '2019-07-01', None),
+        ('N824', 'Electronic Visit Verification (EVV) data must be submitted through EVV Vendor.', '2019-11-01', None),
+        ('N825', 'Early intervention guidelines were not met.', '2019-11-01', None),
+        ('N826', 'Patient did not meet the inclusion criteria for the Medicare Shared Savings Program.', '2019-11-01', None),
+        ('N827', 'Missing/Incomplete/Invalid Federal Information Processing Standard (FIPS) Code.', '2019-11-01', None),
+        ('N828', 'Alert:Payment is suppressed due to a contracted funding.', '2020-03-01', None),
+        ('N829', 'Missing/incomplete/invalid Diagnostics Exchange Z-Code Identifier.', '2020-03-01', None),
+        ('N830', 'Alert:The charge[s] for this service was processed in accordance with Federal/ State, Balance Billing/ No Surprise Billing regulations. As such, any amount identified with OA, CO, or PI cannot be collected from the member and may be considered provider liability or be billable to a subsequent payer. Any amount the provider collected over the identified PR amount must be refunded to the patient within applicable Federal/State timeframes. Payment amounts are eligible for dispute pursuant to any Federal/State documented appeal/grievance process(es).', '2020-03-01', None),
+        ('N831', 'You have not responded to requests to revalidate your provider/supplier enrollment information.', '2020-03-01', None),
+        ('N832', 'Duplicate occurrence code/occurrence span code.', '2020-07-01', None),
+        ('N833', 'Patient share of cost waived.', '2020-07-01', None),
+        ('N834', 'Jurisdiction exempt from sales and health tax charges.', '2020-11-01', None),
+        ('N835', "Unrelated Service/procedure/treatment is reduced. The balance of this charge is the patient's responsibility.", '2020-11-01', None),
+        ('N836', 'Provider W9 or Payee Registration not on file.', '2020-11-01', None),
+        ('N837', 'Alert:Missing modifier was added.', '2020-11-01', None),
+        ('N838', 'Alert:Service/procedure postponed due to a federal, state, or local mandate/disaster declaration. Any amounts applied to deductible or member liability will be applied to the prior plan year from which the procedure was cancelled.', '2020-11-01', None),
+        ('N839', 'The procedure code was added/changed because the level of service exceeds the compensable condition(s).', '2021-03-01', None),
+        ('N840', "Worker's compensation claim filed with a different state.", '2021-03-01', None),
+        ('N841', 'Alert:North Dakota Administrative Rule 92-01-02-50.3.', '2021-03-01', None),
+        ('N842', 'Alert:Patient cannot be billed for charges.', '2021-03-01', None),
+        ('N843', 'Missing/incomplete/invalid Core-Based Statistical Area (CBSA) code.', '2021-03-01', None),
+        ('N844', 'This claim, or a portion of this claim, was processed in accordance with the Nebraska Legislative LB997 July 24, 2020 - Out of Network Emergency Medical Care Act.', '2021-03-01', None),
+        ('N845', 'Alert:Nebraska Legislative LB997 July 24, 2020 - Out of Network Emergency Medical Care Act.', '2021-03-01', None),
+        ('N846', 'National Drug Code (NDC) supplied does not correspond to the HCPCs/CPT billed.', '2021-03-01', None),
+        ('N847', 'National Drug Code (NDC) billed is obsolete.', '2021-03-01', None),
+        ('N848', 'National Drug Code (NDC) billed cannot be associated with a product.', '2021-03-01', None),
+        ('N849', 'Missing Tooth Clause: Tooth missing prior to the member effective date.', '2021-03-01', None),
+        ('N850', 'Missing/incomplete/invalid narrative explaining/describing this service/treatment.', '2021-03-01', None),
+        ('N851', 'Payment reduced because services were furnished by a therapy assistant.', '2021-07-01', None),
+        ('N852', 'The pay-to and rendering provider tax identification numbers (TINs) do not match', '2021-07-01', None),
+        ('N853', 'The number of modalities performed per session exceeds our acceptable maximum.', '2021-07-01', None),
+        ('N854', 'Alert:If you have primary other health insurance (OHI) coverage that has denied services, you must exhaust all appeal levels with your primary OHI before we can consider your claim for reimbursement.', '2021-07-01', None),
+        ('N855', 'This coverage is subject to the exclusive jurisdiction of ERISA (1974), U.S.C. SEC 1001.', '2021-07-01', None),
+        ('N856', 'This coverage is not subject to the exclusive jurisdiction of ERISA (1974), U.S.C. SEC 1001.', '2021-07-01', None),
+        ('N857', 'This claim has been adjusted/reversed. Refund any collected copayment to the member.', '2021-11-01', None),
+        ('N858', "Alert:State regulations relating to an Out of Network Medical Emergency Care Act were applied to the processing of this claim. Payment amounts are eligible for dispute following the state's documented appeal/ grievance/ arbitration process.", '2021-11-01', None),
+        ('N859', 'Alert:The Federal No Surprise Billing Act was applied to the processing of this claim. Payment amounts are eligible for dispute pursuant to any Federal documented appeal/ grievance/ dispute resolution process(es).', '2021-11-01', None),
+        ('N860', 'Alert:The Federal No Surprise Billing Act Qualified Payment Amount (QPA) was used to calculate the member cost share(s).', '2021-11-01', None),
+        ('N861', 'Alert:Mismatch between the submitted Patient Liability/Share of Cost and the amount on record for this recipient.', '2022-03-01', None),
+        ('N862', 'Alert:Member cost share is in compliance with the No Surprises Act, and is calculated using the lesser of the QPA or billed charge.', '2022-03-01', None),
+        ('N863', 'Alert:This claim is subject to the No Surprises Act (NSA). The amount paid is the final out-of-network rate and was calculated based on an All Payer Model Agreement, in accordance with the NSA.', '2022-03-01', None),
+        ('N864', 'Alert:This claim is subject to the No Surprises Act provisions that apply to emergency services.', '2022-03-01', None),
+        ('N865', 'Alert:This claim is subject to the No Surprises Act provisions that apply to nonemergency services furnished by nonparticipating providers during a patient visit to a participating facility.', '2022-03-01', None),
+        ('N866', 'Alert:This claim is subject to the No Surprises Act provisions that apply to services furnished by nonparticipating providers of air ambulance services.', '2022-03-01', None),
+        ('N867', 'Alert:Cost sharing was calculated based on a specified state law, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N868', 'Alert:Cost sharing was calculated based on an All-Payer Model Agreement, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N869', 'Alert:Cost sharing was calculated based on the qualifying payment amount, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N870', 'Alert:In accordance with the No Surprises Act, cost sharing was based on the billed amount because the billed amount was lower than the qualifying payment amount.', '2022-03-01', None),
+        ('N871', 'Alert:This initial payment was calculated based on a specified state law, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N872', 'Alert:This final payment was calculated based on a specified state law, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N873', 'Alert:This final payment was calculated based on an All-Payer Model Agreement, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N874', 'Alert:This final payment was determined through open negotiation, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N875', 'Alert:This final payment equals the amount selected as the out-of-network rate by a Federal Independent Dispute Resolution Entity, in accordance with the No Surprises Act.', '2022-03-01', None),
+        ('N876', 'Alert:This item or service is covered under the plan. This is a notice of denial of payment provided in accordance with the No Surprises Act. The provider or facility may initiate open negotiation if they desire to negotiate a higher out-of-network rate than the amount paid by the patient in cost sharing.', '2022-03-01', None),
+        ('N877', 'Alert:This initial payment is provided in accordance with the No Surprises Act. The provider or facility may initiate open negotiation if they desire to negotiate a higher out-of-network rate.', '2022-03-01', None),
+        ('N878', 'Alert:The provider or facility specified that notice was provided and consent to balance bill obtained, but notice and consent was not provided and obtained in a manner consistent with applicable Federal law. Thus, cost sharing and the total amount paid have been calculated based on the requirements under the No Surprises Act, and balance billing is prohibited.', '2022-03-01', None),
+        ('N879', 'Alert:The notice and consent to balance bill, and to be charged out-of-network cost sharing, that was obtained from the patient with regard to the billed services, is not permitted for these services. Thus, cost sharing and the total amount paid have been calculated based on the requirements under the No Surprises Act, and balance billing is prohibited.', '2022-03-01', None),
+        ('N880', 'Original claim closed due to changes in submitted data. Adjustment claim will be processed under a new claim number.', '2022-11-01', None),
+        ('N881', 'Client Obligation, patient responsibility for Home & Community Based Services (HCBS)', '2022-11-01', None),
+        ('N882', "Alert:The out-of-network payment and cost sharing amounts were based on the plan's allowance because the provider or facility obtained the patient's consent to waive the balance billing protections under the No Surprises Act.", '2022-11-01', None),
+        ('N883', 'Alert:Processed according to state law', '2022-11-01', None),
+        ('N884', 'Alert:The No Surprises Act may apply to this claim. Please contact payer for instructions on how to submit information regarding whether or not the item or service was furnished during a patient visit to a participating facility.', '2022-11-01', None),
+        ('N885', 'Alert:This claim was not processed in accordance with the No Surprises Act cost-sharing or out-of-network payment requirements. The payer disagrees with your determination that those requirements apply. You may contact the payer to find out why it disagrees. You may appeal this adverse determination on behalf of the patient through the payer’s internal appeals and external review processes.', '2022-11-01', None),
+        ('N886', 'Alert:A Health Care Claim Request for Additional Information (277 RFAI) has been sent.', '2023-07-01', None),
+        ('N887', 'Providers not participating in the Medicare Advantage Plan have the right to appeal if the plan has partially or fully denied payment or if the provider believes the plan has not paid the services at the expected Medicare reimbursable rate or type of level/service. Providers may file their appeal in writing within 60 calendar days after the date of the remittance advice. For the plan to review the appeal, the plan will need a completed signed Waiver of Liability Statement. To obtain a Waiver of Liability form, please contact your Medicare Advantage Plan.Once we receive the completed forms, we will give you a decision on your appeal within 60 calendar days.', '2023-07-01', None),
+        ('N888', 'Alert:An electronic request for additional information has been sent for this claim.', '2023-07-01', None),
+        ('N889', 'Alert:This claim was originally processed in real-time, and we sent a real-time 835 response.', '2023-11-01', None),
+        ('N890', 'Electronic Visit Verification Data Element Requirements were not met.', '2023-11-01', None),
+        ('N891', 'The maximum allowable payment for this service/procedure was paid by the primary insurance. No further payment due.', '2023-11-01', None),
+        ('N892', 'The claim does not meet the criteria for acceptable use of the Delay Reason Code.', '2023-11-01', None),
+        ('N893', 'Missing/incomplete/invalid child medical evaluation form/checklist.', '2024-03-01', None),
+        ('N894', "Alert:These payments are made subject to a reservation of rights for the Payor to recoup or otherwise recover all or part of these payments based on any of the following: outcome of pending or future litigation/ new or updated state, federal or regulatory guidance/ any other actions that may affect the Payor's obligation to make these payments.", '2024-03-01', None),
+        ('N895', 'Processed based on a negotiated fee schedule for a specialty drug program.', '2024-03-01', None),
+        ('N896', 'Missing/incomplete/invalid trauma activation sheet.', '2024-07-01', None),
+        ('N897', 'Missing/incomplete/invalid proof of member payment.', '2024-07-01', None),
+        ('N898', 'Missing/incomplete/invalid Resource Utilization Group(s) (RUG) code(s).', '2024-07-01', None),
+        ('N899', 'Missing Initial Evaluation Report.', '2024-07-01', None),
+        ('N900', 'Missing Therapy Notes/Report.', '2024-07-01', None),
+        ('N901', 'Incomplete/Invalid Therapy Notes/Report.', '2024-07-01', None),
+        ('N902', 'Missing Health Risk Assessment (HRA).', '2024-07-01', None),
+        ('N903', 'Incomplete/Invalid Health Risk Assessment (HRA).', '2024-07-01', None),
+        ('N904', 'The transportation vendor is responsible for this claim.', '2024-07-01', None),
+    ],
+    'report_type_codes': [
+        ('AFFRPT', 'References an affiliate payee ID and HIX 820 EFT Trace Number (TRN02) that will allow the payee to identify the affiliate related to the Exchange Payment Type Code in the 2300 Loop.', None, None),
+        ('BALRPT', 'The report type code that corresponds to BAL Payment Type code to provide additional details for the transaction.', None, None),
+        ('DDVCRPT', 'Provides a CMS Invoice Number associated with the DDVC Charge or Payment. The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Benefit Year, Issuer ID, State, and Market associated to the DDVC Charge or Payment.Default Data Validation Charge/Payment Invoice Logic:Invoice Number Example: 214VA160112345001Digit 1: Program and Market Designator (2)Digits 2-3: Program Year (14)Digits 4-5: State Code (VA)Digits 6-9: Year and Month (1601)Digits 10-14: Issuer ID (12345)Digits 15-17: Transaction Sequential Counter (001)Program and Market Designator (Digit 1) Key:Default Data Validation Individual - 2Default Data Validation Small Group - 3Default Data Validation Catastrophic - 4Default Data Validation Merged - 5', None, None),
+        ('HCRPCRPT', 'Provides a CMS Invoice Number associated with the HCRP Contribution/Collection (negative or positive). The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Program Year, Payee ID, and Market associated to the HCRP Contribution/Collection.HCRP Contribution/Collection Invoice Logic:Invoice Number Example: X222311A12345601Digit 1: Program and Market Designator (X)Digits 2-3: Program Year (22)Digits 4-7: Year and Month (2311)Digits 8-14 (or 8-15): Payee ID (A123456)Digits 15-16 (or 16-17): Transaction Sequential Counter (01)Program and Market Designator (Digit 1) Key:High Cost Risk Pool Individual - XHigh Cost Risk Pool Small Group - Y', None, None),
+        ('HCRPPRPT', 'Provides a CMS Invoice Number associated with the HCRP Payment (negative or positive). The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Program Year, Payee ID, and Market associated to the HCRP Payment.HCRP Payment Invoice Logic:Invoice Number Example: X222311A12345601Digit 1: Program and Market Designator (X)Digits 2-3: Program Year (22)Digits 4-7: Year and Month (2311)Digits 8-14 (or 8-15): Payee ID (A123456)Digits 15-16 (or 16-17): Transaction Sequential Counter (01)Program and Market Designator (Digit 1) Key:High Cost Risk Pool Individual - XHigh Cost Risk Pool Small Group - Y', None, None),
+        ('INFORPT', 'The report type code that corresponds to any Payment Type code to provide additional details for the transaction.', None, None),
+        ('INVOICERPT', 'References an Invoice number related to the Exchange Payment Type Code in the 2300 Loop', None, None),
+        ('ISSUERIDRPT', 'References an Issuer (5-digit) HIOS ID number related to the Exchange Payment Type Code in the 2300 Loop', None, None),
+        ('MADJRPT', 'The number included in the document control number references a unique trace number that may be included on a future HIX 820 if the manual adjustment is reversible.', None, None),
+        ('PAYMENTTRANSACTIONID', 'This will be the Payment Transaction ID for the initial payment ID if this is an initial payment.', None, None),
+        ('RARPT', 'Provides a CMS Invoice Number associated with the RA Charge or Payment. The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Benefit Year, Issuer ID, State, and Market associated to the RA Charge or Payment.Risk Adjustment Program Charge/Payment Invoice Logic:Invoice Number Example: I14VA160112345001Digit 1: Program and Market Designator (I)Digits 2-3: Program Year (14)Digits 4-5: State Code (VA)Digits 6-9: Year and Month (1601)Digits 10-14: Issuer ID (12345)Digits 15-17: Transaction Sequential Counter (001)Program and Market Designator (Digit 1) Key:Risk Adjustment Individual - IRisk Adjustment Small Group - LRisk Adjustment Catastrophic - TRisk Adjustment Merged - M', None, None),
+        ('RADRPT', 'Provides a CMS Invoice Number associated with the RAD Charge or Payment. The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Benefit Year, Issuer ID, State, and Market associated to the RAD Charge or Payment.Risk Adjustment Default Charge/Payment Invoice Logic:Invoice Number Example: N14VA160112345001Digit 1: Program and Market Designator (N)Digits 2-3: Program Year (14)Digits 4-5: State Code (VA)Digits 6-9: Year and Month (1601)Digits 10-14: Issuer ID (12345)Digits 15-17: Transaction Sequential Counter (001)Program and Market Designator (Digit 1) Key:Risk Adjustment Default Charge/Payment Individual - NRisk Adjustment Default Charge/Payment Small Group - ORisk Adjustment Default Charge/Payment Catastrophic - HRisk Adjustment Default Charge/Payment Merged - B', None, None),
+        ('RADVRPT', 'Provides a CMS Invoice Number associated with the RADV Charge or Payment. The Invoice Number will be 16 or 17 digits and below provides the necessary key to identify the Benefit Year, Issuer ID, State, and Market associated to the RADV Charge or Payment.Risk Adjustment Data Validation Charge/Payment Invoice Logic:Invoice Number Example: 614VA160112345001Digit 1: Program and Market Designator (6)Digits 2-3: Program Year (14)Digits 4-5: State Code (VA)Digits 6-9: Year and Month (1601)Digits 10-14: Issuer ID (12345)Digits 15-17: Transaction Sequential Counter (001)Program and Market Designator (Digit 1) Key:Risk Adjustment Data Validation Individual - 6Risk Adjustment Data Validation Small Group - 7Risk Adjustment Data Validation Catastrophic - 8Risk Adjustment Data Validation Merged - 9', None, None),
+        ('REVMADJRPT', 'The number included in the document control number references a unique trace number from a prior month HIX 820 where the manual adjustment first occurred.', None, None),
+        ('SHOPUFRPT', 'The number included in the document control number references a unique trace number (TRN02) from a corresponding SHOP HIX 820 transaction.', None, None),
+    ],
+    'service_review_decision_codes': [
+        ('01', 'Price Authorization Expired', None, None),
+        ('02', 'Price authorization no longer required', None, None),
+        ('03', 'Product not on the price authorization', None, None),
+        ('04', 'Authorized Quantity Exceeded', None, None),
+        ('05', 'Special Cost Incorrect', None, None),
+        ('06', 'No Credit Allowed', None, None),
+        ('07', 'Administrative Cancellation', None, None),
+        ('08', 'Unit resale higher than authorized', None, None),
+        ('09', 'Out of Network', None, None),
+        ('0A', 'Testing not Included', None, None),
+        ('0B', 'Request Forwarded To and Decision Response Forthcoming From an External Review Organization', None, None),
+        ('0C', 'Authorization/Access Restrictions', None, None),
+        ('0D', 'Requires PCP authorization', None, None),
+        ('0E', 'Provider is Not Primary Care Physician', None, None),
+        ('0F', 'Not Medically Necessary', None, None),
+        ('0G', 'Level of Care Not Appropriate', None, None),
+        ('0H', 'Certification Not Required for this Service', None, None),
+        ('0J', 'Certification Responsibility of External Review Organization', None, None),
+        ('0K', 'Primary Care Service', None, None),
+        ('0L', 'Exceeds Plan Maximums', None, None),
+        ('0M', 'Non-covered Service', None, None),
+        ('0N', 'No Prior Approval', None, None),
+        ('0P', 'Requested Information Not Received', None, None),
+        ('0Q', 'Duplicate Request', None, None),
+        ('0R', 'Service Inconsistent with Diagnosis', None, None),
+        ('0S', 'Pre-existing Condition', None, None),
+        ('0T', 'Experimental Service or Procedure', None, None),
+        ('0U', 'Additional Patient Information required', None, None),
+        ('0V', 'Requires Medical Review', None, None),
+        ('0W', 'Disposition pending review', None, None),
+        ('0X', 'Service Inconsistent with Provider Type', None, None),
+        ('0Y', "Service inconsistent with Patient's Age", None, None),
+        ('0Z', "Service inconsistent with Patient's Gender", None, None),
+        ('10', 'Product/service/procedure delivery pattern (e.g., units, days, visits, weeks, hours, months)', None, None),
+        ('11', 'Pricing', None, None),
+        ('12', 'Patient is restricted to specific provider', None, None),
+        ('13', 'Service authorized for another provider', None, None),
+        ('14', 'Plan/contractual guidelines not followed', None, None),
+        ('15', 'Plan/contractual geographic restriction', None, None),
+        ('16', 'Inappropriate facility type', None, None),
+        ('17', 'Time limits not met', None, None),
+        ('18', 'Notification received', None, None),
+        ('19', 'Cosmetic', None, None),
+        ('20', 'Once in a lifetime restriction applies', None, None),
+        ('21', 'Transport Request Denied', None, None),
+        ('22', "Ambulance Certification Segment information doesn't correspond to Transport Address Segment", None, None),
+        ('23', 'Mileage cannot be computed based on data submitted', None, None),
+        ('24', 'Computed mileage is inconsistent with transport information or service units submitted', None, None),
+        ('25', 'Services were not considered due to other errors in the request.', None, None),
+        ('26', 'Missing Provider Role', None, None),
+        ('27', 'Patient is currently in a Health Insurance Exchange premium payment grace period -- first month. Usage: Use only for Individual Market Qualified Health Plans.', None, None),
+        ('28', 'Patient is currently in a Health Insurance Exchange premium payment grace period -- second month. Usage: Use only for Individual Market Qualified Health Plans.', None, None),
+        ('29', 'Patient is currently in a Health Insurance Exchange premium payment grace period -- third month. Usage: Use only for Individual Market Qualified Health Plans.', None, None),
+        ('30', 'Initial Utilization Review In Progress', None, None),
+        ('31', 'Escalated Utilization Review in Progress', None, None),
+        ('32', 'Excluded benefit, a service which is specifically excluded from the benefit plan.', None, None),
+        ('33', 'Appeal Denied', None, None),
+        ('34', 'Payer-initiated Void', None, None),
+        ('35', 'The documentation submitted is not legible.', None, None),
+        ('36', 'Signed documentation is required to support medical necessity.', None, None),
+        ('37', 'A signed Order or Intent-to-Order is required.', None, None),
+        ('38', 'A physician certification statement is required.', None, None),
+        ('39', 'An order that supports this service is required.', None, None),
+        ('40', 'The supporting documentation does not match the patient identified in the preauthorization request.', None, None),
+        ('41', 'The supporting documentation does not support the number of units requested.', None, None),
+        ('42', 'A nutritional status assessment is required.', None, None),
+        ('43', 'Initial and repeated wound measurements are required.', None, None),
+        ('44', 'Documentation of conservative treatment failure is required.', None, None),
+        ('45', 'Documentation of a diabetes diagnosis is required.', None, None),
+        ('46', 'Documentation that treatment is an adjunct to conventional therapy is required.', None, None),
+        ('47', 'Documentation of measurable signs of improvement is required.', None, None),
+        ('48', 'Documentation of a diabetic wound classification is required.', None, None),
+        ('49', 'Patient was not admitted within the authorized timeframe.', None, None),
+    ],
+    'service_type_codes': [
+        ('1', 'Medical CareMedical services to diagnose and/or treat a medical condition, illness, or injury', '2009-09-20', None),
+        ('2', 'SurgicalSurgical services provided by a healthcare provider', '2009-09-20', None),
+        ('3', 'ConsultationCounseling and/or coordination of care with other Physicians, other qualified Healthcare Providers or agencies', '2009-09-20', None),
+        ('4', 'Diagnostic X-RayDiagnostic x-ray provided by a  healthcare provider', '2009-09-20', None),
+        ('5', 'Diagnostic LabDiagnostic lab provided by a healthcare provider', '2009-09-20', None),
+        ('6', 'Radiation TherapyRadiation therapy provided by a healthcare provider', '2009-09-20', None),
+        ('7', 'AnesthesiaAnesthesia services provided by a healthcare provider', '2009-09-20', None),
+        ('8', 'Surgical AssistanceAssistant surgeon/surgical assistance provided by a healthcare provider if required because of the complexity of the surgical procedures', '2009-09-20', None),
+        ('9', 'Hearing AidSmall electronic device that is worn in or above the ear.', '2023-09-01', None),
+        ('10', 'BloodThe allotment of whole blood, blood plasma, or blood derivatives', '2009-09-20', None),
+        ('11', 'Durable Medical Equipment UsedUsed equipment needed for medical reasons to be used by a person that is ill or injured and is ordered by a health care provider for use in the home.', '2009-09-20', None),
+        ('12', 'Durable Medical Equipment PurchasedPurchased equipment needed for medical reasons to be used by a person that is ill or injured and is ordered by a healthcare provider for use in the home.', '2009-09-20', None),
+        ('13', 'Hearing Aid Power SourceBatteries or other type of device used to charge a hearing aid', '2023-09-01', None),
+        ('14', 'Renal SuppliesSupplies to support treatment of kidneys, or bladder functions.  (Example: Dialysis Supplies and/or catheters)', '2009-09-20', None),
+        ('15', 'Sleep Study', '2024-01-01', None),
+        ('17', 'Pre-Admission TestingServices related to the preparation for admission to establish the patients current health status.', '2009-09-20', None),
+        ('18', 'Durable Medical Equipment RentalRental equipment needed for medical reasons to be used by a person that is ill or injured and is ordered by a healthcare provider for use in the home.', '2009-09-20', None),
+        ('19', 'Pneumonia VaccineServices provided by a physician or other healthcare provider related to administration of Pneumococcal Pneumonia vaccination.', '2009-09-20', None),
+        ('20', 'Second Surgical OpinionSecond professional opinion sought to verify or confirm the necessity for surgical procedures', '2009-09-20', None),
+        ('21', 'Third Surgical OpinionThird professional opinion sought to verify or confirm the necessity for surgical procedures', '2009-09-20', None),
+        ('22', 'Social WorkServices related to a systematic way of helping individuals and groups towards better adaptation to society', '2009-09-20', None),
+        ('23', 'Diagnostic DentalThe translation of data gathered by clinical and radiographic examination into an organized, classified definition of conditions present.', '2009-09-20', None),
+        ('24', 'PeriodonticsThe art and science of examination, diagnosis, and treatment of diseases affecting the periodontium; a study of the supporting structures of the teeth, normal anatomy and physiology and the deviations.', '2009-09-20', None),
+        ('25', 'RestorativeBroad term applied to any restorations to the tooth/teeth structure(s). Anterior teeth include up to five surface classifications - Mesial, Distal, Incisal, Lingual and Labial. Posterior teeth include up to five surface classifications: Mesial, Distal, Occlusal, Lingual and Buccal.', '2009-09-20', None),
+        ('26', 'EndodonticsThe branch of dentistry that is concerned with the morphology, physiology and pathology of the dental pulp and periradicular (gum) tissues.', '2009-09-20', None),
+        ('27', 'Maxillofacial ProstheticsThe branch of prosthetics is concerned with the restoration of stomatognathic and associated facial structure that have been affected by disease, injury, surgery, or congenital defect.', '2009-09-20', None),
+        ('28', 'Adjunctive Dental ServicesTypically these services involve a drug such as anesthesia or other substances that serve as a supplemental purpose in dental therapy.', '2009-09-20', None),
+        ('30', "Plan Coverage and General BenefitsPlan coverage and general benefits for the member's policy or contract.", '2009-09-20', None),
+        ('32', 'Plan Waiting Period', '2009-09-20', None),
+        ('33', 'ChiropracticManipulations and modalities provided by a healthcare provider', '2009-09-20', None),
+        ('34', 'Chiropractic Modality', '2009-09-20', '2016-07-01'),
+        ('35', 'Dental CareThe treatment of the teeth and their supporting structures.', '2009-09-20', None),
+        ('36', 'Dental CrownsAn artificial replacement for the natural crown of the tooth covering all five surfaces (Anterior teeth surface classifications - Mesial, Distal, Incisal, Lingual and Labial. Posterior teeth surface classifications: Mesial, Distal, Occlusal, Lingual and Buccal.', '2009-09-20', None),
+        ('37', 'Dental AccidentSupplies or appliances for care of teeth due to accidental injury provided by healthcare provider', '2009-09-20', None),
+        ('38', 'OrthodonticsThe area of dentistry concerned with the supervision, guidance, and correction of the growing and mature orofacial structures. This includes conditions that require movement of the teeth or correction of the malrelationships and malformations of related structures by the adjustment of relationships between and among teeth and facial bones by the application of forces or the stimulation and redirection of functional forces within the craniofacial complex.', '2009-09-20', None),
+        ('39', 'ProsthodonticsThe part of dentistry pertaining to the restoration and maintenance of oral function, comfort, appearance and health of the patient by replacement of missing teeth and contiguous tissues with artificial substitutes. It has three main branches: removable prosthodontics, fixed prosthodontics and maxillofacial prosthetics.', '2009-09-20', None),
+        ('40', 'Oral SurgeryDiagnosis and treatment of disorders of the mouth, teeth, jaws and facial structure provided by a healthcare provider', '2009-09-20', None),
+        ('41', 'Preventive DentalThe dental procedures in dental practice and health programs that prevent the occurrence of oral diseases.', '2009-09-20', None),
+        ('42', 'Home Health CareHealthcare services rendered in the home by a healthcare provider', '2009-09-20', None),
+        ('43', 'Home Health Prescriptions', '2009-09-20', None),
+        ('45', 'HospiceAn integrated set of services and supplies to provide palliative and supportive care to terminally ill patients.', '2009-09-20', None),
+        ('46', 'Respite CareServices related to temporary care of a dependent elderly, ill, or handicapped person, providing relief for their usual caregivers', '2009-09-20', None),
+        ('47', 'HospitalizationHospital Inpatient and Outpatient services and supplies for a patient who may or may not have been admitted to a hospital, for the purpose of receiving medical care or other health services.', '2009-09-20', None),
+        ('49', 'Hospital - Room and Board', '2009-09-20', None),
+        ('54', 'Long Term CareCare provided for an individual when they cannot care for themselves within the home or in a facility', '2009-09-20', None),
+        ('55', 'Major Medical', '2009-09-20', None),
+        ('56', 'Medically Related TransportationAmbulance, Ambulate or other Medical transport services', '2009-09-20', None),
+        ('60', 'Plan CoverageIndicates whether a patient has active or inactive coverage for the service date requested.', '2009-09-20', None),
+        ('61', 'In-vitro FertilizationServices to treat infertility', '2009-09-20', None),
+        ('62', 'MRI ScanDiagnostic MRI (Magnetic Resonance Imaging) services.', '2009-09-20', None),
+        ('63', 'Donor ProceduresServices related to the collection of tissues, organs, or fluids for use in the treatment for another person', '2009-09-20', None),
+        ('64', 'AcupunctureA system of alternative treatment that involves pricking the skin or tissues with needles', '2009-09-20', None),
+        ('65', 'Newborn CareManagement of the infant during the transition to extra uterine life and subsequent period of stabilization', '2009-09-20', None),
+        ('66', 'PathologyCreation of slides from tissues and its interpretation provided by a healthcare provider', '2009-09-20', None),
+        ('67', 'Smoking CessationTreatment to assist in the discontinuation of the use of nicotine', '2009-09-20', None),
+        ('68', 'Well Baby CareMedical services and physician visits which are recommended by the American Pediatric Association as appropriate and routine care for a child to a specific age limit.', '2009-09-20', None),
+        ('69', 'MaternityServices related to maternity care including related conditions resulting in childbirth when provided, or ordered and billed by a physician or nurse midwife', '2009-09-20', None),
+        ('70', 'TransplantsServices related to the transfer of living organs or tissue from one body to another.', '2009-09-20', None),
+        ('71', 'AudiologyServices related to hearing disorders, including evaluation of hearing function and rehabilitation of patients with hearing impairment', '2009-09-20', None),
+        ('72', 'Inhalation TherapyServices related to the use of inhaled agents to treat respiratory diseases and conditions', '2009-09-20', None),
+        ('73', 'Diagnostic MedicalServices required to determine the diagnose to treat a medical condition, illness, or injury', '2009-09-20', None),
+        ('74', "Private Duty NursingA nurse who is hired to provide focused care to an individual patient in a hospital, clinic, nursing home or patient's home", '2009-09-20', None),
+        ('75', 'ProstheticsA device that is used to replace a part of the body that is missing.', '2009-09-20', None),
+        ('76', 'DialysisThe process by which uric acid and urea are removed from circulating blood by means of a dialyzer', '2009-09-20', None),
+        ('77', 'OtologyServices related to diagnosis and treatment of the ear and related structures', '2009-09-20', None),
+        ('78', 'ChemotherapyThe treatment of disease by means of chemicals that have a specific toxic effect upon the disease-producing microorganisms or that selectively destroy cancerous tissue.', '2009-09-20', None),
+        ('79', 'Allergy TestingA skin or blood test to determine what substance, or allergen, may trigger an allergic response in a person', '2009-09-20', None),
+        ('80', 'ImmunizationsThe introduction of a vaccine with the goal of producing immunity', '2009-09-20', None),
+        ('81', 'Routine PhysicalA physical examination performed on asymptomatic patients for medical screening purposes.', '2009-09-20', None),
+        ('82', 'Family PlanningEducational services that assists individuals and couples to anticipate and attain their desired number of children and the spacing and timing of their births. It is achieved through use of contraceptive methods and the treatment of involuntary infertility.', '2009-09-20', None),
+        ('83', 'InfertilityServices to diagnose and/or treat infertility. Covered services may include assisted reproductive technology procedures.', '2009-09-20', None),
+        ('84', 'AbortionServices related to the elective termination of a pregnancy', '2009-09-20', None),
+        ('85', 'HIV - AIDS TreatmentServices related to diagnosis and treatment of HIV - AIDS', '2009-09-20', None),
+        ('86', 'Emergency ServicesServices provided by healthcare providers for the treatment of a sudden and unexpected medical condition or injury which requires immediate medical attention', '2009-09-20', None),
+        ('87', 'Cancer TreatmentServices related to diagnosis and treatment of cancer not performed by an Oncologist', '2009-09-20', None),
+        ('88', 'Retail/Independent PharmacyA licensed entity that dispenses prescription drugs and provides professional pharmacy services, such as clinical pharmacy consulting respective to the dispensing function. The entity may be a retail/chain or independent pharmacy or any other entity which dispenses prescription drugs.', '2009-09-20', None),
+        ('89', 'Free Standing Prescription DrugMembers have separate cost sharing for prescription drugs and medical coverage.', '2009-09-20', None),
+        ('90', 'Mail Order PharmacyA mail order pharmacy delivers medications directly to patients through the mail.', '2009-09-20', None),
+        ('91', 'Brand Name Prescription DrugThe original formulation of a prescription drug, approved by the FDA for distribution.', '2009-09-20', None),
+        ('92', 'Generic Prescription DrugGeneric drugs are copies of brand-name drugs that have exactly the same dosage, intended use, effects,\xa0side effects, route of administration, risks, safety, and strength as the original drug. In other words, their pharmacological effects are exactly the same as those of their brand-name counterparts.', '2009-09-20', None),
+        ('93', 'PodiatryProfessional services of a physician or other healthcare provider for the care or treatment of conditions of the foot.', '2009-09-20', None),
+        ('94', 'Dental and prediagnostic tests and examinationsRefer to the American Dental Association Code on Dental Procedures and Nomenclature (CDT Code).', '2019-03-01', None),
+        ('95', 'Periodontal Surgical ServicesRefer to the American Dental Association Code on Dental Procedures and Nomenclature (CDT Code).', '2019-03-01', None),
+        ('96', 'Adjustment to dentures/repairs to complete dentures, denture rebase procedures, and denture reline proceduresRefer to the American Dental Association Code on Dental Procedures and Nomenclature (CDT Code).', '2019-03-01', None),
+        ('97', 'Dental, non-surgical extractionsRefer to the American Dental Association Code on Dental Procedures and Nomenclature (CDT Code).', '2019-03-01', None),
+        ('98', 'Prescription Drug', '2019-03-01', None),
+        ('99', 'Bariatric services - Services that deal with the causes, education, prevention and treatment of obesity.', '2019-07-01', None),
+        ('A4', 'PsychiatricServices related to the diagnosis or treatment of mental health.', '2009-09-20', None),
+        ('A6', 'PsychotherapyProfessional services, including individual or group therapy by providers such as psychiatrists, psychologists, clinical social workers, or psychiatric nurses.', '2009-09-20', None),
+        ('A7', 'Psychiatric - Inpatient', '2009-09-20', None),
+        ('A8', 'Psychiatric - Outpatient', '2009-09-20', None),
+        ('A9', 'RehabilitationServices related to facilitate the process of recovery from injury, illness, or disease to as normal a condition as possible', '2009-09-20', None),
+        ('AB', 'Rehabilitation - Inpatient', '2009-09-20', None),
+        ('AC', 'Rehabilitation - Outpatient', '2009-09-20', None),
+        ('AD', 'Occupational TherapyProfessional and facility occupational therapy services performed by an occupational therapist, physician or other healthcare provider at a hospital, office or other covered facility.', '2009-09-20', None),
+        ('AE', 'Physical MedicineServices related to the diagnosis, evaluation, and management of persons of all ages with physical and/or cognitive impairment and disability.', '2009-09-20', None),
+        ('AF', 'Speech TherapyProfessional and facility speech therapy services performed by a speech therapist, physician or other healthcare provider at a hospital, office or other covered facility.', '2009-09-20', None),
+        ('AG', 'Skilled Nursing CareServices for a patient in a skilled nursing facility for the purpose of receiving medical care or other health services.', '2009-09-20', None),
+        ('AI', 'Substance AbuseServices provided at a hospital, office or other covered facility as they are related to the diagnosis and treatment of Substance Abuse.', '2009-09-20', None),
+        ('AJ', 'Alcoholism TreatmentServices related to the management of Alcohol dependencies or addiction', '2009-09-20', None),
+        ('AK', 'Drug AddictionServices related to the management of Drug dependencies or addiction, excluding Alcohol', '2009-09-20', None),
+        ('AL', 'OptometryRoutine vision services furnished by an optometrist. May include coverage for eyeglasses, contact lenses, routine eye exams, and/or vision testing for the prescribing or fitting of eyeglasses or contact lenses.', '2009-09-20', None),
+        ('AM', 'FramesThe framework for a pair of eyeglasses', '2009-09-20', None),
+        ('AO', 'LensesA piece of transparent substance having two opposite surfaces either both curved or one curved and one plane, used in an optical device in correcting defects of vision.', '2009-09-20', None),
+        ('AP', "Routine Eye ExamA series of tests to evaluate an individual's vision and check for eye diseases.", '2009-09-20', None),
+        ('AQ', 'Nonmedically Necessary Physical (These physicals are required by other entities e.g., insurance application, pilot license, employment or school)A physical examination performed on asymptomatic patients for medical screening purposes.', '2009-09-20', None),
+        ('AR', 'Experimental Drug TherapyTreatment of a physical or mental condition using non-generally accepted drugs, such as not FDA approved, Clinical Trial.', '2009-09-20', None),
+        ('B1', 'Burn CareServices related to the treatment of Burns', '2009-09-20', None),
+        ('B2', 'Brand Name Prescription Drug - FormularyLists of brand name drugs covered and published by the health plan/payer/processor/PBM to help physicians reach clinically and economically appropriate prescribing decisions for patients.', '2009-09-20', None),
+        ('B3', 'Brand Name Prescription Drug - Non-FormularyA brand name drug that is not listed on the covered and published list of the health plan/payer/processor/PBM.', '2009-09-20', None),
+        ('BA', "Independent Medical EvaluationServices when a doctor/physical therapist/chiropractor/psychologist/neuropsychologist who has not previously been involved in a person's care examines an individual. There is no doctor/therapist-patient relationship.", '2009-09-20', None),
+        ('BB', 'Psychiatric Treatment Partial Hospitalization', '2009-09-20', None),
+        ('BC', 'Day Care (Psychiatric)', '2009-09-20', None),
+        ('BD', 'Cognitive TherapyA type of psychotherapy in which negative patterns of thought, are challenged in order to alter unwanted behavior patterns or treat mood disorders.', '2009-09-20', None),
+        ('BE', 'Massage TherapyThe manipulation of muscles and other soft tissues of the body by a therapist for the treatment of health conditions such as pain, cancer, fibromyalgia, HIV/AIDS, depression.', '2009-09-20', None),
+        ('BF', 'Pulmonary RehabilitationServices and instructional guidance administered to an individual suffering from respiratory disease in an attempt to improve the quality of life for the patient.', '2009-09-20', None),
+        ('BG', 'Cardiac RehabilitationServices and instructional guidance rendered by a physician or other healthcare provider in a hospital or covered facility that are designed to help an individual recover from a cardiovascular event', '2009-09-20', None),
+        ('BH', 'PediatricTreatment or care related to infants, children, and adolescents', '2009-09-20', None),
+        ('BI', 'Nursery Room and BoardTreatment or care related to newborns', '2009-09-20', None),
+        ('BK', 'OrthopedicServices related to the correction or prevention of deformities, disorders, or injuries of the skeleton and associated structures.', '2009-09-20', None),
+        ('BL', 'CardiacServices of or relating to the heart', '2009-09-20', None),
+        ('BM', 'LymphaticServices related to a lymph, lymph node, or a lymphatic vessel', '2009-09-20', None),
+        ('BN', 'GastrointestinalServices to treat disorders of the stomach and intestines, and related systems', '2009-09-20', None),
+        ('BP', 'EndocrineServices related to the systems that secrete hormones', '2009-09-20', None),
+        ('BQ', 'NeurologyServices related to the treatment of the nerves or nervous system.', '2009-09-20', None),
+        ('BT', 'GynecologicalMedical care and management of the female reproductive system and associated disorders provided by a physician or other healthcare provider.', '2009-09-20', None),
+        ('BU', 'ObstetricalMedical care and management related to the care of a woman prior, during and after pregnancy, provided by a physician or other healthcare provider.', '2009-09-20', None),
+        ('BV', 'Obstetrical/Gynecological', '2009-09-20', None),
+        ('BW', 'Mail Order Prescription Drug: Brand Name', '2009-09-20', '2016-07-01'),
+        ('BX', 'Mail Order Prescription Drug: Generic', '2009-09-20', '2016-07-01'),
+        ('BY', 'Physician Visit - SickProfessional services rendered by a physician or other healthcare provider during a non-routine visit related to a illness.', '2009-09-20', None),
+        ('BZ', 'Physician Visit - WellProfessional services rendered by a physician or other healthcare provider during a routine or preventative care visit.', '2009-09-20', None),
+        ('C1', 'Coronary CareTreatment of diseases of the arteries of the heart', '2009-09-20', None),
+        ('CK', 'Screening X-rayX-ray services provided by a physician or other healthcare provider for the purpose of preventative care.', '2009-09-20', None),
+        ('CL', 'Screening laboratoryLaboratory services provided by a physician or other healthcare provider for the purpose of preventative care.', '2009-09-20', None),
+        ('CM', 'Mammogram, High Risk PatientMammography services for patients that have been identified with a greater than normal risk for breast cancers and related diseases.', '2009-09-20', None),
+        ('CN', 'Mammogram, Low Risk PatientMammography services for patients that have been identified with a normal risk for breast cancers and related diseases.', '2009-09-20', None),
+        ('CO', 'Flu VaccinationServices provided by a physician or other healthcare provider related to the administration of influenza virus vaccination.', '2009-09-20', None),
+        ('CP', 'Eyewear AccessoriesServices related to Eyewear and Eyewear Accessories', '2009-09-20', None),
+        ('CQ', "Case ManagementServices that assesses, plans, implements, coordinates, monitors, and evaluates the options and services required to meet the client's health and human service needs", '2009-09-20', None),
+        ('DG', 'DermatologyServices provided by a physician or other healthcare provider involving the skin and its diseases.', '2009-09-20', None),
+        ('DM', 'Durable Medical EquipmentDurable medical equipment that can withstand repeated use and is primarily and customarily used to serve a medical purpose and generally is not useful to a person in the absence of an illness or injury.', '2009-09-20', None),
+        ('DS', 'Diabetic SuppliesBlood sugar (glucose) test strips, monitors, insulin, lancet devices and lancets, glucose control solutions used to monitor and assist in the treatment of diabetes.', '2009-09-20', None),
+        ('E0', 'Applied Behavioral Analysis TherapyServices related to the assessment and treatment of learning and/or developmental disabilities to include techniques and principles to bring about meaningful and positive changes in behavior, improve attention, focus, memory, academics and/or increase language, communication and social skills.', '2009-09-20', None),
+        ('E1', "Non-Medical Equipment (non DME)Durable equipment that can withstand repeated use and serves to augment or replace impaired functionality, environmental control and facilitate a patient's independent living.", '2009-09-20', None),
+        ('E2', 'Psychiatric EmergencyEmergency services related to the diagnosis or treatment of mental disease.', '2009-09-20', None),
+        ('E3', 'Step Down UnitA hospital unit providing a level of care between intensive and routine.', '2009-09-20', None),
+        ('E4', 'Skilled Nursing Facility Head Level of CareServices directly related to care associated with severe brain injuries requiring a skilled level of care.', '2009-09-20', None),
+        ('E5', 'Skilled Nursing Facility Ventilator Level of CareServices directly related to care associated with ventilator dependent respiratory conditions requiring a skilled level of care.', '2009-09-20', None),
+        ('E6', 'Level of Care 1Skilled Care - Skilled Nursing Care in a regular hospital bed', '2009-09-20', None),
+        ('E7', 'Level of Care 2Comprehensive Care - Skilled Nursing Care Level II includes attributes of prior level plus services such as Wound Care (Stage 3), Tracheotomy Care, etc.', '2009-09-20', None),
+        ('E8', 'Level of Care 3Complex Care - Skilled Nursing Care Level III include attributes of prior levels plus services such as Ventilator Care, Specialty Beds, Peritoneal Dialysis, etc.', '2009-09-20', None),
+        ('E9', 'Level of Care 4', '2009-09-20', None),
+        ('E10', 'RadiographsAn image or picture produced on a radiation-sensitive film emulsion by exposure to ionizing radiation direct through an area, region, or substance of interest, followed by chemical processing of the film', '2010-01-24', None),
+        ('E11', 'Diagnostic ImagingThe use of radiographic, sonographic, and other technologies to create a graphic depiction of the body parts in question.', '2010-01-24', None),
+        ('E12', 'Basic Restorative - Dental', '2010-01-24', '2017-07-01'),
+        ('E13', 'Major Restorative - Dental', '2010-01-24', '2017-07-01'),
+        ('E14', 'Fixed ProsthodonticsThe branch of prosthodontics concerned with the replacement or restoration of teeth by artificial substitutes that are not readily removable such as fixed partial dentures, pontics and abutments.', '2010-01-24', None),
+        ('E15', 'Removable ProsthodonticsThe branch of prosthodontics concerned with the replacement or restoration of teeth by artificial substitutes that are readily removable such as a denture, partial denture and interim prosthesis.', '2010-01-24', None),
+        ('E16', 'Intraoral Images - Complete SeriesComplete set of images using radiographic, sonographic, and other technologies representing an image or set of images within the oral cavity.', '2010-01-24', None),
+        ('E17', "Oral EvaluationThe art and science of evaluation to make a clinical judgment or appraisal of a patient's dental health or condition.", '2010-01-24', None),
+        ('E18', 'Dental ProphylaxisA series of procedures where plaque, calculus, and stain are removed from the teeth often referred to as "prophy" or teeth cleaning.', '2010-01-24', None),
+        ('E19', 'Panoramic ImagesA tomogram of the jaws, taken with a specialized machine designed to present a panoramic view of the full circumferential length of the jaws on a single film.', '2010-01-24', None),
+        ('E20', 'SealantsA resinous material designed for application to the occlusal surfaces of posterior teeth to seal the surface irregularities and prevent the carious process.', '2010-01-24', None),
+        ('E21', 'Fluoride TreatmentsA separate process from dental prophylaxis of applying prescription strength fluoride product designed to prevent caries.', '2010-01-24', None),
+        ('E22', 'Dental ImplantsA device, usually alloplastic, that is surgically inserted into or onto the oral tissue. To be used as a prosthodontic abutment, it should remain quiescent and purely secondary to local tissue physiology.', '2010-01-24', None),
+        ('E23', 'Temporomandibular Joint DysfunctionServices related to the Impaired function of the temporomandibular articulation of the jaw.', '2010-01-24', None),
+        ('E24', 'Retail Pharmacy Prescription DrugDispenses prescription drugs and provides professional pharmacy services, such as clinical pharmacy consulting respective to the dispensing function. The entity may be a retail/chain or independent pharmacy or any other entity which dispenses prescription drugs.', '2010-06-06', '2017-11-01'),
+        ('E25', 'Long Term Care PharmacyLong term care pharmacy serve the residents of nursing homes, assisted care facilities, extended care facilities, retirement homes, or post acute care. These are considered "closed door pharmacies"', '2010-06-06', None),
+        ('E26', 'Comprehensive Medication Therapy Management ReviewA holistic review of medical care provided by pharmacists whose aim is to optimize drug therapy and improve therapeutic outcomes for patients', '2011-06-05', None),
+        ('E27', 'Targeted Medication Therapy Management ReviewA targeted medication therapy management (MTM) review is consultation with a patient about their medication therapy related to a specific diagnosis, disease state or medication', '2011-06-05', None),
+        ('E28', 'Dietary/Nutritional ServicesNutrition and diet counseling such as: weight management, eating disorders, pregnancy, pediatric, food allergy, diabetes, celiac disease', '2012-01-29', None),
+        ('E29', 'Technical Cardiac Rehabilitation Services Component', '2012-09-30', '2016-07-01'),
+        ('E30', 'Professional Cardiac Rehabilitation Services Component', '2012-09-30', '2016-07-01'),
+        ('E31', 'Professional Intensive Cardiac Rehabilitation Services Component', '2012-09-30', '2016-07-01'),
+        ('E32', 'Intensive Cardiac Rehabilitation - Technical Component', '2013-06-02', '2017-05-01'),
+        ('E33', 'Intensive Cardiac RehabilitationA group of physical activities designed to help a patient recover from a cardiovascular event', '2013-06-02', None),
+        ('E34', 'Pulmonary Rehabilitation - Technical Component', '2013-06-02', '2017-05-01'),
+        ('E35', 'Pulmonary Rehabilitation - Professional Component', '2013-06-02', '2017-05-01'),
+        ('E36', 'Convenience CareA category of walk-in clinic located in retail stores, supermarkets and pharmacies that treat uncomplicated minor illnesses', '2013-06-02', None),
+        ('E37', 'TelemedicineServices provided via telecommunication and/or information technology venues to provide clinical health services.', '2015-07-01', None),
+        ('E38', 'Pharmacist ServicesClinical services provided by a pharmacist', '2015-07-01', None),
+        ('E39', 'Diabetic EducationPatient educational program designed to bring awareness of diabetes, what it takes to treat it, and the necessary changes that should be made to improve their lifestyle.', '2016-03-01', None),
+        ('E40', 'Early InterventionServices related to treatment for babies or toddlers with developmental delays or disabilities.', '2016-11-01', None),
+        ('EA', 'Preventive ServicesPreventive services such as check-ups, patient counseling and screenings to prevent illness, disease and other health-related problems.', '2009-09-20', None),
+        ('EB', 'Specialty PharmacySpecialty pharmacies are designed to efficiently deliver medications with specialized handling, storage, and distribution requirements. Specialty pharmacies are also designed to improve clinical and economic outcomes for patients with complex, often chronic and rare conditions, with close contact and management by clinicians.', '2009-09-20', None),
+        ('EC', 'Durable Medical Equipment NewNew equipment needed for medical reasons to be used by a person that is ill or injured and is ordered by a health care provider for use in the home.', '2009-09-20', None),
+        ('ED', 'CAT ScanA multi-dimensional diagnostic image of a cross section of the body that is useful in diagnosing disease', '2009-09-20', None),
+        ('EE', 'OphthalmologyServices related to diagnosis and treatment of the eye and related structures including surgical services.', '2009-09-20', None),
+        ('EF', 'Contact LensesA thin lens placed directly on the surface of the eye. Contact Lenses are considered medical devices', '2009-09-20', None),
+        ('EG', 'Fertility Preservation', '2022-11-01', None),
+        ('EH', 'Medically Tailored Meals (MTM)Meals approved by a medical professional or healthcare plan that reflect appropriate dietary therapy for the individual', '2023-03-01', None),
+        ('EJ', 'IV TherapyIntravenous (IV) therapy is a medical technique of administering fluids directly into a vein.', '2023-03-01', None),
+        ('EO', 'Applied Behavioral Analysis Therapy', '2017-03-01', '2017-07-01'),
+        ('F1', 'Medical CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F2', 'Social Work CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F3', 'Dental CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F4', 'Hearing CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F5', 'Prescription Drug CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F6', 'Vision CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F7', 'Orthodontia CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('F8', 'Mental Health CoverageThis code will be used by the payer on the 271 response to show coverage type. This code cannot be submitted with the 270 Inquiry.', '2015-11-01', None),
+        ('GF', 'Generic Prescription Drug - FormularyLists of generic drugs covered and published by the health plan/payer/processor/PBM to help physicians reach clinically and economically appropriate prescribing decisions for patients.', '2009-09-20', None),
+        ('GN', 'Generic Prescription Drug - Non-FormularyA generic drug that is not listed on the covered and published list of the health plan/payer/processor/PBM.', '2009-09-20', None),
+        ('GY', 'AllergyServices for conditions caused by abnormal hypersensitivity of the immune system to medications, chemical or food substances, and/or environmental factors.', '2009-09-20', None),
+        ('IC', 'Intensive CareContinuous and closely monitored health care services provided in a hospital to critically ill patients.', '2009-09-20', None),
+        ('MH', 'Mental HealthMental Health services provided by a physician or other healthcare providers who are trained and educated to perform services related to mental health and may be licensed or practice within the scope or licensure or training.', '2009-09-20', None),
+        ('NI', 'Neonatal Intensive CareContinuous and closely monitored health care services provided in a hospital to critically ill newborn/neonatal patients.', '2009-09-20', None),
+        ('ON', 'OncologyServices related to diagnosis and treatment of cancer provided by an Oncology provider', '2009-09-20', None),
+        ('PE', 'Positron Emission Tomography (PET) ScanA nuclear imaging examination which reveals molecular function and activity.', '2009-09-20', None),
+        ('PT', 'Physical TherapyServices and care related to evaluation and treatment of injury or disorders', '2009-09-20', None),
+        ('PU', 'PulmonaryServices related to the diagnosis and treatment of respiratory conditions.', '2009-09-20', None),
+        ('RN', 'RenalServices related to the diagnosis and treatment of kidney conditions.', '2009-09-20', None),
+        ('RT', 'Residential Psychiatric TreatmentPsychiatry services provided at a live-in facility to a person with emotional disorders who requires continuous medication and/or supervision or relief from environmental stresses', '2009-09-20', None),
+        ('SMH', 'Serious Mental HealthServices for disorders characterized by severe deficits and pervasive impairment in multiple areas of development.', '2011-01-30', None),
+        ('TC', 'Transitional CareServices related to the coordination and continuity of heath care during a movement from one health care setting to another or to home.', '2009-09-20', None),
+        ('TN', 'Transitional Nursery CareServices related to the coordination and continuity of heath care for a newborn during a movement from one health care setting to another or to home.', '2009-09-20', None),
+        ('UC', 'Urgent CareMedical services and supplies provided by physicians or other healthcare providers for the treatment of an urgent medical condition or injury which requires medical attention.', '2009-09-20', None),
+    ],
+    'service_type_descriptor_codes': [
+        ('A', 'Preventive Service(s)', '2018-07-05', None),
+        ('B', 'Primary (Care) Provider', '2018-07-05', None),
+        ('C', 'Professional Component', '2018-07-05', None),
+        ('D', 'Specialty Provider', '2018-07-05', None),
+        ('E', 'Technical Component', '2018-07-05', None),
+        ('F', 'Telehealth(s)', '2018-07-05', None),
+        ('G', 'Intensive or Serious', '2020-04-01', None),
+        ('H', 'High Risk', '2020-04-01', None),
+        ('I', 'Rental', '2020-04-01', None),
+        ('J', 'On Hold', '2020-04-01', None),
+        ('K', 'Used', '2020-04-01', None),
+        ('L', 'Long Term Care', '2020-04-01', None),
+        ('M', 'Acute Care', '2020-04-01', None),
+    ],
+}
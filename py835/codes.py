@@ -1,8 +1,17 @@
 import csv
 import os 
+import re
+from .lazy import LazyModule
+
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
 
 BASE_DIR = os.path.dirname(__file__)
 
+# What the py835 package re-exports. The code tables (CODE_TABLE_NAMES) are loaded on first
+# use through __getattr__, and table()/describe() are used as py835.codes.table(...)
+__all__ = ['DTM01', 'REF01', 'cas_descriptions', 'ref_descriptions']
+
 def import_csv_to_dict(file_path):
     """Import a CSV file and return a dictionary."""
     data_dict = {}
@@ -89,21 +98,21 @@ cas_descriptions = {
     "CAS02": "Adjustment Reason Code",
     "CAS03": "Adjustment Amount",
     "CAS04": "Quantity",
-    "CAS05": "Reserved",
-    "CAS06": "Reserved",
-    "CAS07": "Reserved",
-    "CAS08": "Reserved",
-    "CAS09": "Reserved",
-    "CAS10": "Reserved",
-    "CAS11": "Reserved",
-    "CAS12": "Reserved",
-    "CAS13": "Reserved",
-    "CAS14": "Reserved",
-    "CAS15": "Reserved",
-    "CAS16": "Reserved",
-    "CAS17": "Reserved",
-    "CAS18": "Reserved",
-    "CAS19": "Reserved"
+    "CAS05": "Adjustment Reason Code",
+    "CAS06": "Adjustment Amount",
+    "CAS07": "Quantity",
+    "CAS08": "Adjustment Reason Code",
+    "CAS09": "Adjustment Amount",
+    "CAS10": "Quantity",
+    "CAS11": "Adjustment Reason Code",
+    "CAS12": "Adjustment Amount",
+    "CAS13": "Quantity",
+    "CAS14": "Adjustment Reason Code",
+    "CAS15": "Adjustment Amount",
+    "CAS16": "Quantity",
+    "CAS17": "Adjustment Reason Code",
+    "CAS18": "Adjustment Amount",
+    "CAS19": "Quantity"
 }
 
 ref_descriptions = {
@@ -130,7 +139,251 @@ ref_descriptions = {
 
 
 
-claim_adjustment_group_codes = import_csv_to_dict(os.path.join(BASE_DIR,'codes','claim_adjustment_group_codes.csv'))
+##########################################################################################
+# Code lists
+##########################################################################################
+# The CSV files in py835/codes are compiled into code_tables.py (see generate_code_tables),
+# which is only imported the first time one of these tables is looked up.
+CODE_TABLE_NAMES = [
+    'claim_adjustment_group_codes',
+    'claim_adjustment_reason_codes',
+    'claim_adjustment_reason_groups',
+    'claim_status_category_codes',
+    'claim_status_codes',
+    'error_reason_codes',
+    'insurance_business_process_application_error_codes',
+    'insurance_descriptor_codes',
+    'payment_type_codes',
+    'property_casualty_codes',
+    'provider_adjustment_reason_codes',
+    'remittance_advice_remark_codes',
+    'report_type_codes',
+    'service_review_decision_codes',
+    'service_type_codes',
+    'service_type_descriptor_codes'
+    ]
+
+# Short names for the code lists people usually mean
+CODE_TABLE_ALIASES = {
+    'CAGC': 'claim_adjustment_group_codes',
+    'CARC': 'claim_adjustment_reason_codes',
+    'RARC': 'remittance_advice_remark_codes',
+    'PLB': 'provider_adjustment_reason_codes'
+}
+
+# Code list of the elements whose values are codes from one of the tables above
+ELEMENT_CODE_TABLES = {
+    'CAS01': 'claim_adjustment_group_codes',
+    'CAS02': 'claim_adjustment_reason_codes',
+    'CAS05': 'claim_adjustment_reason_codes',
+    'CAS08': 'claim_adjustment_reason_codes',
+    'CAS11': 'claim_adjustment_reason_codes',
+    'CAS14': 'claim_adjustment_reason_codes',
+    'CAS17': 'claim_adjustment_reason_codes',
+    'LQ02': 'remittance_advice_remark_codes',
+    'MIA05': 'remittance_advice_remark_codes',
+    'MIA20': 'remittance_advice_remark_codes',
+    'MIA21': 'remittance_advice_remark_codes',
+    'MIA22': 'remittance_advice_remark_codes',
+    'MIA23': 'remittance_advice_remark_codes',
+    'MOA03': 'remittance_advice_remark_codes',
+    'MOA04': 'remittance_advice_remark_codes',
+    'MOA05': 'remittance_advice_remark_codes',
+    'MOA06': 'remittance_advice_remark_codes',
+    'MOA07': 'remittance_advice_remark_codes'
+}
+
+class CodeTable:
+    """
+    One code list, indexed for lookups. Single codes can be looked up like a dict; describe()
+    maps a whole column of codes in one index lookup instead of a dict.get() per row.
+    A code can have more than one entry (e.g. reused after it was stopped); each entry is
+    valid from its start date up to, not including, its stop date. Without a date the last
+    entry of a code is used, like the plain dicts.
+    """
+    def __init__(self, name, rows):
+        self.name = name
+        # Entries of the same code next to each other, oldest first
+        rows = sorted(rows, key=lambda row: (row[0], row[2] or ''))
+        codes, descriptions, starts, stops = zip(*rows) if rows else ((), (), (), ())
+        self.index = pd.Index(codes).unique()
+        positions = self.index.get_indexer_for(codes)
+        self.first = np.searchsorted(positions, np.arange(len(self.index)))
+        self.count = np.bincount(positions, minlength=len(self.index))
+        self.descriptions = np.array(descriptions, dtype=object)
+        self.starts = pd.to_datetime(pd.Series(starts, dtype=object)).to_numpy(dtype='datetime64[ns]')
+        self.stops = pd.to_datetime(pd.Series(stops, dtype=object)).to_numpy(dtype='datetime64[ns]')
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, code):
+        return code in self.index
+
+    def __getitem__(self, code):
+        description = self.get(code)
+        if description is None:
+            raise KeyError(code)
+        return description
+
+    def __repr__(self):
+        return f'CodeTable({self.name!r}, {len(self)} codes)'
+
+    def get(self, code, default=None, date=None):
+        description = self.describe([code], dates=date)[0]
+        return default if description is None else description
+
+    def entry_rows(self, values, dates=None):
+        """Entry (row of self.rows) for each value, -1 where the code is unknown or not valid on its date."""
+        positions = self.index.get_indexer(values)
+        found = positions >= 0
+        first = np.where(found, self.first[positions], -1)
+        count = np.where(found, self.count[positions], 0)
+        if dates is None:
+            return np.where(found, first + count - 1, -1)
+
+        dates = pd.to_datetime(dates, errors='coerce')
+        if np.ndim(dates) == 0:
+            dates = np.full(len(positions), np.datetime64(dates, 'ns'))
+        else:
+            dates = np.asarray(dates, dtype='datetime64[ns]')
+        # A missing date can't rule an entry out
+        no_date = np.isnat(dates)
+        rows = np.full(len(positions), -1, dtype=np.int64)
+        # Codes rarely have more than two entries, so go through them by their rank
+        for rank in range(int(count.max(initial=0))):
+            candidate = first + rank
+            has_entry = rank < count
+            candidate = np.where(has_entry, candidate, 0)
+            starts = self.starts[candidate]
+            stops = self.stops[candidate]
+            valid = has_entry & (no_date | ((np.isnat(starts) | (starts <= dates)) & (np.isnat(stops) | (dates < stops))))
+            # Later entries win over earlier ones when both are valid
+            rows = np.where(valid, candidate, rows)
+        return rows
+
+    def describe(self, values, dates=None):
+        """
+        Descriptions for a column (or list) of codes, None where a code is unknown or, when
+        dates are given, not valid on that date. dates is one date for every value (e.g. the
+        payment date of the remittance) or one date per value; dates given as text have to
+        be in a format pd.to_datetime reads, e.g. the 835's CCYYMMDD.
+        Returns a Series aligned with values when values is a Series, a numpy array otherwise.
+        """
+        index = values.index if isinstance(values, pd.Series) else None
+        if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype) and dates is None:
+            # Look up each category once
+            categories = self.describe(np.asarray(values.cat.categories, dtype=object))
+            categories = np.append(categories, None)
+            descriptions = categories[np.asarray(values.cat.codes)]
+        else:
+            values = np.asarray(values, dtype=object)
+            rows = self.entry_rows(values, dates)
+            descriptions = np.where(rows >= 0, self.descriptions[rows] if len(self.descriptions) else None, None)
+        if index is not None:
+            return pd.Series(descriptions, index=index, dtype=object)
+        return descriptions
+
+    def to_dict(self):
+        """{code: description}, the last entry of each code."""
+        return {code: description for code, description, start, stop in self.rows}
+
+    def to_frame(self):
+        frame = pd.DataFrame(self.rows, columns=['code', 'description', 'start', 'stop'])
+        frame['start'] = pd.to_datetime(frame['start'])
+        frame['stop'] = pd.to_datetime(frame['stop'])
+        return frame
+
+CODE_TABLE_CACHE = {}
+
+def table(name):
+    """
+    The CodeTable of a code list, by its name in CODE_TABLE_NAMES, an alias (CARC, RARC, ...)
+    or an element id (CAS02, LQ02, ...). Tables are loaded the first time they are used.
+    """
+    name = CODE_TABLE_ALIASES.get(name, ELEMENT_CODE_TABLES.get(name, name))
+    if name not in CODE_TABLE_NAMES:
+        raise ValueError(f'Unknown code table {name!r}. Use one of {CODE_TABLE_NAMES}, {list(CODE_TABLE_ALIASES)} or an element in {list(ELEMENT_CODE_TABLES)}.')
+    code_table = CODE_TABLE_CACHE.get(name)
+    if code_table is None:
+        code_table = CODE_TABLE_CACHE[name] = CodeTable(name, load_code_table(name))
+    return code_table
+
+def describe(values, code_table, dates=None):
+    """Descriptions for a column of codes from one code list, see CodeTable.describe."""
+    return table(code_table).describe(values, dates=dates)
+
+def describe_columns(frame, columns=None, date_column=None, suffix='_description'):
+    """
+    Add a description column next to every column of frame that holds codes from one of the
+    code lists (see ELEMENT_CODE_TABLES), e.g. CAS02 -> CAS02_description with the CARC text.
+    columns limits it to some of them; date_column names a column with the date each row's
+    codes have to be valid on, e.g. 'BPR16' for the payment date.
+    Returns a new DataFrame.
+    """
+    from .table import ELEMENT_ID
+    frame = frame.copy()
+    dates = frame[date_column] if date_column is not None else None
+    for column in list(columns if columns is not None else frame.columns):
+        match = ELEMENT_ID.match(str(column))
+        if match is None or match.group(1) not in ELEMENT_CODE_TABLES:
+            if columns is not None:
+                raise ValueError(f'Column {column!r} does not hold codes from a code list.')
+            continue
+        # LQ02 is only a remark code when LQ01 says so (HE), MIA/MOA always are
+        values = frame[column]
+        if match.group(1) == 'LQ02' and 'LQ01' in frame.columns:
+            values = values.where(frame['LQ01'] == 'HE')
+        described = table(match.group(1)).describe(values, dates=dates)
+        frame.insert(frame.columns.get_loc(column) + 1, str(column) + suffix, described)
+    return frame
+
+def load_code_table(name):
+    from .code_tables import CODE_TABLES
+    return CODE_TABLES[name]
+
+def __getattr__(name):
+    # The plain {code: description} dicts
+    if name in CODE_TABLE_NAMES:
+        from .code_tables import CODE_TABLES
+        code_table = globals()[name] = {code: description for code, description, start, stop in CODE_TABLES[name]}
+        return code_table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Validity dates the X12 code list pages append to a description, e.g.
+# 'Not paid separately when the patient is an inpatient.Start: 01/01/1997 | Last Modified: ...'
+CODE_DATE = re.compile(r'(Start|Stop|Last Modified|Activation Date|Deactivation Date): *(\d{1,2})/(\d{1,2})/(\d{4})')
 
-claim_adjustment_reason_codes = import_csv_to_dict(os.path.join(BASE_DIR,'codes','claim_adjustment_reason_codes.csv'))
+def parse_code_description(text):
+    """(description, start, stop) from the description of a code list CSV, dates as YYYY-MM-DD or None."""
+    match = CODE_DATE.search(text)
+    if match is None:
+        return text.strip(), None, None
+    dates = {}
+    for field, month, day, year in CODE_DATE.findall(text):
+        dates.setdefault(field, f'{year}-{int(month):02d}-{int(day):02d}')
+    start = dates.get('Start', dates.get('Activation Date'))
+    stop = dates.get('Stop', dates.get('Deactivation Date'))
+    return text[:match.start()].strip(), start, stop
 
+def generate_code_tables(output_file=os.path.join(BASE_DIR, 'code_tables.py')):
+    """Rebuild code_tables.py from the CSV files in py835/codes, e.g. after running their update_codes()."""
+    codes_dir = os.path.join(BASE_DIR, 'codes')
+    lines = [
+        '# Generated from the CSV files in py835/codes by codes.generate_code_tables(), do not edit.',
+        '# One (code, description, start, stop) entry per row, dates as YYYY-MM-DD or None.',
+        'CODE_TABLES = {'
+    ]
+    for file_name in sorted(os.listdir(codes_dir)):
+        if not file_name.endswith('.csv'):
+            continue
+        lines.append(f'    {file_name[:-len(".csv")]!r}: [')
+        with open(os.path.join(codes_dir, file_name), mode='r', newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                entry = (row['Code'].strip(),) + parse_code_description(row['Description'])
+                lines.append(f'        {entry!r},')
+        lines.append('    ],')
+    lines.append('}')
+    with open(output_file, 'w', encoding='utf-8') as output:
+        output.write('\n'.join(lines) + '\n')
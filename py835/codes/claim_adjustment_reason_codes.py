@@ -26,8 +26,7 @@ def update_codes():
         if len(columns) >= 2:
             code = columns[0].get_text(strip=True)
             description = columns[1].get_text(strip=True)
-            # Handle extra information like Start Date or Last Modified
-            description = description.split("Start")[0].strip()  # Remove extra date info
+            # Keep the Start/Stop dates, codes.generate_code_tables() splits them off
             codes.append(code)
             descriptions.append(description)
 
@@ -38,4 +37,4 @@ def update_codes():
     })
 
     # Save the data to a CSV file
-    df.to_csv('claim_adjustment_reaspon_codes.csv',index=False)
+    df.to_csv('claim_adjustment_reason_codes.csv',index=False)
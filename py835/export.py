@@ -0,0 +1,109 @@
+import hashlib
+import os
+
+# Tables written by write_dataset, by the name of their Parser attribute
+DATASET_TABLES = ['functional_groups', 'transaction_sets', 'claims', 'services', 'claims_cas', 'claims_refs', 'services_cas', 'services_refs']
+ID_COLUMNS = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
+STATEMENT_KEYS = ['isa_id', 'functional_group_id', 'statement_id']
+
+def table_frame(parser, table, partition_by):
+    """
+    The rows of one table of a parser, with the filename and the partition columns. Partition
+    columns the table doesn't have are taken from its statement, e.g. N102-PR for a claim.
+    """
+    # A new frame over the cached values, which are only read, so the filename column added
+    # here doesn't end up in the cache
+    frame = getattr(parser, table + '_table')(copy=False).copy(deep=False)
+    frame['filename'] = os.path.basename(parser.file_path)
+    missing = [column for column in partition_by if column not in frame.columns]
+    if missing and not frame.empty and all(key in frame.columns for key in STATEMENT_KEYS):
+        statements = parser.transaction_sets_table(copy=False)
+        statements = statements.reindex(columns=STATEMENT_KEYS + missing)
+        frame = frame.merge(statements, on=STATEMENT_KEYS, how='left')
+    return frame
+
+def source_key(parser):
+    """
+    The prefix of the files written for one source file: its name, then a short hash of its
+    full path and interchange control number (ISA13), so files with the same name in
+    different folders don't write over each other.
+    """
+    stem = os.path.splitext(os.path.basename(parser.file_path))[0].replace('{', '').replace('}', '')
+    control_number = (parser.isa or {}).get('ISA13') or ''
+    digest = hashlib.blake2b(repr((os.path.abspath(parser.file_path), control_number)).encode(), digest_size=6).hexdigest()
+    return f'{stem}-{digest}-'
+
+def remove_source_files(table_dir, prefix, format):
+    """Remove the files an earlier export of a source wrote under table_dir, in any partition, and the directories left empty."""
+    if not os.path.isdir(table_dir):
+        return
+    for directory, _, file_names in os.walk(table_dir, topdown=False):
+        for file_name in file_names:
+            if file_name.startswith(prefix) and file_name.endswith('.' + format):
+                os.remove(os.path.join(directory, file_name))
+        if directory != table_dir and not os.listdir(directory):
+            os.rmdir(directory)
+
+def table_schema(columns, ids):
+    import pyarrow as pa
+
+    # Every element is written as a string so a column has the same type in every file, even
+    # when it is empty in some of them; only the ids are numbers, and only for int/hash ids.
+    id_type = pa.int64() if ids in ('int', 'hash') else pa.string()
+    return pa.schema([
+        pa.field(column, id_type if column in ID_COLUMNS else pa.string())
+        for column in columns
+    ])
+
+def write_dataset(parsers, base_dir, partition_by=None, tables=None, format='parquet'):
+    """
+    Write the tables of one or more parsers as an Arrow dataset under base_dir, one directory
+    per table (base_dir/claims, base_dir/services, ...), hive partitioned by the columns in
+    partition_by, e.g. ['N102-PR', 'DTM02-405']. Files are named after the source file (see
+    source_key), and exporting the same file again first removes what it wrote before, in
+    every partition. Within one call every file of a table has the same columns and types;
+    separate calls only write the columns their files have, so read the dataset with a
+    unified schema (pyarrow.unify_schemas). Needs pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError('write_dataset needs pyarrow: pip install pyarrow')
+
+    partition_by = list(partition_by or [])
+    tables = list(tables or DATASET_TABLES)
+    for table in tables:
+        if table not in DATASET_TABLES:
+            raise ValueError(f'Unknown table {table!r}. Use one of {DATASET_TABLES}.')
+    if not parsers:
+        return
+
+    for table in tables:
+        frames = [table_frame(parser, table, partition_by) for parser in parsers]
+        # Union of the columns of every file, in the order they first appear
+        columns = []
+        for frame in frames:
+            columns.extend(column for column in frame.columns if column not in columns)
+        if not columns:
+            continue
+        # Tables above the statements (functional_groups) are only partitioned by the columns they have
+        partitioning = [column for column in partition_by if column in columns]
+        schema = table_schema(columns, parsers[0].ids)
+        table_dir = os.path.join(base_dir, table)
+        for parser, frame in zip(parsers, frames):
+            prefix = source_key(parser)
+            # Its partition values may have changed since, so old files aren't simply overwritten
+            remove_source_files(table_dir, prefix, format)
+            if frame.empty:
+                continue
+            frame = frame.reindex(columns=columns)
+            ds.write_dataset(
+                pa.Table.from_pandas(frame, schema=schema, preserve_index=False),
+                table_dir,
+                format=format,
+                partitioning=partitioning or None,
+                partitioning_flavor='hive' if partitioning else None,
+                basename_template=prefix + '{i}.' + format,
+                existing_data_behavior='overwrite_or_ignore'
+            )
@@ -0,0 +1,368 @@
+from . import codes
+from .segments import ELEMENTS, QUALIFIED_ELEMENTS
+
+# What Parser.iter_records does with each segment, keyed by segment id, or by
+# (segment id, qualifier) for segments handled differently depending on their first element
+# (REF01, DTM01, ...). A qualified handler replaces the segment's plain handler for that
+# qualifier; segments without a handler are skipped. Every segment costs one dict lookup
+# (two for qualified segments), however many handlers there are.
+#
+# A handler is called as handler(state, segment_data, schema) with the RecordState of the
+# walk. It adds to the rows being built in state, and hands out finished rows with
+# state.emit(table, row) or, for rows that belong to the current claim, with
+# state.claim_rows(table).append(row). Rows of tables Parser doesn't know end up in
+# parser.extra_tables. Register handlers for every Parser with segment_handler, or for one
+# parser with Parser(..., handlers={'PLB': handler}).
+SEGMENT_HANDLERS = {}
+
+# Segments the built-in handlers make a new id for. A parse split over worker processes
+# (Parser(..., workers=4)) counts them to know which ids each part of the file starts at.
+ID_SEGMENTS = ('ISA', 'GS', 'ST', 'CLP', 'SVC')
+
+# Segments whose handlers open and close the levels of the hierarchy. A parse that only
+# includes some segments (Parser(..., include={'CLP', 'CAS'})) still walks these, without
+# their elements, so every row gets the right ids.
+LOOP_SEGMENTS = ('ISA', 'GS', 'ST', 'CLP', 'SVC', 'SE', 'GE')
+
+def segment_handler(seg_id, *qualifiers, handlers=SEGMENT_HANDLERS):
+    """
+    Decorator registering a handler for a segment, or only for some of its qualifiers, e.g.
+    @segment_handler('DTM', '232', '233'). Replaces the handler registered before it, if any.
+    """
+    def register(handler):
+        if qualifiers:
+            for qualifier in qualifiers:
+                handlers[(seg_id, qualifier)] = handler
+        else:
+            handlers[seg_id] = handler
+        return handler
+    return register
+
+def qualified_handler(seg_id, by_qualifier, default):
+    # The qualifier is always the segment's first element
+    qualifier_id = seg_id + '01'
+
+    def handler(state, segment_data, schema):
+        handler = by_qualifier.get(segment_data.get(qualifier_id), default)
+        if handler is not None:
+            handler(state, segment_data, schema)
+    return handler
+
+def dispatch_table(handlers):
+    """{seg_id: handler} for the walk, with the qualified handlers folded into one handler per segment."""
+    dispatch = {}
+    qualified = {}
+    for key, handler in handlers.items():
+        if isinstance(key, tuple):
+            seg_id, qualifier = key
+            qualified.setdefault(seg_id, {})[qualifier] = handler
+        else:
+            dispatch[key] = handler
+    for seg_id, by_qualifier in qualified.items():
+        dispatch[seg_id] = qualified_handler(seg_id, by_qualifier, dispatch.get(seg_id))
+    return dispatch
+
+# Fields a where= condition can name: an element id, with its qualifier or level when the
+# column has one (CLP02, N104-PR, DTM02-232, AMT02-Claim)
+WHERE_ELEMENT_IDS = frozenset(
+    child.id for children in (*ELEMENTS.values(), *QUALIFIED_ELEMENTS.values()) for child in children
+)
+
+def field_segment(field):
+    """The segment id of a where= field, e.g. N104-PR -> N1."""
+    element_id = str(field).split('-', 1)[0]
+    if element_id not in WHERE_ELEMENT_IDS:
+        raise ValueError(f"Unknown where field {field!r}. Use an element id such as 'CLP02' or 'N104-PR', or pass a callable.")
+    return element_id[:-2]
+
+def claim_filter(where):
+    """
+    keep(record, statement) for Parser(..., where=...), or None to keep every claim. where is
+    either a callable taking the claim record (as yielded by Parser.iter_claims) and returning
+    whether to keep it, or a dict of conditions {field: value or collection of values} that
+    must all hold, e.g. {'CLP02': ['4', '22']}. A field is looked up on the claim row, or on
+    its statement row for fields the claim doesn't have (e.g. the payer id, N104-PR). Fields
+    that aren't element ids (see field_segment) raise ValueError rather than dropping every
+    claim.
+    """
+    if where is None:
+        return None
+    if callable(where):
+        return lambda record, statement: where(record)
+    if not isinstance(where, dict):
+        raise ValueError(f'where takes a callable or a dict of field conditions, not {where!r}.')
+    conditions = []
+    for field, values in where.items():
+        field_segment(field)
+        if values is None or isinstance(values, (str, int, float)):
+            values = [values]
+        # Element values are text: compare 4 and '4' alike. None matches a missing element.
+        conditions.append((field, frozenset(None if value is None else str(value) for value in values)))
+
+    def keep(record, statement):
+        claim = record['claim']
+        for field, values in conditions:
+            value = claim[field] if field in claim else statement.get(field)
+            if value not in values:
+                return False
+        return True
+    return keep
+
+class RecordState:
+    """
+    Where the walk over the segments is: the ids and rows of the interchange, functional
+    group, statement, claim and service currently open, and the column names seen so far.
+    """
+    __slots__ = (
+        'new_id', 'output', 'isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id',
+        'current_functional_group', 'statement_base', 'current_statement', 'claim_base', 'current_claim',
+        'current_record', 'service_base', 'current_service', 'colnames', 'ref_colnames', 'cas_colnames',
+        'claim_filter'
+    )
+
+    def __init__(self, new_id, claim_filter=None):
+        self.new_id = new_id
+        # keep(record, statement) deciding which claims are handed out, see claim_filter()
+        self.claim_filter = claim_filter
+        # (table, row) pairs handed out by the handler of the current segment
+        self.output = []
+        self.isa_id = None
+        self.functional_group_id = None
+        self.statement_id = None
+        self.claim_id = None
+        self.service_id = None
+        self.current_functional_group = None
+        self.statement_base = None
+        self.current_statement = None
+        self.claim_base = None
+        self.current_claim = None
+        self.current_record = None
+        self.service_base = None
+        self.current_service = None
+        self.colnames = {}
+        self.ref_colnames = {}
+        self.cas_colnames = {}
+
+    def emit(self, table, row):
+        """Hand a finished row of a table to the parser."""
+        self.output.append((table, row))
+
+    def claim_rows(self, table):
+        """The list of rows of a table that is handed out along with the current claim."""
+        return self.current_record.setdefault(table, [])
+
+    def close_service(self):
+        if self.current_service:
+            self.current_record['services'].append(self.current_service)
+        self.current_service = None
+
+    def close_claim(self):
+        """Hand out the current claim, including its last service, unless the claim filter drops it."""
+        if self.current_claim is not None:
+            self.close_service()
+            if self.claim_filter is None or self.claim_filter(self.current_record, self.current_statement):
+                self.emit('claims', self.current_record)
+        self.current_claim = None
+        self.current_record = None
+
+##### Header
+@segment_handler('ISA')
+def interchange_header(state, segment_data, schema):
+    state.isa_id = state.new_id(None, segment_data)
+    isa_data = {'isa_id': state.isa_id}
+    isa_data.update(segment_data)
+    state.emit('isa', isa_data)
+    state.colnames.update(schema.labels())
+
+########## Start Functional Group
+@segment_handler('GS')
+def functional_group_header(state, segment_data, schema):
+    state.functional_group_id = state.new_id(state.isa_id, segment_data)
+    state.current_functional_group = {'isa_id': state.isa_id, 'functional_group_id': state.functional_group_id}
+    state.current_functional_group.update(segment_data)
+    state.colnames.update(schema.labels())
+
+#################### Start of a Transaction Set
+@segment_handler('ST')
+def transaction_set_header(state, segment_data, schema):
+    state.statement_id = state.new_id(state.functional_group_id, segment_data)
+    state.statement_base = {'isa_id': state.isa_id, 'functional_group_id': state.functional_group_id, 'statement_id': state.statement_id}
+    state.current_statement = state.statement_base.copy()
+    state.current_statement.update(segment_data)
+    state.colnames.update(schema.labels())
+
+@segment_handler('BPR')
+@segment_handler('TRN')
+@segment_handler('LX')
+def statement_segment(state, segment_data, schema):
+    state.current_statement.update(segment_data)
+    state.colnames.update(schema.labels())
+
+@segment_handler('N1')
+def statement_party(state, segment_data, schema):
+    state.current_statement.update(
+        dict(zip(schema.keys('-' + segment_data['N101']), segment_data.values()))
+    )
+    state.colnames.update(schema.labels('-' + segment_data['N101']))
+
+@segment_handler('REF', 'EV', 'F2')
+def statement_reference(state, segment_data, schema):
+    statement_ref = state.statement_base.copy()
+    statement_ref.update(segment_data)
+    state.emit('transaction_refs', statement_ref)
+    state.ref_colnames[segment_data['REF01']] = schema.labels()
+
+@segment_handler('REF')
+def reference(state, segment_data, schema):
+    # A REF belongs to the service, claim or statement it comes after
+    if state.current_service is not None:
+        service_ref = state.service_base.copy()
+        service_ref.update(segment_data)
+        state.current_record['services_refs'].append(service_ref)
+    elif state.current_claim is not None:
+        claim_ref = state.claim_base.copy()
+        claim_ref.update(segment_data)
+        state.current_record['claims_refs'].append(claim_ref)
+    else:
+        statement_ref = state.statement_base.copy()
+        statement_ref.update(segment_data)
+        state.emit('transaction_refs', statement_ref)
+    state.ref_colnames[segment_data['REF01']] = schema.labels()
+
+@segment_handler('REF', '2U', 'TJ')
+def payer_payee_reference(state, segment_data, schema):
+    # Payer and payee ids are kept on the statement as well as in the references
+    state.current_statement.update(segment_data)
+    reference(state, segment_data, schema)
+
+@segment_handler('DTM', '405')
+def statement_date(state, segment_data, schema):
+    dated(state.current_statement, state, segment_data, schema)
+
+@segment_handler('DTM', '232', '233', '050')
+def claim_date(state, segment_data, schema):
+    dated(state.current_claim, state, segment_data, schema)
+
+@segment_handler('DTM', '472')
+def service_date(state, segment_data, schema):
+    dated(state.current_service, state, segment_data, schema)
+
+def dated(row, state, segment_data, schema):
+    row.update(
+        dict(zip(schema.keys('-' + segment_data['DTM01']), segment_data.values()))
+    )
+    state.colnames.update(schema.labels('-' + segment_data['DTM01'], codes.DTM01.get(segment_data['DTM01'])))
+
+######################################## Start of a new claim
+@segment_handler('CLP')
+def claim_header(state, segment_data, schema):
+    # Close the previous claim, including its last service
+    state.close_claim()
+    state.claim_id = state.new_id(state.statement_id, segment_data)
+    state.claim_base = {
+        'isa_id': state.isa_id, 'functional_group_id': state.functional_group_id,
+        'statement_id': state.statement_id, 'claim_id': state.claim_id
+    }
+    state.current_claim = state.claim_base.copy()
+    state.current_claim.update(segment_data)
+    state.current_record = {
+        'claim': state.current_claim,
+        'claims_cas': [],
+        'claims_refs': [],
+        'services': [],
+        'services_cas': [],
+        'services_refs': []
+    }
+    state.colnames.update(schema.labels())
+
+@segment_handler('NM1')
+def claim_party(state, segment_data, schema):
+    state.current_claim.update(
+        dict(zip(schema.keys('-' + segment_data['NM101']), segment_data.values()))
+    )
+    state.colnames.update(schema.labels('-' + segment_data['NM101']))
+
+@segment_handler('CAS')
+def adjustment(state, segment_data, schema):
+    if state.current_service is None:
+        # This is a claim-level CAS
+        claim_cas = state.claim_base.copy()
+        claim_cas.update(segment_data)
+        state.current_record['claims_cas'].append(claim_cas)
+    else:
+        service_cas = state.service_base.copy()
+        service_cas.update(segment_data)
+        state.current_record['services_cas'].append(service_cas)
+    state.cas_colnames[segment_data['CAS01']] = schema.labels()
+
+@segment_handler('AMT')
+def amount(state, segment_data, schema):
+    level = '-Claim' if state.current_service is None else '-Service'
+    row = state.current_claim if state.current_service is None else state.current_service
+    row.update(dict(zip(schema.keys(level), segment_data.values())))
+    state.colnames.update(schema.labels(level))
+
+################################################################################ Start a new service
+@segment_handler('SVC')
+def service_header(state, segment_data, schema):
+    state.close_service()
+    state.service_id = state.new_id(state.claim_id, segment_data)
+    state.service_base = {
+        'isa_id': state.isa_id, 'functional_group_id': state.functional_group_id,
+        'statement_id': state.statement_id, 'claim_id': state.claim_id, 'service_id': state.service_id
+    }
+    state.current_service = state.service_base.copy()
+    state.current_service.update(segment_data)
+    state.colnames.update(schema.labels())
+
+######################################## End of Transaction Set
+@segment_handler('SE')
+def transaction_set_trailer(state, segment_data, schema):
+    state.close_claim()
+    if state.current_statement:
+        state.emit('transaction_sets', state.current_statement)
+    state.colnames.update(schema.labels())
+    state.current_statement = None
+
+########## End Functional Group
+@segment_handler('GE')
+def functional_group_trailer(state, segment_data, schema):
+    state.current_functional_group.update(segment_data)
+    state.emit('functional_groups', state.current_functional_group)
+    state.current_functional_group = None
+    state.colnames.update(schema.labels())
+
+##########################################################################################
+# Extra handlers, not registered by default: Parser(..., handlers=EXTRA_HANDLERS)
+##########################################################################################
+def provider_adjustment(state, segment_data, schema):
+    # PLB: adjustments to the whole payment, one row per segment in extra_tables['provider_adjustments']
+    row = state.statement_base.copy()
+    row.update(segment_data)
+    state.emit('provider_adjustments', row)
+    state.colnames.update(schema.labels())
+
+def claim_adjudication(state, segment_data, schema):
+    # MIA/MOA: inpatient/outpatient adjudication, at most one per claim, kept on the claim row
+    state.current_claim.update(segment_data)
+    state.colnames.update(schema.labels())
+
+def remark(state, segment_data, schema):
+    # LQ: remark codes, in extra_tables['services_remarks']; the 835 only has them in the service
+    # loop, but one that comes before the claim's first service goes to extra_tables['claims_remarks']
+    if state.current_service is None:
+        row = state.claim_base.copy()
+        table = 'claims_remarks'
+    else:
+        row = state.service_base.copy()
+        table = 'services_remarks'
+    row.update(segment_data)
+    state.claim_rows(table).append(row)
+    state.colnames.update(schema.labels())
+
+EXTRA_HANDLERS = {
+    'PLB': provider_adjustment,
+    'MIA': claim_adjudication,
+    'MOA': claim_adjudication,
+    'LQ': remark
+}
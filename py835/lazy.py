@@ -0,0 +1,27 @@
+import importlib
+
+class LazyModule:
+    """
+    Stands in for a module and imports it the first time one of its attributes is used, so
+    `import py835` doesn't pay for pandas, numpy or pyx12 until a DataFrame or the pyx12
+    engine is actually needed. submodules are imported along with it, e.g. pyx12.params.
+    """
+    def __init__(self, name, submodules=()):
+        self._name = name
+        self._submodules = submodules
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            for submodule in self._submodules:
+                importlib.import_module(self._name + '.' + submodule)
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        # Only called for attributes not set in __init__, i.e. those of the module itself
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f'<lazy module {self._name!r} ({state})>'
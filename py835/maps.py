@@ -0,0 +1,97 @@
+"""
+A process-wide cache of the pyx12 maps, so each Parser doesn't load them again.
+
+pyx12's X12ContextReader loads two XML maps for every file it reads: the control map for
+the ISA/GS envelope, and the 835 map once it reaches the GS segment. Building them is most of
+the time spent on a small file. The maps aren't changed while a file is walked (the walker
+keeps its own counts), so they are loaded once per process and shared by every reader.
+"""
+import threading
+from .lazy import LazyModule
+
+# Imported on first use, see lazy.py
+pyx12 = LazyModule('pyx12', ['error_handler', 'x12context', 'params', 'map_if', 'map_index'])
+
+# The maps warm_up loads: the 5010 control map and the 835 map it points to
+CONTROL_MAP = 'x12.control.00501.xml'
+REMITTANCE_VERSION = ('00501', '005010X221A1', 'HP')
+
+MAP_CACHE = {}
+MAP_INDEX_CACHE = {}
+PARAMS = None
+LOCK = threading.Lock()
+
+def params():
+    """The pyx12 params shared by every reader in this process."""
+    global PARAMS
+    if PARAMS is None:
+        PARAMS = pyx12.params.params()
+    return PARAMS
+
+def load_map_file(map_file, param, map_path=None):
+    """pyx12.map_if.load_map_file, loading each map once per process."""
+    # The settings the map is built with are part of the key
+    key = (map_file, map_path, param.get('exclude_external_codes'), param.get('charset'))
+    cached = MAP_CACHE.get(key)
+    if cached is None:
+        with LOCK:
+            # Another thread may have loaded it while this one waited
+            cached = MAP_CACHE.get(key)
+            if cached is None:
+                cached = pyx12.map_if.load_map_file(map_file, param, map_path)
+                MAP_CACHE[key] = cached
+    return cached
+
+def load_map_index(map_path=None):
+    """pyx12.map_index.map_index (the list of maps in maps.xml), read once per process."""
+    cached = MAP_INDEX_CACHE.get(map_path)
+    if cached is None:
+        with LOCK:
+            cached = MAP_INDEX_CACHE.get(map_path)
+            if cached is None:
+                cached = pyx12.map_index.map_index(map_path)
+                MAP_INDEX_CACHE[map_path] = cached
+    return cached
+
+class CachedModule:
+    """Stands in for a pyx12 module in x12context, with one of its functions replaced."""
+    def __init__(self, module, **replaced):
+        self._module = module
+        self.__dict__.update(replaced)
+
+    def __getattr__(self, attr):
+        return getattr(self._module, attr)
+
+def install():
+    """
+    Have X12ContextReader load its maps through the cache. Only the module names x12context
+    uses are replaced, pyx12.map_if itself is left alone for other users of pyx12.
+    """
+    x12context = pyx12.x12context
+    if not isinstance(x12context.map_if, CachedModule):
+        with LOCK:
+            if not isinstance(x12context.map_if, CachedModule):
+                x12context.map_index = CachedModule(x12context.map_index, map_index=load_map_index)
+                x12context.map_if = CachedModule(x12context.map_if, load_map_file=load_map_file)
+
+def context_reader(edi_file_stream):
+    """An X12ContextReader over a stream, using the cached params and maps."""
+    install()
+    errh = pyx12.error_handler.errh_null()
+    return pyx12.x12context.X12ContextReader(params(), errh, edi_file_stream)
+
+def warm_up():
+    """
+    Load the 835 maps ahead of the first file, e.g. as the initializer of a process pool:
+    ProcessPoolExecutor(initializer=py835.maps.warm_up).
+    """
+    install()
+    param = params()
+    load_map_file(CONTROL_MAP, param)
+    load_map_file(load_map_index().get_filename(*REMITTANCE_VERSION), param)
+
+def clear():
+    """Drop the cached maps, e.g. after changing params()."""
+    with LOCK:
+        MAP_CACHE.clear()
+        MAP_INDEX_CACHE.clear()
@@ -1,15 +1,30 @@
-import pyx12
-import pyx12.error_handler
-import pyx12.x12context
-import pyx12.params
-import pandas as pd
 from io import StringIO
 import os
-import json  # Add this for final JSON conversion
 from . import codes
+from . import export
+from . import maps
+from . import tokenizer
+from .handlers import ID_SEGMENTS, LOOP_SEGMENTS, SEGMENT_HANDLERS, RecordState, claim_filter, dispatch_table, field_segment
+from .lazy import LazyModule
+from .segments import SegmentSchema
+from .stats import ParseStats
+from .table import ColumnTable, join_levels, row_positions, to_frame, typed_frame
 import re 
 import secrets
 import string 
+import contextlib
+import functools
+import inspect
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import itertools
+import pickle
+import time
+
+# Imported on first use, see lazy.py
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
 
 BASE_DIR = os.path.dirname(__file__)
 
@@ -29,345 +44,657 @@ def generate_custom_string():
     random_string = '-'.join(segments)
     
     return random_string
+
+# 'random' makes random strings (see generate_custom_string).
+# 'int' counts up from an offset; ParserBatch gives every file its own range.
+# 'hash' hashes the segment, its parent id and its position, so reparsing a file gives the same ids.
+ID_TYPES = ['random', 'int', 'hash']
+
+def id_generator(ids='random', offset=0):
+    """Returns new_id(parent_id, segment_data) used for the isa/functional group/statement/claim/service ids."""
+    if ids not in ID_TYPES:
+        raise ValueError(f"Unknown ids {ids!r}. Expected one of {ID_TYPES}.")
+    if ids == 'random':
+        return lambda parent_id, segment_data: generate_custom_string()
+    counter = itertools.count(offset)
+    if ids == 'int':
+        return lambda parent_id, segment_data: next(counter)
+
+    def new_hash_id(parent_id, segment_data):
+        # The position keeps identical segments in one file apart; the parent keeps the same claim in different files apart
+        content = repr((parent_id, next(counter), tuple(segment_data.values()))).encode()
+        return int.from_bytes(hashlib.blake2b(content, digest_size=8).digest(), 'big', signed=True)
+    return new_hash_id
+
+class IdCounter:
+    """new_id for a walk over part of a file, counting the ids it hands out."""
+    __slots__ = ('new_id', 'issued')
+
+    def __init__(self, ids='random', offset=0):
+        self.new_id = id_generator(ids, offset)
+        self.issued = 0
+
+    def __call__(self, parent_id, segment_data):
+        self.issued += 1
+        return self.new_id(parent_id, segment_data)
+
+def cached_view(method):
+    """
+    Build a table view on first use and keep it in the Parser's cache, one per combination of
+    arguments (colnames, flatten, typed). Callers get a copy, as they got a new frame on every
+    call before, so editing it in place doesn't change the cached view. copy=False returns the
+    cached frame itself, without copying, for callers that only read it.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, copy=True, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (method.__name__,) + tuple(arguments.arguments.values())[1:]
+        cached = self.table_cache.get(key)
+        if cached is None:
+            started = time.perf_counter()
+            # Copied once here, which also merges its blocks, so the copies of later calls
+            # don't have to merge them again every time
+            frame = method(self, *args, **kwargs).copy()
+            if self.stats is not None:
+                self.stats.view_seconds[method.__name__] += time.perf_counter() - started
+            self.cache_view(key, frame)
+        else:
+            frame = cached[0]
+            self.table_cache.move_to_end(key)
+        # Deep: without copy-on-write a shallow copy shares its values with the cache
+        return frame.copy() if copy else frame
+    return wrapper
+
+ID_COLUMNS = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
+# A CAS segment holds up to six (reason, amount, quantity) triplets after the group code
+CAS_TRIPLETS = [('CAS%02d' % i, 'CAS%02d' % (i + 1), 'CAS%02d' % (i + 2)) for i in range(2, 20, 3)]
+
+# Lists of rows in the claim records of iter_records
+CLAIM_RECORD_KEYS = {'claim', 'claims_cas', 'claims_refs', 'services', 'services_cas', 'services_refs'}
+# The tables of the claim records, as iter_tables yields them
+CHUNK_TABLES = ['claims', 'services', 'claims_cas', 'services_cas', 'claims_refs', 'services_refs']
+
+# The tables parse() fills, besides isa and the tables of extra handlers
+PARSED_TABLES = ['functional_groups', 'transaction_sets', 'transaction_refs', 'claims', 'claims_refs', 'claims_cas', 'services', 'services_refs', 'services_cas']
+
+# Smallest run of transaction sets worth sending to a worker, in characters
+MIN_PART_SIZE = 1 << 20
+
+class ParsedTables:
+    """The tables of a parse, filled from the records of iter_records in file order."""
+    def __init__(self):
+        self.isa = None
+        # Rows are stored column by column so the tables don't pay for a dict per row
+        for name in PARSED_TABLES:
+            setattr(self, name, ColumnTable())
+        # Rows of the tables of extra segment handlers, e.g. 'provider_adjustments'
+        self.extra_tables = {}
+        # Row position of the parent of every service, so transactions() can line the tables up
+        # without merging on the id columns (see Parser.set_tables for the other levels)
+        self.service_parents = []
+
+    def add(self, table, record, stats=None):
+        if table == 'isa':
+            self.isa = record
+        elif table == 'functional_groups':
+            self.functional_groups.append(record)
+        elif table == 'transaction_sets':
+            self.transaction_sets.append(record)
+        elif table == 'transaction_refs':
+            self.transaction_refs.append(record)
+        elif table == 'claims':
+            self.claims.append(record['claim'])
+            self.claims_refs.extend(record['claims_refs'])
+            self.claims_cas.extend(record['claims_cas'])
+            self.service_parents.extend([len(self.claims) - 1] * len(record['services']))
+            self.services.extend(record['services'])
+            self.services_refs.extend(record['services_refs'])
+            self.services_cas.extend(record['services_cas'])
+            if len(record) > len(CLAIM_RECORD_KEYS):
+                for key, rows in record.items():
+                    if key not in CLAIM_RECORD_KEYS:
+                        self.extra_tables.setdefault(key, ColumnTable()).extend(rows)
+            if stats is not None:
+                stats.count_record(record)
+        else:
+            self.extra_tables.setdefault(table, ColumnTable()).append(record)
+
+    def concat(self, other):
+        """Append the tables of a later part of the same file."""
+        if other.isa is not None:
+            self.isa = other.isa
+        claims = len(self.claims)
+        for name in PARSED_TABLES:
+            getattr(self, name).concat(getattr(other, name))
+        for name, table in other.extra_tables.items():
+            self.extra_tables.setdefault(name, ColumnTable()).concat(table)
+        self.service_parents.extend(position + claims for position in other.service_parents)
+
+def parse_transaction_sets(parser, content, parents, id_offset):
+    """
+    Parse a run of transaction sets in a worker process, see Parser.parse_parallel. content
+    is the run inside its ISA/GS envelope and parents the (isa_id, functional_group_id) the
+    main process gave that envelope. Returns the ParsedTables, the column names, the number
+    of ids handed out and the ParseStats (or None) of the part.
+    """
+    parser.file_content = content
+    parser.id_offset = id_offset
+    # The envelope around the run was handled by the main process
+    segments = (segment for segment in parser.iter_segments() if segment[0] not in tokenizer.ENVELOPE_SEGMENTS)
+    tables = parser.read_tables(segments, parents)
+    return tables, (parser.colnames, parser.ref_colnames, parser.cas_colnames), parser.ids_used, parser.stats
+
+def cancel_parts(results):
+    """Cancel the parts of parse_parallel that haven't started yet."""
+    for result in results:
+        if not isinstance(result, list):
+            result[0].cancel()
+
+# 'pyx12' validates every segment against the X12 map (strict, slow).
+# 'fast' tokenizes the file itself using the delimiters in the ISA segment.
+ENGINES = ['pyx12', 'fast']
+
 class Parser:
-    def __init__(self, file_path):
+    def __init__(self, file_path, engine='pyx12', parse=True, ids='random', id_offset=0, keep_raw=True, cache_budget=None, stats=False, handlers=None, workers=None, include=None, where=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}. Expected one of {ENGINES}.")
+        if ids not in ID_TYPES:
+            raise ValueError(f"Unknown ids {ids!r}. Expected one of {ID_TYPES}.")
+        if isinstance(include, str):
+            raise ValueError(f"include takes a collection of segment ids, e.g. {{'CLP', 'CAS'}}, not {include!r}.")
         self.file_path = file_path
-        self.file_content = self.load_file_content()
-        self.load_context()
+        self.engine = engine
+        self.ids = ids
+        # Only integer ids are shifted: hash ids count from the start of the file, so the same
+        # file gets the same ids wherever it sits in a batch
+        self.id_offset = id_offset if ids == 'int' else 0
+        self.file_content = None
+        # Bytes of DataFrames the table views may keep cached (None for no limit, 0 to not cache)
+        self.cache_budget = cache_budget
+        self.table_cache = OrderedDict()
+        # stats=True keeps counts and timings of the parse and the table views in self.stats
+        self.stats = ParseStats() if stats else None
+        # Segment handlers added to or replacing the registered ones, see handlers.py
+        self.handlers = handlers
+        # workers > 1 parses the transaction sets (ST to SE) of the file in that many processes.
+        # The whole text is read in to split it, even with keep_raw=False (see parse_parallel)
+        self.workers = workers
+        # include={'CLP', 'CAS'} only keeps those segments; the loop segments (see handlers.py)
+        # are still walked, without their elements, to keep the ids of every row right
+        self.include = None if include is None else frozenset(include)
+        # where={'CLP02': '4'} or a callable on the claim record: other claims are dropped as
+        # they close, with their services, adjustments and references (see handlers.claim_filter)
+        self.where = where
+        # Check it up front rather than at the first claim
+        claim_filter(where)
+        if self.include is not None and isinstance(where, dict):
+            # A field left out by include would be missing from every claim
+            left_out = sorted(field for field in where if field_segment(field) not in self.include)
+            if left_out:
+                raise ValueError(f'include leaves out the segments of the where fields {left_out}.')
+        # parse=False leaves the file unread, for the streaming iterators
+        if not parse:
+            return
+        # keep_raw=False never holds the whole text: the file is parsed straight from disk
+        if keep_raw:
+            self.file_content = self.load_file_content()
         self.parse()
 
+    def __getstate__(self):
+        # The pyx12 reader holds the open input stream and map; it isn't needed after parsing
+        # and keeps Parser from being sent between processes.
+        state = self.__dict__.copy()
+        state.pop('context_reader', None)
+        # Cached views are rebuilt on demand rather than pickled
+        state['table_cache'] = OrderedDict()
+        return state
+
+    def cache_view(self, key, frame):
+        # Only the column arrays count: the values are the same objects the parsed rows hold
+        size = int(frame.memory_usage(index=True, deep=False).sum())
+        if self.cache_budget is not None and size > self.cache_budget:
+            return
+        self.table_cache[key] = (frame, size)
+        if self.cache_budget is not None:
+            # Drop the least recently used views until the cache fits the budget again
+            while sum(size for frame, size in self.table_cache.values()) > self.cache_budget:
+                self.table_cache.popitem(last=False)
+
+    def clear_cache(self, view=None):
+        """Drop the cached table views, or only those of one method, e.g. clear_cache('transactions')."""
+        if view is None:
+            self.table_cache.clear()
+            return
+        for key in [key for key in self.table_cache if key[0] == view]:
+            del self.table_cache[key]
+
+    def open_input(self):
+        """The open file to parse, or nothing when the text has already been read into file_content."""
+        if self.file_content is None:
+            return open(self.file_path, 'r')
+        return contextlib.nullcontext()
+
     def load_file_content(self):
+        started = time.perf_counter()
         with open(self.file_path, 'r') as edi_file:
-            return edi_file.read()
-
-    def load_context(self):
-        params = pyx12.params.params()
-        errh = pyx12.error_handler.errh_null()
-        edi_file_stream = StringIO(self.file_content)
-        self.context_reader = pyx12.x12context.X12ContextReader(params, errh, edi_file_stream)
-
-    def parse(self):
-        self.load_context()
-
-        # Final JSON structure to be returned
-        final_json = {
-            'ISA': {},
-            'FunctionalGroups': []
-        }
-
-        current_statement = None
-        current_claim = None
-        current_service = None
-
-        functional_groups = []
-        statements = []
-        statement_refs = []
-        claims = []
-        claim_refs = []
-        claim_cass = []
-        services = []
-        service_refs = [] 
-        service_cass = []
-        colnames = set()
-        ref_colnames = {}
-        cas_colnames = {} 
+            content = edi_file.read()
+        if self.stats is not None:
+            self.stats.add_time('read', time.perf_counter() - started)
+        return content
+
+    def load_context(self, edi_file_stream=None):
+        started = time.perf_counter()
+        if edi_file_stream is None:
+            edi_file_stream = StringIO(self.file_content)
+        # The pyx12 maps are loaded once per process, see maps.py
+        self.context_reader = maps.context_reader(edi_file_stream)
+        if self.stats is not None:
+            self.stats.add_time('context', time.perf_counter() - started)
+
+    def projection(self):
+        """(include, bare) for the tokenizer: the segments to keep, and the loop segments to walk without their elements."""
+        if self.include is None:
+            return None, ()
+        return self.include, frozenset(LOOP_SEGMENTS) - self.include
+
+    def iter_context_segments(self, edi_file_stream=None):
+        self.load_context(edi_file_stream)
+        # id(x12_map_node) -> SegmentSchema, so the element ids and column names are worked out once per map node
+        schemas = {}
+        include, bare = self.projection()
+        bare_schemas = {seg_id: SegmentSchema(seg_id, ()) for seg_id in bare}
         for seg in self.context_reader.iter_segments():
+            if include is not None and seg.id not in include:
+                if seg.id in bare_schemas:
+                    yield seg.id, {}, bare_schemas[seg.id]
+                continue
             seg_node = seg.x12_map_node
-            seg_data = seg.seg_data
-            seg_id = seg.id
-            # Create a dictionary for the current segment's data using dynamic IDs from segment children
+            schema = schemas.get(id(seg_node))
+            if schema is None:
+                schema = schemas[id(seg_node)] = SegmentSchema(seg.id, seg_node.children)
+            # Read the elements by position rather than parsing a reference designator for each one
+            elements = seg.seg_data.elements
+            count = len(elements)
             segment_data = dict(
                 zip(
-                    [child.id for child in seg_node.children],
-                    [seg_data.get_value(child.id).strip() if seg_data.get_value(child.id) is not None else None for child in seg_node.children]
+                    schema.ids,
+                    [elements[position].format().strip() if position < count else None for position in schema.positions]
                 )
             )
-
-            ##### Header
-            if seg_id == 'ISA':
-                isa_id = generate_custom_string()
-                isa_data = {'isa_id':isa_id}
-                isa_data.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            ########## Start Functional Group
-            if seg_id == 'GS':
-                functional_group_id = generate_custom_string()
-                current_functional_group = {'isa_id': isa_id,'functional_group_id': functional_group_id}
-                current_functional_group.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            #################### Start of a Transaction Set
-            if seg_id == 'ST':
-
-                statement_id = generate_custom_string()
-                statement_base = {'isa_id': isa_id, 'functional_group_id': functional_group_id,'statement_id': statement_id}
-                current_statement = statement_base.copy()
-                current_statement.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            if seg_id in ['BPR','TRN']:
-                current_statement.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            if seg_id == 'REF' and seg_data.get_value('REF01') == 'EV':
-                statement_ref = statement_base.copy()
-                statement_ref.update(segment_data)
-                statement_refs.append(statement_ref)
-                # Save column names to ref colnames
-                ref_colnames.update({
-                    seg_data.get_value("REF01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'REF' and seg_data.get_value('REF01') == 'F2':
-                statement_ref = statement_base.copy()
-                statement_ref.update(segment_data)
-                statement_refs.append(statement_ref)
-                # Save column names
-                # Save column names to ref colnames
-                ref_colnames.update({
-                    seg_data.get_value("REF01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'DTM' and seg_data.get_value("DTM01") == '405':
-                current_statement.update(
-                    {x+'-'+seg_data.get_value("DTM01"): segment_data[x] for x in segment_data.keys()}
-                )
-                # Save column names
-                colnames = colnames.union(set((child.id+'-'+seg_data.get_value("DTM01"), child.id+'-'+seg_data.get_value("DTM01") + codes.DTM01.get(seg_data.get_value("DTM01"),child.id+'-'+child.name)) for child in seg_node.children))
-            if seg_id == 'N1':
-                current_statement.update(
-                    {x + '-' + seg_data.get_value("N101"): segment_data[x] for x in segment_data.keys()}
-                )
-                # Save column names
-                colnames = colnames.union(set((child.id+'-'+seg_data.get_value("N101"), child.id +'-'+seg_data.get_value("N101")+'-' + child.name) for child in seg_node.children))
-            if seg_id == 'REF' and seg_data.get_value("REF01") in ['2U','TJ']:
-                current_statement.update(
-                    segment_data
-                )
-                # Save column names
-                # Save column names to ref colnames
-                ref_colnames.update({
-                    seg_data.get_value("REF01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'LX':
-                current_statement.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            ######################################## Start of a new claim
-            if seg_id == 'CLP':
-
-                if current_claim is not None:
-                    claims.append(current_claim)
-                
-                # Reset service-level context
-                current_service = None 
-
-                # Claim base
-                claim_id = generate_custom_string()
-                claim_base = {'isa_id': isa_id, 'functional_group_id': functional_group_id,'statement_id': statement_id, 'claim_id': claim_id}
-                current_claim = claim_base.copy()
-                current_claim.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            if seg_id == 'CAS' and seg_data.get_value("CAS01") in['CO','OA','PR']:
-                claim_cas = claim_base.copy()
-                claim_cas.update(segment_data)
-                claim_cass.append(claim_cas)
-                # Save column names to ref colnames
-                cas_colnames.update({
-                    seg_data.get_value("CAS01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'NM1':
-                current_claim.update(
-                    {x+'-'+seg_data.get_value('NM101'): segment_data[x] for x in segment_data.keys()}
-                )
-                # Save column names
-                colnames = colnames.union(set((child.id+'-'+seg_data.get_value("NM101"), child.id+'-'+seg_data.get_value('NM101') +'-'+ child.name) for child in seg_node.children))
-            
-            if seg_id == 'REF' and seg_data.get_value('REF01') not in  ['EV','F2']:
-                if current_service is None:
-                    if current_claim is not None:
-                        claim_ref = claim_base.copy()
-                        claim_ref.update(segment_data)
-                        claim_refs.append(claim_ref)
-                    else:
-                        statement_ref = statement_base.copy()
-                        statement_ref.update(segment_data)
-                        statement_refs.append(statement_ref)
-                # Save column names
-                # Save column names to ref colnames
-                ref_colnames.update({
-                    seg_data.get_value("REF01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'DTM' and seg_data.get_value("DTM01") in ['232', '233', '050']:
-                current_claim.update(
-                    {x+'-'+seg_data.get_value("DTM01"):segment_data[x] for x in segment_data.keys()}
-                )
-                # Save column names
-                colnames = colnames.union(set((child.id+'-'+seg_data.get_value("DTM01"), child.id+'-'+seg_data.get_value("DTM01") + codes.DTM01.get(seg_data.get_value("DTM01"),child.id+'-'+child.name)) for child in seg_node.children))
-            ################################################################################ Start a new service
-            if seg_id == 'SVC':
-                # Append the last service 
-                if current_service:
-                    services.append(current_service)
-                service_id =  generate_custom_string()
-                service_base = {'isa_id': isa_id, 'functional_group_id': functional_group_id,'statement_id': statement_id, 'claim_id': claim_id, 'service_id': service_id}
-                current_service = service_base.copy()
-                current_service.update(segment_data)
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-            if seg_id == 'CAS':
-                if current_service is None:
-                    # This is a claim-level CAS. 
-                    claim_cas = claim_base.copy()
-                    claim_cas.update(segment_data)
-                    claim_cass.append(claim_cas)
-                else:
-                    service_cas = service_base.copy()
-                    service_cas.update(segment_data)
-                    service_cass.append(service_cas)
-                # Save column names to ref colnames
-                cas_colnames.update({
-                    seg_data.get_value("CAS01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
-                })
-            if seg_id == 'AMT':
-                if current_service is None:
-                    current_claim.update(
-                        {x+'-Claim':segment_data[x] for x in segment_data.keys()}
-                    )
-                    # Save column names
-                    colnames = colnames.union(set((child.id+'-Claim', child.id +'-Claim-'+ child.name) for child in seg_node.children))
-                else:
-                    current_service.update(
-                        {x+'-Service':segment_data[x] for x in segment_data.keys()}
-                    )
-                    # Save column names
-                    colnames = colnames.union(set((child.id+'-Service', child.id +'-Service-'+ child.name) for child in seg_node.children))
-            if seg_id == 'DTM' and seg_data.get_value("DTM01") == '472':
-                current_service.update(
-                    {x+'-'+seg_data.get_value("DTM01"):segment_data[x] for x in segment_data.keys()}
-                )
-                # Save column names
-                colnames = colnames.union(set((child.id+'-'+seg_data.get_value("DTM01"), child.id+'-'+seg_data.get_value("DTM01") + codes.DTM01.get(seg_data.get_value("DTM01"),child.id+'-'+child.name)) for child in seg_node.children))
-
-            if seg_id == 'REF' and seg_data.get_value('REF01') not in  ['EV','F2']:
-                if current_service is not None:
-                    service_ref = service_base.copy()
-                    service_ref.update(segment_data)
-                    service_refs.append(service_ref)
-                # Save column names
-                # Save column names to ref colnames
-                ref_colnames.update({
-                    seg_data.get_value("REF01"):{child.id: child.id +'-'+child.name for child in seg_node.children}
+            yield seg.id, segment_data, schema
+
+    def iter_segments(self, edi_file_stream=None):
+        # Every engine yields (seg_id, segment_data, schema) so parse() doesn't care which one is used.
+        # Passing an open file reads it incrementally instead of using self.file_content.
+        if self.engine == 'fast':
+            if edi_file_stream is not None:
+                return tokenizer.iter_stream_segments(edi_file_stream, *self.projection())
+            return tokenizer.iter_segments(self.file_content, *self.projection())
+        return self.iter_context_segments(edi_file_stream)
+
+    @classmethod
+    def iter_claims(cls, file_path, engine='pyx12', ids='random', handlers=None, include=None, where=None):
+        """
+        Yield each claim as soon as it is complete, reading the file incrementally so memory
+        stays flat no matter how big the file is. Each item is a dict with the 'claim' and its
+        'claims_cas', 'claims_refs', 'services', 'services_cas' and 'services_refs' rows.
+        """
+        parser = cls(file_path, engine=engine, parse=False, ids=ids, handlers=handlers, include=include, where=where)
+        with open(file_path, 'r') as edi_file:
+            for table, record in parser.iter_records(parser.iter_segments(edi_file)):
+                if table == 'claims':
+                    yield record
+
+    @classmethod
+    def iter_tables(cls, file_path, chunk_claims=50_000, engine='pyx12', ids='random', handlers=None, include=None, where=None, colnames=False, typed=False):
+        """
+        Yield the claim-level tables a chunk of claims at a time, reading the file incrementally
+        like iter_claims, e.g. to bulk load each chunk into a warehouse and drop it. Each chunk
+        is a dict of DataFrames: 'claims', 'services', 'claims_cas', 'services_cas', 'claims_refs'
+        and 'services_refs' (plus any claim-level tables of extra handlers) for up to
+        chunk_claims claims and their rows, as claims_table() and the other views give them.
+        A chunk has every column seen so far in the file, so columns don't come and go
+        between chunks; later chunks may add columns. typed=True types amounts and dates as
+        the views do, but leaves codes as strings, so every chunk has the same dtypes.
+        """
+        if chunk_claims < 1:
+            raise ValueError('chunk_claims must be at least 1.')
+        parser = cls(file_path, engine=engine, parse=False, ids=ids, handlers=handlers, include=include, where=where)
+        # Columns of each table so far, in the order they first appeared
+        seen = {name: [] for name in CHUNK_TABLES}
+        dtypes = {}
+        tables = None
+        with open(file_path, 'r') as edi_file:
+            for table, record in parser.iter_records(parser.iter_segments(edi_file)):
+                if table != 'claims':
+                    continue
+                if tables is None:
+                    tables = {name: ColumnTable(columns=columns) for name, columns in seen.items()}
+                for name, rows in record.items():
+                    if name == 'claim':
+                        tables['claims'].append(rows)
+                        continue
+                    if name not in tables:
+                        tables[name] = ColumnTable(columns=seen.setdefault(name, []))
+                    tables[name].extend(rows)
+                if len(tables['claims']) >= chunk_claims:
+                    yield parser.chunk_frames(tables, seen, dtypes, colnames, typed)
+                    tables = None
+        if tables is not None:
+            yield parser.chunk_frames(tables, seen, dtypes, colnames, typed)
+
+    def chunk_frames(self, tables, seen, dtypes, colnames=False, typed=False):
+        """
+        The DataFrames of one chunk of iter_tables, built like the table views. seen and dtypes
+        hold the columns and dtypes of each table in the chunks so far. typed=True keeps codes
+        as strings: categories of one chunk would differ from the next one's.
+        """
+        frames = {}
+        # Ids are numbers for int and hash ids; everything else starts out as strings
+        id_dtype = 'int64' if self.ids in ('int', 'hash') else object
+        for name, table in tables.items():
+            seen[name] = list(table.columns)
+            if name.endswith('_refs'):
+                frame = self.parse_refs_data(table, colnames, False)
+            elif name.endswith('_cas'):
+                frame = self.parse_cas_data(table, colnames, False)
+            else:
+                frame = table.to_frame()
+                if colnames:
+                    frame = frame.rename(self.colnames, axis=1)
+            if frame.empty:
+                # A table without rows in this chunk comes out all float64: give its columns
+                # the dtypes they had in the chunks before
+                frame = frame.astype({
+                    column: dtypes.get(name, {}).get(column, id_dtype if column in ID_COLUMNS else object)
+                    for column in frame.columns
                 })
-            ######################################## End of Transaction Set
-            if seg_id == 'SE':
-                # Append the last service 
-                if current_service:
-                    services.append(current_service)
-                # Append the last claim
-                if current_claim:
-                    claims.append(current_claim)
-                # Append the last statement to the functional group
-                if current_statement:
-                    statements.append(current_statement)
-
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
-
-                # Reset the variables
-                current_service = None
-                current_claim = None 
-                current_statement = None
-            ########## End Functional Group
-            if seg_id == 'GE':
-                current_functional_group.update(segment_data)
-                functional_groups.append(current_functional_group)
-                current_functional_group = None
-                # Save column names
-                colnames = colnames.union(set((child.id, child.id +'-'+ child.name) for child in seg_node.children))
+            if typed:
+                frame = typed_frame(frame, categories=False)
+            if not frame.empty:
+                dtypes[name] = dict(frame.dtypes)
+            frames[name] = frame
+        return frames
+
+    def parse(self):
+        self.clear_cache()
+        stats = self.stats
+        if stats is not None:
+            stats.start_parse()
+            stats.bytes_read = os.path.getsize(self.file_path)
+        tables = None
+        if self.workers is not None and self.workers > 1:
+            tables = self.parse_parallel()
+        if tables is None:
+            # One pass over the input with one reader: the text already read in, or else the open file
+            with self.open_input() as edi_file_stream:
+                tables = self.read_tables(self.iter_segments(edi_file_stream))
+        self.set_tables(tables)
+
+    def read_tables(self, segments, parents=None):
+        """Walk the segments into a ParsedTables; parents as in iter_records."""
+        tables = ParsedTables()
+        stats = self.stats
+        if stats is not None:
+            segments = stats.count_segments(segments)
+        for table, record in self.iter_records(segments, parents):
+            tables.add(table, record, stats)
+        return tables
+
+    def set_tables(self, tables):
+        started = time.perf_counter()
         # Add to self. 
-        self.isa = isa_data
-        self.functional_groups = functional_groups 
-        self.transaction_sets = statements 
-        self.transaction_refs = statement_refs
-        self.claims = claims 
-        self.claims_refs = claim_refs
-        self.claims_cas = claim_cass
-        self.services = services 
-        self.services_refs = service_refs
-        self.services_cas = service_cass
-        self.colnames = dict(colnames)
-        self.ref_colnames = ref_colnames
-        self.cas_colnames = cas_colnames
-
-    def isa_table(self,colnames=False):
+        self.isa = tables.isa
+        for name in PARSED_TABLES:
+            setattr(self, name, getattr(tables, name))
+        self.extra_tables = tables.extra_tables
+        # Statements and functional groups are yielded when they close, after their children,
+        # so claims and statements are matched to their parent row by id once the walk is done
+        statement_positions = row_positions(self.transaction_sets, 'statement_id')
+        functional_group_positions = row_positions(self.functional_groups, 'functional_group_id')
+        self.parents = {
+            'functional_groups': [0] * len(self.functional_groups),
+            'transaction_sets': [functional_group_positions.get(row_id, -1) for row_id in self.transaction_sets.columns.get('functional_group_id', [])],
+            'claims': [statement_positions.get(row_id, -1) for row_id in self.claims.columns.get('statement_id', [])],
+            'services': tables.service_parents
+        }
+        stats = self.stats
+        if stats is not None:
+            stats.add_time('index', time.perf_counter() - started)
+            stats.table_rows.update((name, len(getattr(self, name))) for name in PARSED_TABLES)
+            stats.table_rows.update((name, len(table)) for name, table in self.extra_tables.items())
+
+    def parse_parallel(self):
+        """
+        Parse runs of transaction sets in self.workers processes and stitch the parts back
+        together in file order. The envelope (ISA, GS, GE, IEA) is handled here, so each part
+        gets the isa_id and functional_group_id of its parents, and the ids each part starts
+        at are counted up front, so every ids type gives the same ids as a serial parse.
+        Returns None when the file holds a single run, when a transaction set comes before
+        its ISA or GS, when where or the handlers can't be pickled for the workers (e.g. a
+        lambda), or when handlers made other ids than counted, for parse() to read the file
+        serially instead.
+
+        The file is split on its text, so the whole of it is read into memory for the parse,
+        even with keep_raw=False; it is only kept in self.file_content with keep_raw=True.
+        """
+        content = self.file_content if self.file_content is not None else self.load_file_content()
+        delimiters = tokenizer.read_delimiters(content)
+        size = max(MIN_PART_SIZE, len(content) // (self.workers * 4))
+        pieces = list(tokenizer.split_transaction_sets(content, delimiters, size))
+        if sum(seg_id == 'ST' for seg_id, text in pieces) < 2:
+            return None
+        # The segments each part makes ids for, found the same way the split finds ST and SE
+        terminator = re.escape(delimiters.segment)
+        id_segments = '|'.join(seg_id for seg_id in ID_SEGMENTS if seg_id not in tokenizer.ENVELOPE_SEGMENTS)
+        id_pattern = re.compile(rf'(?:^|{terminator})\s*({id_segments}){re.escape(delimiters.element)}')
+        element = delimiters.element
+
+        dispatch = self.segment_dispatch()
+        state = RecordState(None)
+        # What the workers get: the settings of this parser, without the file
+        part = Parser(self.file_path, engine=self.engine, parse=False, ids=self.ids, stats=self.stats is not None, handlers=self.handlers, include=self.include, where=self.where)
+        try:
+            pickle.dumps(part)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # A lambda or nested function as where or a handler can't be sent to the workers
+            return None
+        initializer = maps.warm_up if self.engine == 'pyx12' else None
+        position = self.id_offset
+        # In file order: lists of records of the envelope, and (future, ids expected) of the parts
+        results = []
+        # The envelope the parts are wrapped in, set as ISA and GS go by
+        isa_text = gs_text = None
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=initializer) as executor:
+            for seg_id, text in pieces:
+                if seg_id == 'ST':
+                    if isa_text is None or gs_text is None:
+                        # Not a well formed envelope; the serial parse reads it as best it can
+                        cancel_parts(results)
+                        return None
+                    found = id_pattern.findall(text)
+                    # Wrap the run in its own envelope, which the worker skips
+                    envelope_end = [
+                        element.join(['GE', str(found.count('ST')), gs_text.split(element)[6]]),
+                        element.join(['IEA', '1', isa_text.split(element)[13]]),
+                        ''
+                    ]
+                    part_content = delimiters.segment.join([isa_text, gs_text, text] + envelope_end)
+                    future = executor.submit(parse_transaction_sets, part, part_content, (state.isa_id, state.functional_group_id), position)
+                    results.append((future, len(found)))
+                    position += len(found)
+                    continue
+                if seg_id == 'ISA':
+                    isa_text = text
+                elif seg_id == 'GS':
+                    gs_text = text
+                segment = next(tokenizer.tokenize([text], delimiters, *self.projection()), None)
+                if segment is None:
+                    # Left out by include
+                    continue
+                state.new_id = IdCounter(self.ids, position)
+                if self.stats is not None:
+                    self.stats.segment_counts[seg_id] += 1
+                handler = dispatch.get(seg_id)
+                if handler is not None:
+                    handler(state, *segment[1:])
+                position += state.new_id.issued
+                results.append(list(state.output))
+                state.output.clear()
+
+            tables = ParsedTables()
+            colnames = [state.colnames, state.ref_colnames, state.cas_colnames]
+            for result in results:
+                if isinstance(result, list):
+                    for table, record in result:
+                        tables.add(table, record)
+                    continue
+                future, expected_ids = result
+                part_tables, part_colnames, ids_used, part_stats = future.result()
+                if ids_used != expected_ids and self.ids != 'random':
+                    # The parts' ids would overlap
+                    cancel_parts(results)
+                    return None
+                tables.concat(part_tables)
+                for names, part_names in zip(colnames, part_colnames):
+                    names.update(part_names)
+                if part_stats is not None:
+                    self.stats.merge(part_stats)
+        self.colnames, self.ref_colnames, self.cas_colnames = colnames
+        return tables
+
+    def segment_dispatch(self):
+        # One lookup per segment in the dispatch table instead of testing every segment id in turn
+        return dispatch_table({**SEGMENT_HANDLERS, **self.handlers} if self.handlers else SEGMENT_HANDLERS)
+
+    def iter_records(self, segments, parents=None):
+        """
+        Walk the segments and yield (table, record) as soon as each record is complete.
+        Tables are 'isa', 'functional_groups', 'transaction_sets', 'transaction_refs' and 'claims'
+        (plus any tables of extra handlers, see handlers.py). A claim record holds the claim
+        and its own claims_cas, claims_refs, services, services_cas and services_refs rows.
+        Column names are saved in self.colnames as they are seen.
+
+        parents=(isa_id, functional_group_id) walks transaction sets without their envelope
+        for parse_parallel: they get these parents, and the number of ids handed out is kept
+        in self.ids_used.
+        """
+        dispatch = self.segment_dispatch()
+        keep = claim_filter(self.where)
+        if parents is None:
+            state = RecordState(id_generator(self.ids, self.id_offset), keep)
+        else:
+            state = RecordState(IdCounter(self.ids, self.id_offset), keep)
+            state.isa_id, state.functional_group_id = parents
+        output = state.output
+        # Filled in as the walk goes, e.g. for the chunks of iter_tables
+        self.colnames = state.colnames
+        self.ref_colnames = state.ref_colnames
+        self.cas_colnames = state.cas_colnames
+        for seg_id, segment_data, schema in segments:
+            handler = dispatch.get(seg_id)
+            if handler is not None:
+                handler(state, segment_data, schema)
+                if output:
+                    yield from output
+                    output.clear()
+        if parents is not None:
+            self.ids_used = state.new_id.issued
+
+    @cached_view
+    def isa_table(self,colnames=False,typed=False):
         isa_data = pd.DataFrame([self.isa])
         isa_data['filename'] = os.path.basename(self.file_path)
+        if typed:
+            isa_data = typed_frame(isa_data)
         if colnames:
             isa_data = isa_data.rename(self.colnames,axis = 1)
         return isa_data
-    def functional_groups_table(self,colnames = False):
-        functional_groups = pd.DataFrame(self.functional_groups)
+    @cached_view
+    def functional_groups_table(self,colnames = False,typed=False):
+        functional_groups = self.functional_groups.to_frame()
+        if typed:
+            functional_groups = typed_frame(functional_groups)
         if colnames:
             functional_groups = functional_groups.rename(self.colnames,axis = 1)
         return functional_groups
     
-    def transaction_sets_table(self,colnames=False):
-        transaction_sets = pd.DataFrame(self.transaction_sets)
+    @cached_view
+    def transaction_sets_table(self,colnames=False,typed=False):
+        transaction_sets = self.transaction_sets.to_frame()
+        if typed:
+            transaction_sets = typed_frame(transaction_sets)
         if colnames:
             transaction_sets = transaction_sets.rename(self.colnames,axis = 1)
         return transaction_sets
     
-    def claims_table(self,colnames=False):
-        claims = pd.DataFrame(self.claims)
+    @cached_view
+    def claims_table(self,colnames=False,typed=False):
+        claims = self.claims.to_frame()
+        if typed:
+            claims = typed_frame(claims)
         if colnames:
             claims = claims.rename(self.colnames,axis=1)
         return claims 
     
-    def services_table(self,colnames=False):
-        services = pd.DataFrame(self.services)
+    @cached_view
+    def services_table(self,colnames=False,typed=False):
+        services = self.services.to_frame()
+        if typed:
+            services = typed_frame(services)
         if colnames:
             services = services.rename(self.colnames,axis=1)
         return services
 
-    def transactions(self,colnames=False):
-        # Convert lists to DataFrames
-        isa_data = self.isa_table()  
-        functional_groups = self.functional_groups_table()
-        transaction_sets = self.transaction_sets_table()
-        claims = self.claims_table()
-        services = self.services_table()
-
-        # Join the DataFrames
-        # 1. Join isa_data with functional_groups on 'isa_id'
-        master_df = pd.merge(isa_data, functional_groups, on='isa_id', how='left')
-
-        if not transaction_sets.empty:
-            # 2. Join with transaction_sets on 'isa_id' and 'functional_group_id'
-            master_df = pd.merge(master_df, transaction_sets, on=['isa_id', 'functional_group_id'], how='left')
-
-        if not claims.empty:
-            # 3. Join with claims on 'isa_id', 'functional_group_id', and 'statement_id'
-            master_df = pd.merge(master_df, claims, on=['isa_id', 'functional_group_id', 'statement_id'], how='left')
-
-        # 4. Join with services on 'isa_id', 'functional_group_id', 'statement_id', and 'claim_id'
-        if not services.empty:
-            master_df = pd.merge(master_df, services, on=['isa_id', 'functional_group_id', 'statement_id', 'claim_id'], how='left')
-
+    @cached_view
+    def extra_table(self, name, colnames=False, typed=False):
+        """
+        A table filled by an extra segment handler, e.g. extra_table('provider_adjustments') with
+        EXTRA_HANDLERS. Empty when the file has no such rows.
+        """
+        table = self.extra_tables.get(name, ColumnTable()).to_frame()
+        if typed:
+            table = typed_frame(table)
+        if colnames:
+            table = table.rename(self.colnames, axis=1)
+        return table
+
+    @cached_view
+    def transactions(self,colnames=False,typed=False):
+        isa_data = self.isa_table(copy=False)  
+        functional_groups = self.functional_groups_table(copy=False)
+        transaction_sets = self.transaction_sets_table(copy=False)
+        claims = self.claims_table(copy=False)
+        services = self.services_table(copy=False)
+
+        # Each level is lined up with its parent rows by position (see parse), which gives the
+        # same table as left merging on the id columns without building the merge keys
+        levels = [
+            (functional_groups, self.parents['functional_groups'], ['isa_id']),
+            (transaction_sets, self.parents['transaction_sets'], ['isa_id', 'functional_group_id']),
+            (claims, self.parents['claims'], ['isa_id', 'functional_group_id', 'statement_id']),
+            (services, self.parents['services'], ['isa_id', 'functional_group_id', 'statement_id', 'claim_id'])
+        ]
+        master_df = join_levels(isa_data, [level for level in levels if not level[0].empty])
+
+        if typed:
+            master_df = typed_frame(master_df)
         if colnames:
             master_df = master_df.rename(self.colnames,axis=1)
         # Return the final master DataFrame
         return master_df
     
-    def parse_refs_data(self, data, colnames=False, flatten=False):
+    def parse_refs_data(self, data, colnames=False, flatten=False, typed=False):
         # Create DataFrame from the provided data
-        refs = pd.DataFrame(data)
+        refs = to_frame(data)
+        # List of identifier columns
+        id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id']
+        if 'service_id' in refs.columns:
+            id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
         if not refs.empty:
-            # List of identifier columns
-            id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id']
-            if 'service_id' in refs.columns:
-                id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
-
             # Pivot the table if flatten flag is True
             if flatten:
                 # Pivot the DataFrame on REF01 and other REF columns (REF02, REF03, etc.)
@@ -393,35 +720,42 @@ class Parser:
                     # Rename the columns using the created dictionary
                     pivoted_refs = pivoted_refs.rename(rename_dict, axis=1)
 
+                if typed:
+                    pivoted_refs = typed_frame(pivoted_refs)
                 return pivoted_refs
-            
-            if colnames:
-                rename_dict = {
-                    f'{col}': f'{col} {codes.ref_descriptions['REF01'].get(col,col)} = {codes.ref_descriptions.get(col, col)}'
-                    for col in [col for col in refs.columns if col.startswith('REF') and col not in id_vars + ['REF01']]
-                }
-                refs = refs.rename(rename_dict,axis=1)
+
+        # Also without rows, for the columns of an empty chunk of iter_tables
+        if colnames and not flatten:
+            rename_dict = {
+                f'{col}': f'{col} {codes.ref_descriptions["REF01"].get(col,col)} = {codes.ref_descriptions.get(col, col)}'
+                for col in [col for col in refs.columns if col.startswith('REF') and col not in id_vars + ['REF01']]
+            }
+            refs = refs.rename(rename_dict,axis=1)
 
         # Return the original table if flatten is False
+        if typed:
+            refs = typed_frame(refs)
         return refs
 
-    def claims_refs_table(self, colnames=False, flatten=False):
-        result = self.parse_refs_data(self.claims_refs,colnames,flatten)
+    @cached_view
+    def claims_refs_table(self, colnames=False, flatten=False, typed=False):
+        result = self.parse_refs_data(self.claims_refs, colnames, flatten, typed)
         return result
 
-    def services_refs_table(self, colnames=False, flatten=False):
-        result = self.parse_refs_data(self.services_refs,colnames,flatten)
+    @cached_view
+    def services_refs_table(self, colnames=False, flatten=False, typed=False):
+        result = self.parse_refs_data(self.services_refs, colnames, flatten, typed)
         return result
 
-    def parse_cas_data(self, data, colnames=False, flatten=False):
+    def parse_cas_data(self, data, colnames=False, flatten=False, typed=False):
         # Create DataFrame from the provided data
-        claim_cas = pd.DataFrame(data)
+        claim_cas = to_frame(data)
+        # List of identifier columns
+        id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id']
+        if 'service_id' in claim_cas.columns:
+            id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
 
         if not claim_cas.empty:
-            # List of identifier columns
-            id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id']
-            if 'service_id' in claim_cas.columns:
-                id_vars = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
             # Pivot the table if flatten flag is True
             if flatten:
                 # Pivot the DataFrame on CAS01 and other CAS columns (CAS02, CAS03, etc.)
@@ -446,22 +780,115 @@ class Parser:
                     # Rename the columns using the created dictionary
                     pivoted_claim_cas = pivoted_claim_cas.rename(rename_dict, axis=1)
 
+                if typed:
+                    pivoted_claim_cas = typed_frame(pivoted_claim_cas)
                 return pivoted_claim_cas
-            if colnames:
-                rename_dict = {
-                    col: f'{col} {codes.cas_descriptions['CAS01'].get(col,col)} - {codes.cas_descriptions.get(col, col)}'
-                    for col in (col for col in claim_cas.columns if col.startswith('CAS') and col not in id_vars + ['CAS01'])
-                }
-                claim_cas = claim_cas.rename(rename_dict,axis=1)
+
+        # Also without rows, for the columns of an empty chunk of iter_tables
+        if colnames and not flatten:
+            rename_dict = {
+                col: f'{col} {codes.cas_descriptions["CAS01"].get(col,col)} - {codes.cas_descriptions.get(col, col)}'
+                for col in (col for col in claim_cas.columns if col.startswith('CAS') and col not in id_vars + ['CAS01'])
+            }
+            claim_cas = claim_cas.rename(rename_dict,axis=1)
 
         # Return the original table if flatten is False
+        if typed:
+            claim_cas = typed_frame(claim_cas)
         return claim_cas
 
 
-    def claims_cas_table(self, colnames=False, flatten=False):
-        result = self.parse_cas_data(self.claims_cas,colnames,flatten)
+    @cached_view
+    def claims_cas_table(self, colnames=False, flatten=False, typed=False):
+        result = self.parse_cas_data(self.claims_cas, colnames, flatten, typed)
         return result
     
-    def services_cas_table(self,colnames=False,flatten=False):
-        result = self.parse_cas_data(self.services_cas,colnames,flatten)
-        return result
\ No newline at end of file
+    @cached_view
+    def services_cas_table(self, colnames=False, flatten=False, typed=False):
+        result = self.parse_cas_data(self.services_cas, colnames, flatten, typed)
+        return result
+
+    def parse_adjustments_data(self, data, id_vars, colnames=False, typed=False):
+        """
+        One row per adjustment: the ids (id_vars, the id columns of the claim or service level),
+        the group code (CAS01) and one reason code, amount and quantity triplet, under the names
+        of the first triplet (CAS02, CAS03, CAS04). Built by reshaping the six triplet columns
+        at once, in the order they appear in the file.
+        """
+        cas = to_frame(data)
+        columns = id_vars + ['CAS01', 'CAS02', 'CAS03', 'CAS04']
+        if cas.empty:
+            # The same columns as when there are adjustments
+            adjustments = pd.DataFrame(columns=columns)
+        else:
+            def triplet_values(position):
+                # (rows, 6) array of one element of every triplet, None where the segment stops early
+                return np.column_stack([
+                    cas[triplet[position]].to_numpy(dtype=object) if triplet[position] in cas.columns else np.full(len(cas), None, dtype=object)
+                    for triplet in CAS_TRIPLETS
+                ])
+
+            reasons = triplet_values(0)
+            rows, slots = np.nonzero(pd.notna(reasons) & (reasons != ''))
+            adjustments = {column: cas[column].to_numpy()[rows] for column in id_vars + ['CAS01']}
+            adjustments['CAS02'] = reasons[rows, slots]
+            adjustments['CAS03'] = triplet_values(1)[rows, slots]
+            adjustments['CAS04'] = triplet_values(2)[rows, slots]
+            adjustments = pd.DataFrame(adjustments, columns=columns)
+        if typed:
+            adjustments = typed_frame(adjustments)
+        if colnames:
+            adjustments = adjustments.rename({
+                'CAS01': 'CAS01-Claim Adjustment Group Code',
+                'CAS02': 'CAS02-' + codes.cas_descriptions['CAS02'],
+                'CAS03': 'CAS03-' + codes.cas_descriptions['CAS03'],
+                'CAS04': 'CAS04-' + codes.cas_descriptions['CAS04']
+            }, axis=1)
+        return adjustments
+
+    @cached_view
+    def claims_adjustments_table(self, colnames=False, typed=False):
+        return self.parse_adjustments_data(self.claims_cas_table(copy=False), ID_COLUMNS[:4], colnames, typed)
+
+    @cached_view
+    def services_adjustments_table(self, colnames=False, typed=False):
+        return self.parse_adjustments_data(self.services_cas_table(copy=False), ID_COLUMNS, colnames, typed)
+
+    def summarize_adjustments(self, adjustments, colnames=False):
+        """
+        Total adjustment amount per claim (or service) for every group and reason code pair, one
+        column per pair, e.g. CAS03_CO-45. Sums repeated pairs instead of keeping the first one.
+        """
+        id_vars = [column for column in ID_COLUMNS if column in adjustments.columns]
+        if adjustments.empty:
+            return pd.DataFrame(columns=id_vars)
+        amounts = pd.to_numeric(adjustments['CAS03'], errors='coerce')
+        pairs = adjustments['CAS01'].astype(str) + '-' + adjustments['CAS02'].astype(str)
+        summary = (
+            amounts.groupby([adjustments[column] for column in id_vars] + [pairs.rename('pair')], sort=False)
+            .sum()
+            .unstack('pair', fill_value=0.0)
+        )
+        summary.columns = ['CAS03_' + pair for pair in summary.columns]
+        summary = summary.reset_index()
+        if colnames:
+            rename_dict = {}
+            for column in summary.columns[len(id_vars):]:
+                group, reason = column[len('CAS03_'):].split('-', 1)
+                group = codes.cas_descriptions['CAS01'].get(group, group)
+                reason = codes.claim_adjustment_reason_codes.get(reason, reason)
+                rename_dict[column] = f'{column} {group} - {reason}'
+            summary = summary.rename(rename_dict, axis=1)
+        return summary
+
+    @cached_view
+    def claims_adjustments_summary(self, colnames=False):
+        return self.summarize_adjustments(self.claims_adjustments_table(copy=False), colnames)
+
+    @cached_view
+    def services_adjustments_summary(self, colnames=False):
+        return self.summarize_adjustments(self.services_adjustments_table(copy=False), colnames)
+
+    def write_dataset(self, base_dir, partition_by=None, tables=None, format='parquet'):
+        """Write the tables as a (partitioned) Parquet dataset, see export.write_dataset."""
+        export.write_dataset([self], base_dir, partition_by=partition_by, tables=tables, format=format)
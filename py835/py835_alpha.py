@@ -1,335 +1,262 @@
-import pyx12
-import pyx12.error_handler
-import pyx12.x12context
-import pyx12.params
 import random
 import string
 from io import StringIO
-import pandas as pd 
+from itertools import repeat
+from . import maps
+from .lazy import LazyModule
+from .table import join_levels
+
+# Imported on first use, see lazy.py
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
 
 def generate_id():
     # Define the character set: digits and uppercase letters
     characters = string.ascii_letters + string.digits
-    
+
     # Generate four segments, each with six random characters
     segments = [''.join(random.choice(characters) for _ in range(6)) for _ in range(4)]
-    
+
     # Join the segments with dashes
     api_key = '-'.join(segments)
-    
+
     return api_key
 
-current_state = {
-    'header': None,
-    'functional_group':None,
-    'statement':None,
-    'claim':None,
-    'service':None
-}
+# Segments whose element ids carry the segment's qualifier (its first element), e.g. REF02-EA
+QUALIFIED_SEGMENTS = {'REF', 'CAS', 'DTM', 'NM1', 'N1', 'AMT', 'SVC', 'BPR'}
+
+# The long-format tables, one per level of the hierarchy, and the id columns of their rows
+LEVEL_TABLES = ['HEADER', 'FUNCTIONAL_GROUPS', 'STATEMENTS', 'CLAIMS', 'SERVICES']
+LEVEL_IDS = ['header_id', 'functional_group_id', 'statement_id', 'claim_id', 'service_id']
+HEADER, FUNCTIONAL_GROUP, STATEMENT, CLAIM, SERVICE = range(len(LEVEL_TABLES))
+# Prefix of each level's columns in financial_report
+REPORT_PREFIXES = ['HEADER', 'TRANSACTION', 'STATEMENT', 'CLAIM', 'SERVICE']
 
 class Element:
-    def __init__(self,child,value,segment):
-        if segment.id in ['REF','CAS','DTM','NM1','N1','AMT','SVC','BPR']:
-            self.id = child.id + '-'+ segment.seg_data.get_value(segment.id+'01')
-        else:
-            self.id = child.id
-        self.name = child.name
+    __slots__ = ('id', 'name', 'value')
+
+    def __init__(self, id, name, value):
+        self.id = id
+        self.name = name
         self.value = value
 
 class Segment:
-    def __init__(self,segment):
-        self.segment_id = generate_id()
-        self.elements = []
-        self.cas = []
-        
-        for child in segment.x12_map_node.children:
-            self.elements.append(
-                Element(child,segment.seg_data.get_value(child.id),segment)
-            )
-
-class CAS:
-    def __init__(self,segment):
-        self.segment_id = generate_id()
-        self.segments = []
-    def update(self,segment):
-        self.segments.append(Segment(segment))
+    """
+    One segment in long format: the id and name of every element of its map node, and the
+    values. ids and names are shared by all segments of the same map node and qualifier.
+    """
+    __slots__ = ('seg_id', 'ids', 'names', 'values')
+
+    def __init__(self, seg_id, ids, names, values):
+        self.seg_id = seg_id
+        self.ids = ids
+        self.names = names
+        self.values = values
+
+    @property
+    def elements(self):
+        return [Element(*element) for element in zip(self.ids, self.names, self.values)]
+
+class LevelColumns:
+    """The rows of one long-format table, column by column: its id columns, then id, name and value."""
+    __slots__ = ('id_columns', 'ids', 'names', 'values')
+
+    def __init__(self, depth):
+        # {id column: list}, e.g. header_id and functional_group_id for the functional groups
+        self.id_columns = {column: [] for column in LEVEL_IDS[:depth + 1]}
+        self.ids = []
+        self.names = []
+        self.values = []
+
+    def add(self, row_ids, segment):
+        count = len(segment.values)
+        for column, row_id in zip(self.id_columns.values(), row_ids):
+            column.extend(repeat(row_id, count))
+        self.ids.extend(segment.ids)
+        self.names.extend(segment.names)
+        self.values.extend(segment.values)
+
+    def to_frame(self):
+        columns = dict(self.id_columns)
+        columns.update(id=self.ids, name=self.names, value=self.values)
+        return pd.DataFrame(columns)
+
+class ParseState:
+    """
+    Where the walk over one file is: the id of each level currently open (None when it
+    isn't) and the columns of each level's table. Each Parser has its own, so parsers in
+    different threads don't share anything but the read-only pyx12 maps.
+    """
+    __slots__ = ('level_ids', 'tables', 'layouts')
 
-class Service:
-    def __init__(self):
-        self.service_id = generate_id()
-        self.segments = []
-        
-    def update(self,segment):
-        self.segments.append(Segment(segment))
-
-    
-class Claim:
-    def __init__(self):
-        self.claim_id = generate_id()
-        self.segments = []
-        self.SERVICES = []
-        
-
-    def update(self,segment):
-        self.segments.append(Segment(segment))
-
-    def append(self,service):
-        self.SERVICES.append(service)
-    
-class Statement:
-    def __init__(self):
-        self.statement_id = generate_id()
-        self.segments = []
-        self.CLAIMS = []
-        
-
-    def update(self,segment):
-        self.segments.append(Segment(segment))
-
-    def append(self,claim):
-        self.CLAIMS.append(claim)
-    
-class Functional_Group:
     def __init__(self):
-        self.functional_group_id = generate_id()
-        self.segments = []
-        self.STATEMENTS = []
-        
-    def update(self,segment):
-        self.segments.append(Segment(segment))
-
-    def append(self,statement):
-        self.STATEMENTS.append(statement)
-    
-class Header:
-    def __init__(self):
-        self.header_id = generate_id()
-        self.segments = []
-        self.FUNCTIONAL_GROUPS = []
-
-    def update(self,segment):
-        self.segments.append(Segment(segment))
+        self.level_ids = [generate_id(), None, None, None, None]
+        self.tables = [LevelColumns(depth) for depth in range(len(LEVEL_TABLES))]
+        # (id(map node), qualifier) -> (element ids, names, positions), worked out once per map node
+        self.layouts = {}
+
+    def open(self, level):
+        """Start a new row of a level; the levels below it are closed."""
+        self.level_ids[level] = generate_id()
+        for below in range(level + 1, len(self.level_ids)):
+            self.level_ids[below] = None
+
+    def close(self, level):
+        for below in range(level, len(self.level_ids)):
+            self.level_ids[below] = None
+
+    def current_level(self):
+        # The deepest level open
+        level = HEADER
+        for depth, level_id in enumerate(self.level_ids):
+            if level_id is not None:
+                level = depth
+        return level
+
+    def segment(self, segment):
+        seg_data = segment.seg_data
+        children = segment.x12_map_node.children
+        qualifier = seg_data.get_value(segment.id + '01') if segment.id in QUALIFIED_SEGMENTS else None
+        key = (id(segment.x12_map_node), qualifier)
+        layout = self.layouts.get(key)
+        if layout is None:
+            suffix = '' if qualifier is None else '-' + qualifier
+            layout = self.layouts[key] = (
+                tuple(child.id + suffix for child in children),
+                tuple(child.name for child in children),
+                range(len(children))
+            )
+        ids, names, positions = layout
+        # Read the elements by position rather than parsing a reference designator for each one
+        elements = seg_data.elements
+        count = len(elements)
+        values = [elements[position].format() if position < count else None for position in positions]
+        return Segment(segment.id, ids, names, values)
+
+    def add(self, level, segment):
+        self.tables[level].add(self.level_ids[:level + 1], segment)
+
+class PandasClass:
+    """The long-format (id, name, value) tables, one row per element of each segment."""
+    def __init__(self, state):
+        for name, table in zip(LEVEL_TABLES, state.tables):
+            # One DataFrame per table, straight from its columns
+            setattr(self, name, table.to_frame())
 
-    def append(self,functional_group):
-        self.FUNCTIONAL_GROUPS.append(functional_group)
-    
 class Parser:
     def __init__(self,filepath):
         self.filepath = filepath
         self.unpack()
-        
+
     def load_file_content(self):
         with open(self.filepath, 'r') as edi_file:
             return edi_file.read()
 
     def load_context(self):
-        params = pyx12.params.params()
-        errh = pyx12.error_handler.errh_null()
         edi_file_stream = StringIO(self.load_file_content())
-        return pyx12.x12context.X12ContextReader(params, errh, edi_file_stream)
+        # The pyx12 maps are loaded once per process, see maps.py
+        return maps.context_reader(edi_file_stream)
 
     def unpack(self):
-        current_state['header'] = Header()
+        state = ParseState()
         reader = self.load_context()
-        for segment in reader.iter_segments():
-            if segment.id == 'GS':  # Begin functional group
-                if current_state['functional_group'] is not None:
-                    current_state['header'].append(current_state['functional_group'])
-                current_state['service'] = None
-                current_state['claim'] = None 
-                current_state['statement'] = None 
-                current_state['functional_group'] = Functional_Group()
-                current_state['functional_group'].update(segment)
-                
-            elif segment.id == 'ST':  # Begin statement
-                # Ensure that the functional group does not append to statements
-                if current_state['statement'] is not None:
-                    current_state['functional_group'].append(current_state['statement'])
-                current_state['service'] = None
-                current_state['claim'] = None 
-                current_state['statement'] = Statement()
-                current_state['statement'].update(segment)
-            elif segment.id == 'CLP':
-                if current_state['claim'] is not None:
-                    current_state['statement'].append(current_state['claim'])
-                current_state['service'] = None 
-                current_state['claim'] = Claim()
-                current_state['claim'].update(segment)
-            elif segment.id == 'SVC':
-                if current_state['service'] is not None:
-                    current_state['claim'].append(current_state['service'])
-                current_state['service'] = Service()
-                current_state['service'].update(segment)
-            elif segment.id == 'SE': # End of a statement
-                
-                current_state['statement'].update(segment)
-                current_state['functional_group'].append(current_state['statement'])
-                current_state['statement'] = None
-                current_state['claim'] = None 
-                current_state['service'] = None  
-            elif segment.id == 'GE': # End of a functional group
-                
-                current_state['functional_group'].update(segment)
-                current_state['header'].append(current_state['functional_group'])
-                current_state['functional_group'] = None
-                current_state['statement'] = None
-                current_state['claim'] = None 
-                current_state['service'] = None  
-
+        for x12_segment in reader.iter_segments():
+            seg_id = x12_segment.id
+            segment = state.segment(x12_segment)
+            if seg_id == 'GS':  # Begin functional group
+                state.open(FUNCTIONAL_GROUP)
+                level = FUNCTIONAL_GROUP
+            elif seg_id == 'ST':  # Begin statement
+                state.open(STATEMENT)
+                level = STATEMENT
+            elif seg_id == 'CLP':
+                state.open(CLAIM)
+                level = CLAIM
+            elif seg_id == 'SVC':
+                state.open(SERVICE)
+                level = SERVICE
+            elif seg_id == 'SE':  # End of a statement
+                level = STATEMENT
+            elif seg_id == 'GE':  # End of a functional group
+                level = FUNCTIONAL_GROUP
             else:
-                if current_state['service'] is not None:
-                    current_state['service'].update(segment)
-                elif current_state['claim'] is not None:
-                    current_state['claim'].update(segment)
-                elif current_state['statement'] is not None:
-                    current_state['statement'].update(segment)
-                elif current_state['functional_group'] is not None:
-                    current_state['functional_group'].update(segment)
-                else: current_state['header'].update(segment)
-
-        self.HEADER = current_state['header']
-
-        # Generate pandas dataframes
-        class PandasClass:
-            def __init__(self,header):
-                self.HEADER = [] 
-                self.FUNCTIONAL_GROUPS = [] 
-                self.STATEMENTS = [] 
-                self.CLAIMS = [] 
-                self.SERVICES = [] 
-                self.generate_dfs(header)
-
-            def generate_dfs(self,header):
-                header_id = header.header_id
-                for seg_head in header.segments:
-                    head_data = []
-                    for seg_el in seg_head.elements:
-                        el = {'header_id': header_id,'id':seg_el.id,'name':seg_el.name,'value':seg_el.value}
-                        head_data.append(el)
-                    head_df = pd.DataFrame(head_data)
-                    if not head_df.empty:
-                        self.HEADER.append(head_df)
-                for group in header.FUNCTIONAL_GROUPS:
-                    functional_group_id = group.functional_group_id
-
-                    for seg_group in group.segments:
-                        group_data =[]
-                        for seg_el in seg_group.elements:
-                            el = {'header_id': header_id, 'functional_group_id': functional_group_id,'id':seg_el.id,'name':seg_el.name,'value':seg_el.value}
-                            group_data.append(el)
-                        group_df = pd.DataFrame(group_data)
-                        if not group_df.empty:
-                            self.FUNCTIONAL_GROUPS.append(group_df)
-
-                    for statement in group.STATEMENTS:
-                        statement_id = statement.statement_id 
-                        for seg_statement in statement.segments:
-                            statement_data = []
-                            for seg_el in seg_statement.elements:
-                                el = {'header_id': header_id, 'functional_group_id': functional_group_id,'statement_id':statement_id,'id':seg_el.id,'name':seg_el.name,'value':seg_el.value}
-                                statement_data.append(el)
-                            statement_df = pd.DataFrame(statement_data)
-                            if not statement_df.empty:
-                                self.STATEMENTS.append(statement_df)
-
-                        for claim in statement.CLAIMS:
-                            claim_id = claim.claim_id
-                            for seg_claim in claim.segments:
-                                claim_data = []
-                                for seg_el in seg_claim.elements:
-                                    el = {'header_id': header_id, 'functional_group_id': functional_group_id,'statement_id':statement_id,'claim_id':claim_id,'id':seg_el.id,'name':seg_el.name,'value':seg_el.value}
-                                    claim_data.append(el)
-                                claim_df = pd.DataFrame(claim_data)
-                                if not claim_df.empty:
-                                    self.CLAIMS.append(claim_df)
-
-                            for service in claim.SERVICES:
-                                service_id = service.service_id
-                                for seg_service in service.segments:
-                                    service_data = []
-                                    for seg_el in seg_service.elements:
-                                        el = {'header_id': header_id, 'functional_group_id': functional_group_id,'statement_id':statement_id,'claim_id':claim_id,'service_id':service_id,'id':seg_el.id,'name':seg_el.name,'value':seg_el.value}
-                                        service_data.append(el)
-                                    service_df = pd.DataFrame(service_data)
-                                    if not service_df.empty:
-                                        self.SERVICES.append(service_df)
-                self.HEADER = pd.concat(self.HEADER,ignore_index=True)
-                self.FUNCTIONAL_GROUPS = pd.concat(self.FUNCTIONAL_GROUPS,ignore_index=True)
-                self.STATEMENTS = pd.concat(self.STATEMENTS,ignore_index=True)
-                self.CLAIMS = pd.concat(self.CLAIMS,ignore_index=True)
-                self.SERVICES = pd.concat(self.SERVICES,ignore_index=True)
-
-        self.pandas = PandasClass(self.HEADER)
-
-    def financial_report(self):
-        # Prepare header 
-        header = self.pandas.HEADER.copy()
-        header['id-name'] = 'HEADER ' + header['id']+' '+header['name']
-        header = header[['header_id','id-name','value']].pivot(
-            index='header_id',
-            columns='id-name',
-            values='value'
-        )
-
-        df = header
-
-        functional_groups = self.pandas.FUNCTIONAL_GROUPS.copy()
-        functional_groups['id-name'] = 'TRANSACTION ' + functional_groups['id']+' '+ functional_groups['name']
-        functional_groups = functional_groups[['header_id','functional_group_id','id-name','value']].pivot(
-            index = ['header_id','functional_group_id'],
-            columns = 'id-name',
-            values= 'value'
-        ).reset_index()
-
-        df = df.merge(
-            functional_groups,
-            on = ['header_id'],
-            how = 'left'
-        ).reset_index()
-
-        statements = self.pandas.STATEMENTS.copy()
-        if not statements.empty:
-            statements['id-name'] = 'STATEMENT ' + statements['id']+' '+statements['name']
-            statements = statements[['header_id','functional_group_id','statement_id','id-name','value']].pivot(
-                index = ['header_id','functional_group_id','statement_id'],
-                columns = 'id-name',
-                values = 'value'
-            ).reset_index()
-            df = df.merge(
-                statements,
-                on = ['header_id','functional_group_id'],
-                how = 'left'
-            ).reset_index()
-
-        claims = self.pandas.CLAIMS.copy()
-        if not claims.empty:
-            claims['id-name'] = 'CLAIM ' + claims['id']+' '+claims['name']
-            claims = claims[['header_id','functional_group_id','statement_id','claim_id','id-name','value']].pivot(
-                index = ['header_id','functional_group_id','statement_id','claim_id'],
-                columns = 'id-name',
-                values = 'value'
-            ).reset_index()
-
-            df = df.merge(
-                claims,
-                on = ['header_id','functional_group_id','statement_id'],
-                how = 'left'
-            )
-
-        services = self.pandas.SERVICES.copy()
-        if not services.empty:
-            services['id-name'] = 'SERVICE ' + services['id'] + ' ' + services['name']
-            services = services[['header_id','functional_group_id','statement_id','claim_id','service_id','id-name','value']].pivot(
-                index = ['header_id','functional_group_id','statement_id','claim_id','service_id'],
-                columns = 'id-name',
-                values = 'value'
-            ).reset_index()
-
-            df = df.merge(
-                services,
-                on = ['header_id','functional_group_id','statement_id','claim_id'],
-                how = 'left'
-            )
-
-        return df
-
+                # Everything else belongs to the deepest level open
+                level = state.current_level()
+            state.add(level, segment)
+            if seg_id in ('SE', 'GE'):
+                state.close(level)
+
+        self.pandas = PandasClass(state)
+
+    def financial_report(self, columns=None):
+        """
+        One wide row per service (or per claim, statement, ... where there is nothing below
+        it), with the ids of every level and a column per element label, e.g.
+        'CLAIM CLP04 Claim Payment Amount'. columns picks the elements to include, by id
+        ('CLP04', 'REF02-EA') or label; the id columns are always there.
+        """
+        tables = [getattr(self.pandas, name) for name in LEVEL_TABLES]
+        root, parent_ids = pivot_level(tables[HEADER], HEADER, columns)
+        levels = []
+        parent = root
+        for depth in range(FUNCTIONAL_GROUP, len(LEVEL_TABLES)):
+            # A level without rows has none below it either
+            if tables[depth].empty:
+                break
+            frame, parent_ids = pivot_level(tables[depth], depth, columns)
+            # Join by the row position of each parent rather than merging on the id columns
+            parent_positions = pd.Index(parent[LEVEL_IDS[depth - 1]]).get_indexer(parent_ids)
+            levels.append((frame, parent_positions, []))
+            parent = frame
+        return join_levels(root, levels)
+
+def pivot_level(table, depth, columns=None):
+    """
+    One row per entity of a level in file order, with its id and a column per element
+    label (the level's prefix, the element id and name) in sorted order, as a pivot would
+    give. An element repeated within an entity, e.g. the CAS03-CO of a claim's second
+    CAS*CO segment, gets a column of its own for each repeat: 'CLAIM CAS03-CO Adjustment
+    Amount', then 'CLAIM CAS03-CO Adjustment Amount (2)'. Also returns the parent id of
+    every row (None for the header).
+    """
+    level_id = LEVEL_IDS[depth]
+    row_codes, row_ids = pd.factorize(table[level_id], use_na_sentinel=False)
+    # The rows of an entity are all together, so its first row has its parent id
+    first_rows = np.unique(row_codes, return_index=True)[1]
+    parent_ids = table[LEVEL_IDS[depth - 1]].to_numpy()[first_rows] if depth else None
+
+    # Labels are worked out once per distinct (id, name) rather than once per row
+    id_codes, element_ids = pd.factorize(table['id'], use_na_sentinel=False)
+    name_codes, names = pd.factorize(table['name'], use_na_sentinel=False)
+    name_count = max(len(names), 1)
+    pair_codes, pairs = pd.factorize(id_codes * name_count + name_codes)
+    pair_ids = [element_ids[pair // name_count] for pair in pairs]
+    labels = [f'{REPORT_PREFIXES[depth]} {element_id} {names[pair % name_count]}' for element_id, pair in zip(pair_ids, pairs)]
+
+    # How many times each element has been seen before within its entity, in file order
+    repeats = pd.DataFrame({'row': row_codes, 'pair': pair_codes}).groupby(['row', 'pair'], sort=False).cumcount().to_numpy()
+    repeat_count = int(repeats.max(initial=0)) + 1
+    column_codes, column_keys = pd.factorize(pair_codes * repeat_count + repeats)
+    column_pairs = column_keys // repeat_count
+    column_labels = [
+        labels[pair] + (f' ({repeat + 1})' if repeat else '')
+        for pair, repeat in zip(column_pairs, column_keys % repeat_count)
+    ]
+    kept = [
+        column for column, pair in enumerate(column_pairs)
+        if columns is None or labels[pair] in columns or pair_ids[pair] in columns
+    ]
+    kept.sort(key=column_labels.__getitem__)
+    column_positions = np.full(len(column_labels), -1, dtype=np.int64)
+    column_positions[kept] = np.arange(len(kept))
+
+    width = len(kept)
+    column_codes = column_positions[column_codes]
+    selected = column_codes >= 0
+    # Every (entity, column) cell has one value now that repeats have columns of their own
+    cells = row_codes[selected] * width + column_codes[selected]
+    grid = np.full(len(row_ids) * width, np.nan, dtype=object)
+    grid[cells] = table['value'].to_numpy()[selected]
+    frame = pd.DataFrame(grid.reshape(len(row_ids), width), columns=[column_labels[column] for column in kept])
+    frame.insert(0, level_id, np.asarray(row_ids, dtype=object))
+    return frame, parent_ids
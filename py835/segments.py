@@ -0,0 +1,1120 @@
+from collections import namedtuple
+
+# Element ids and names for the 005010X221A1 (835) segments, taken from the pyx12
+# maps (see generate_elements below). The fast engine uses these in place of
+# pyx12's x12_map_node.children, so the same colnames come out of both engines.
+Element = namedtuple('Element', ['id', 'name'])
+
+ELEMENTS = {
+    'ISA': (
+        ('ISA01', 'Authorization Information Qualifier'),
+        ('ISA02', 'Authorization Information'),
+        ('ISA03', 'Security Information Qualifier'),
+        ('ISA04', 'Security Information'),
+        ('ISA05', 'Interchange Sender ID Qualifier'),
+        ('ISA06', 'Interchange Sender ID'),
+        ('ISA07', 'Interchange Receiver ID Qualifier'),
+        ('ISA08', 'Interchange Receiver ID'),
+        ('ISA09', 'Interchange Date'),
+        ('ISA10', 'Interchange Time'),
+        ('ISA11', 'Interchange Control Standards Identifier'),
+        ('ISA12', 'Interchange Control Version Number'),
+        ('ISA13', 'Interchange Control Number'),
+        ('ISA14', 'Acknowledgment Requested'),
+        ('ISA15', 'Usage Indicator'),
+        ('ISA16', 'Component Element Separator'),
+    ),
+    'GS': (
+        ('GS01', 'Functional Identifier Code'),
+        ('GS02', "Application Sender's Code"),
+        ('GS03', "Application Receiver's Code"),
+        ('GS04', 'Date'),
+        ('GS05', 'Time'),
+        ('GS06', 'Group Control Number'),
+        ('GS07', 'Responsible Agency Code'),
+        ('GS08', 'Version / Release / Industry Identifier Code'),
+    ),
+    'ST': (
+        ('ST01', 'Transaction Set Identifier Code'),
+        ('ST02', 'Transaction Set Control Number'),
+        ('ST03', 'Implementation Convention Reference'),
+    ),
+    'BPR': (
+        ('BPR01', 'Transaction Handling Code'),
+        ('BPR02', 'Total Actual Provider Payment Amount'),
+        ('BPR03', 'Credit or Debit Flag Code'),
+        ('BPR04', 'Payment Method Code'),
+        ('BPR05', 'Payment Format Code'),
+        ('BPR06', 'Depository Financial Institution (DFI) Identification Number Qualifier'),
+        ('BPR07', 'Sender DFI Identifier'),
+        ('BPR08', 'Account Number Qualifier'),
+        ('BPR09', 'Sender Bank Account Number'),
+        ('BPR10', 'Payer Identifier'),
+        ('BPR11', 'Originating Company Supplemental Code'),
+        ('BPR12', 'Depository Financial Institution (DFI) Identification Number Qualifier'),
+        ('BPR13', 'Receiver or Provider Bank ID Number'),
+        ('BPR14', 'Account Number Qualifier'),
+        ('BPR15', 'Receiver or Provider Account Number'),
+        ('BPR16', 'Check Issue or EFT Effective Date'),
+        ('BPR17', 'Business Function Code'),
+        ('BPR18', '(DFI) ID Number Qualifier'),
+        ('BPR19', '(DFI) Identification Number'),
+        ('BPR20', 'Account Number Qualifier'),
+        ('BPR21', 'Account Number'),
+    ),
+    'TRN': (
+        ('TRN01', 'Trace Type Code'),
+        ('TRN02', 'Check or EFT Trace Number'),
+        ('TRN03', 'Payer Identifier'),
+        ('TRN04', 'Originating Company Supplemental Code'),
+    ),
+    'CUR': (
+        ('CUR01', 'Entity Identifier Code'),
+        ('CUR02', 'Currency Code'),
+        ('CUR03', 'Exchange Rate'),
+        ('CUR04', 'Entity Identifier Code'),
+        ('CUR05', 'Currency Code'),
+        ('CUR06', 'Currency Market/Exchange Code'),
+        ('CUR07', 'Date/Time Qualifier'),
+        ('CUR08', 'Date'),
+        ('CUR09', 'Time'),
+        ('CUR10', 'Date/Time Qualifier'),
+        ('CUR11', 'Date'),
+        ('CUR12', 'Time'),
+        ('CUR13', 'Date/Time Qualifier'),
+        ('CUR14', 'Date'),
+        ('CUR15', 'Time'),
+        ('CUR16', 'Date/Time Qualifier'),
+        ('CUR17', 'Date'),
+        ('CUR18', 'Time'),
+        ('CUR19', 'Date/Time Qualifier'),
+        ('CUR20', 'Date'),
+        ('CUR21', 'Time'),
+    ),
+    'REF': (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Receiver Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    'DTM': (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Production Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    'N1': (
+        ('N101', 'Entity Identifier Code'),
+        ('N102', 'Payer Name'),
+        ('N103', 'Identification Code Qualifier'),
+        ('N104', 'Payer Identifier'),
+        ('N105', 'Entity Relationship Code'),
+        ('N106', 'Entity Identifier Code'),
+    ),
+    'N3': (
+        ('N301', 'Payer Address Line'),
+        ('N302', 'Payer Address Line'),
+    ),
+    'N4': (
+        ('N401', 'Payer City Name'),
+        ('N402', 'Payer State Code'),
+        ('N403', 'Payer Postal Zone or ZIP Code'),
+        ('N404', 'Country Code'),
+        ('N405', 'Location Qualifier'),
+        ('N406', 'Location Identifier'),
+        ('N407', 'Country Subdivision Code'),
+    ),
+    'PER': (
+        ('PER01', 'Contact Function Code'),
+        ('PER02', 'Payer Contact Name'),
+        ('PER03', 'Communication Number Qualifier'),
+        ('PER04', 'Payer Contact Communication Number'),
+        ('PER05', 'Communication Number Qualifier'),
+        ('PER06', 'Payer Contact Communication Number'),
+        ('PER07', 'Communication Number Qualifier'),
+        ('PER08', 'Payer Contact Communication Number'),
+        ('PER09', 'Contact Inquiry Reference'),
+    ),
+    'RDM': (
+        ('RDM01', 'Report Transmission Code'),
+        ('RDM02', 'Name'),
+        ('RDM03', 'Communication Number'),
+        ('RDM04', 'Reference Identifier'),
+        ('RDM05', 'Reference Identifier'),
+    ),
+    'LX': (
+        ('LX01', 'Assigned Number'),
+    ),
+    'TS3': (
+        ('TS301', 'Provider Identifier'),
+        ('TS302', 'Facility Type Code'),
+        ('TS303', 'Fiscal Period Date'),
+        ('TS304', 'Total Claim Count'),
+        ('TS305', 'Total Claim Charge Amount'),
+        ('TS306', 'Monetary Amount'),
+        ('TS307', 'Monetary Amount'),
+        ('TS308', 'Monetary Amount'),
+        ('TS309', 'Monetary Amount'),
+        ('TS310', 'Monetary Amount'),
+        ('TS311', 'Monetary Amount'),
+        ('TS312', 'Monetary Amount'),
+        ('TS313', 'Total MSP Payer Amount'),
+        ('TS314', 'Monetary Amount'),
+        ('TS315', 'Total Non-Lab Charge Amount'),
+        ('TS316', 'Monetary Amount'),
+        ('TS317', 'Total HCPCS Reported Charge Amount'),
+        ('TS318', 'Total HCPCS Payable Amount'),
+        ('TS319', 'Monetary Amount'),
+        ('TS320', 'Total Professional Component Amount'),
+        ('TS321', 'Total MSP Patient Liability Met Amount'),
+        ('TS322', 'Total Patient Reimbursement Amount'),
+        ('TS323', 'Total PIP Claim Count'),
+        ('TS324', 'Total PIP Adjustment Amount'),
+    ),
+    'TS2': (
+        ('TS201', 'Total DRG Amount'),
+        ('TS202', 'Total Federal Specific Amount'),
+        ('TS203', 'Total Hospital Specific Amount'),
+        ('TS204', 'Total Disproportionate Share Amount'),
+        ('TS205', 'Total Capital Amount'),
+        ('TS206', 'Total Indirect Medical Education Amount'),
+        ('TS207', 'Total Outlier Day Count'),
+        ('TS208', 'Total Day Outlier Amount'),
+        ('TS209', 'Total Cost Outlier Amount'),
+        ('TS210', 'Average DRG Length of Stay'),
+        ('TS211', 'Total Discharge Count'),
+        ('TS212', 'Total Cost Report Day Count'),
+        ('TS213', 'Total Covered Day Count'),
+        ('TS214', 'Total Noncovered Day Count'),
+        ('TS215', 'Total MSP Pass-Through Amount'),
+        ('TS216', 'Average DRG weight'),
+        ('TS217', 'Total PPS Capital FSP DRG Amount'),
+        ('TS218', 'Total PPS Capital HSP DRG Amount'),
+        ('TS219', 'Total PPS DSH DRG Amount'),
+    ),
+    'CLP': (
+        ('CLP01', 'Patient Control Number'),
+        ('CLP02', 'Claim Status Code'),
+        ('CLP03', 'Total Claim Charge Amount'),
+        ('CLP04', 'Claim Payment Amount'),
+        ('CLP05', 'Patient Responsibility Amount'),
+        ('CLP06', 'Claim Filing Indicator Code'),
+        ('CLP07', 'Payer Claim Control Number'),
+        ('CLP08', 'Facility Type Code'),
+        ('CLP09', 'Claim Frequency Code'),
+        ('CLP10', 'Patient Status Code'),
+        ('CLP11', 'Diagnosis Related Group (DRG) Code'),
+        ('CLP12', 'Diagnosis Related Group (DRG) Weight'),
+        ('CLP13', 'Discharge Fraction'),
+        ('CLP14', 'Yes/No Condition or Response Code'),
+    ),
+    'CAS': (
+        ('CAS01', 'Claim Adjustment Group Code'),
+        ('CAS02', 'Adjustment Reason Code'),
+        ('CAS03', 'Adjustment Amount'),
+        ('CAS04', 'Adjustment Quantity'),
+        ('CAS05', 'Adjustment Reason Code'),
+        ('CAS06', 'Adjustment Amount'),
+        ('CAS07', 'Adjustment Quantity'),
+        ('CAS08', 'Adjustment Reason Code'),
+        ('CAS09', 'Adjustment Amount'),
+        ('CAS10', 'Adjustment Quantity'),
+        ('CAS11', 'Adjustment Reason Code'),
+        ('CAS12', 'Adjustment Amount'),
+        ('CAS13', 'Adjustment Quantity'),
+        ('CAS14', 'Adjustment Reason Code'),
+        ('CAS15', 'Adjustment Amount'),
+        ('CAS16', 'Adjustment Quantity'),
+        ('CAS17', 'Adjustment Reason Code'),
+        ('CAS18', 'Adjustment Amount'),
+        ('CAS19', 'Adjustment Quantity'),
+    ),
+    'NM1': (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Patient Last Name'),
+        ('NM104', 'Patient First Name'),
+        ('NM105', 'Patient Middle Name or Initial'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Patient Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Patient Identifier'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    'MIA': (
+        ('MIA01', 'Covered Days or Visits Count'),
+        ('MIA02', 'PPS Operating Outlier Amount'),
+        ('MIA03', 'Lifetime Psychiatric Days Count'),
+        ('MIA04', 'Claim DRG Amount'),
+        ('MIA05', 'Claim Payment Remark Code'),
+        ('MIA06', 'Claim Disproportionate Share Amount'),
+        ('MIA07', 'Claim MSP Pass-through Amount'),
+        ('MIA08', 'Claim PPS Capital Amount'),
+        ('MIA09', 'PPS-Capital FSP DRG Amount'),
+        ('MIA10', 'PPS-Capital HSP DRG Amount'),
+        ('MIA11', 'PPS-Capital DSH DRG Amount'),
+        ('MIA12', 'Old Capital Amount'),
+        ('MIA13', 'PPS-Capital IME amount'),
+        ('MIA14', 'PPS-Operating Hospital Specific DRG Amount'),
+        ('MIA15', 'Cost Report Day Count'),
+        ('MIA16', 'PPS-Operating Federal Specific DRG Amount'),
+        ('MIA17', 'Claim PPS Capital Outlier Amount'),
+        ('MIA18', 'Claim Indirect Teaching Amount'),
+        ('MIA19', 'Nonpayable Professional Component Amount'),
+        ('MIA20', 'Claim Payment Remark Code'),
+        ('MIA21', 'Claim Payment Remark Code'),
+        ('MIA22', 'Claim Payment Remark Code'),
+        ('MIA23', 'Claim Payment Remark Code'),
+        ('MIA24', 'PPS-Capital Exception Amount'),
+    ),
+    'MOA': (
+        ('MOA01', 'Reimbursement Rate'),
+        ('MOA02', 'Claim HCPCS Payable Amount'),
+        ('MOA03', 'Claim Payment Remark Code'),
+        ('MOA04', 'Claim Payment Remark Code'),
+        ('MOA05', 'Claim Payment Remark Code'),
+        ('MOA06', 'Claim Payment Remark Code'),
+        ('MOA07', 'Claim Payment Remark Code'),
+        ('MOA08', 'Claim ESRD Payment Amount'),
+        ('MOA09', 'Nonpayable Professional Component Amount'),
+    ),
+    'AMT': (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Claim Supplemental Information Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    'QTY': (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Claim Supplemental Information Quantity'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+    'SVC': (
+        ('SVC01', 'Composite Medical Procedure Identifier'),
+        ('SVC02', 'Line Item Charge Amount'),
+        ('SVC03', 'Line Item Provider Payment Amount'),
+        ('SVC04', 'National Uniform Billing Committee Revenue Code'),
+        ('SVC05', 'Units of Service Paid Count'),
+        ('SVC06', 'Composite Medical Procedure Identifier'),
+        ('SVC07', 'Original Units of Service Count'),
+    ),
+    'LQ': (
+        ('LQ01', 'Code List Qualifier Code'),
+        ('LQ02', 'Remark Code'),
+    ),
+    'PLB': (
+        ('PLB01', 'Provider Identifier'),
+        ('PLB02', 'Fiscal Period Date'),
+        ('PLB03', 'Adjustment Identifier'),
+        ('PLB04', 'Provider Adjustment Amount'),
+        ('PLB05', 'Adjustment Identifier'),
+        ('PLB06', 'Provider Adjustment Amount'),
+        ('PLB07', 'Adjustment Identifier'),
+        ('PLB08', 'Provider Adjustment Amount'),
+        ('PLB09', 'Adjustment Identifier'),
+        ('PLB10', 'Provider Adjustment Amount'),
+        ('PLB11', 'Adjustment Identifier'),
+        ('PLB12', 'Provider Adjustment Amount'),
+        ('PLB13', 'Adjustment Identifier'),
+        ('PLB14', 'Provider Adjustment Amount'),
+    ),
+    'SE': (
+        ('SE01', 'Transaction Segment Count'),
+        ('SE02', 'Transaction Set Control Number'),
+    ),
+    'GE': (
+        ('GE01', 'Number of Transaction Sets Included'),
+        ('GE02', 'Group Control Number'),
+    ),
+    'TA1': (
+        ('TA101', 'Interchange Control Number'),
+        ('TA102', 'Interchange Date'),
+        ('TA103', 'Interchange Time'),
+        ('TA104', 'Interchange Acknowledgement Code'),
+        ('TA105', 'Interchange Note Code'),
+    ),
+    'IEA': (
+        ('IEA01', 'Number of Included Functional Groups'),
+        ('IEA02', 'Interchange Control Number'),
+    ),
+}
+
+QUALIFIED_ELEMENTS = {
+    ('REF', 'F2'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Version Identification Code'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '2U'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payer Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'EO'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payer Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'HI'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payer Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'NF'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payer Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('PER', 'BL'): (
+        ('PER01', 'Contact Function Code'),
+        ('PER02', 'Payer Technical Contact Name'),
+        ('PER03', 'Communication Number Qualifier'),
+        ('PER04', 'Payer Contact Communication Number'),
+        ('PER05', 'Communication Number Qualifier'),
+        ('PER06', 'Payer Technical Contact Communication Number'),
+        ('PER07', 'Communication Number Qualifier'),
+        ('PER08', 'Payer Contact Communication Number'),
+        ('PER09', 'Contact Inquiry Reference'),
+    ),
+    ('PER', 'IC'): (
+        ('PER01', 'Contact Function Code'),
+        ('PER02', 'Name'),
+        ('PER03', 'Communication Number Qualifier'),
+        ('PER04', 'Communication Number'),
+        ('PER05', 'Communication Number Qualifier'),
+        ('PER06', 'Communication Number'),
+        ('PER07', 'Communication Number Qualifier'),
+        ('PER08', 'Communication Number'),
+        ('PER09', 'Contact Inquiry Reference'),
+    ),
+    ('N1', 'PE'): (
+        ('N101', 'Entity Identifier Code'),
+        ('N102', 'Payee Name'),
+        ('N103', 'Identification Code Qualifier'),
+        ('N104', 'Payee Identification Code'),
+        ('N105', 'Entity Relationship Code'),
+        ('N106', 'Entity Identifier Code'),
+    ),
+    ('REF', '0B'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payee Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'D3'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payee Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'PQ'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payee Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'TJ'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Additional Payee Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('NM1', 'IL'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Subscriber Last Name'),
+        ('NM104', 'Subscriber First Name'),
+        ('NM105', 'Subscriber Middle Name or Initial'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Subscriber Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Subscriber Identifier'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('NM1', '74'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Corrected Patient or Insured Last Name'),
+        ('NM104', 'Corrected Patient or Insured First Name'),
+        ('NM105', 'Corrected Patient or Insured Middle Name'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Corrected Patient or Insured Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Corrected Insured Identification Indicator'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('NM1', '82'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Rendering Provider Last or Organization Name'),
+        ('NM104', 'Rendering Provider First Name'),
+        ('NM105', 'Rendering Provider Middle Name or Initial'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Rendering Provider Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Rendering Provider Identifier'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('NM1', 'TT'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Coordination of Benefits Carrier Name'),
+        ('NM104', 'Name First'),
+        ('NM105', 'Name Middle'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Coordination of Benefits Carrier Identifier'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('NM1', 'PR'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Corrected Priority Payer Name'),
+        ('NM104', 'Name First'),
+        ('NM105', 'Name Middle'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Corrected Priority Payer Identification Number'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('NM1', 'GB'): (
+        ('NM101', 'Entity Identifier Code'),
+        ('NM102', 'Entity Type Qualifier'),
+        ('NM103', 'Other Subscriber Last Name'),
+        ('NM104', 'Other Subscriber First Name'),
+        ('NM105', 'Other Subscriber Middle Name or Initial'),
+        ('NM106', 'Name Prefix'),
+        ('NM107', 'Other Subscriber Name Suffix'),
+        ('NM108', 'Identification Code Qualifier'),
+        ('NM109', 'Other Subscriber Identifier'),
+        ('NM110', 'Entity Relationship Code'),
+        ('NM111', 'Entity Identifier Code'),
+        ('NM112', 'Name Last or Organization Name'),
+    ),
+    ('REF', '1L'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1W'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '28'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '6P'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '9A'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '9C'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'BB'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'CE'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'EA'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'F8'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'G1'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'G3'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'IG'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'SY'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Other Claim Related Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1A'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1B'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1C'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1D'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1G'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1H'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '1J'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'G2'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'LU'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Secondary Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('DTM', '232'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Claim Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('DTM', '233'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Claim Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('DTM', '036'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('DTM', '050'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('PER', 'CX'): (
+        ('PER01', 'Contact Function Code'),
+        ('PER02', 'Claim Contact Name'),
+        ('PER03', 'Communication Number Qualifier'),
+        ('PER04', 'Claim Contact Communications Number'),
+        ('PER05', 'Communication Number Qualifier'),
+        ('PER06', 'Claim Contact Communications Number'),
+        ('PER07', 'Communication Number Qualifier'),
+        ('PER08', 'Communication Number Extension'),
+        ('PER09', 'Contact Inquiry Reference'),
+    ),
+    ('DTM', '150'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Service Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('DTM', '151'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Service Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('DTM', '472'): (
+        ('DTM01', 'Date Time Qualifier'),
+        ('DTM02', 'Service Date'),
+        ('DTM03', 'Time'),
+        ('DTM04', 'Time Code'),
+        ('DTM05', 'Date Time Period Format Qualifier'),
+        ('DTM06', 'Date Time Period'),
+    ),
+    ('REF', '1S'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Provider Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'APC'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Provider Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'E9'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Provider Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'RB'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Provider Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '6R'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Line Item Control Number'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', 'HPI'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Rendering Provider Identifier'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('REF', '0K'): (
+        ('REF01', 'Reference Identification Qualifier'),
+        ('REF02', 'Healthcare Policy Identification'),
+        ('REF03', 'Description'),
+        ('REF04', 'Reference Identifier'),
+    ),
+    ('AMT', 'B6'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'KH'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'T'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'T2'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'ZK'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'ZL'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'ZM'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'ZN'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('AMT', 'ZO'): (
+        ('AMT01', 'Amount Qualifier Code'),
+        ('AMT02', 'Service Supplemental Amount'),
+        ('AMT03', 'Credit/Debit Flag Code'),
+    ),
+    ('QTY', 'ZK'): (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Service Supplemental Quantity Count'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+    ('QTY', 'ZL'): (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Service Supplemental Quantity Count'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+    ('QTY', 'ZM'): (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Service Supplemental Quantity Count'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+    ('QTY', 'ZN'): (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Service Supplemental Quantity Count'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+    ('QTY', 'ZO'): (
+        ('QTY01', 'Quantity Qualifier'),
+        ('QTY02', 'Service Supplemental Quantity Count'),
+        ('QTY03', 'Composite Unit of Measure'),
+        ('QTY04', 'Free-form Information'),
+    ),
+}
+
+# X12 data type and maximum length of the elements typed=True converts: R (decimal amounts),
+# DT (dates) and ID (codes from a code list). Generated by generate_element_types below.
+TYPED_DATA_TYPES = ('R', 'DT', 'ID')
+ELEMENT_TYPES = {
+    'AMT01': ('ID', 3),
+    'AMT02': ('R', 18),
+    'AMT03': ('ID', 1),
+    'BPR01': ('ID', 2),
+    'BPR02': ('R', 18),
+    'BPR03': ('ID', 1),
+    'BPR04': ('ID', 3),
+    'BPR05': ('ID', 10),
+    'BPR06': ('ID', 2),
+    'BPR08': ('ID', 3),
+    'BPR12': ('ID', 2),
+    'BPR14': ('ID', 3),
+    'BPR16': ('DT', 8),
+    'BPR17': ('ID', 3),
+    'BPR18': ('ID', 2),
+    'BPR20': ('ID', 3),
+    'CAS01': ('ID', 2),
+    'CAS02': ('ID', 5),
+    'CAS03': ('R', 18),
+    'CAS04': ('R', 15),
+    'CAS05': ('ID', 5),
+    'CAS06': ('R', 18),
+    'CAS07': ('R', 15),
+    'CAS08': ('ID', 5),
+    'CAS09': ('R', 18),
+    'CAS10': ('R', 15),
+    'CAS11': ('ID', 5),
+    'CAS12': ('R', 18),
+    'CAS13': ('R', 15),
+    'CAS14': ('ID', 5),
+    'CAS15': ('R', 18),
+    'CAS16': ('R', 15),
+    'CAS17': ('ID', 5),
+    'CAS18': ('R', 18),
+    'CAS19': ('R', 15),
+    'CLP02': ('ID', 2),
+    'CLP03': ('R', 18),
+    'CLP04': ('R', 18),
+    'CLP05': ('R', 18),
+    'CLP06': ('ID', 2),
+    'CLP09': ('ID', 1),
+    'CLP10': ('ID', 2),
+    'CLP11': ('ID', 4),
+    'CLP12': ('R', 15),
+    'CLP13': ('R', 10),
+    'CLP14': ('ID', 1),
+    'CUR01': ('ID', 3),
+    'CUR02': ('ID', 3),
+    'CUR03': ('R', 10),
+    'CUR04': ('ID', 3),
+    'CUR05': ('ID', 3),
+    'CUR06': ('ID', 3),
+    'CUR07': ('ID', 3),
+    'CUR08': ('DT', 8),
+    'CUR10': ('ID', 3),
+    'CUR11': ('DT', 8),
+    'CUR13': ('ID', 3),
+    'CUR14': ('DT', 8),
+    'CUR16': ('ID', 3),
+    'CUR17': ('DT', 8),
+    'CUR19': ('ID', 3),
+    'CUR20': ('DT', 8),
+    'DTM01': ('ID', 3),
+    'DTM02': ('DT', 8),
+    'DTM04': ('ID', 2),
+    'DTM05': ('ID', 3),
+    'GS01': ('ID', 2),
+    'GS04': ('DT', 8),
+    'GS07': ('ID', 2),
+    'ISA01': ('ID', 2),
+    'ISA03': ('ID', 2),
+    'ISA05': ('ID', 2),
+    'ISA07': ('ID', 2),
+    'ISA09': ('DT', 6),
+    'ISA12': ('ID', 5),
+    'ISA14': ('ID', 1),
+    'ISA15': ('ID', 1),
+    'LQ01': ('ID', 3),
+    'MIA01': ('R', 15),
+    'MIA02': ('R', 18),
+    'MIA03': ('R', 15),
+    'MIA04': ('R', 18),
+    'MIA06': ('R', 18),
+    'MIA07': ('R', 18),
+    'MIA08': ('R', 18),
+    'MIA09': ('R', 18),
+    'MIA10': ('R', 18),
+    'MIA11': ('R', 18),
+    'MIA12': ('R', 18),
+    'MIA13': ('R', 18),
+    'MIA14': ('R', 18),
+    'MIA15': ('R', 15),
+    'MIA16': ('R', 18),
+    'MIA17': ('R', 18),
+    'MIA18': ('R', 18),
+    'MIA19': ('R', 18),
+    'MIA24': ('R', 18),
+    'MOA01': ('R', 10),
+    'MOA02': ('R', 18),
+    'MOA08': ('R', 18),
+    'MOA09': ('R', 18),
+    'N101': ('ID', 3),
+    'N103': ('ID', 2),
+    'N105': ('ID', 2),
+    'N106': ('ID', 3),
+    'N402': ('ID', 2),
+    'N403': ('ID', 15),
+    'N404': ('ID', 3),
+    'N405': ('ID', 2),
+    'N407': ('ID', 3),
+    'NM101': ('ID', 3),
+    'NM102': ('ID', 1),
+    'NM108': ('ID', 2),
+    'NM110': ('ID', 2),
+    'NM111': ('ID', 3),
+    'PER01': ('ID', 2),
+    'PER03': ('ID', 2),
+    'PER05': ('ID', 2),
+    'PER07': ('ID', 2),
+    'PLB02': ('DT', 8),
+    'PLB04': ('R', 18),
+    'PLB06': ('R', 18),
+    'PLB08': ('R', 18),
+    'PLB10': ('R', 18),
+    'PLB12': ('R', 18),
+    'PLB14': ('R', 18),
+    'QTY01': ('ID', 2),
+    'QTY02': ('R', 15),
+    'RDM01': ('ID', 2),
+    'REF01': ('ID', 3),
+    'ST01': ('ID', 3),
+    'SVC02': ('R', 18),
+    'SVC03': ('R', 18),
+    'SVC05': ('R', 15),
+    'SVC07': ('R', 15),
+    'TA102': ('DT', 6),
+    'TA104': ('ID', 1),
+    'TA105': ('ID', 3),
+    'TRN01': ('ID', 2),
+    'TS201': ('R', 18),
+    'TS202': ('R', 18),
+    'TS203': ('R', 18),
+    'TS204': ('R', 18),
+    'TS205': ('R', 18),
+    'TS206': ('R', 18),
+    'TS207': ('R', 15),
+    'TS208': ('R', 18),
+    'TS209': ('R', 18),
+    'TS210': ('R', 15),
+    'TS211': ('R', 15),
+    'TS212': ('R', 15),
+    'TS213': ('R', 15),
+    'TS214': ('R', 15),
+    'TS215': ('R', 18),
+    'TS216': ('R', 15),
+    'TS217': ('R', 18),
+    'TS218': ('R', 18),
+    'TS219': ('R', 18),
+    'TS303': ('DT', 8),
+    'TS304': ('R', 15),
+    'TS305': ('R', 18),
+    'TS306': ('R', 18),
+    'TS307': ('R', 18),
+    'TS308': ('R', 18),
+    'TS309': ('R', 18),
+    'TS310': ('R', 18),
+    'TS311': ('R', 18),
+    'TS312': ('R', 18),
+    'TS313': ('R', 18),
+    'TS314': ('R', 18),
+    'TS315': ('R', 18),
+    'TS316': ('R', 18),
+    'TS317': ('R', 18),
+    'TS318': ('R', 18),
+    'TS319': ('R', 18),
+    'TS320': ('R', 18),
+    'TS321': ('R', 18),
+    'TS322': ('R', 18),
+    'TS323': ('R', 15),
+    'TS324': ('R', 18),
+}
+
+# Wrap the raw tuples once so callers can use child.id / child.name like pyx12 nodes.
+ELEMENTS = {
+    seg_id: tuple(Element(*child) for child in children)
+    for seg_id, children in ELEMENTS.items()
+}
+QUALIFIED_ELEMENTS = {
+    key: tuple(Element(*child) for child in children)
+    for key, children in QUALIFIED_ELEMENTS.items()
+}
+
+def get_elements(seg_id, qualifier=None):
+    """Return the elements of a segment, using the loop specific names for the qualifier if there are any."""
+    children = QUALIFIED_ELEMENTS.get((seg_id, qualifier))
+    if children is None:
+        children = ELEMENTS.get(seg_id)
+    return children
+
+class SegmentSchema:
+    """
+    What parse() needs to know about one segment layout: the element ids, their positions
+    in the raw segment and the column names they turn into. Built once per map node (or per
+    segment id and qualifier in the fast engine) and reused for every segment like it.
+    """
+    def __init__(self, seg_id, children):
+        self.seg_id = seg_id
+        self.children = tuple(children)
+        self.ids = [child.id for child in self.children]
+        # Position of each element in the segment, e.g. CLP07 -> 6
+        self.positions = [int(child.id[len(seg_id):]) - 1 for child in self.children]
+        self.padding = [None] * len(self.children)
+        self._keys = {}
+        self._labels = {}
+
+    def keys(self, suffix=''):
+        """Element ids with a suffix added, e.g. NM101-QC or AMT01-Claim."""
+        keys = self._keys.get(suffix)
+        if keys is None:
+            keys = self._keys[suffix] = [id + suffix for id in self.ids]
+        return keys
+
+    def labels(self, suffix='', description=None):
+        """Descriptive label for each suffixed element id, e.g. {'NM103-QC': 'NM103-QC-Patient Last Name'}."""
+        labels = self._labels.get((suffix, description))
+        if labels is None:
+            if description is None:
+                labels = {key: key + '-' + child.name for key, child in zip(self.keys(suffix), self.children)}
+            else:
+                labels = {key: key + description for key in self.keys(suffix)}
+            self._labels[(suffix, description)] = labels
+        return labels
+
+def iter_segment_nodes(node):
+    """The segment nodes of a pyx12 map node, in map order, going down into its loops."""
+    for pos in sorted(node.pos_map):
+        for child in node.pos_map[pos]:
+            if child.is_segment():
+                yield child
+            elif child.is_loop():
+                yield from iter_segment_nodes(child)
+
+def generate_elements(map_file='835.5010.X221.A1.xml', control_map_file='x12.control.00501.xml'):
+    import pyx12.map_if
+    import pyx12.params
+
+    params = pyx12.params.params()
+    elements = {}
+    qualified_elements = {}
+    # pyx12 reads the ISA segment with the interchange control map and everything else with the 835 map
+    for seg_node in iter_segment_nodes(pyx12.map_if.load_map_file(control_map_file, params)):
+        if seg_node.id == 'ISA':
+            elements['ISA'] = tuple((child.id, child.name) for child in seg_node.children)
+    x12_map = pyx12.map_if.load_map_file(map_file, params)
+    for seg_node in iter_segment_nodes(x12_map):
+        if seg_node.id == 'ISA':
+            continue
+        children = tuple((child.id, child.name) for child in seg_node.children)
+        elements.setdefault(seg_node.id, children)
+        # Segments that repeat in several loops are told apart by their qualifier (first element)
+        if children != elements[seg_node.id]:
+            for code in getattr(seg_node.children[0], 'valid_codes', None) or []:
+                qualified_elements.setdefault((seg_node.id, code), children)
+    return elements, qualified_elements
+
+def generate_element_types(map_file='835.5010.X221.A1.xml', control_map_file='x12.control.00501.xml'):
+    import pyx12.map_if
+    import pyx12.params
+
+    params = pyx12.params.params()
+    element_types = {}
+    for file_name in (control_map_file, map_file):
+        for seg_node in iter_segment_nodes(pyx12.map_if.load_map_file(file_name, params)):
+            for child in seg_node.children:
+                # Composites (e.g. SVC01) and free text stay as strings
+                if child.is_element() and child.data_type in TYPED_DATA_TYPES:
+                    element_types.setdefault(child.id, (child.data_type, child.max_len))
+    return element_types
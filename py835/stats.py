@@ -0,0 +1,129 @@
+import time
+from collections import defaultdict
+
+# Stages of a parse, in the order they run
+PARSE_STAGES = ['read', 'context', 'segments', 'records', 'index']
+
+class ParseStats:
+    """
+    Counts and timings of one Parser, kept when it is created with stats=True:
+    bytes read, segments by seg_id, seconds per stage, per segment handler and per table
+    view, rows per table, the largest lists of a single claim, and throughput.
+    Timing takes two clock reads per segment, so it can stay on in production runs.
+    to_dict() gives everything as plain numbers and dicts, e.g. for a metrics pipeline.
+
+    Stages:
+    - read: reading the file into memory (keep_raw=True only)
+    - context: setting up the pyx12 reader (pyx12 engine only)
+    - segments: reading and tokenizing the segments, by pyx12 or the fast tokenizer
+    - records: turning segments into rows (iter_records and parse), per seg_id in handler_seconds
+    - index: lining the rows up with their parents once the walk is done
+    """
+    def __init__(self):
+        self.bytes_read = 0
+        self.stage_seconds = dict.fromkeys(PARSE_STAGES, 0.0)
+        # defaultdict rather than Counter: its += is several times faster, which matters once per segment
+        self.segment_counts = defaultdict(int)
+        self.handler_seconds = defaultdict(float)
+        # Seconds spent building each table view; a view includes the views it is built from
+        self.view_seconds = defaultdict(float)
+        self.table_rows = {}
+        # Largest number of rows a single claim record held, e.g. services per claim
+        self.peak_record_sizes = {}
+
+    def __repr__(self):
+        return f'ParseStats({self.segments} segments, {self.claims} claims, {self.parse_seconds:.3f}s)'
+
+    def start_parse(self):
+        """Forget the counts of an earlier parse; the time spent reading the file is kept."""
+        for stage in PARSE_STAGES[1:]:
+            self.stage_seconds[stage] = 0.0
+        self.segment_counts.clear()
+        self.handler_seconds.clear()
+        self.view_seconds.clear()
+        self.table_rows.clear()
+        self.peak_record_sizes.clear()
+
+    def add_time(self, stage, seconds):
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def count_segments(self, segments):
+        """
+        Pass the segments through, counting them by seg_id. The time until a segment arrives
+        is reading/tokenizing it; the time until the next one is asked for is spent handling it.
+        """
+        clock = time.perf_counter
+        segment_counts = self.segment_counts
+        handler_seconds = self.handler_seconds
+        segments = iter(segments)
+        producing = 0.0
+        started = clock()
+        try:
+            for segment in segments:
+                arrived = clock()
+                producing += arrived - started
+                seg_id = segment[0]
+                segment_counts[seg_id] += 1
+                yield segment
+                started = clock()
+                handler_seconds[seg_id] += started - arrived
+            producing += clock() - started
+        finally:
+            # The pyx12 reader is set up while the first segment is asked for
+            self.add_time('segments', producing - self.stage_seconds.get('context', 0.0))
+            self.add_time('records', sum(handler_seconds.values()))
+
+    def merge(self, other):
+        """
+        Add the counts and timings of another parse, e.g. of a part of the file parsed in a
+        worker process. Stage seconds then add up the time spent in every process.
+        """
+        for stage, seconds in other.stage_seconds.items():
+            self.add_time(stage, seconds)
+        for seg_id, count in other.segment_counts.items():
+            self.segment_counts[seg_id] += count
+        for seg_id, seconds in other.handler_seconds.items():
+            self.handler_seconds[seg_id] += seconds
+        for key, size in other.peak_record_sizes.items():
+            if size > self.peak_record_sizes.get(key, 0):
+                self.peak_record_sizes[key] = size
+
+    def count_record(self, record):
+        # Only called once per claim, with the claim's lists of rows
+        peaks = self.peak_record_sizes
+        for key, rows in record.items():
+            if key != 'claim' and len(rows) > peaks.get(key, 0):
+                peaks[key] = len(rows)
+
+    @property
+    def segments(self):
+        return sum(self.segment_counts.values())
+
+    @property
+    def claims(self):
+        return self.table_rows.get('claims', 0)
+
+    @property
+    def parse_seconds(self):
+        return sum(self.stage_seconds.get(stage, 0.0) for stage in PARSE_STAGES)
+
+    def per_second(self, count):
+        seconds = self.parse_seconds
+        return count / seconds if seconds > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'bytes_read': self.bytes_read,
+            'segments': self.segments,
+            'claims': self.claims,
+            'parse_seconds': self.parse_seconds,
+            'segments_per_second': self.per_second(self.segments),
+            'claims_per_second': self.per_second(self.claims),
+            'bytes_per_second': self.per_second(self.bytes_read),
+            'stage_seconds': dict(self.stage_seconds),
+            'segment_counts': dict(self.segment_counts),
+            'handler_seconds': dict(self.handler_seconds),
+            'view_seconds': dict(self.view_seconds),
+            'table_rows': dict(self.table_rows),
+            'peak_record_sizes': dict(self.peak_record_sizes)
+        }
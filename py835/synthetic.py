@@ -0,0 +1,242 @@
+import datetime
+import random
+
+# Synthetic X12 5010 835 (005010X221A1) remittances for benchmarks and load tests.
+# Amounts balance the way a real remittance does: every service's charge minus its adjustments
+# is its payment, a claim's charge and payment are the totals of its services, its patient
+# responsibility is the total of its PR adjustments, and BPR02 is the total paid in the statement.
+
+# (code, weight) pairs, roughly how often each one shows up in real remittances
+CLAIM_STATUS_CODES = [('1', 78), ('2', 8), ('3', 1), ('4', 9), ('22', 4)]
+CLAIM_FILING_CODES = [('12', 20), ('MB', 25), ('MC', 20), ('HM', 20), ('15', 15)]
+ADJUSTMENT_GROUP_CODES = [('CO', 62), ('PR', 28), ('OA', 7), ('PI', 3)]
+ADJUSTMENT_REASON_CODES = {
+    'CO': [('45', 60), ('253', 14), ('97', 10), ('16', 4), ('50', 4), ('29', 3), ('B7', 2), ('197', 3)],
+    'PR': [('1', 38), ('2', 34), ('3', 26), ('96', 2)],
+    'OA': [('23', 65), ('18', 25), ('94', 10)],
+    'PI': [('45', 50), ('16', 30), ('B13', 20)]
+}
+# Reasons for a claim that is denied outright
+DENIAL_REASON_CODES = [('50', 35), ('16', 25), ('29', 15), ('197', 15), ('27', 10)]
+REMARK_CODES = [('N130', 30), ('M15', 15), ('N381', 15), ('MA130', 10), ('N290', 10), ('M80', 10), ('N20', 10)]
+PROCEDURE_CODES = [
+    ('HC:99213', 22), ('HC:99214', 18), ('HC:99203', 6), ('HC:36415', 10), ('HC:85025', 8),
+    ('HC:80053', 7), ('HC:93000', 5), ('HC:71046', 5), ('HC:97110', 6), ('HC:G0439', 3),
+    ('HC:J1885', 3), ('HC:99285', 4), ('AD:D0120', 2), ('AD:D1110', 1)
+]
+CLAIM_REF_QUALIFIERS = [('EA', 40), ('1L', 25), ('F8', 15), ('9A', 10), ('G1', 10)]
+SERVICE_REF_QUALIFIERS = [('6R', 70), ('LU', 15), ('G1', 10), ('0K', 5)]
+
+LAST_NAMES = ['SMITH', 'JOHNSON', 'GARCIA', 'MARTINEZ', 'BROWN', 'DAVIS', 'LOPEZ', 'WILSON', 'HERNANDEZ', 'MOORE']
+FIRST_NAMES = ['MARIA', 'JAMES', 'JOSE', 'LINDA', 'DAVID', 'ANA', 'JOHN', 'SUSAN', 'CARLOS', 'MARY']
+
+class Choices:
+    """Weighted choice over (code, weight) pairs, with the cumulative weights worked out once."""
+    def __init__(self, rng, pairs):
+        self.rng = rng
+        self.codes = [code for code, weight in pairs]
+        self.cum_weights = []
+        total = 0
+        for code, weight in pairs:
+            total += weight
+            self.cum_weights.append(total)
+
+    def __call__(self):
+        return self.rng.choices(self.codes, cum_weights=self.cum_weights)[0]
+
+def amount(cents):
+    """X12 decimal: no trailing zeros, e.g. 2500 -> '25', 2550 -> '25.5'."""
+    text = '%.2f' % (cents / 100)
+    return text.rstrip('0').rstrip('.') if '.' in text else text
+
+def segment(*elements):
+    # Trailing empty elements are left out, as the standard requires
+    elements = list(elements)
+    while elements and elements[-1] == '':
+        elements.pop()
+    return '*'.join(str(element) for element in elements)
+
+class RemittanceGenerator:
+    """
+    Writes synthetic 835 files. The counts are ranges (low, high) drawn from per claim or
+    per service, and the same seed always gives the same file.
+    """
+    def __init__(self, seed=0, services=(1, 6), service_adjustments=(0, 3), claim_adjustments=0.1,
+                 claim_refs=(0, 2), service_refs=(0, 1), remarks=0.1, date=datetime.date(2024, 1, 31)):
+        self.rng = random.Random(seed)
+        self.services = services
+        self.service_adjustments = service_adjustments
+        self.claim_adjustments = claim_adjustments
+        self.claim_refs = claim_refs
+        self.service_refs = service_refs
+        self.remarks = remarks
+        self.date = date
+        rng = self.rng
+        self.claim_status = Choices(rng, CLAIM_STATUS_CODES)
+        self.claim_filing = Choices(rng, CLAIM_FILING_CODES)
+        self.adjustment_group = Choices(rng, ADJUSTMENT_GROUP_CODES)
+        self.adjustment_reason = {group: Choices(rng, pairs) for group, pairs in ADJUSTMENT_REASON_CODES.items()}
+        self.denial_reason = Choices(rng, DENIAL_REASON_CODES)
+        self.remark = Choices(rng, REMARK_CODES)
+        self.procedure = Choices(rng, PROCEDURE_CODES)
+        self.claim_ref = Choices(rng, CLAIM_REF_QUALIFIERS)
+        self.service_ref = Choices(rng, SERVICE_REF_QUALIFIERS)
+        self.claim_number = 0
+
+    def write(self, output, statements=1, claims=100):
+        """
+        Write one interchange with one functional group of `statements` transaction sets and
+        `claims` claims spread evenly across them to an open text file.
+        Returns the number of segments written.
+        """
+        if statements < 1 or claims < 0:
+            raise ValueError('statements must be at least 1 and claims can not be negative.')
+        date = self.date
+        isa = (
+            'ISA*00*          *00*          *ZZ*' + 'PY835PAYER'.ljust(15) + '*ZZ*' + 'PY835PROVIDER'.ljust(15)
+            + '*' + date.strftime('%y%m%d') + '*1200*^*00501*000000001*0*P*:~'
+        )
+        output.write(isa + '\n')
+        output.write(segment('GS', 'HP', 'PY835PAYER', 'PY835PROVIDER', date.strftime('%Y%m%d'), '1200', '1', 'X', '005010X221A1') + '~\n')
+        written = 2
+        for statement in range(statements):
+            count = claims // statements + (1 if statement < claims % statements else 0)
+            segments = self.statement(statement + 1, count)
+            output.write('~\n'.join(segments) + '~\n')
+            written += len(segments)
+        output.write(segment('GE', statements, '1') + '~\n')
+        output.write(segment('IEA', '1', '000000001') + '~\n')
+        return written + 2
+
+    def statement(self, number, claims):
+        """The segments of one transaction set, ST to SE."""
+        date = self.date.strftime('%Y%m%d')
+        body = []
+        paid = 0
+        for line in range(claims):
+            claim_segments, claim_paid = self.claim()
+            if line % 1000 == 0:
+                # Claims are grouped under LX headers, up to a thousand per header here
+                body.append(segment('LX', line // 1000 + 1))
+            body.extend(claim_segments)
+            paid += claim_paid
+        control = '%04d' % number
+        header = [
+            segment('ST', '835', control),
+            segment('BPR', 'I' if paid > 0 else 'H', amount(max(paid, 0)), 'C', 'ACH', 'CCP', '01', '999999992', 'DA', '123456', '1512345678', '', '01', '999988880', 'DA', '98765', date),
+            segment('TRN', '1', '%010d' % (number * 7919), '1512345678'),
+            segment('REF', 'EV', 'PY835 CLEARINGHOUSE'),
+            segment('DTM', '405', date),
+            segment('N1', 'PR', 'SYNTHETIC HEALTH PLAN'),
+            segment('N3', '100 MAIN STREET'),
+            segment('N4', 'ANYTOWN', 'TX', '78501'),
+            segment('PER', 'BL', 'PROVIDER SERVICES', 'TE', '8005550100'),
+            segment('N1', 'PE', 'SYNTHETIC MEDICAL GROUP', 'XX', '1999999984'),
+            segment('REF', 'TJ', '741234567')
+        ]
+        segments = header + body
+        # SE01 counts every segment from ST to SE
+        segments.append(segment('SE', len(segments) + 1, control))
+        return segments
+
+    def claim(self):
+        """(segments of one claim, paid amount in cents)."""
+        rng = self.rng
+        self.claim_number += 1
+        status = self.claim_status()
+        denied = status == '4'
+        reversal = status == '22'
+        service_dates = self.date - datetime.timedelta(days=rng.randint(14, 120))
+        service_date = service_dates.strftime('%Y%m%d')
+
+        services = []
+        charge = paid = patient = 0
+        for index in range(rng.randint(*self.services)):
+            service_segments, service_charge, service_paid, service_patient = self.service(service_date, denied)
+            services.extend(service_segments)
+            charge += service_charge
+            paid += service_paid
+            patient += service_patient
+
+        claim_segments = []
+        if not denied and rng.random() < self.claim_adjustments:
+            # A claim level adjustment taken off the payment, e.g. a sequestration reduction
+            reduction = min(paid, rng.randint(1, 50) * 10)
+            if reduction:
+                claim_segments.append(segment('CAS', 'CO', '253', amount(reduction)))
+                paid -= reduction
+        sign = -1 if reversal else 1
+        last = rng.choice(LAST_NAMES)
+        first = rng.choice(FIRST_NAMES)
+        segments = [
+            segment('CLP', 'PCN%09d' % self.claim_number, status, amount(sign * charge), amount(sign * paid),
+                    amount(sign * patient) if patient else '', self.claim_filing(), '%014d' % (self.claim_number * 104729), '11', '1'),
+        ]
+        segments.extend(claim_segments)
+        segments.append(segment('NM1', 'QC', '1', last, first, '', '', '', 'MI', 'MBR%08d' % rng.randint(1, 99999999)))
+        if rng.random() < 0.3:
+            segments.append(segment('NM1', 'IL', '1', rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES), '', '', '', 'MI', 'SUB%08d' % rng.randint(1, 99999999)))
+        if rng.random() < 0.6:
+            segments.append(segment('NM1', '82', '1', 'PROVIDER', 'RENDERING', '', '', '', 'XX', '1%09d' % rng.randint(0, 999999999)))
+        for index in range(rng.randint(*self.claim_refs)):
+            segments.append(segment('REF', self.claim_ref(), '%010d' % rng.randint(0, 9999999999)))
+        if rng.random() < 0.3:
+            segments.append(segment('DTM', '232', service_date))
+            segments.append(segment('DTM', '233', service_date))
+        if rng.random() < 0.5:
+            segments.append(segment('DTM', '050', (service_dates + datetime.timedelta(days=7)).strftime('%Y%m%d')))
+        segments.append(segment('AMT', 'AU', amount(sign * charge)))
+        segments.extend(services)
+        return segments, sign * paid
+
+    def service(self, service_date, denied):
+        """(segments of one service line, charge, paid and patient responsibility in cents)."""
+        rng = self.rng
+        units = rng.choice([1, 1, 1, 1, 2, 3])
+        charge = rng.randint(20, 600) * 100 * units
+        # Adjustments as (group, reason, amount), together no more than the charge
+        adjustments = []
+        if denied:
+            adjustments.append(('CO', self.denial_reason(), charge))
+        else:
+            remaining = charge
+            for index in range(rng.randint(*self.service_adjustments)):
+                if not remaining:
+                    break
+                group = self.adjustment_group()
+                adjusted = rng.randint(1, max(1, remaining * 6 // 10))
+                adjustments.append((group, self.adjustment_reason[group](), adjusted))
+                remaining -= adjusted
+        paid = charge - sum(adjusted for group, reason, adjusted in adjustments)
+        patient = sum(adjusted for group, reason, adjusted in adjustments if group == 'PR')
+
+        segments = [segment('SVC', self.procedure(), amount(charge), amount(paid), '', units)]
+        segments.append(segment('DTM', '472', service_date))
+        # One CAS per group, with up to six reason triplets each and each reason once
+        by_group = {}
+        for group, reason, adjusted in adjustments:
+            reasons = by_group.setdefault(group, {})
+            reasons[reason] = reasons.get(reason, 0) + adjusted
+        by_group = {group: [(reason, amount(adjusted), '') for reason, adjusted in reasons.items()] for group, reasons in by_group.items()}
+        for group, triplets in by_group.items():
+            for start in range(0, len(triplets), 6):
+                elements = ['CAS', group]
+                for triplet in triplets[start:start + 6]:
+                    elements.extend(triplet)
+                segments.append(segment(*elements))
+        for index in range(rng.randint(*self.service_refs)):
+            segments.append(segment('REF', self.service_ref(), '%012d' % rng.randint(0, 999999999999)))
+        allowed = charge - sum(adjusted for group, reason, adjusted in adjustments if group != 'PR')
+        segments.append(segment('AMT', 'B6', amount(allowed)))
+        if rng.random() < self.remarks:
+            segments.append(segment('LQ', 'HE', self.remark()))
+        return segments, charge, paid, patient
+
+def generate_835(path, statements=1, claims=100, seed=0, **options):
+    """
+    Write a synthetic 835 to path and return the number of segments written. options are
+    passed to RemittanceGenerator, e.g. services=(1, 10) for one to ten services per claim.
+    """
+    generator = RemittanceGenerator(seed=seed, **options)
+    with open(path, 'w') as output:
+        return generator.write(output, statements=statements, claims=claims)
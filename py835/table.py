@@ -0,0 +1,203 @@
+from collections import deque
+from itertools import repeat
+import re
+from .lazy import LazyModule
+from .segments import ELEMENT_TYPES
+
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+
+class ColumnTable:
+    """
+    Rows stored column by column (a dict of lists), so a DataFrame can be built straight
+    from the columns instead of rediscovering them from a list of row dicts. Columns keep
+    the order they first appeared in; rows missing a column get None.
+    Iterating (or records()) still gives one dict per row. columns are empty columns to
+    start with, e.g. to give several tables of the same rows the same columns.
+    """
+    def __init__(self, rows=None, columns=()):
+        self.columns = {key: [] for key in columns}
+        self.length = 0
+        # tuple of row keys -> (columns for those keys, columns the row doesn't have)
+        self.shapes = {}
+        if rows is not None:
+            self.extend(rows)
+
+    def add_shape(self, shape):
+        for key in shape:
+            if key not in self.columns:
+                self.columns[key] = [None] * self.length
+                # Every shape seen so far is now missing this column
+                self.shapes.clear()
+        keys = set(shape)
+        present = [self.columns[key] for key in shape]
+        missing = [column for key, column in self.columns.items() if key not in keys]
+        self.shapes[shape] = (present, missing)
+        return present, missing
+
+    def append(self, row):
+        # Rows mostly come in a handful of shapes, so look up the target columns once per shape
+        # and let map() do the appends
+        shape = tuple(row)
+        targets = self.shapes.get(shape)
+        if targets is None:
+            targets = self.add_shape(shape)
+        present, missing = targets
+        deque(map(list.append, present, row.values()), maxlen=0)
+        if missing:
+            deque(map(list.append, missing, repeat(None)), maxlen=0)
+        self.length += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def concat(self, other):
+        """Append the rows of another ColumnTable, column by column."""
+        for key in other.columns:
+            if key not in self.columns:
+                self.columns[key] = [None] * self.length
+                self.shapes.clear()
+        for key, column in self.columns.items():
+            values = other.columns.get(key)
+            column.extend(repeat(None, other.length) if values is None else values)
+        self.length += other.length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('row index out of range')
+        return {key: column[index] for key, column in self.columns.items()}
+
+    def __iter__(self):
+        keys = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(keys, values))
+
+    def __repr__(self):
+        return f'ColumnTable({self.length} rows, {len(self.columns)} columns)'
+
+    def records(self):
+        """One dict per row, e.g. for json.dumps."""
+        return list(self)
+
+    def to_frame(self):
+        return pd.DataFrame(self.columns)
+
+def to_frame(data):
+    """DataFrame from a ColumnTable or anything pd.DataFrame accepts (e.g. a list of row dicts)."""
+    if isinstance(data, ColumnTable):
+        return data.to_frame()
+    return pd.DataFrame(data)
+
+# Element id at the start of a column name, e.g. CLP03, DTM02-232, CAS03_CO or 'NM103-QC-Patient Last Name'
+ELEMENT_ID = re.compile(r'^([A-Z][A-Z0-9]{1,2}[0-9]{2})(?![0-9])')
+DATE_FORMATS = {6: '%y%m%d', 8: '%Y%m%d'}
+
+def element_type(column):
+    """(data type, max length) of the element a column holds, or None if it isn't typed."""
+    match = ELEMENT_ID.match(str(column))
+    if match is None:
+        return None
+    return ELEMENT_TYPES.get(match.group(1))
+
+def typed_frame(frame, categories=True):
+    """
+    Convert the columns of a table to the types of their elements: amounts (R) to floats,
+    dates (DT) to datetime64 and codes (ID) to categories. Empty values and values that don't
+    convert become NaN/NaT. Everything else is left as it is. categories=False keeps codes
+    as strings (empty ones NaN), for tables built in pieces, whose categories would differ
+    from piece to piece.
+    """
+    frame = frame.copy()
+    for column in frame.columns:
+        types = element_type(column)
+        if types is None:
+            continue
+        data_type, max_len = types
+        if data_type == 'R':
+            # Always float, so the dtype doesn't depend on whether a file happens to have cents
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').astype('float64')
+        elif data_type == 'DT':
+            frame[column] = pd.to_datetime(frame[column], format=DATE_FORMATS.get(max_len, '%Y%m%d'), errors='coerce')
+        else:
+            # Empty elements are missing codes, not a category of their own
+            values = frame[column].mask(frame[column] == '')
+            frame[column] = values.astype('category') if categories else values
+    return frame
+
+def row_positions(table, column):
+    """{value: row position} for an id column of a ColumnTable."""
+    return {value: position for position, value in enumerate(table.columns.get(column, []))}
+
+def child_rows(parent_positions, child_parents):
+    """
+    Row positions for left joining a level of the hierarchy onto its parents.
+    parent_positions holds, for each row joined so far, the parent level row it came from
+    (-1 for none); child_parents holds the parent level row of each child (-1 for none).
+    Returns (parent_take, child_take): each joined row repeats once per child of its parent
+    row, or stays once with child_take -1 when there are none, like a left merge.
+    """
+    parent_positions = np.asarray(parent_positions, dtype=np.int64)
+    child_parents = np.asarray(child_parents, dtype=np.int64)
+    size = max(int(parent_positions.max(initial=-1)), int(child_parents.max(initial=-1))) + 1
+    # Children without a parent row would not match in a merge either; park them past the end
+    child_parents = np.where(child_parents < 0, size, child_parents)
+    counts = np.bincount(child_parents, minlength=size + 1)
+    # Children of the same parent, in file order, and where each parent's run of children starts
+    order = np.argsort(child_parents, kind='stable')
+    child_starts = np.cumsum(counts) - counts
+
+    matches = np.where(parent_positions >= 0, counts[parent_positions], 0)
+    repeats = np.maximum(matches, 1)
+    parent_take = np.repeat(np.arange(len(parent_positions)), repeats)
+    child_take = np.full(len(parent_take), -1, dtype=np.int64)
+    rows = np.flatnonzero(matches)
+    rows_matches = matches[rows]
+    rows = np.repeat(rows, rows_matches)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(rows_matches) - rows_matches, rows_matches)
+    out_starts = np.cumsum(repeats) - repeats
+    child_take[out_starts[rows] + offsets] = order[child_starts[parent_positions[rows]] + offsets]
+    return parent_take, child_take
+
+def join_levels(root, levels):
+    """
+    Join the levels of the hierarchy below root using the parent row position of every row
+    instead of key columns. levels is a list of (table, parent positions, keys), each level a
+    child of the one before it. Gives the same rows, order and columns as left merging each
+    level on its keys in turn, but takes every table only once.
+    """
+    takes = [np.arange(len(root))]
+    tables = [root]
+    parent_positions = takes[0]
+    for table, child_parents, keys in levels:
+        parent_take, child_take = child_rows(parent_positions, child_parents)
+        takes = [take[parent_take] for take in takes]
+        takes.append(child_take)
+        tables.append(table.drop(columns=keys))
+        parent_positions = child_take
+
+    # Columns both sides have get the suffixes pd.merge would give them
+    names = [list(tables[0].columns)]
+    for table in tables[1:]:
+        joined = set(name for level_names in names for name in level_names)
+        overlap = set(table.columns) & joined
+        if overlap:
+            names = [[name + '_x' if name in overlap else name for name in level_names] for level_names in names]
+        names.append([name + '_y' if name in overlap else name for name in table.columns])
+
+    frames = []
+    for table, take, level_names in zip(tables, takes, names):
+        if (take < 0).any():
+            # reindex fills the rows without a match with NaN, like a left merge
+            frame = table.reset_index(drop=True).reindex(take)
+        else:
+            frame = table.take(take)
+        frame.columns = level_names
+        frame.index = pd.RangeIndex(len(frame))
+        frames.append(frame)
+    return pd.concat(frames, axis=1)
@@ -0,0 +1,125 @@
+from collections import namedtuple
+import re
+from .segments import Element, ELEMENTS, QUALIFIED_ELEMENTS, SegmentSchema, get_elements
+
+# The ISA segment is fixed width, so the delimiters are always at the same offsets.
+ISA_LENGTH = 106
+# How much of the file to read at a time when streaming
+BUFFER_SIZE = 1024 * 1024
+Delimiters = namedtuple('Delimiters', ['element', 'repetition', 'component', 'segment'])
+
+# Segments of the interchange and functional group envelopes around the transaction sets
+ENVELOPE_SEGMENTS = ('ISA', 'IEA', 'GS', 'GE')
+
+# Segments whose element names depend on their qualifier (e.g. N1*PR vs N1*PE)
+QUALIFIED_SEGMENTS = set(seg_id for seg_id, qualifier in QUALIFIED_ELEMENTS)
+
+def read_delimiters(content):
+    """Read the element, repetition, component and segment delimiters from the ISA segment."""
+    start = content.find('ISA')
+    isa = content[start:start + ISA_LENGTH]
+    if start < 0 or len(isa) < ISA_LENGTH:
+        raise ValueError('Could not find a complete ISA segment to read the delimiters from.')
+    return Delimiters(
+        element=isa[3],
+        repetition=isa[82],
+        component=isa[104],
+        segment=isa[105]
+    )
+
+def split_stream(edi_file_stream, terminator, buffer=''):
+    """Read an open file a block at a time and yield the raw segments in it."""
+    while True:
+        chunk = edi_file_stream.read(BUFFER_SIZE)
+        if not chunk:
+            break
+        segments = (buffer + chunk).split(terminator)
+        # The last piece may be a partial segment, keep it for the next block
+        buffer = segments.pop()
+        yield from segments
+    yield from buffer.split(terminator)
+
+def tokenize(raw_segments, delimiters, include=None, bare=()):
+    """
+    Yields (seg_id, segment_data, schema) for every raw segment, where segment_data
+    matches what the pyx12 engine builds: stripped values, '' for empty elements and None
+    for elements missing at the end of the segment.
+
+    include limits this to the segments with those ids. The segments in bare are yielded
+    without their elements, so their handlers can still open and close loops; the rest are
+    skipped before their elements are split.
+    """
+    # (seg_id, qualifier) -> SegmentSchema
+    schemas = {}
+    bare_schemas = {seg_id: SegmentSchema(seg_id, ()) for seg_id in bare}
+    element = delimiters.element
+    for segment in raw_segments:
+        segment = segment.strip()
+        if not segment:
+            continue
+        if include is not None:
+            end = segment.find(element)
+            seg_id = segment if end < 0 else segment[:end]
+            if seg_id not in include:
+                if seg_id in bare_schemas:
+                    yield seg_id, {}, bare_schemas[seg_id]
+                continue
+        values = segment.split(element)
+        seg_id = values[0]
+        qualifier = values[1].strip() if seg_id in QUALIFIED_SEGMENTS and len(values) > 1 else None
+        schema = schemas.get((seg_id, qualifier))
+        if schema is None:
+            if seg_id in ELEMENTS:
+                schema = schemas[(seg_id, qualifier)] = SegmentSchema(seg_id, get_elements(seg_id, qualifier))
+            else:
+                # Not part of the 835 map; fall back to positional ids.
+                schema = SegmentSchema(seg_id, (Element('%s%02d' % (seg_id, i), '') for i in range(1, len(values))))
+        values = [value.strip() for value in values[1:]]
+        values.extend(schema.padding[len(values):])
+        yield seg_id, dict(zip(schema.ids, values)), schema
+
+def iter_segments(content, include=None, bare=()):
+    """Tokenize an 835 held in memory without pyx12. include and bare as in tokenize."""
+    delimiters = read_delimiters(content)
+    start = content.find('ISA')
+    return tokenize(content[start:].split(delimiters.segment), delimiters, include, bare)
+
+def iter_stream_segments(edi_file_stream, include=None, bare=()):
+    """Tokenize an 835 from an open file without reading all of it into memory."""
+    head = edi_file_stream.read(BUFFER_SIZE)
+    # Make sure the whole ISA segment is in the first block
+    while len(head) - max(head.find('ISA'), 0) < ISA_LENGTH:
+        chunk = edi_file_stream.read(BUFFER_SIZE)
+        if not chunk:
+            break
+        head += chunk
+    delimiters = read_delimiters(head)
+    start = head.find('ISA')
+    return tokenize(split_stream(edi_file_stream, delimiters.segment, head[start:]), delimiters, include, bare)
+
+def split_transaction_sets(content, delimiters, size):
+    """
+    Split an 835 held in memory at its transaction sets, finding the segment ids with one
+    regex pass instead of tokenizing it. Yields (seg_id, text) in file order: the text of
+    the ISA, GS, GE and IEA segments, and ('ST', text) for runs of whole transaction sets
+    (ST to SE) of about size characters. A run never crosses into another functional group.
+    """
+    terminator = re.escape(delimiters.segment)
+    pattern = re.compile(rf'(?:^|{terminator})\s*((ISA|IEA|GS|GE|ST|SE){re.escape(delimiters.element)}[^{terminator}]*)')
+    run_start = None
+    for match in pattern.finditer(content):
+        seg_id = match.group(2)
+        if seg_id == 'ST':
+            if run_start is None:
+                run_start = match.start(1)
+        elif seg_id == 'SE':
+            if run_start is not None and match.end(1) - run_start >= size:
+                yield 'ST', content[run_start:match.end(1)]
+                run_start = None
+        else:
+            if run_start is not None:
+                yield 'ST', content[run_start:match.start()]
+                run_start = None
+            yield seg_id, match.group(1)
+    if run_start is not None:
+        yield 'ST', content[run_start:]
@@ -0,0 +1,9 @@
+import pytest
+from py835.synthetic import generate_835
+
+@pytest.fixture(scope='session')
+def remittance(tmp_path_factory):
+    """A synthetic 835 with several transaction sets, see synthetic.py."""
+    path = tmp_path_factory.mktemp('remits') / 'remittance.835'
+    generate_835(path, statements=6, claims=120, seed=1)
+    return str(path)
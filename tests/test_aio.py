@@ -0,0 +1,85 @@
+import asyncio
+import contextlib
+from concurrent.futures import Executor, Future
+import pytest
+from py835.aio import aiter_parse
+
+PATHS = [f'remit-{index}.835' for index in range(10)]
+
+class StubExecutor(Executor):
+    """
+    Doesn't parse: each file's future is finished with (file_path, file_path, None) after
+    delays[file_path] seconds, or never when it has no delay. Records how many files were
+    handed out and not yet taken by the consumer, which counts them in taken.
+    """
+    def __init__(self, delays):
+        self.delays = delays
+        self.futures = {}
+        self.taken = 0
+        self.most_in_flight = 0
+
+    def submit(self, function, file_path, *args):
+        future = Future()
+        self.futures[file_path] = future
+        self.most_in_flight = max(self.most_in_flight, len(self.futures) - self.taken)
+        if file_path in self.delays:
+            asyncio.get_running_loop().call_later(self.delays[file_path], future.set_result, (file_path, file_path, None))
+        return future
+
+async def take(results, executor, count=None):
+    taken = []
+    async for file_path, parser, error in results:
+        executor.taken += 1
+        taken.append(file_path)
+        if len(taken) == count:
+            break
+    return taken
+
+@pytest.mark.parametrize('ordered', [False, True])
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_in_flight_files_never_exceed_concurrency(ordered, concurrency):
+    async def run():
+        # Uneven delays, so files finish out of order
+        executor = StubExecutor({path: (index * 7 % 5) / 1000 for index, path in enumerate(PATHS)})
+        taken = await take(aiter_parse(PATHS, executor=executor, concurrency=concurrency, ordered=ordered), executor)
+        return executor, taken
+    executor, taken = asyncio.run(run())
+    assert sorted(taken) == sorted(PATHS)
+    assert executor.most_in_flight == concurrency
+
+def test_a_slow_consumer_holds_the_parsing_back():
+    async def run():
+        executor = StubExecutor({path: 0 for path in PATHS})
+        results = aiter_parse(PATHS, executor=executor, concurrency=3)
+        await take(results, executor, count=1)
+        # Every file handed out is done, but no more are started until the next one is taken
+        await asyncio.sleep(0.01)
+        assert len(executor.futures) == 3
+        await take(results, executor, count=3)
+        await asyncio.sleep(0.01)
+        assert len(executor.futures) == 6
+        await results.aclose()
+    asyncio.run(run())
+
+@pytest.mark.parametrize('ordered', [False, True])
+def test_ordered_results_keep_the_order_of_paths(ordered):
+    async def run():
+        # Later files finish first
+        executor = StubExecutor({path: (len(PATHS) - index) / 500 for index, path in enumerate(PATHS)})
+        return await take(aiter_parse(PATHS, executor=executor, concurrency=4, ordered=ordered), executor)
+    taken = asyncio.run(run())
+    if ordered:
+        assert taken == PATHS
+    else:
+        assert sorted(taken) == sorted(PATHS) and taken != PATHS
+
+def test_stopping_early_cancels_the_pending_files():
+    async def run():
+        # Only the first file ever finishes
+        executor = StubExecutor({PATHS[0]: 0})
+        async with contextlib.aclosing(aiter_parse(PATHS, executor=executor, concurrency=4)) as results:
+            assert await take(results, executor, count=1) == [PATHS[0]]
+        return executor
+    executor = asyncio.run(run())
+    assert list(executor.futures) == PATHS[:4]
+    assert [future.cancelled() for future in executor.futures.values()] == [False, True, True, True]
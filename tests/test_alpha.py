@@ -0,0 +1,171 @@
+import re
+import threading
+from collections import Counter
+from io import StringIO
+import pytest
+from py835 import maps
+from py835.py835_alpha import LEVEL_IDS, LEVEL_TABLES, REPORT_PREFIXES, Parser
+from py835.synthetic import generate_835
+
+QUALIFIED = {'REF', 'CAS', 'DTM', 'NM1', 'N1', 'AMT', 'SVC', 'BPR'}
+
+@pytest.fixture(scope='module')
+def alpha_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('alpha') / 'remittance.835'
+    generate_835(path, statements=3, claims=40, seed=2)
+    return str(path)
+
+def old_engine_rows(path):
+    """
+    The (id, name, value) rows of each level as the engine before the rewrite made them, by
+    level name, one list per entity. It only kept a claim or service once the next one of
+    its parent started, so the last service of every claim, and the last claim of every
+    statement with its services, were dropped.
+    """
+    levels = {name: [] for name in LEVEL_TABLES}
+    current = dict.fromkeys(LEVEL_TABLES)
+    current['HEADER'] = []
+    levels['HEADER'].append(current['HEADER'])
+    # id() of the entities it dropped, and the services of the open claim, dropped with it
+    dropped = set()
+    claim_services = []
+
+    def drop(name):
+        if current[name] is not None:
+            dropped.add(id(current[name]))
+            if name == 'CLAIMS':
+                dropped.update(map(id, claim_services))
+        current[name] = None
+
+    def open_level(name):
+        current[name] = []
+        levels[name].append(current[name])
+
+    with open(path) as edi_file:
+        reader = maps.context_reader(StringIO(edi_file.read()))
+        for segment in reader.iter_segments():
+            suffix = '-' + segment.seg_data.get_value(segment.id + '01') if segment.id in QUALIFIED else ''
+            rows = [(child.id + suffix, child.name, segment.seg_data.get_value(child.id)) for child in segment.x12_map_node.children]
+            if segment.id in ('GS', 'ST', 'SE', 'GE'):
+                drop('SERVICES')
+                drop('CLAIMS')
+                if segment.id == 'GS':
+                    open_level('FUNCTIONAL_GROUPS')
+                elif segment.id == 'ST':
+                    open_level('STATEMENTS')
+                name = 'FUNCTIONAL_GROUPS' if segment.id in ('GS', 'GE') else 'STATEMENTS'
+                current[name].extend(rows)
+                if segment.id == 'SE':
+                    current['STATEMENTS'] = None
+                elif segment.id == 'GE':
+                    current['FUNCTIONAL_GROUPS'] = None
+                continue
+            if segment.id == 'CLP':
+                drop('SERVICES')
+                current['CLAIMS'] = None
+                claim_services = []
+                open_level('CLAIMS')
+            elif segment.id == 'SVC':
+                current['SERVICES'] = None
+                open_level('SERVICES')
+                claim_services.append(current['SERVICES'])
+            deepest = next(name for name in reversed(LEVEL_TABLES) if current[name] is not None)
+            current[deepest].extend(rows)
+    return {name: [rows for rows in entities if id(rows) not in dropped] for name, entities in levels.items()}
+
+def entity_rows(frame, level):
+    """The (id, name, value) rows of each entity of a long table, in file order."""
+    level_id = LEVEL_IDS[LEVEL_TABLES.index(level)]
+    return [
+        list(zip(rows['id'], rows['name'], rows['value']))
+        for _, rows in frame.groupby(level_id, sort=False)
+    ]
+
+def segment_count(path, seg_id):
+    return len(re.findall(rf'(?:^|~)\s*{seg_id}\*', open(path).read()))
+
+def test_last_claim_and_service_of_each_statement_are_kept(alpha_file):
+    parser = Parser(alpha_file)
+    assert parser.pandas.CLAIMS['claim_id'].nunique() == segment_count(alpha_file, 'CLP') == 40
+    assert parser.pandas.SERVICES['service_id'].nunique() == segment_count(alpha_file, 'SVC')
+    assert parser.pandas.STATEMENTS['statement_id'].nunique() == 3
+
+def test_one_claim_per_statement(tmp_path):
+    # The old engine dropped every claim of this file and failed building CLAIMS
+    path = tmp_path / 'single.835'
+    generate_835(path, statements=4, claims=4, seed=3)
+    parser = Parser(str(path))
+    assert parser.pandas.CLAIMS['claim_id'].nunique() == 4
+    assert len(parser.financial_report()) == segment_count(str(path), 'SVC')
+
+def test_envelope_and_statements_match_the_old_engine(alpha_file):
+    parser = Parser(alpha_file)
+    old = old_engine_rows(alpha_file)
+    for level in ['HEADER', 'FUNCTIONAL_GROUPS', 'STATEMENTS']:
+        assert entity_rows(getattr(parser.pandas, level), level) == old[level], level
+    # The old claims and services are all still there, next to the ones it dropped
+    for level in ['CLAIMS', 'SERVICES']:
+        new = entity_rows(getattr(parser.pandas, level), level)
+        assert len(new) > len(old[level])
+        assert not Counter(map(tuple, old[level])) - Counter(map(tuple, new)), level
+
+def test_parsers_in_threads_keep_their_own_levels(alpha_file, tmp_path):
+    other = tmp_path / 'other.835'
+    generate_835(other, statements=2, claims=25, seed=4)
+    paths = [alpha_file, str(other)] * 4
+    expected = {path: Parser(path) for path in set(paths)}
+    results = [None] * len(paths)
+
+    def parse(index):
+        results[index] = Parser(paths[index])
+
+    threads = [threading.Thread(target=parse, args=(index,)) for index in range(len(paths))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for path, parser in zip(paths, results):
+        for level in LEVEL_TABLES:
+            frame = getattr(parser.pandas, level)
+            assert entity_rows(frame, level) == entity_rows(getattr(expected[path].pandas, level), level), level
+            depth = LEVEL_TABLES.index(level)
+            if depth:
+                # Every row's parent is an entity of the same parser
+                parents = getattr(parser.pandas, LEVEL_TABLES[depth - 1])[LEVEL_IDS[depth - 1]]
+                assert set(frame[LEVEL_IDS[depth - 1]]) <= set(parents), level
+
+def report_cells(report, depth):
+    """(entity id, element label, value) of every filled cell of one level of a financial_report."""
+    level_id = LEVEL_IDS[depth]
+    prefix = REPORT_PREFIXES[depth] + ' '
+    columns = [column for column in report.columns if column.startswith(prefix)]
+    entities = report.dropna(subset=[level_id]).drop_duplicates(level_id)
+    cells = entities.melt(id_vars=[level_id], value_vars=columns).dropna(subset=['value'])
+    # Repeats are numbered columns of the same element, e.g. '... Adjustment Amount (2)'
+    labels = cells['variable'].str.replace(r' \(\d+\)$', '', regex=True)
+    return Counter(zip(cells[level_id], labels, cells['value']))
+
+def long_cells(table, depth):
+    table = table.dropna(subset=['value'])
+    labels = REPORT_PREFIXES[depth] + ' ' + table['id'] + ' ' + table['name']
+    return Counter(zip(table[LEVEL_IDS[depth]], labels, table['value']))
+
+def test_financial_report_keeps_every_value_of_the_long_tables(alpha_file):
+    parser = Parser(alpha_file)
+    report = parser.financial_report()
+    for depth, level in enumerate(LEVEL_TABLES):
+        assert report_cells(report, depth) == long_cells(getattr(parser.pandas, level), depth), level
+    # Repeated elements are there: two REF*EA on a claim, or two CAS with the same group
+    assert any(column.endswith(' (2)') for column in report.columns)
+    assert len(report) == report['service_id'].nunique()
+
+def test_financial_report_columns(alpha_file):
+    parser = Parser(alpha_file)
+    report = parser.financial_report()
+    subset = parser.financial_report(columns=['CLP04', 'CAS03-CO', 'SERVICE SVC03 Line Item Provider Payment Amount'])
+    chosen = [column for column in subset.columns if column not in LEVEL_IDS]
+    assert chosen
+    for column in chosen:
+        assert re.match(r'(CLAIM CLP04 |CLAIM CAS03-CO |SERVICE CAS03-CO |SERVICE SVC03 )', column), column
+    assert set(LEVEL_IDS) <= set(subset.columns)
+    assert subset[chosen + LEVEL_IDS].equals(report[chosen + LEVEL_IDS])
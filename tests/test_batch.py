@@ -0,0 +1,43 @@
+import os
+import pytest
+from py835 import Parser
+from py835.batch import ParserBatch, file_id_offset
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'example-x12-files')
+FILE = os.path.join(EXAMPLES, 'X221-multiple-claims-single-check.edi')
+OTHER = os.path.join(EXAMPLES, 'X221-claim-specific-negotiated-discount.edi')
+# The only one of the three with an MOA segment
+MOA_FILE = os.path.join(EXAMPLES, 'X221-line-service-line-penalty-tax-or-bonuses-impacting-payment-only-example-1.edi')
+
+def exit_worker(state, segment_data, schema):
+    # Kills the worker process, as a crash or running out of memory would
+    os._exit(1)
+
+@pytest.fixture
+def garbage(tmp_path):
+    path = tmp_path / 'garbage.835'
+    path.write_text('not an 835 file')
+    return str(path)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_failures_table_lists_files_that_fail(garbage, workers):
+    batch = ParserBatch([FILE, garbage, OTHER], workers=workers, engine='fast')
+    failures = batch.failures_table()
+    assert failures['file_path'].tolist() == [garbage]
+    assert failures['filename'].tolist() == ['garbage.835']
+    assert failures['error'][0].startswith('Traceback')
+    assert [parser.file_path for parser in batch.parsers] == [FILE, OTHER]
+
+def test_a_worker_that_dies_only_fails_its_file():
+    # Enough files for two per task, so the file shares its task with another one
+    paths = [FILE, OTHER] * 4 + [MOA_FILE] + [OTHER, FILE] * 4
+    batch = ParserBatch(paths, workers=2, engine='fast', ids='int', handlers={'MOA': exit_worker})
+    failures = batch.failures_table()
+    assert failures['file_path'].tolist() == [MOA_FILE]
+    assert 'stopped abruptly' in failures['error'][0]
+    # The other files still parse, in their order and with the ids of their place in the batch
+    parsed = [index for index, path in enumerate(paths) if path != MOA_FILE]
+    assert [parser.file_path for parser in batch.parsers] == [paths[index] for index in parsed]
+    for parser, index in zip(batch.parsers, parsed):
+        expected = Parser(paths[index], engine='fast', ids='int', id_offset=file_id_offset('int', index))
+        assert parser.claims_table().equals(expected.claims_table())
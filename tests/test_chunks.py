@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+from py835 import Parser
+from py835.handlers import EXTRA_HANDLERS
+
+VIEWS = {
+    'claims': 'claims_table',
+    'services': 'services_table',
+    'claims_cas': 'claims_cas_table',
+    'services_cas': 'services_cas_table',
+    'claims_refs': 'claims_refs_table',
+    'services_refs': 'services_refs_table'
+}
+
+def view_frame(parser, view, colnames=False, typed=False):
+    frame = getattr(parser, view)(colnames=colnames, typed=typed)
+    # Chunks keep codes as strings, see Parser.chunk_frames
+    return frame.astype({column: object for column, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)})
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+@pytest.mark.parametrize('colnames', [False, True])
+@pytest.mark.parametrize('typed', [False, True])
+def test_chunks_add_up_to_the_views(remittance, engine, colnames, typed):
+    parser = Parser(remittance, engine=engine, ids='int', handlers=EXTRA_HANDLERS)
+    # Small chunks, so some of them have no claim level CAS or REF rows at all
+    chunks = list(Parser.iter_tables(remittance, chunk_claims=7, engine=engine, ids='int', handlers=EXTRA_HANDLERS, colnames=colnames, typed=typed))
+    assert [len(chunk['claims']) for chunk in chunks] == [7] * 17 + [1]
+    for name, view in VIEWS.items():
+        frames = [chunk[name] for chunk in chunks]
+        combined = pd.concat(frames, ignore_index=True)
+        assert combined.equals(view_frame(parser, view, colnames, typed).reindex(columns=combined.columns)), name
+        # Every chunk has the columns and dtypes of the ones before it
+        for before, after in zip(frames, frames[1:]):
+            assert list(after.columns[:len(before.columns)]) == list(before.columns), name
+            assert after.dtypes[before.columns].equals(before.dtypes), name
+    for name, table in parser.extra_tables.items():
+        if name in chunks[0]:
+            combined = pd.concat([chunk[name] for chunk in chunks], ignore_index=True)
+            assert combined.equals(parser.extra_table(name).reindex(columns=combined.columns)), name
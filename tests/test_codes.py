@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+from py835 import codes
+from py835.codes import CodeTable, describe_columns
+
+# A: replaced on 2010-01-01, B: valid 2001 to 2003 only, C: no dates
+ENTRIES = [
+    ('B', 'B until 2003', '2001-01-01', '2003-01-01'),
+    ('A', 'A since 2010', '2010-01-01', None),
+    ('C', 'C always', None, None),
+    ('A', 'A until 2010', '2000-01-01', '2010-01-01'),
+]
+
+@pytest.fixture
+def code_table():
+    return CodeTable('test_codes', ENTRIES)
+
+def descriptions(code_table, rows):
+    return [code_table.rows[row][1] if row >= 0 else None for row in rows]
+
+def test_entry_rows_without_dates_take_the_last_entry(code_table):
+    rows = code_table.entry_rows(np.array(['A', 'B', 'C', 'X'], dtype=object))
+    assert descriptions(code_table, rows) == ['A since 2010', 'B until 2003', 'C always', None]
+    assert code_table['A'] == 'A since 2010'
+    assert code_table.to_dict()['A'] == 'A since 2010'
+
+def test_entry_rows_pick_the_entry_valid_on_the_date(code_table):
+    values = np.array(['A', 'A', 'A', 'A', 'B', 'B', 'B', 'C'], dtype=object)
+    dates = ['1999-06-01', '2005-06-01', '2009-12-31', '2010-01-01', '2000-12-31', '2002-06-01', '2003-01-01', '1900-01-01']
+    rows = code_table.entry_rows(values, dates)
+    assert descriptions(code_table, rows) == [
+        None, 'A until 2010', 'A until 2010',
+        # The stop date is the first day an entry isn't valid
+        'A since 2010',
+        None, 'B until 2003', None,
+        'C always',
+    ]
+
+def test_missing_dates_rule_no_entry_out(code_table):
+    values = np.array(['A', 'B', 'X'], dtype=object)
+    for dates in [[None, None, None], [pd.NaT, 'not a date', None], pd.Series([pd.NaT] * 3)]:
+        rows = code_table.entry_rows(values, dates)
+        assert descriptions(code_table, rows) == ['A since 2010', 'B until 2003', None]
+
+def test_one_date_for_every_value(code_table):
+    values = pd.Series(['A', 'B', 'C', 'X'])
+    one_date = code_table.describe(values, dates='20020601')
+    assert one_date.tolist() == ['A until 2010', 'B until 2003', 'C always', None]
+    assert one_date.tolist() == code_table.describe(values, dates=['20020601'] * 4).tolist()
+    assert code_table.get('A', date='2012-01-01') == 'A since 2010'
+    assert code_table.get('B', default='?', date='2012-01-01') == '?'
+
+def test_categorical_values(code_table):
+    values = pd.Series(['A', None, 'B', 'X', 'A'], index=[5, 6, 7, 8, 9])
+    expected = code_table.describe(values)
+    categorical = code_table.describe(values.astype('category'))
+    assert categorical.index.tolist() == [5, 6, 7, 8, 9]
+    assert categorical.tolist() == expected.tolist() == ['A since 2010', None, 'B until 2003', None, 'A since 2010']
+    dates = ['2005-01-01'] * 5
+    assert code_table.describe(values.astype('category'), dates=dates).tolist() == code_table.describe(values, dates=dates).tolist()
+
+@pytest.fixture
+def code_lists(monkeypatch, code_table):
+    # describe_columns looks the tables up by name: serve the small one for both lists
+    monkeypatch.setitem(codes.CODE_TABLE_CACHE, 'claim_adjustment_reason_codes', code_table)
+    monkeypatch.setitem(codes.CODE_TABLE_CACHE, 'remittance_advice_remark_codes', code_table)
+
+def test_describe_columns(code_lists):
+    frame = pd.DataFrame({
+        'CAS02': ['A', 'B', 'X'],
+        'CAS05': pd.Categorical(['C', None, 'A']),
+        'BPR16': ['20050101', '20020101', '20120101'],
+    })
+    described = describe_columns(frame, date_column='BPR16')
+    assert list(described.columns) == ['CAS02', 'CAS02_description', 'CAS05', 'CAS05_description', 'BPR16']
+    assert described['CAS02_description'].tolist() == ['A until 2010', 'B until 2003', None]
+    assert described['CAS05_description'].tolist() == ['C always', None, 'A since 2010']
+    assert 'CAS02_description' not in frame.columns
+
+def test_describe_columns_only_describes_remark_lq(code_lists):
+    frame = pd.DataFrame({'LQ01': ['HE', 'RX', 'HE'], 'LQ02': ['A', 'A', 'C']})
+    described = describe_columns(frame, columns=['LQ02'], suffix=' text')
+    assert described['LQ02 text'].tolist() == ['A since 2010', None, 'C always']
+
+def test_describe_columns_rejects_other_columns(code_lists):
+    with pytest.raises(ValueError):
+        describe_columns(pd.DataFrame({'CLP01': ['A']}), columns=['CLP01'])
@@ -0,0 +1,25 @@
+import glob
+import os
+import pytest
+from py835 import Parser
+from py835.handlers import EXTRA_HANDLERS
+
+EXAMPLES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '..', 'example-x12-files', '*.edi')))
+VIEWS = ['isa_table', 'functional_groups_table', 'transaction_sets_table', 'claims_table', 'services_table', 'claims_cas_table', 'services_cas_table', 'claims_refs_table', 'services_refs_table', 'transactions']
+
+@pytest.mark.parametrize('path', EXAMPLES, ids=os.path.basename)
+def test_fast_engine_matches_pyx12(path):
+    strict = Parser(path, engine='pyx12', ids='int', handlers=EXTRA_HANDLERS)
+    fast = Parser(path, engine='fast', ids='int', handlers=EXTRA_HANDLERS)
+    for view in VIEWS:
+        for colnames in (False, True):
+            assert getattr(fast, view)(colnames=colnames).equals(getattr(strict, view)(colnames=colnames)), (view, colnames)
+    assert fast.extra_tables.keys() == strict.extra_tables.keys()
+    for name in strict.extra_tables:
+        assert fast.extra_table(name).equals(strict.extra_table(name)), name
+
+def test_fast_engine_matches_pyx12_on_a_large_file(remittance):
+    strict = Parser(remittance, engine='pyx12', ids='hash')
+    fast = Parser(remittance, engine='fast', ids='hash')
+    assert fast.transactions(colnames=True).equals(strict.transactions(colnames=True))
+    assert fast.services_cas_table().equals(strict.services_cas_table())
@@ -0,0 +1,37 @@
+import os
+import shutil
+import pytest
+from py835 import Parser
+from py835.batch import ParserBatch
+
+pa = pytest.importorskip('pyarrow')
+ds = pytest.importorskip('pyarrow.dataset')
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'example-x12-files')
+FILE = os.path.join(EXAMPLES, 'X221-multiple-claims-single-check.edi')
+
+def count_rows(path):
+    return ds.dataset(path, format='parquet').count_rows()
+
+def test_same_file_name_in_different_folders(tmp_path):
+    paths = []
+    for folder in ('d1', 'd2'):
+        os.makedirs(tmp_path / folder)
+        paths.append(shutil.copy(FILE, tmp_path / folder / 'x.edi'))
+    batch = ParserBatch(paths, workers=1, engine='fast', ids='hash')
+    batch.write_dataset(tmp_path / 'lake')
+    assert count_rows(tmp_path / 'lake' / 'claims') == len(batch.claims_table())
+
+def test_export_again_replaces_earlier_files(tmp_path):
+    parser = Parser(FILE, engine='fast', ids='hash')
+    parser.write_dataset(tmp_path / 'lake', partition_by=['N102-PR'])
+    parser.write_dataset(tmp_path / 'lake', partition_by=['N102-PR'])
+    assert count_rows(tmp_path / 'lake' / 'claims') == len(parser.claims_table())
+
+    # A payer renamed since the last export: its rows move to the new partition
+    parser.transaction_sets.columns['N102-PR'] = ['RENAMED PAYER'] * len(parser.transaction_sets)
+    parser.clear_cache()
+    parser.write_dataset(tmp_path / 'lake', partition_by=['N102-PR'])
+    claims_dir = tmp_path / 'lake' / 'claims'
+    assert os.listdir(claims_dir) == ['N102-PR=RENAMED%20PAYER']
+    assert count_rows(claims_dir) == len(parser.claims_table())
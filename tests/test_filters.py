@@ -0,0 +1,71 @@
+import pytest
+from py835 import Parser
+
+CLAIM_VIEWS = ['claims_table', 'services_table', 'claims_cas_table', 'services_cas_table', 'claims_refs_table', 'services_refs_table']
+TABLES = ['transaction_sets', 'claims', 'claims_refs', 'claims_cas', 'services', 'services_refs', 'services_cas']
+
+def many_services(record):
+    return len(record['services']) > 3
+
+def assert_rows_of(frame, expected):
+    # Columns only the dropped rows had are left out of the filtered parse
+    assert set(frame.columns) <= set(expected.columns)
+    assert expected.drop(columns=frame.columns).isna().all().all()
+    assert frame.equals(expected[frame.columns])
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+@pytest.mark.parametrize('where', [{'CLP02': '4'}, {'CLP02': [4, 22]}, {'N102-PR': 'SYNTHETIC HEALTH PLAN', 'CLP02': '1'}, many_services], ids=['status', 'statuses', 'statement', 'callable'])
+def test_where_matches_filtering_a_full_parse(remittance, engine, where):
+    full = Parser(remittance, engine=engine, ids='int')
+    filtered = Parser(remittance, engine=engine, ids='int', where=where)
+    if callable(where):
+        kept = {record['claim']['claim_id'] for record in Parser.iter_claims(remittance, engine=engine, ids='int') if where(record)}
+    else:
+        transactions = full.transactions()
+        matches = True
+        for field, values in where.items():
+            values = values if isinstance(values, list) else [values]
+            matches = matches & transactions[field].isin([str(value) for value in values])
+        kept = set(transactions.loc[matches, 'claim_id'])
+    assert 0 < len(kept) < len(full.claims)
+    assert len(filtered.claims) == len(kept)
+    for view in CLAIM_VIEWS:
+        expected = getattr(full, view)()
+        expected = expected[expected['claim_id'].isin(kept)].reset_index(drop=True)
+        assert_rows_of(getattr(filtered, view)(), expected)
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+@pytest.mark.parametrize('include', [{'CLP', 'CAS'}, {'SVC', 'REF', 'DTM'}, {'N1'}])
+def test_include_matches_the_columns_of_a_full_parse(remittance, engine, include):
+    full = Parser(remittance, engine=engine, ids='int')
+    projected = Parser(remittance, engine=engine, ids='int', include=include)
+    for name in TABLES:
+        full_table, table = getattr(full, name), getattr(projected, name)
+        # The loop segments are still walked, so every level keeps its rows and ids
+        if name in ('transaction_sets', 'claims', 'services'):
+            assert len(table) == len(full_table), name
+        for column, values in table.columns.items():
+            assert values == full_table.columns[column], (name, column)
+            segment = column.split('-')[0][:-2]
+            assert column.endswith('_id') or segment in include, (name, column)
+    # The views still build without the left out segments
+    projected.transactions()
+    projected.claims_cas_table(flatten=True)
+
+@pytest.mark.parametrize('where', [{'CLP2': '1'}, {'CLP02': '1', 'payer': 'X'}, {'XYZ01-PR': 'X'}, {'claim_id': 1}])
+def test_where_rejects_unknown_fields(remittance, where):
+    with pytest.raises(ValueError, match='Unknown where field'):
+        Parser(remittance, engine='fast', where=where)
+
+def test_where_takes_qualified_fields(remittance):
+    full = Parser(remittance, engine='fast', ids='int').claims_table()
+    date = full['DTM02-232'].dropna().iloc[0]
+    parser = Parser(remittance, engine='fast', ids='int', where={'DTM02-232': date, 'NM101-QC': 'QC'})
+    assert 0 < len(parser.claims) < len(full)
+    assert list(parser.claims_table()['claim_id']) == list(full.loc[full['DTM02-232'] == date, 'claim_id'])
+
+def test_where_fields_must_be_included(remittance):
+    with pytest.raises(ValueError, match='include leaves out'):
+        Parser(remittance, engine='fast', include={'CLP', 'CAS'}, where={'CLP02': '4', 'N102-PR': 'SYNTHETIC HEALTH PLAN'})
+    parser = Parser(remittance, engine='fast', include={'CLP', 'N1'}, where={'CLP02': '4', 'N102-PR': 'SYNTHETIC HEALTH PLAN'})
+    assert len(parser.claims) == len(Parser(remittance, engine='fast', where={'CLP02': '4'}).claims) > 0
@@ -0,0 +1,123 @@
+import pytest
+from py835 import Parser
+from py835.handlers import EXTRA_HANDLERS, SEGMENT_HANDLERS, dispatch_table, segment_handler
+
+# One claim with an MOA, two services, the first with an LQ remark, and a PLB for the payment
+SEGMENTS = [
+    'ISA*00*          *00*          *ZZ*SUBMITTERS ID  *ZZ*RECEIVERS ID   *200101*1253*^*00501*000000905*0*T*|',
+    'GS*HP*SENDER CODE*RECEIVER CODE*20200101*0802*1*X*005010X221A1',
+    'ST*835*10060875',
+    'BPR*I*11.06*C*CHK************20190816',
+    'TRN*1*CK NUMBER 1*1234567890',
+    'REF*EV*FAC',
+    'DTM*405*20190827',
+    'N1*PR*ANY PLAN USA',
+    'N3*1 WALK THIS WAY',
+    'N4*ANYCITY*OH*45209',
+    'PER*BL*EDI*TE*8002223333',
+    'N1*PE*PROVIDER*XX*1123454567',
+    'N3*2255 ANY ROAD',
+    'N4*ANY CITY*CA*12211',
+    'LX*1',
+    'CLP*PCN*1*36.20*11.06**12*CLAIMNUMB*11*1',
+    'NM1*QC*1*LAST*FIRST*J***MI*123456789',
+    'MOA***N25',
+    'REF*1L*102345',
+    'DTM*050*20170113',
+    'AMT*AU*36.20',
+    'SVC*HC|99214*26.2*3.06',
+    'DTM*472*20170109',
+    'CAS*CO*45*23.2**137*-.06',
+    'REF*6R*B1',
+    'AMT*B6*3',
+    'LQ*HE*N123',
+    'SVC*HC|36415*10*8',
+    'DTM*472*20170109',
+    'CAS*CO*45*2',
+    'REF*6R*B2',
+    'AMT*B6*8',
+    'PLB*1123454567*20191231*L6|ABC*-1.5',
+    'SE*33*10060875',
+    'GE*1*1',
+    'IEA*1*000000905',
+]
+
+@pytest.fixture
+def remit(tmp_path):
+    path = tmp_path / 'remit.edi'
+    path.write_text('~'.join(SEGMENTS) + '~')
+    return str(path)
+
+def count_segments(table):
+    # A handler that only counts the segments it's called for, as rows of its own table
+    def handler(state, segment_data, schema):
+        state.emit(table, dict(segment_data))
+    return handler
+
+def test_segment_handler_registers_and_removes(remit):
+    handler = segment_handler('PLB')(count_segments('plb_segments'))
+    try:
+        assert SEGMENT_HANDLERS['PLB'] is handler
+        assert Parser(remit, engine='fast').extra_table('plb_segments')['PLB04'].tolist() == ['-1.5']
+    finally:
+        del SEGMENT_HANDLERS['PLB']
+    assert Parser(remit, engine='fast').extra_table('plb_segments').empty
+
+def test_segment_handler_into_another_registry():
+    handlers = {}
+    handler = segment_handler('LQ', handlers=handlers)(count_segments('remarks'))
+    assert handlers == {'LQ': handler}
+    assert 'LQ' not in SEGMENT_HANDLERS
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_parser_handlers_override_a_built_in(remit, engine):
+    parser = Parser(remit, engine=engine, handlers={'AMT': count_segments('amounts')})
+    assert parser.extra_table('amounts')['AMT02'].tolist() == ['36.20', '3', '8']
+    assert 'AMT02-Claim' not in parser.claims_table().columns
+    assert 'AMT02-Service' not in parser.services_table().columns
+    # Other parsers keep the built-in handler
+    assert Parser(remit, engine=engine).claims_table()['AMT02-Claim'].tolist() == ['36.20']
+
+def test_dispatch_table_folds_qualified_handlers():
+    calls = []
+    def record(name):
+        return lambda state, segment_data, schema: calls.append((name, segment_data['REF02']))
+    dispatch = dispatch_table({'REF': record('plain'), ('REF', '6R'): record('6R'), ('DTM', '472'): record('472')})
+    assert set(dispatch) == {'REF', 'DTM'}
+    for qualifier in ['6R', '1L']:
+        dispatch['REF'](None, {'REF01': qualifier, 'REF02': qualifier}, None)
+    assert calls == [('6R', '6R'), ('plain', '1L')]
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_qualified_handlers_only_take_their_qualifier(remit, engine):
+    parser = Parser(remit, engine=engine, handlers={('REF', '6R'): count_segments('line_items'), ('DTM', '050'): count_segments('received')})
+    # REF*6R goes to the qualified handler, the other REF segments to the plain one
+    assert parser.extra_table('line_items')['REF02'].tolist() == ['B1', 'B2']
+    assert parser.services_refs_table().empty
+    assert parser.claims_refs_table()['REF02'].tolist() == ['102345']
+    # DTM has no plain handler: only the qualifiers registered are handled
+    assert parser.extra_table('received')['DTM02'].tolist() == ['20170113']
+    assert 'DTM02-050' not in parser.claims_table().columns
+    assert parser.services_table()['DTM02-472'].tolist() == ['20170109', '20170109']
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_extra_handlers(remit, engine):
+    parser = Parser(remit, engine=engine, ids='int', handlers=EXTRA_HANDLERS)
+    services = parser.services_table()
+
+    plb = parser.extra_table('provider_adjustments')
+    assert plb[['statement_id', 'PLB01', 'PLB03', 'PLB04']].to_dict('records') == [
+        {'statement_id': parser.transaction_sets_table()['statement_id'][0], 'PLB01': '1123454567', 'PLB03': 'L6|ABC', 'PLB04': '-1.5'}
+    ]
+
+    remarks = parser.extra_table('services_remarks')
+    assert remarks[['service_id', 'LQ01', 'LQ02']].to_dict('records') == [
+        {'service_id': services['service_id'][0], 'LQ01': 'HE', 'LQ02': 'N123'}
+    ]
+    assert parser.extra_table('claims_remarks').empty
+
+    assert parser.claims_table()['MOA03'].tolist() == ['N25']
+    # Without them the segments are skipped
+    plain = Parser(remit, engine=engine, ids='int')
+    assert plain.extra_tables == {}
+    assert 'MOA03' not in plain.claims_table().columns
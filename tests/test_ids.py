@@ -0,0 +1,30 @@
+import asyncio
+import os
+import pytest
+from py835 import Parser
+from py835.aio import aparse_many
+from py835.batch import FILE_ID_RANGE, ParserBatch
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'example-x12-files')
+FILE = os.path.join(EXAMPLES, 'X221-multiple-claims-single-check.edi')
+OTHER = os.path.join(EXAMPLES, 'X221-claim-adjustment-reason-code-45.edi')
+
+def claim_ids(parser):
+    return parser.claims_table()['claim_id'].tolist()
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_hash_ids_do_not_depend_on_batch_position(engine):
+    # The same file first and second in a batch
+    first = ParserBatch([FILE, OTHER], workers=1, engine=engine, ids='hash')
+    second = ParserBatch([OTHER, FILE], workers=1, engine=engine, ids='hash')
+    alone = Parser(FILE, engine=engine, ids='hash')
+    assert claim_ids(first.parsers[0]) == claim_ids(second.parsers[1]) == claim_ids(alone)
+
+def test_hash_ids_do_not_depend_on_aio_position():
+    batch = asyncio.run(aparse_many([OTHER, FILE], engine='fast', ids='hash'))
+    assert claim_ids(batch.parsers[1]) == claim_ids(Parser(FILE, engine='fast', ids='hash'))
+
+def test_int_ids_get_a_range_per_file():
+    batch = ParserBatch([FILE, FILE], workers=1, engine='fast', ids='int')
+    first, second = (claim_ids(parser) for parser in batch.parsers)
+    assert [claim_id + FILE_ID_RANGE for claim_id in first] == second
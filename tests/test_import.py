@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+# About 100ms here; the heavy imports alone (pandas, pyx12, the code CSVs) took 850ms
+IMPORT_BUDGET_US = 300_000
+HEAVY_MODULES = ['pandas', 'numpy', 'pyx12']
+
+def run_import():
+    # A fresh interpreter, so nothing this test process imported counts
+    code = f'import sys, py835; print(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules))'
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+def cumulative_import_time(stderr, package):
+    # Lines look like "import time:       393 |      91399 | py835"
+    for line in stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == package:
+            return int(fields[1])
+    raise AssertionError(f'{package} missing from the -X importtime output')
+
+def test_import_stays_under_budget():
+    result = run_import()
+    assert cumulative_import_time(result.stderr, 'py835') < IMPORT_BUDGET_US
+
+def test_import_leaves_heavy_modules_unloaded():
+    result = run_import()
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,44 @@
+import re
+import pytest
+import py835.py835
+from py835 import Parser
+from py835.handlers import EXTRA_HANDLERS
+
+VIEWS = ['claims_table', 'services_table', 'claims_cas_table', 'services_cas_table', 'claims_refs_table', 'services_refs_table', 'transactions']
+
+@pytest.fixture
+def small_parts(monkeypatch):
+    # Small enough for the synthetic file to be split into several parts
+    monkeypatch.setattr(py835.py835, 'MIN_PART_SIZE', 1000)
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+@pytest.mark.parametrize('ids', ['int', 'hash'])
+def test_workers_match_a_serial_parse(remittance, small_parts, engine, ids):
+    serial = Parser(remittance, engine=engine, ids=ids, handlers=EXTRA_HANDLERS)
+    parallel = Parser(remittance, engine=engine, ids=ids, handlers=EXTRA_HANDLERS, workers=2)
+    for view in VIEWS:
+        assert getattr(parallel, view)().equals(getattr(serial, view)()), view
+    assert parallel.parents == serial.parents
+    assert parallel.extra_tables.keys() == serial.extra_tables.keys()
+    for name in serial.extra_tables:
+        assert parallel.extra_table(name).equals(serial.extra_table(name)), name
+
+def test_transaction_sets_outside_a_functional_group(remittance, small_parts, tmp_path):
+    # Without its GS (and GE) the parts have no envelope to be wrapped in: parsed serially instead
+    content = open(remittance).read()
+    content = re.sub(r'(GS|GE)\*[^~]*~\n', '', content)
+    path = tmp_path / 'no_gs.835'
+    path.write_text(content)
+    serial = Parser(str(path), engine='fast', ids='int')
+    parallel = Parser(str(path), engine='fast', ids='int', workers=2)
+    assert len(serial.claims) == 120
+    assert parallel.claims_table().equals(serial.claims_table())
+
+def test_functions_that_cannot_be_pickled(remittance, small_parts):
+    # A lambda can't be sent to the workers: the file is parsed serially instead of failing
+    where = lambda record: record['claim']['CLP02'] == '1'
+    handlers = {'PLB': lambda state, segment_data, schema: None}
+    serial = Parser(remittance, engine='fast', ids='int', where=where, handlers=handlers)
+    parallel = Parser(remittance, engine='fast', ids='int', where=where, handlers=handlers, workers=2)
+    assert 0 < len(parallel.claims) < 120
+    assert parallel.claims_table().equals(serial.claims_table())
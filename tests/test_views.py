@@ -0,0 +1,112 @@
+import os
+import pytest
+from py835 import Parser
+from py835.py835 import CAS_TRIPLETS
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'example-x12-files')
+FILE = os.path.join(EXAMPLES, 'X221-multiple-claims-single-check.edi')
+
+@pytest.mark.parametrize('edit', ['loc', 'iloc', 'column'])
+def test_editing_a_view_leaves_the_cache_alone(edit):
+    parser = Parser(FILE, engine='fast')
+    claims = parser.claims_table()
+    expected = claims.copy()
+    if edit == 'loc':
+        claims.loc[0, 'CLP01'] = 'MUTATED'
+    elif edit == 'iloc':
+        claims.iloc[0, claims.columns.get_loc('CLP01')] = 'MUTATED'
+    else:
+        claims['CLP01'] = 'MUTATED'
+    assert parser.claims_table().equals(expected)
+
+def test_adjustments_keep_their_id_columns_without_cas():
+    # No claim level CAS segments in this file, only service level ones
+    parser = Parser(os.path.join(EXAMPLES, 'X221-line-service-line-penalty-tax-or-bonuses-impacting-payment-only-example-3.edi'), engine='fast')
+    claim_ids = ['isa_id', 'functional_group_id', 'statement_id', 'claim_id']
+    assert parser.claims_cas_table().empty
+    assert list(parser.claims_adjustments_table().columns) == claim_ids + ['CAS01', 'CAS02', 'CAS03', 'CAS04']
+    assert list(parser.claims_adjustments_summary().columns) == claim_ids
+    assert list(parser.services_adjustments_table().columns) == claim_ids + ['service_id', 'CAS01', 'CAS02', 'CAS03', 'CAS04']
+
+def test_views_without_a_copy_share_the_cached_frame():
+    parser = Parser(FILE, engine='fast')
+    claims = parser.claims_table(copy=False)
+    assert parser.claims_table(copy=False) is claims
+    # copy isn't part of the cache key
+    assert parser.claims_table().equals(claims)
+    assert list(parser.table_cache) == [('claims_table', False, False)]
+
+# Repeated group and reason pairs, within a CAS and across CAS segments, and one CAS with all
+# six triplets (up to CAS19) and one with an empty triplet in the middle
+CAS_SEGMENTS = [
+    'ISA*00*          *00*          *ZZ*SUBMITTERS ID  *ZZ*RECEIVERS ID   *200101*1253*^*00501*000000905*0*T*|',
+    'GS*HP*SENDER CODE*RECEIVER CODE*20200101*0802*1*X*005010X221A1',
+    'ST*835*0001',
+    'BPR*I*43*C*CHK************20190816',
+    'TRN*1*CK NUMBER 1*1234567890',
+    'N1*PR*ANY PLAN USA',
+    'N1*PE*PROVIDER*XX*1123454567',
+    'LX*1',
+    'CLP*PCN*1*100*43**12*CLAIMNUMB*11*1',
+    'CAS*CO*45*10**45*5',
+    'CAS*CO*45*2.5',
+    'CAS*PR*1*20*1*2*3**3*4*1*45*1*1*142*0.5**97*2*1',
+    'CAS*OA*23*1*****94*2',
+    'NM1*QC*1*LAST*FIRST',
+    'SVC*HC|99214*100*40',
+    'DTM*472*20170109',
+    'CAS*CO*45*30',
+    'CAS*CO*45*25*1*253*5',
+    'SE*17*0001',
+    'GE*1*1',
+    'IEA*1*000000905',
+]
+
+@pytest.fixture
+def cas_file(tmp_path):
+    path = tmp_path / 'cas.835'
+    path.write_text('~'.join(CAS_SEGMENTS) + '~')
+    return str(path)
+
+def cas_rows(path):
+    """(level, group, reason, amount, quantity) of every non-empty triplet of the CAS segments of a file."""
+    rows = []
+    level = None
+    for text in open(path).read().replace('\n', '').split('~'):
+        elements = text.split('*')
+        if elements[0] in ('CLP', 'SVC'):
+            level = elements[0]
+        if elements[0] != 'CAS':
+            continue
+        for start in range(2, len(elements), 3):
+            reason, amount, quantity = (elements[start:start + 3] + ['', ''])[:3]
+            if reason:
+                rows.append((level, elements[1], reason, amount, quantity or None))
+    return rows
+
+def adjustment_rows(parser):
+    rows = []
+    for level, table in [('CLP', parser.claims_adjustments_table()), ('SVC', parser.services_adjustments_table())]:
+        rows += [(level, group, reason, amount, quantity or None) for group, reason, amount, quantity in table[['CAS01', 'CAS02', 'CAS03', 'CAS04']].itertuples(index=False)]
+    return rows
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_adjustments_have_a_row_per_triplet(cas_file, remittance, engine):
+    assert CAS_TRIPLETS[-1] == ('CAS17', 'CAS18', 'CAS19')
+    for path in [cas_file, remittance]:
+        expected = cas_rows(path)
+        # Claim level adjustments come before the service level ones, in file order within each
+        expected = [row for row in expected if row[0] == 'CLP'] + [row for row in expected if row[0] == 'SVC']
+        assert adjustment_rows(Parser(path, engine=engine)) == expected
+
+@pytest.mark.parametrize('engine', ['fast', 'pyx12'])
+def test_adjustment_summaries_add_up_repeated_pairs(cas_file, engine):
+    parser = Parser(cas_file, engine=engine)
+    claims = parser.claims_adjustments_summary()
+    assert claims.drop(columns=['isa_id', 'functional_group_id', 'statement_id', 'claim_id']).to_dict('records') == [{
+        'CAS03_CO-45': 17.5,
+        'CAS03_PR-1': 20.0, 'CAS03_PR-2': 3.0, 'CAS03_PR-3': 4.0, 'CAS03_PR-45': 1.0, 'CAS03_PR-142': 0.5, 'CAS03_PR-97': 2.0,
+        'CAS03_OA-23': 1.0, 'CAS03_OA-94': 2.0,
+    }]
+    services = parser.services_adjustments_summary()
+    assert services[['CAS03_CO-45', 'CAS03_CO-253']].to_dict('records') == [{'CAS03_CO-45': 55.0, 'CAS03_CO-253': 5.0}]